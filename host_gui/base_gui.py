@@ -52,26 +52,14 @@ try:
             raise ImportError("Matplotlib Qt backend not available")
     from matplotlib.figure import Figure
     matplotlib_available = True
-    # Import and configure seaborn for enhanced plot styling
-    try:
-        import seaborn as sns
-        # Set seaborn style for all matplotlib plots
-        sns.set_style("whitegrid")
-        sns.set_palette("husl")
-        seaborn_available = True
-    except ImportError:
-        seaborn_available = False
+    # Seaborn "whitegrid"/"husl" look without importing seaborn (slow to import)
+    from host_gui.utils.plot_style import apply_plot_style
+    apply_plot_style()
 except Exception:
     matplotlib = None
     FigureCanvasQTAgg = None
     Figure = None
     matplotlib_available = False
-    seaborn_available = False
-try:
-    import cantools
-except Exception:
-    cantools = None
-
 import logging
 
 # Logging is configured centrally in host_gui.config.configure_logging()
@@ -96,7 +84,9 @@ try:
         SLEEP_INTERVAL_SHORT, SLEEP_INTERVAL_MEDIUM,
         MUX_CHANNEL_MAX, DWELL_TIME_MAX_MS,
         LEFT_PANEL_MIN_WIDTH, LOGO_WIDTH, LOGO_HEIGHT,
-        PLOT_GRID_ALPHA, ADC_A3_GAIN_FACTOR
+        PLOT_GRID_ALPHA, ADC_A3_GAIN_FACTOR,
+        CAN_TRACE_PRE_TRIGGER_S, CAN_TRACE_POST_TRIGGER_S, CAN_ID_VIEW_REFRESH_MS,
+        SIGNAL_VIEW_REFRESH_MS, PLOT_REFRESH_MS, OSC_KNOWN_RESOURCES_FILE
     )
 except ImportError:
     # Fallback to absolute import
@@ -112,7 +102,9 @@ except ImportError:
             SLEEP_INTERVAL_SHORT, SLEEP_INTERVAL_MEDIUM,
             MUX_CHANNEL_MAX, DWELL_TIME_MAX_MS,
             LEFT_PANEL_MIN_WIDTH, LOGO_WIDTH, LOGO_HEIGHT,
-            PLOT_GRID_ALPHA, ADC_A3_GAIN_FACTOR
+            PLOT_GRID_ALPHA, ADC_A3_GAIN_FACTOR,
+            CAN_TRACE_PRE_TRIGGER_S, CAN_TRACE_POST_TRIGGER_S, CAN_ID_VIEW_REFRESH_MS,
+            SIGNAL_VIEW_REFRESH_MS, PLOT_REFRESH_MS, OSC_KNOWN_RESOURCES_FILE
         )
     except ImportError:
         logger.error("Failed to import constants - using fallback values")
@@ -145,16 +137,23 @@ except ImportError:
         DWELL_TIME_MAX_MS = 60000
         PLOT_GRID_ALPHA = 0.3
         ADC_A3_GAIN_FACTOR = 1.998
+        CAN_TRACE_PRE_TRIGGER_S = 5.0
+        CAN_TRACE_POST_TRIGGER_S = 2.0
+        CAN_ID_VIEW_REFRESH_MS = 100
+        SIGNAL_VIEW_REFRESH_MS = 66
+        PLOT_REFRESH_MS = 33
+        OSC_KNOWN_RESOURCES_FILE = 'oscilloscope_resources.json'
 
 # Import services
 try:
-    from host_gui.services import CanService, DbcService, SignalService
+    from host_gui.services import CanService, DbcService, SignalService, ServiceContainer
     from host_gui.services.can_trace_logger import CanTraceLogger
 except ImportError:
     logger.error("Failed to import services")
     CanService = None
     DbcService = None
     SignalService = None
+    ServiceContainer = None
     CanTraceLogger = None
 
 # Import exceptions
@@ -195,27 +194,23 @@ try:
         apply_moving_average_filter,
     )
     from host_gui.utils.waveform_decoder import WaveformDecoder
+    from host_gui.utils.plot_stream import PlotDataStream, PLOT_CLEAR
+    from host_gui.utils.decimation import decimate_for_display
 except ImportError:
     logger.error("Failed to import utilities")
     analyze_steady_state_can = None
     apply_lowpass_filter = None
     apply_moving_average_filter = None
     WaveformDecoder = None
+    PlotDataStream = None
+    PLOT_CLEAR = 'clear'
+    def decimate_for_display(x, y, *args, **kwargs):
+        return x, y
 
-# Import numpy and scipy (optional)
-try:
-    import numpy as np
-    numpy_available = True
-except ImportError:
-    numpy = None
-    numpy_available = False
-
-try:
-    from scipy import signal
-    scipy_available = True
-except ImportError:
-    signal = None
-    scipy_available = False
+# numpy and scipy are imported on first use (host_gui.utils.signal_processing)
+import importlib.util
+numpy_available = importlib.util.find_spec('numpy') is not None
+scipy_available = importlib.util.find_spec('scipy') is not None
 
 # Import shared regex patterns for oscilloscope command parsing
 try:
@@ -236,6 +231,12 @@ except ImportError:
 # Import TestRunner
 from host_gui.test_runner import TestRunner
 
+from host_gui.widgets.frame_table_model import FrameTableModel
+from host_gui.widgets.can_id_monitor_model import CanIdMonitorModel
+from host_gui.widgets.signal_table_model import SignalTableModel
+from host_gui.widgets.monitor_subscriptions import MonitorSubscriptions
+from host_gui.widgets.live_plot import LivePlot
+
 # Import PhaseCurrentTestStateMachine
 try:
     from host_gui.services.phase_current_service import PhaseCurrentTestStateMachine
@@ -337,41 +338,45 @@ class BaseGUI(QtWidgets.QMainWindow):
         # self.frame_q -> self.can_service.frame_queue
         
         # Initialize services (Phase 1) - use ConfigManager if available
-        if CanService is not None:
-            if self.config_manager:
-                can_channel = self.config_manager.can_settings.channel
-                can_bitrate = self.config_manager.can_settings.bitrate
-            else:
-                # Fallback to environment variables (backwards compatibility)
-                can_channel = os.environ.get('CAN_CHANNEL', os.environ.get('PCAN_CHANNEL', CAN_CHANNEL_DEFAULT))
-                try:
-                    can_bitrate = int(os.environ.get('CAN_BITRATE', os.environ.get('PCAN_BITRATE', str(CAN_BITRATE_DEFAULT))))
-                except Exception:
-                    can_bitrate = CAN_BITRATE_DEFAULT
-            self.can_service = CanService(channel=can_channel, bitrate=can_bitrate)
-            # frame_queue accessed via self.can_service.frame_queue
+        if self.config_manager:
+            can_channel = self.config_manager.can_settings.channel
+            can_bitrate = self.config_manager.can_settings.bitrate
         else:
-            self.can_service = None
-        
-        # Initialize oscilloscope service
-        try:
-            from host_gui.services.oscilloscope_service import OscilloscopeService
-            self.oscilloscope_service = OscilloscopeService()
-        except ImportError:
-            logger.warning("OscilloscopeService not available - PyVISA may not be installed")
-            self.oscilloscope_service = None
-        except Exception as e:
-            logger.warning(f"Failed to initialize OscilloscopeService: {e}", exc_info=True)
-            self.oscilloscope_service = None
+            # Fallback to environment variables (backwards compatibility)
+            can_channel = os.environ.get('CAN_CHANNEL', os.environ.get('PCAN_CHANNEL', CAN_CHANNEL_DEFAULT))
+            try:
+                can_bitrate = int(os.environ.get('CAN_BITRATE', os.environ.get('PCAN_BITRATE', str(CAN_BITRATE_DEFAULT))))
+            except Exception:
+                can_bitrate = CAN_BITRATE_DEFAULT
+        
+        # Phase 3: Services warm up concurrently in the ServiceContainer (VISA ResourceManager
+        # creation and the oscilloscope scan run while the UI is built); get() blocks only
+        # until the requested service is ready
+        self.service_container = None
+        self._oscilloscope_service = None
+        self._oscilloscope_service_resolved = False
+        if ServiceContainer is not None:
+            try:
+                self.service_container = ServiceContainer()
+                data_dir = (self.config_manager.app_settings.get_data_dir() if self.config_manager
+                            else os.path.join(repo_root, 'backend', 'data'))
+                self.service_container.initialize_services({
+                    'can_channel': can_channel,
+                    'can_bitrate': can_bitrate,
+                    'oscilloscope_cache_path': os.path.join(data_dir, OSC_KNOWN_RESOURCES_FILE),
+                }, warm_up=True)
+            except Exception as e:
+                logger.warning(f"Failed to initialize ServiceContainer: {e}", exc_info=True)
+                self.service_container = None
         
-        if DbcService is not None:
-            self.dbc_service = DbcService()
+        if self.service_container is not None:
+            self.can_service = self.service_container.get_can_service()
+            self.dbc_service = self.service_container.get_dbc_service()
+            self.signal_service = self.service_container.get_signal_service()
+            # frame_queue accessed via self.can_service.frame_queue
         else:
+            self.can_service = None
             self.dbc_service = None
-        
-        if SignalService is not None and self.dbc_service is not None:
-            self.signal_service = SignalService(self.dbc_service)
-        else:
             self.signal_service = None
         
         # Initialize CAN trace logger
@@ -436,12 +441,13 @@ class BaseGUI(QtWidgets.QMainWindow):
         self._build_central()
         self._build_statusbar()
 
-        # Perform initial oscilloscope scan if service is available
-        if self.oscilloscope_service is not None:
-            try:
-                self._refresh_oscilloscopes()
-            except Exception as e:
-                logger.warning(f"Failed to perform initial oscilloscope scan: {e}")
+        # Initial oscilloscope scan runs during service warm-up. Known-good resources from the
+        # last session are offered as soon as the service exists; the scan result replaces them.
+        self._pending_oscilloscope_entries = None
+        self._oscilloscope_scan_applied = False
+        if self.service_container is not None and self.service_container.has('oscilloscope_resources'):
+            self.service_container.when_ready('oscilloscope_service', self._on_oscilloscope_service_ready)
+            self.service_container.when_ready('oscilloscope_resources', self._on_oscilloscope_scan)
 
         # Auto-load last used oscilloscope configuration - DISABLED per user request
         # self._load_last_osc_config()
@@ -460,6 +466,25 @@ class BaseGUI(QtWidgets.QMainWindow):
         # Initialize dialog reference
         self._connect_eol_dialog = None
 
+    @property
+    def oscilloscope_service(self):
+        """OscilloscopeService instance (None if unavailable).
+
+        The service is created during service warm-up; the first access waits
+        for it only if it is not ready yet.
+        """
+        if not self._oscilloscope_service_resolved:
+            container = self.service_container
+            if container is not None and container.has('oscilloscope_service'):
+                self._oscilloscope_service = container.get_oscilloscope_service()
+            self._oscilloscope_service_resolved = True
+        return self._oscilloscope_service
+
+    @oscilloscope_service.setter
+    def oscilloscope_service(self, service) -> None:
+        self._oscilloscope_service = service
+        self._oscilloscope_service_resolved = True
+
     def _build_menu(self):
         """Build the application menu bar with File, EOL, and Help menus."""
         menubar = self.menuBar()
@@ -1352,6 +1377,9 @@ class BaseGUI(QtWidgets.QMainWindow):
         self._monitor_sent_values = {}  # Track latest sent command values (for Digital Logic, Phase Current, etc.)
         self._monitor_static_values = {}  # Store static reference values from test config
         self._monitor_label_slots = []  # List of 6 label slots (QLabel widgets) in grid order
+        # Labels subscribe to signal handles; changed values arrive in one batch per refresh
+        self.monitor_subscriptions = MonitorSubscriptions(self)
+        self.monitor_subscriptions.values_changed.connect(self._apply_monitor_updates)
         
         # Create compact grid layout (3 rows x 2 columns)
         grid_widget = QtWidgets.QWidget()
@@ -1441,6 +1469,12 @@ class BaseGUI(QtWidgets.QMainWindow):
         plot_layout.setContentsMargins(5, 5, 5, 5)  # Add margins inside plot group
         plot_layout.setSpacing(0)  # No spacing inside plot group
         plot_layout.setSizeConstraint(QtWidgets.QLayout.SetMinimumSize)  # Prevent compression
+        # Plot points from the test thread are queued here and drawn once per frame
+        self.plot_stream = PlotDataStream() if PlotDataStream is not None else None
+        self.plot_refresh_timer = QtCore.QTimer(self)
+        self.plot_refresh_timer.setInterval(PLOT_REFRESH_MS)
+        self.plot_refresh_timer.timeout.connect(self._drain_plot_stream)
+        self.plot_refresh_timer.start()
         if matplotlib_available:
             try:
                 self._init_plot()
@@ -3493,6 +3527,9 @@ Data Points Used: {data_points}"""
         self._monitor_display_names.clear()
         self._monitor_sent_values.clear()
         self._monitor_static_values.clear()
+        subscriptions = getattr(self, 'monitor_subscriptions', None)
+        if subscriptions is not None:
+            subscriptions.clear()
         
         # Clear history
         for signal_name in self._monitor_data.keys():
@@ -3516,27 +3553,6 @@ Data Points Used: {data_points}"""
         if hasattr(self, 'update_rate_label'):
             self.update_rate_label.setText('Update Rate: -- Hz')
         
-        # Stop update timer if no test is provided (thread-safe)
-        if test is None:
-            if hasattr(self, '_monitor_update_timer'):
-                try:
-                    # Check if we're in the main thread
-                    current_thread = QtCore.QThread.currentThread()
-                    main_thread = QtCore.QCoreApplication.instance().thread()
-                    
-                    if current_thread == main_thread:
-                        # We're in the main thread, stop directly
-                        self._monitor_update_timer.stop()
-                    else:
-                        # We're in a background thread, use QueuedConnection for thread safety
-                        QtCore.QMetaObject.invokeMethod(
-                            self._monitor_update_timer,
-                            'stop',
-                            QtCore.Qt.ConnectionType.QueuedConnection
-                        )
-                except Exception:
-                    pass
-        
         # Configure labels based on test type if test provided
         if test is not None:
             self._configure_monitor_signals_for_test(test)
@@ -3740,232 +3756,153 @@ Data Points Used: {data_points}"""
         self.pfc_power_good_monitor_label = self._monitor_labels.get('pfc_power_good')
         self.output_current_monitor_label = self._monitor_labels.get('output_current')
         
-        # Start periodic update timer for monitored signals if any are configured
+        # Subscribe labels to their CAN signals (values are pushed on display refresh)
         if self._monitor_labels:
-            self._start_monitor_update_timer()
+            self._subscribe_monitor_signals(test)
     
-    def _start_monitor_update_timer(self) -> None:
-        """Start a timer to periodically update monitored signals from CAN (thread-safe)."""
-        # Stop existing timer if any (thread-safe)
-        if hasattr(self, '_monitor_update_timer'):
+    def _subscribe_monitor_signals(self, test: Dict[str, Any]) -> None:
+        """Subscribe configured monitor labels to their CAN signals.
+        
+        Decoded values are pushed to the labels by monitor_subscriptions on the
+        next display refresh; labels whose signal does not change cost nothing.
+        The latest cached value (if any) is shown immediately.
+        
+        Args:
+            test: Test configuration dictionary (used for Digital Logic feedback)
+        """
+        subscriptions = getattr(self, 'monitor_subscriptions', None)
+        if subscriptions is None:
+            return
+        
+        # Monitor label key -> prefix of its '<prefix>_signal_name' / '<prefix>_msg_id' entries
+        sources = {
+            'eol_measured_signal': 'eol',
+            'dut_feedback_signal': 'feedback',
+            'eol_measurement': 'eol_ext_5v',
+            'dut_measurement': 'dut_measurement',
+            'dut_dc_bus_voltage': 'dc_bus',
+            'dut_output_current': 'output_current',
+            'fan_tach_signal': 'fan_tach',
+            'dut_pwm_frequency': 'pwm_freq',
+            'dut_duty': 'duty',
+            'dut_temperature': 'temp',
+        }
+        for signal_key in list(self._monitor_labels.keys()):
+            if signal_key == 'digital_input':
+                signal_name = test.get('feedback_signal')
+                msg_id = test.get('feedback_message_id')
+            else:
+                prefix = sources.get(signal_key, signal_key)
+                signal_name = self._monitor_sent_values.get(f'{prefix}_signal_name')
+                msg_id = self._monitor_sent_values.get(f'{prefix}_msg_id')
+            if not signal_name or msg_id is None:
+                continue
+            if not subscriptions.subscribe(signal_key, msg_id, signal_name):
+                logger.debug(f"Cannot monitor {signal_key}: invalid message ID {msg_id!r}")
+                continue
             try:
-                # Check if we're in the main thread
-                current_thread = QtCore.QThread.currentThread()
-                main_thread = QtCore.QCoreApplication.instance().thread()
-                
-                if current_thread == main_thread:
-                    # We're in the main thread, stop directly
-                    self._monitor_update_timer.stop()
-                else:
-                    # We're in a background thread, use QueuedConnection for thread safety
-                    QtCore.QMetaObject.invokeMethod(
-                        self._monitor_update_timer,
-                        'stop',
-                        QtCore.Qt.ConnectionType.QueuedConnection
-                    )
+                ts, val = self.get_latest_signal(msg_id, signal_name)
+                subscriptions.push(signal_key, val)
             except Exception as e:
-                logger.debug(f"Error stopping monitor update timer: {e}")
-        
-        # Create new timer to update signals every 100ms (must be done in main thread)
-        # Note: This method should only be called from main thread, but we check anyway
-        current_thread = QtCore.QThread.currentThread()
-        main_thread = QtCore.QCoreApplication.instance().thread()
-        
-        if current_thread == main_thread:
-            # We're in the main thread, create timer directly
-            self._monitor_update_timer = QtCore.QTimer(self)
-            self._monitor_update_timer.timeout.connect(self._update_monitored_signals_from_can)
-            self._monitor_update_timer.start(100)  # Update every 100ms
-        else:
-            # We're in a background thread - schedule timer creation in main thread
-            # Use a lambda to capture self and create timer when invoked
-            QtCore.QMetaObject.invokeMethod(
-                self,
-                '_create_monitor_timer',
-                QtCore.Qt.ConnectionType.QueuedConnection
-            )
-    
-    def _create_monitor_timer(self) -> None:
-        """Create and start monitor update timer (called from main thread via invokeMethod)."""
-        if not hasattr(self, '_monitor_update_timer') or self._monitor_update_timer is None:
-            self._monitor_update_timer = QtCore.QTimer(self)
-        self._monitor_update_timer.timeout.connect(self._update_monitored_signals_from_can)
-        self._monitor_update_timer.start(100)  # Update every 100ms
+                logger.debug(f"Error reading cached value for monitored signal {signal_key}: {e}")
     
-    def _update_monitored_signals_from_can(self) -> None:
-        """Periodically update monitored signals by reading from CAN cache."""
-        if not self._monitor_labels:
-            return
+    def _apply_monitor_updates(self, changes: Dict[str, Any]) -> None:
+        """Apply one batch of changed monitor values (monitor_subscriptions.values_changed slot).
         
-        # Create a copy of items to avoid "dictionary changed size during iteration" error
-        # This can happen if reset_monitor_signals() is called from another thread during iteration
-        try:
-            monitor_items = list(self._monitor_labels.items())
-        except RuntimeError:
-            # Dictionary was modified during copy - skip this update cycle
-            return
-        
-        # Update signals based on stored signal names and message IDs
-        for signal_key, label in monitor_items:
+        Args:
+            changes: Dictionary mapping monitor label key -> new value
+        """
+        for signal_key, value in changes.items():
+            if signal_key not in self._monitor_labels:
+                continue  # Label was reconfigured since the value was queued
             try:
-                # Get signal name and message ID from stored values
-                signal_name_key = f'{signal_key}_signal_name'
-                msg_id_key = f'{signal_key}_msg_id'
-                
-                signal_name = self._monitor_sent_values.get(signal_name_key)
-                msg_id = self._monitor_sent_values.get(msg_id_key)
-                
-                if signal_name and msg_id is not None:
-                    # Get latest signal value from cache
-                    ts, val = self.get_latest_signal(msg_id, signal_name)
-                    if val is not None:
-                        self._update_signal_with_status(signal_key, val)
-                
-                # Special handling for Digital Logic Test feedback
-                if signal_key == 'digital_input':
-                    # Get feedback signal from current test config if available
-                    if hasattr(self, '_current_test_index') and self._current_test_index is not None:
-                        try:
-                            if self._current_test_index < len(self._tests):
-                                test = self._tests[self._current_test_index]
-                                fb_signal = test.get('feedback_signal')
-                                fb_msg_id = test.get('feedback_message_id')
-                                if fb_signal and fb_msg_id is not None:
-                                    ts, val = self.get_latest_signal(fb_msg_id, fb_signal)
-                                    if val is not None:
-                                        self._update_signal_with_status('digital_input', val)
-                        except Exception:
-                            pass
-                
-                # Special handling for Analog Static Test - both signals
-                if signal_key == 'eol_measured_signal':
-                    eol_signal = self._monitor_sent_values.get('eol_signal_name')
-                    eol_msg_id = self._monitor_sent_values.get('eol_msg_id')
-                    if eol_signal and eol_msg_id is not None:
-                        ts, val = self.get_latest_signal(eol_msg_id, eol_signal)
-                        if val is not None:
-                            self._update_signal_with_status('eol_measured_signal', val)
-                
-                if signal_key == 'dut_feedback_signal':
-                    fb_signal = self._monitor_sent_values.get('feedback_signal_name')
-                    fb_msg_id = self._monitor_sent_values.get('feedback_msg_id')
-                    if fb_signal and fb_msg_id is not None:
-                        ts, val = self.get_latest_signal(fb_msg_id, fb_signal)
-                        if val is not None:
-                            self._update_signal_with_status('dut_feedback_signal', val)
-                
-                # Special handling for External 5V Test
-                if signal_key == 'eol_measurement':
-                    eol_signal = self._monitor_sent_values.get('eol_ext_5v_signal_name')
-                    eol_msg_id = self._monitor_sent_values.get('eol_ext_5v_msg_id')
-                    if eol_signal and eol_msg_id is not None:
-                        ts, val = self.get_latest_signal(eol_msg_id, eol_signal)
-                        if val is not None:
-                            self._update_signal_with_status('eol_measurement', val)
-                
-                if signal_key == 'dut_measurement':
-                    fb_signal = self._monitor_sent_values.get('dut_measurement_signal_name')
-                    fb_msg_id = self._monitor_sent_values.get('dut_measurement_msg_id')
-                    if fb_signal and fb_msg_id is not None:
-                        ts, val = self.get_latest_signal(fb_msg_id, fb_signal)
-                        if val is not None:
-                            self._update_signal_with_status('dut_measurement', val)
-                
-                # Special handling for DC Bus Sensing
-                if signal_key == 'dut_dc_bus_voltage':
-                    fb_signal = self._monitor_sent_values.get('dc_bus_signal_name')
-                    fb_msg_id = self._monitor_sent_values.get('dc_bus_msg_id')
-                    if fb_signal and fb_msg_id is not None:
-                        ts, val = self.get_latest_signal(fb_msg_id, fb_signal)
-                        if val is not None:
-                            self._update_signal_with_status('dut_dc_bus_voltage', val)
-                
-                # Special handling for Output Current Calibration
-                if signal_key == 'dut_output_current':
-                    fb_signal = self._monitor_sent_values.get('output_current_signal_name')
-                    fb_msg_id = self._monitor_sent_values.get('output_current_msg_id')
-                    if fb_signal and fb_msg_id is not None:
-                        ts, val = self.get_latest_signal(fb_msg_id, fb_signal)
-                        if val is not None:
-                            self._update_signal_with_status('dut_output_current', val)
-                
-                # Special handling for Fan Control Test
-                if signal_key == 'fan_enabled':
-                    fb_signal = self._monitor_sent_values.get('fan_enabled_signal_name')
-                    fb_msg_id = self._monitor_sent_values.get('fan_enabled_msg_id')
-                    if fb_signal and fb_msg_id is not None:
-                        ts, val = self.get_latest_signal(fb_msg_id, fb_signal)
-                        if val is not None:
-                            self._update_signal_with_status('fan_enabled', val)
-                
-                if signal_key == 'fan_tach_signal':
-                    fb_signal = self._monitor_sent_values.get('fan_tach_signal_name')
-                    fb_msg_id = self._monitor_sent_values.get('fan_tach_msg_id')
-                    if fb_signal and fb_msg_id is not None:
-                        ts, val = self.get_latest_signal(fb_msg_id, fb_signal)
-                        if val is not None:
-                            self._update_signal_with_status('fan_tach_signal', val)
-                
-                if signal_key == 'fan_fault':
-                    fb_signal = self._monitor_sent_values.get('fan_fault_signal_name')
-                    fb_msg_id = self._monitor_sent_values.get('fan_fault_msg_id')
-                    if fb_signal and fb_msg_id is not None:
-                        ts, val = self.get_latest_signal(fb_msg_id, fb_signal)
-                        if val is not None:
-                            self._update_signal_with_status('fan_fault', val)
-                
-                # Special handling for Analog PWM Sensor Test
-                if signal_key == 'dut_pwm_frequency':
-                    fb_signal = self._monitor_sent_values.get('pwm_freq_signal_name')
-                    fb_msg_id = self._monitor_sent_values.get('pwm_freq_msg_id')
-                    if fb_signal and fb_msg_id is not None:
-                        ts, val = self.get_latest_signal(fb_msg_id, fb_signal)
-                        if val is not None:
-                            self._update_signal_with_status('dut_pwm_frequency', val)
-                
-                if signal_key == 'dut_duty':
-                    fb_signal = self._monitor_sent_values.get('duty_signal_name')
-                    fb_msg_id = self._monitor_sent_values.get('duty_msg_id')
-                    if fb_signal and fb_msg_id is not None:
-                        ts, val = self.get_latest_signal(fb_msg_id, fb_signal)
-                        if val is not None:
-                            self._update_signal_with_status('dut_duty', val)
-                
-                # Special handling for Temperature Validation Test
-                if signal_key == 'dut_temperature':
-                    fb_signal = self._monitor_sent_values.get('temp_signal_name')
-                    fb_msg_id = self._monitor_sent_values.get('temp_msg_id')
-                    if fb_signal and fb_msg_id is not None:
-                        ts, val = self.get_latest_signal(fb_msg_id, fb_signal)
-                        if val is not None:
-                            self._update_signal_with_status('dut_temperature', val)
-                
-                # Charger tests are handled through update_monitor_signal which already works
+                self._update_signal_with_status(signal_key, value)
             except Exception as e:
                 logger.debug(f"Error updating monitored signal {signal_key}: {e}")
 
     @QtCore.Slot(float, float, str)
     def _update_plot(self, dac_voltage: float, feedback_value: float, test_name: str = '') -> None:
-        """Update the plot with a new data point (DAC voltage, feedback value).
+        """Update the plot with a new data point (DAC voltage, feedback value) and redraw.
         
-        Also updates real-time monitoring for Analog Sweep Test.
+        Also updates real-time monitoring for Analog Sweep Test. The test thread does not
+        call this per point; it pushes points to plot_stream, which _drain_plot_stream
+        applies once per frame.
         
-        This method is thread-safe and can be called from background threads via QMetaObject.invokeMethod.
+        Args:
+            dac_voltage: DAC output voltage in millivolts (or oscilloscope value for Output Current Calibration)
+            feedback_value: IPC feedback signal value (or CAN value for Output Current Calibration)
+            test_name: Optional test name for plot title
+        """
+        if self._append_plot_point(dac_voltage, feedback_value, test_name):
+            self._redraw_plot()
+    
+    @QtCore.Slot()
+    def _drain_plot_stream(self) -> None:
+        """Apply all queued plot updates and redraw once (plot_refresh_timer slot).
+        
+        Also invoked with BlockingQueuedConnection by the test thread when it needs the
+        plot arrays to be complete (e.g. before computing the sweep regression).
+        """
+        stream = getattr(self, 'plot_stream', None)
+        if stream is None or not len(stream):
+            return
+        needs_redraw = False
+        for kind, x, y, name in stream.drain():
+            if kind == PLOT_CLEAR:
+                self._clear_plot()
+                needs_redraw = False
+            elif self._append_plot_point(x, y, name):
+                needs_redraw = True
+        if needs_redraw:
+            self._redraw_plot()
+    
+    def _redraw_plot(self) -> None:
+        """Show new live plot points.
+        
+        Uses the blitting LivePlot engine for plot_line: only points added since the
+        last frame are drawn over the cached background, and the full figure is redrawn
+        only when the axes have to grow. Falls back to relim/autoscale/draw otherwise.
+        """
+        if getattr(self, 'plot_axes', None) is None or getattr(self, 'plot_canvas', None) is None:
+            return
+        try:
+            line = getattr(self, 'plot_line', None)
+            live = getattr(self, '_live_plot', None)
+            attached = line is not None and line.axes is self.plot_axes
+            if live is not None and (not attached or not live.tracks([line])):
+                live.close()  # Plot was re-initialized (or taken over by another test)
+                live = self._live_plot = None
+            if attached:
+                if live is None:
+                    live = self._live_plot = LivePlot(self.plot_canvas, [line])
+                live.update()
+                return
+            self.plot_axes.relim()
+            self.plot_axes.autoscale()
+            self.plot_canvas.draw()
+        except Exception as e:
+            logger.error(f"Error redrawing plot: {e}", exc_info=True)
+    
+    def _append_plot_point(self, dac_voltage: float, feedback_value: float, test_name: str = '') -> bool:
+        """Add a data point to the live plot data and line without redrawing.
         
         Args:
             dac_voltage: DAC output voltage in millivolts (or oscilloscope value for Output Current Calibration)
             feedback_value: IPC feedback signal value (or CAN value for Output Current Calibration)
             test_name: Optional test name for plot title
+            
+        Returns:
+            True if a point was added and the canvas needs a redraw
         """
         if not matplotlib_available:
             logger.debug("Matplotlib not available, skipping plot update")
-            return
+            return False
         if not hasattr(self, 'plot_axes') or self.plot_axes is None:
             logger.debug("Plot axes not initialized, skipping plot update")
-            return
+            return False
         if not hasattr(self, 'plot_canvas') or self.plot_canvas is None:
             logger.debug("Plot canvas not initialized, skipping plot update")
-            return
+            return False
         try:
             # Convert empty string to None for test_name (Qt slot requires str, but we want Optional[str] internally)
             if test_name == '':
@@ -4025,7 +3962,7 @@ Data Points Used: {data_points}"""
                         self.plot_feedback_values.append(fb_val)
                     except (ValueError, TypeError) as e:
                         logger.warning(f"Invalid plot data point: dac={dac_voltage}, fb={feedback_value}, error={e}")
-                        return  # Skip this point if conversion fails
+                        return False  # Skip this point if conversion fails
                     
                     logger.debug(
                         f"Plot update (Analog Sweep): Added point (DAC={dac_voltage}mV, Feedback={feedback_value}), "
@@ -4054,7 +3991,7 @@ Data Points Used: {data_points}"""
                         self.plot_feedback_values.append(fb_val)
                     except (ValueError, TypeError) as e:
                         logger.warning(f"Invalid plot data point: dac={dac_voltage}, fb={feedback_value}, error={e}")
-                        return  # Skip this point if conversion fails
+                        return False  # Skip this point if conversion fails
                     
                     logger.debug(
                         f"Plot update: Added point (DAC={dac_voltage}mV, Feedback={feedback_value}), "
@@ -4064,17 +4001,10 @@ Data Points Used: {data_points}"""
                     # Update plot line
                     # Note: In batched mode, this will be updated once after all points are added
                     self.plot_line.set_data(self.plot_dac_voltages, self.plot_feedback_values)
-                
-                # Auto-scale axes and redraw only if not in batch mode
-                # Batch mode will handle this once after all points are added
-                # Auto-scale axes and redraw
-                # Use draw() instead of draw_idle() to force immediate update during test execution
-                # This ensures plots update in real-time, not just after test completion
-                self.plot_axes.relim()
-                self.plot_axes.autoscale()
-                self.plot_canvas.draw()
+                return True
         except Exception as e:
             logger.error(f"Error updating plot: {e}", exc_info=True)
+        return False
     
     def _add_regression_line_to_plot(self, slope: float, intercept: float) -> None:
         """Add regression line to the current plot after test completion.
@@ -4961,7 +4891,8 @@ Data Points Used: {data_points}"""
             fig = Figure(figsize=(6, 4))
             ax = fig.add_subplot(111)
             
-            ax.plot(dac_voltages, feedback_values, 'bo-', markersize=6, linewidth=1)
+            # Reduce long series to display resolution (min/max per bucket keeps peaks)
+            ax.plot(*decimate_for_display(dac_voltages, feedback_values), 'bo-', markersize=6, linewidth=1)
             ax.set_xlabel('DAC Output Voltage (mV)')
             ax.set_ylabel('Feedback Signal Value')
             ax.set_title(f'Feedback vs DAC Output: {test_name}')
@@ -5055,7 +4986,7 @@ Data Points Used: {data_points}"""
             # Phase V plot
             ax_v = fig.add_subplot(121)
             if osc_v_clean and can_v_clean:
-                ax_v.plot(osc_v_clean, can_v_clean, 'bo', markersize=6, label='Phase V')
+                ax_v.plot(*decimate_for_display(osc_v_clean, can_v_clean), 'bo', markersize=6, label='Phase V')
                 # Add diagonal reference line (y=x)
                 ax_v.axline((0, 0), slope=1, color='gray', linestyle='--', alpha=0.5, label='Ideal (y=x)')
             ax_v.set_xlabel('Average Phase V Current from Oscilloscope (A)')
@@ -5067,7 +4998,7 @@ Data Points Used: {data_points}"""
             # Phase W plot
             ax_w = fig.add_subplot(122)
             if osc_w_clean and can_w_clean:
-                ax_w.plot(osc_w_clean, can_w_clean, 'ro', markersize=6, label='Phase W')
+                ax_w.plot(*decimate_for_display(osc_w_clean, can_w_clean), 'ro', markersize=6, label='Phase W')
                 # Add diagonal reference line (y=x)
                 ax_w.axline((0, 0), slope=1, color='gray', linestyle='--', alpha=0.5, label='Ideal (y=x)')
             ax_w.set_xlabel('Average Phase W Current from Oscilloscope (A)')
@@ -5153,8 +5084,8 @@ Data Points Used: {data_points}"""
             fig = Figure(figsize=(8, 6))
             ax = fig.add_subplot(111)
             
-            # Plot data points
-            ax.plot(osc_clean, can_clean, 'bo', markersize=6, label='Data Points')
+            # Plot data points (decimated to display resolution)
+            ax.plot(*decimate_for_display(osc_clean, can_clean), 'bo', markersize=6, label='Data Points')
             
             # Add diagonal reference line (y=x) for ideal line
             ax.axline((0, 0), slope=1, color='gray', linestyle='--', alpha=0.5, label='Ideal (y=x)')
@@ -6800,14 +6731,44 @@ Data Points Used: {data_points}"""
         # Live Data
         self.live_widget = QtWidgets.QWidget()
         live_layout = QtWidgets.QVBoxLayout(self.live_widget)
-        self.frame_table = QtWidgets.QTableWidget(0, 4)
-        self.frame_table.setHorizontalHeaderLabels(['ts', 'can_id', 'len', 'data'])
+        # Model/view frame table: ring buffer model, rows rendered lazily by the view
+        self.frame_model = FrameTableModel(self._max_frames, self)
+        self.frame_table = QtWidgets.QTableView()
+        self.frame_table.setModel(self.frame_model)
         self.frame_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.frame_table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.frame_table.verticalHeader().setDefaultSectionSize(20)
+        self.frame_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        # Fixed view: one row per CAN ID (and mux value), updated in place at a capped rate
+        self.can_id_model = CanIdMonitorModel(parent=self)
+        self.can_id_table = QtWidgets.QTableView()
+        self.can_id_table.setModel(self.can_id_model)
+        self.can_id_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.can_id_table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.can_id_table.verticalHeader().setDefaultSectionSize(20)
+        self.can_id_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.can_id_refresh_timer = QtCore.QTimer(self)
+        self.can_id_refresh_timer.setInterval(CAN_ID_VIEW_REFRESH_MS)
+        self.can_id_refresh_timer.timeout.connect(self.can_id_model.refresh)
+        self.frame_view_stack = QtWidgets.QStackedWidget()
+        self.frame_view_stack.addWidget(self.frame_table)
+        self.frame_view_stack.addWidget(self.can_id_table)
+        view_row = QtWidgets.QHBoxLayout()
+        view_row.addWidget(QtWidgets.QLabel('View:'))
+        self.frame_view_combo = QtWidgets.QComboBox()
+        self.frame_view_combo.addItems(['Scrolling (latest frames)', 'Fixed (last value per CAN ID)'])
+        self.frame_view_combo.currentIndexChanged.connect(self._on_frame_view_mode_changed)
+        view_row.addWidget(self.frame_view_combo)
+        reset_stats_btn = QtWidgets.QPushButton('Reset Statistics')
+        reset_stats_btn.clicked.connect(self.can_id_model.clear)
+        view_row.addWidget(reset_stats_btn)
+        view_row.addStretch()
+        live_layout.addLayout(view_row)
         self.msg_log = QtWidgets.QListWidget()
         self.msg_log.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
         self.msg_log.setMinimumWidth(360)
         splitter = QtWidgets.QSplitter(QtCore.Qt.Horizontal)
-        splitter.addWidget(self.frame_table)
+        splitter.addWidget(self.frame_view_stack)
         splitter.addWidget(self.msg_log)
         splitter.setStretchFactor(0, 3)
         splitter.setStretchFactor(1, 1)
@@ -6828,6 +6789,7 @@ Data Points Used: {data_points}"""
         self.settings_widget = QtWidgets.QWidget()
         s_layout = QtWidgets.QVBoxLayout(self.settings_widget)
         s_layout.addWidget(QtWidgets.QLabel('Settings / Configurations'))
+        s_layout.addWidget(self._build_trace_capture_settings())
         s_layout.addStretch()
 
         inner.addTab(self.dbc_widget, 'DBC Manager')
@@ -6835,13 +6797,22 @@ Data Points Used: {data_points}"""
         # Signal view: decoded signals from DBC (if loaded)
         self.signal_widget = QtWidgets.QWidget()
         sig_layout = QtWidgets.QVBoxLayout(self.signal_widget)
-        self.signal_table = QtWidgets.QTableWidget(0, 5)
-        self.signal_table.setHorizontalHeaderLabels(['ts', 'message', 'can_id', 'signal', 'value'])
+        # Latest-value model with a dirty set; views are refreshed at a fixed display rate
+        self.signal_model = SignalTableModel(self)
+        self.signal_table = QtWidgets.QTableView()
+        self.signal_table.setModel(self.signal_model)
         self.signal_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.signal_table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.signal_table.verticalHeader().setDefaultSectionSize(20)
+        self.signal_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         sig_layout.addWidget(self.signal_table)
         inner.addTab(self.signal_widget, 'Signal View')
-        # mapping of signal key -> row index in signal_table for fast updates
-        self._signal_rows = {}
+        # latest value of the monitored feedback signal, applied once per display refresh
+        self._pending_feedback_value = None
+        self.signal_refresh_timer = QtCore.QTimer(self)
+        self.signal_refresh_timer.setInterval(SIGNAL_VIEW_REFRESH_MS)
+        self.signal_refresh_timer.timeout.connect(self._refresh_signal_view)
+        self.signal_refresh_timer.start()
         # Signal values accessed via signal_service (legacy _signal_values removed)
         # currently monitored feedback signal during test run: (msg_id, signal_name) or None
         self._current_feedback = None
@@ -6890,6 +6861,127 @@ Data Points Used: {data_points}"""
         except Exception:
             pass
 
+    def _build_trace_capture_settings(self) -> QtWidgets.QGroupBox:
+        """Build the CAN trace capture settings group (continuous vs triggered capture)."""
+        group = QtWidgets.QGroupBox('CAN Trace Capture')
+        form = QtWidgets.QFormLayout(group)
+        
+        self.trace_mode_combo = QtWidgets.QComboBox()
+        self.trace_mode_combo.addItem('Continuous (log every frame)', 'continuous')
+        self.trace_mode_combo.addItem('Triggered (ring buffer around failures)', 'triggered')
+        self.trace_pre_trigger_spin = QtWidgets.QDoubleSpinBox()
+        self.trace_pre_trigger_spin.setRange(0.0, 60.0)
+        self.trace_pre_trigger_spin.setSuffix(' s')
+        self.trace_pre_trigger_spin.setValue(CAN_TRACE_PRE_TRIGGER_S)
+        self.trace_post_trigger_spin = QtWidgets.QDoubleSpinBox()
+        self.trace_post_trigger_spin.setRange(0.0, 60.0)
+        self.trace_post_trigger_spin.setSuffix(' s')
+        self.trace_post_trigger_spin.setValue(CAN_TRACE_POST_TRIGGER_S)
+        
+        # Restore last used settings
+        if self.config_manager:
+            try:
+                mode = self.config_manager.get_user_preference('can_trace/mode', 'continuous')
+                idx = self.trace_mode_combo.findData(mode)
+                if idx >= 0:
+                    self.trace_mode_combo.setCurrentIndex(idx)
+                self.trace_pre_trigger_spin.setValue(float(self.config_manager.get_user_preference(
+                    'can_trace/pre_trigger_s', CAN_TRACE_PRE_TRIGGER_S)))
+                self.trace_post_trigger_spin.setValue(float(self.config_manager.get_user_preference(
+                    'can_trace/post_trigger_s', CAN_TRACE_POST_TRIGGER_S)))
+            except Exception as e:
+                logger.debug(f"Failed to restore CAN trace settings: {e}")
+        
+        form.addRow('Mode:', self.trace_mode_combo)
+        form.addRow('Pre-trigger window:', self.trace_pre_trigger_spin)
+        form.addRow('Post-trigger window:', self.trace_post_trigger_spin)
+        
+        # Signal threshold trigger
+        sig_row = QtWidgets.QHBoxLayout()
+        self.trace_sig_can_id = QtWidgets.QLineEdit()
+        self.trace_sig_can_id.setPlaceholderText('CAN ID (hex/dec)')
+        self.trace_sig_name = QtWidgets.QLineEdit()
+        self.trace_sig_name.setPlaceholderText('Signal name')
+        self.trace_sig_threshold = QtWidgets.QLineEdit()
+        self.trace_sig_threshold.setPlaceholderText('Threshold')
+        self.trace_sig_edge = QtWidgets.QComboBox()
+        self.trace_sig_edge.addItems(['rising', 'falling', 'both'])
+        add_sig_btn = QtWidgets.QPushButton('Add')
+        add_sig_btn.clicked.connect(self._on_add_trace_signal_trigger)
+        clear_sig_btn = QtWidgets.QPushButton('Clear')
+        clear_sig_btn.clicked.connect(self._on_clear_trace_signal_triggers)
+        for w in (self.trace_sig_can_id, self.trace_sig_name, self.trace_sig_threshold,
+                  self.trace_sig_edge, add_sig_btn, clear_sig_btn):
+            sig_row.addWidget(w)
+        form.addRow('Signal trigger:', sig_row)
+        self.trace_sig_triggers_label = QtWidgets.QLabel('No signal triggers')
+        form.addRow('', self.trace_sig_triggers_label)
+        
+        manual_btn = QtWidgets.QPushButton('Trigger Capture Now')
+        manual_btn.setToolTip('Persist the trace window around this moment (triggered mode only)')
+        manual_btn.clicked.connect(lambda: self._trigger_trace_capture('Manual trigger'))
+        form.addRow(manual_btn)
+        
+        self.trace_mode_combo.currentIndexChanged.connect(self._apply_trace_capture_settings)
+        self.trace_pre_trigger_spin.valueChanged.connect(self._apply_trace_capture_settings)
+        self.trace_post_trigger_spin.valueChanged.connect(self._apply_trace_capture_settings)
+        self._apply_trace_capture_settings()
+        return group
+    
+    def _apply_trace_capture_settings(self, *_args) -> None:
+        """Push capture mode/window settings to the CAN trace logger and persist them."""
+        mode = self.trace_mode_combo.currentData()
+        pre_s = self.trace_pre_trigger_spin.value()
+        post_s = self.trace_post_trigger_spin.value()
+        if getattr(self, 'can_trace_logger', None) is not None:
+            try:
+                self.can_trace_logger.set_capture_mode(mode, pre_trigger_s=pre_s, post_trigger_s=post_s)
+            except ValueError as e:
+                logger.warning(f"Invalid CAN trace capture settings: {e}")
+                return
+        if self.config_manager:
+            self.config_manager.save_user_preference('can_trace/mode', mode)
+            self.config_manager.save_user_preference('can_trace/pre_trigger_s', pre_s)
+            self.config_manager.save_user_preference('can_trace/post_trigger_s', post_s)
+    
+    def _on_add_trace_signal_trigger(self) -> None:
+        """Register a signal threshold trigger from the settings inputs."""
+        if getattr(self, 'can_trace_logger', None) is None:
+            return
+        try:
+            can_id = self._parse_can_id(self.trace_sig_can_id.text())
+            if can_id is None:
+                raise ValueError('CAN ID is required')
+            name = self.trace_sig_name.text().strip()
+            if not name:
+                raise ValueError('Signal name is required')
+            threshold = float(self.trace_sig_threshold.text().strip())
+            edge = self.trace_sig_edge.currentText()
+            self.can_trace_logger.add_signal_trigger(can_id, name, threshold, edge)
+        except ValueError as e:
+            QtWidgets.QMessageBox.warning(self, 'Invalid Signal Trigger', str(e))
+            return
+        self._trace_signal_trigger_desc = getattr(self, '_trace_signal_trigger_desc', [])
+        self._trace_signal_trigger_desc.append(f"0x{can_id:X}:{name} {edge} {threshold:g}")
+        self.trace_sig_triggers_label.setText(', '.join(self._trace_signal_trigger_desc))
+    
+    def _on_clear_trace_signal_triggers(self) -> None:
+        """Remove all signal threshold triggers."""
+        if getattr(self, 'can_trace_logger', None) is not None:
+            self.can_trace_logger.clear_signal_triggers()
+        self._trace_signal_trigger_desc = []
+        self.trace_sig_triggers_label.setText('No signal triggers')
+    
+    def _trigger_trace_capture(self, reason: str) -> None:
+        """Fire a CAN trace capture trigger (no-op unless triggered capture is active)."""
+        if getattr(self, 'can_trace_logger', None) is None:
+            return
+        try:
+            if self.can_trace_logger.trigger(reason):
+                self.status_label.setText(f'Status: CAN trace captured ({reason})')
+        except Exception as e:
+            logger.debug(f"Error firing CAN trace trigger: {e}")
+
     # Welcome actions
     def _refresh_can_devices(self):
         """Refresh the list of available CAN adapter types in the device combo box.
@@ -6944,7 +7036,10 @@ Data Points Used: {data_points}"""
         self.toggle_adapter()
 
     def _refresh_oscilloscopes(self) -> None:
-        """Refresh the list of available oscilloscopes."""
+        """Refresh the list of available oscilloscopes.
+        
+        The scan runs in the background; the dropdown is updated when it completes.
+        """
         if self.oscilloscope_service is None:
             # Only show warning if dialog is open (widget exists)
             if hasattr(self, 'oscilloscope_combo') and self.oscilloscope_combo is not None:
@@ -6957,44 +7052,106 @@ Data Points Used: {data_points}"""
             return
         
         try:
-            # Clear and repopulate dropdown
             self.oscilloscope_combo.clear()
-            
-            # Scan for devices
-            devices = self.oscilloscope_service.scan_for_devices()
-            
-            if not devices:
-                self.oscilloscope_combo.addItem('No devices found')
-                self.oscilloscope_combo.setEnabled(False)
-                logger.info("No oscilloscopes found (USB or LAN)")
-            else:
-                for device in devices:
-                    # Try to get device info for display
-                    try:
-                        temp_resource = self.oscilloscope_service.resource_manager.open_resource(device)
-                        try:
-                            idn = temp_resource.query('*IDN?')
-                            # Format: "Manufacturer,Model,Serial,Version"
-                            parts = idn.split(',')
-                            if len(parts) >= 2:
-                                display_name = f"{parts[0].strip()} {parts[1].strip()}"
-                            else:
-                                display_name = idn.strip()
-                            self.oscilloscope_combo.addItem(f"{display_name} ({device})", device)
-                        except Exception:
-                            self.oscilloscope_combo.addItem(device, device)
-                        finally:
-                            temp_resource.close()
-                    except Exception:
-                        self.oscilloscope_combo.addItem(device, device)
-                
-                self.oscilloscope_combo.setEnabled(True)
-                logger.info(f"Found {len(devices)} oscilloscope(s)")
+            self.oscilloscope_combo.addItem('Scanning...')
+            self.oscilloscope_combo.setEnabled(False)
+            self.osc_refresh_btn.setEnabled(False)
+            future = self.oscilloscope_service.scan_async()
+            future.add_done_callback(
+                lambda f: self._on_oscilloscope_scan(None if f.exception() else f.result()))
         except Exception as e:
             logger.error(f"Error refreshing oscilloscopes: {e}", exc_info=True)
+            self.osc_refresh_btn.setEnabled(True)
             QtWidgets.QMessageBox.critical(self, 'Error', 
                 f'Failed to scan for oscilloscopes:\n{e}')
     
+    def _describe_oscilloscopes(self, devices: List[str]) -> List[Tuple[str, str]]:
+        """Build display names from the (cached) *IDN? of each device.
+        
+        Args:
+            devices: VISA resource strings
+            
+        Returns:
+            List of (display text, resource string) tuples
+        """
+        return [(self._oscilloscope_display_text(device, self.oscilloscope_service.identify(device)), device)
+                for device in devices]
+    
+    @staticmethod
+    def _oscilloscope_display_text(device: str, idn: Optional[str]) -> str:
+        """Return dropdown text for a resource ("Manufacturer Model (resource)")."""
+        if not idn:
+            return device
+        # Format: "Manufacturer,Model,Serial,Version"
+        parts = idn.split(',')
+        if len(parts) >= 2:
+            display_name = f"{parts[0].strip()} {parts[1].strip()}"
+        else:
+            display_name = idn.strip()
+        return f"{display_name} ({device})"
+    
+    def _populate_oscilloscope_combo(self, entries: List[Tuple[str, str]]) -> None:
+        """Fill the oscilloscope dropdown with (display text, resource) entries."""
+        # Clear and repopulate dropdown
+        self.oscilloscope_combo.clear()
+        if not entries:
+            self.oscilloscope_combo.addItem('No devices found')
+            self.oscilloscope_combo.setEnabled(False)
+            logger.info("No oscilloscopes found (USB or LAN)")
+        else:
+            for text, device in entries:
+                self.oscilloscope_combo.addItem(text, device)
+            self.oscilloscope_combo.setEnabled(True)
+            logger.info(f"Found {len(entries)} oscilloscope(s)")
+    
+    def _on_oscilloscope_service_ready(self, service) -> None:
+        """Offer known-good resources from the last session (called on a warm-up thread)."""
+        if service is None:
+            return
+        known = service.known_resources()
+        if known:
+            self._queue_oscilloscope_entries(
+                [(f"{self._oscilloscope_display_text(resource, idn)} - last session", resource)
+                 for resource, idn in known], final=False)
+    
+    def _on_oscilloscope_scan(self, devices: Optional[List[str]]) -> None:
+        """Handle an oscilloscope scan result (called on a background thread)."""
+        if self.oscilloscope_service is None:
+            return
+        entries = self._describe_oscilloscopes(devices) if devices else []
+        self._queue_oscilloscope_entries(entries, final=True)
+    
+    def _queue_oscilloscope_entries(self, entries: List[Tuple[str, str]], final: bool) -> None:
+        """Hand dropdown entries to the GUI thread."""
+        pending = self._pending_oscilloscope_entries
+        if not final and pending is not None and pending[1]:
+            return
+        try:
+            self._pending_oscilloscope_entries = (entries, final)
+            QtCore.QMetaObject.invokeMethod(self, '_apply_oscilloscope_entries',
+                                            QtCore.Qt.QueuedConnection)
+        except Exception as e:
+            # Window may already be closed
+            logger.debug(f"Oscilloscope scan result dropped: {e}")
+    
+    @QtCore.Slot()
+    def _apply_oscilloscope_entries(self) -> None:
+        """Show queued oscilloscope entries in the dropdown (GUI thread)."""
+        pending, self._pending_oscilloscope_entries = self._pending_oscilloscope_entries, None
+        if pending is None:
+            return
+        entries, final = pending
+        if not final and self._oscilloscope_scan_applied:
+            # A scan result is already shown
+            return
+        try:
+            self._populate_oscilloscope_combo(entries)
+            if final:
+                self._oscilloscope_scan_applied = True
+                self.osc_refresh_btn.setEnabled(True)
+        except Exception as e:
+            logger.warning(f"Failed to show oscilloscope scan result: {e}")
+    
     def _toggle_oscilloscope_connection(self) -> None:
         """Toggle oscilloscope connection/disconnection."""
         if self.oscilloscope_service is None:
@@ -8799,7 +8956,9 @@ Data Points Used: {data_points}"""
                 return
         
         # Legacy implementation (fallback) - should not be reached if services are available
-        if cantools is None:
+        try:
+            import cantools
+        except ImportError:
             QtWidgets.QMessageBox.warning(self, 'DBC Load', 'cantools not installed in this environment. Install cantools to enable DBC parsing.')
             return
         try:
@@ -16511,6 +16670,10 @@ Data Points Used: {data_points}"""
         timestamp = datetime.now().strftime('%H:%M:%S')
         self.test_log.appendPlainText(f'[{timestamp}] Result: {result}\n{info}')
         
+        if not success:
+            test_name = self._tests[test_index].get('name', '<unnamed>') if test_index < len(self._tests) else '<unknown>'
+            self._trigger_trace_capture(f'Test failed: {test_name}')
+        
         # Update Test Plan row
         try:
             if test_index < len(self._tests):
@@ -16742,6 +16905,9 @@ Data Points Used: {data_points}"""
         timestamp = datetime.now().strftime('%H:%M:%S')
         self.test_log.appendPlainText(f'[{timestamp}] Error: {error}')
         
+        test_name = self._tests[test_index].get('name', '<unnamed>') if test_index < len(self._tests) else '<unknown>'
+        self._trigger_trace_capture(f'Test error: {test_name}')
+        
         # Update Test Plan row
         try:
             if test_index < len(self._tests):
@@ -17209,18 +17375,36 @@ Data Points Used: {data_points}"""
         return self._toggle_adapter_with_service()
 
 
+    @staticmethod
+    def _format_msg_log_line(direction: str, frame) -> str:
+        """Format a frame as a message log line."""
+        ts = getattr(frame, 'timestamp', time.time()) or time.time()
+        can_id = getattr(frame, 'can_id', '')
+        data = getattr(frame, 'data', b'')
+        return f"{datetime.fromtimestamp(ts).isoformat()} {direction} ID=0x{can_id:X} LEN={len(data) if isinstance(data,(bytes,bytearray)) else ''} DATA={data.hex() if isinstance(data,(bytes,bytearray)) else str(data)}"
+
     def _append_msg_log(self, direction: str, frame):
+        self._append_msg_log_frames(direction, [frame])
+
+    def _append_msg_log_frames(self, direction: str, frames) -> None:
+        """Append frames to the message log with one insert, trim and auto-scroll."""
         try:
-            ts = getattr(frame, 'timestamp', time.time()) or time.time()
-            can_id = getattr(frame, 'can_id', '')
-            data = getattr(frame, 'data', b'')
-            txt = f"{datetime.fromtimestamp(ts).isoformat()} {direction} ID=0x{can_id:X} LEN={len(data) if isinstance(data,(bytes,bytearray)) else ''} DATA={data.hex() if isinstance(data,(bytes,bytearray)) else str(data)}"
+            lines = []
+            for frame in frames:
+                try:
+                    lines.append(self._format_msg_log_line(direction, frame))
+                except Exception:
+                    continue
+            if not lines:
+                return
+            lines = lines[-self._max_messages:]
             # append to bottom and auto-scroll
-            self.msg_log.addItem(txt)
+            self.msg_log.addItems(lines)
             try:
-                # limit stored messages
-                while self.msg_log.count() > self._max_messages:
-                    self.msg_log.takeItem(0)
+                # limit stored messages (one row removal for the whole batch)
+                excess = self.msg_log.count() - self._max_messages
+                if excess > 0:
+                    self.msg_log.model().removeRows(0, excess)
                 # auto-scroll to newest
                 self.msg_log.scrollToBottom()
             except Exception:
@@ -17248,18 +17432,32 @@ Data Points Used: {data_points}"""
             # Limit frames processed per poll to prevent UI blocking
             # Higher limit for better throughput while maintaining responsiveness
             MAX_FRAMES_PER_POLL = 100
+            batch = []
             
             # Process frames in batch, but limit to prevent UI freeze
             while not self.can_service.frame_queue.empty() and frames_processed < MAX_FRAMES_PER_POLL:
                 try:
                     f = self.can_service.frame_queue.get_nowait()
-                    self._add_frame_row(f)  # Process each frame - CRITICAL: must be inside loop
+                    self._process_rx_frame(f)  # Process each frame - CRITICAL: must be inside loop
+                    batch.append(f)
                     frames_processed += 1
                 except Exception as frame_error:
                     logger.debug(f"Error processing frame in poll: {frame_error}")
                     # Continue with next frame even if one fails
                     continue
             
+            # One model insert, message log append and auto-scroll per poll tick
+            if batch:
+                try:
+                    self.frame_model.append_frames(batch)
+                    self._append_msg_log_frames('RX', batch)
+                    # Per-ID stats are only accumulated here; the fixed view refreshes on its own timer
+                    self.can_id_model.record_frames(batch)
+                    if self.frame_view_stack.currentWidget() is self.frame_table:
+                        self.frame_table.scrollToBottom()
+                except Exception as e:
+                    logger.debug(f"Error updating frame table: {e}")
+            
             # Log if we hit the rate limit (indicates high traffic)
             if frames_processed >= MAX_FRAMES_PER_POLL:
                 remaining = self.can_service.frame_queue.qsize()
@@ -17273,8 +17471,33 @@ Data Points Used: {data_points}"""
         except Exception as e:
             logger.error(f"Error polling frames: {e}", exc_info=True)
 
-    def _add_frame_row(self, frame):
-        """Add a received CAN frame to the frame table and process it.
+    def _on_frame_view_mode_changed(self, index: int) -> None:
+        """Switch the Live Data view between the scrolling and fixed per-ID tables."""
+        fixed = index == 1
+        self.frame_view_stack.setCurrentWidget(self.can_id_table if fixed else self.frame_table)
+        if fixed:
+            self.can_id_model.refresh()
+            self.can_id_refresh_timer.start()
+        else:
+            self.can_id_refresh_timer.stop()
+            self.frame_table.scrollToBottom()
+
+    def _refresh_signal_view(self) -> None:
+        """Push coalesced Signal View, monitor and feedback value changes to the UI."""
+        try:
+            self.signal_model.refresh()
+            self.monitor_subscriptions.flush()
+            value = self._pending_feedback_value
+            if value is not None:
+                self._pending_feedback_value = None
+                self._update_signal_with_status('feedback_signal', value)
+        except Exception as e:
+            logger.debug(f"Error refreshing signal view: {e}")
+
+    def _process_rx_frame(self, frame):
+        """Process a received CAN frame (trace log, signal decode).
+        
+        The frame table and message log are updated in batches by _poll_frames.
         
         Args:
             frame: CAN frame object with attributes: can_id, data, timestamp
@@ -17286,30 +17509,6 @@ Data Points Used: {data_points}"""
             except Exception as e:
                 logger.debug(f"Error logging RX frame to trace: {e}")
         
-        r = self.frame_table.rowCount()
-        self.frame_table.insertRow(r)
-        ts = getattr(frame, 'timestamp', '')
-        can_id = getattr(frame, 'can_id', '')
-        data = getattr(frame, 'data', b'')
-        self.frame_table.setItem(r, 0, QtWidgets.QTableWidgetItem(str(ts)))
-        self.frame_table.setItem(r, 1, QtWidgets.QTableWidgetItem(str(can_id)))
-        self.frame_table.setItem(r, 2, QtWidgets.QTableWidgetItem(str(len(data) if isinstance(data, (bytes, bytearray)) else '')))
-        self.frame_table.setItem(r, 3, QtWidgets.QTableWidgetItem(data.hex() if isinstance(data, (bytes, bytearray)) else str(data)))
-        # also append to message log
-        try:
-            self._append_msg_log('RX', frame)
-        except Exception as e:
-            logger.debug(f"Error appending to message log: {e}")
-        # limit number of rows to latest N
-        try:
-            while self.frame_table.rowCount() > self._max_frames:
-                self.frame_table.removeRow(0)
-            # scroll to bottom
-            item = self.frame_table.item(self.frame_table.rowCount()-1, 0)
-            if item is not None:
-                self.frame_table.scrollToItem(item, QtWidgets.QAbstractItemView.PositionAtBottom)
-        except Exception as e:
-            logger.debug(f"Error managing frame table rows: {e}")
         # Also attempt to decode signals from DBC and show in Signal View
         try:
             self._decode_and_add_signals(frame)
@@ -17317,11 +17516,12 @@ Data Points Used: {data_points}"""
             logger.error(f"Error decoding signals from frame: {e}", exc_info=True)
 
     def _decode_and_add_signals(self, frame):
-        """Decode a received CAN frame using loaded DBC and append each signal to Signal View.
+        """Decode a received CAN frame using loaded DBC and update the Signal View model.
         
         This method decodes the frame's data bytes using the DBC database to extract
-        individual signal values. Each decoded signal is added to the signal table
-        and cached in _signal_values for quick lookup during test execution.
+        individual signal values. Decoded values are stored in signal_model (latest
+        value + dirty set) and shown on the next display refresh; SignalService caches
+        them for quick lookup during test execution.
         
         Args:
             frame: CAN frame object with can_id and data attributes
@@ -17374,53 +17574,26 @@ Data Points Used: {data_points}"""
                     
                     # Only proceed if we got signal values
                     if signal_values:
-                        # Update UI table (legacy table handling)
-                        for sig_val in signal_values:
-                            key = sig_val.key
-                            fid = sig_val.message_id
-                            sig_name = sig_val.signal_name
-                            val = sig_val.value  # SignalService already applies gain factors (e.g., ADC_A3_GAIN_FACTOR)
-                            ts = sig_val.timestamp or time.time()
-                            
-                            if key in self._signal_rows:
-                                row = self._signal_rows[key]
-                                try:
-                                    self.signal_table.setItem(row, 0, QtWidgets.QTableWidgetItem(datetime.fromtimestamp(ts).isoformat()))
-                                except Exception:
-                                    self.signal_table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(ts)))
-                                self.signal_table.setItem(row, 4, QtWidgets.QTableWidgetItem(str(val)))
-                                # Signal values stored in signal_service (legacy cache removed)
-                            else:
-                                r = self.signal_table.rowCount()
-                                self.signal_table.insertRow(r)
-                                try:
-                                    self.signal_table.setItem(r, 0, QtWidgets.QTableWidgetItem(datetime.fromtimestamp(ts).isoformat()))
-                                except Exception:
-                                    self.signal_table.setItem(r, 0, QtWidgets.QTableWidgetItem(str(ts)))
-                                self.signal_table.setItem(r, 1, QtWidgets.QTableWidgetItem(str(sig_val.message_name or '')))
-                                self.signal_table.setItem(r, 2, QtWidgets.QTableWidgetItem(str(fid)))
-                                self.signal_table.setItem(r, 3, QtWidgets.QTableWidgetItem(str(sig_name)))
-                                self.signal_table.setItem(r, 4, QtWidgets.QTableWidgetItem(str(val)))
-                                self._signal_rows[key] = r
-                                # Signal values stored in signal_service
-                            
-                            # Update feedback label if this is the current monitored signal
+                        trace_logger = getattr(self, 'can_trace_logger', None)
+                        if trace_logger is not None and trace_logger.has_signal_triggers():
+                            for sig_val in signal_values:
+                                trace_logger.check_signal(sig_val.message_id, sig_val.signal_name, sig_val.value)
+                        # Store latest values; the view is refreshed by signal_refresh_timer
+                        self.signal_model.update_signals(signal_values, default_ts=time.time())
+                        self.monitor_subscriptions.offer(signal_values)
+                        
+                        # Remember the monitored feedback value (applied on next display refresh)
+                        cur = self._current_feedback
+                        if cur and cur[1] and cur[0] is not None:
                             try:
-                                cur = getattr(self, '_current_feedback', None)
-                                if cur and cur[1] and str(cur[1]) == str(sig_name):
-                                    try:
-                                        cur_id = int(cur[0]) if cur[0] is not None else None
-                                        this_id = int(fid)
-                                        if cur_id is not None and this_id is not None and cur_id == this_id:
-                                            try:
-                                                # Use the gain-adjusted value for feedback label
-                                                self._update_signal_with_status('feedback_signal', val)
-                                            except Exception:
-                                                pass
-                                    except Exception:
-                                        pass
-                            except Exception:
-                                pass
+                                fb_key = f"{int(cur[0])}:{cur[1]}"
+                            except (TypeError, ValueError):
+                                fb_key = None
+                            if fb_key is not None:
+                                for sig_val in signal_values:
+                                    if sig_val.key == fb_key:
+                                        # Use the gain-adjusted value for feedback label
+                                        self._pending_feedback_value = sig_val.value
                         return  # Successfully decoded via service
                 except Exception as e:
                     logger.debug(f"SignalService decode failed: {e}", exc_info=True)
@@ -49,6 +49,24 @@ DATA_COLLECTION_PERIOD_MS = 500
 MAX_MESSAGES_DEFAULT = 50
 MAX_FRAMES_DEFAULT = 50
 
+# Fixed "last value per CAN ID" view
+# Multiplexed messages get one row per MessageType value (byte 1 of the payload)
+CAN_ID_VIEW_REFRESH_MS = 100  # Capped refresh rate of the per-ID view (10 Hz)
+CAN_MUX_BYTE_INDEX = 1
+# Signal View display refresh: decoded values are coalesced and shown at ~15 Hz
+SIGNAL_VIEW_REFRESH_MS = 66
+# Live plot frame rate: points from the test thread are drained and drawn at ~30 fps
+PLOT_REFRESH_MS = 33
+
+# CAN trace triggered capture (seconds / frames)
+# In triggered mode the trace logger keeps the last CAN_TRACE_PRE_TRIGGER_S seconds
+# of traffic in memory and only persists a window around each trigger
+CAN_TRACE_PRE_TRIGGER_S = 5.0
+CAN_TRACE_POST_TRIGGER_S = 2.0
+# The ring is pruned by timestamp; as a memory guard it holds at most
+# (pre + post + flush interval) seconds at this frame rate (frames beyond it are counted as dropped)
+CAN_TRACE_MAX_FRAME_RATE = 20000
+
 # Message Type values from DBC (Command message CAN ID 272)
 MSG_TYPE_SET_RELAY = 16
 MSG_TYPE_SET_MUX = 17
@@ -66,6 +84,8 @@ MSG_TYPE_ANALOG_VALUES4 = 104
 CAN_ID_COMMAND = 0x110  # 272
 CAN_ID_IPC_STATUS = 0xFA  # 250
 CAN_ID_EOL_STATUS = 0x100  # 256
+# Messages multiplexed on the MessageType byte (shown per mux value in the per-ID view)
+CAN_MUXED_IDS = frozenset({CAN_ID_COMMAND, CAN_ID_IPC_STATUS, CAN_ID_EOL_STATUS})
 
 # Default CAN settings
 CAN_BITRATE_DEFAULT = 500  # kbps
@@ -89,6 +109,40 @@ DWELL_TIME_MAX_MS = 60000  # Maximum dwell time in milliseconds (60 seconds)
 # Plot settings
 PLOT_GRID_ALPHA = 0.3  # Grid transparency for matplotlib plots
 
+# Oscilloscope discovery
+OSC_PROBE_TIMEOUT_LAN_MS = 5000  # *IDN? timeout per LAN (TCPIP) probe
+OSC_PROBE_TIMEOUT_USB_MS = 2000  # *IDN? timeout per USB (USBTMC) probe
+OSC_SCAN_MAX_WORKERS = 8  # Resources probed in parallel
+OSC_IDN_CACHE_TTL_S = 600.0  # Identification results reused for this long without re-probing
+OSC_KNOWN_RESOURCES_FILE = 'oscilloscope_resources.json'  # Known-good resources (in the data dir)
+OSC_SIMULATOR_RESOURCE = 'SIM::SDS1104X-U::INSTR'  # Resources starting with 'SIM' open the built-in simulator
+
+# Oscilloscope session (ScopeSession)
+OSC_QUERY_TIMEOUT_LAN_MS = 3000  # VISA timeout for commands and queries over LAN (transfers: OSC_WAVEFORM_TIMEOUT_MS)
+OSC_QUERY_TIMEOUT_USB_MS = 2000  # VISA timeout for commands and queries over USB
+OSC_KEEPALIVE_S = 5.0  # Probe an idle connection with *OPC? after this long
+OSC_RECONNECT_BACKOFF_S = 0.5  # Delay before retrying a failed reconnect (doubles per failure)
+OSC_RECONNECT_BACKOFF_MAX_S = 30.0  # Longest delay between reconnect attempts
+
+# Oscilloscope SCPI command batching
+SCPI_BATCH_MAX_BYTES = 512  # Longest ';'-joined program message sent in one transfer
+
+# Oscilloscope waveform transfer
+OSC_BLOCK_CHUNK_BYTES = 1024 * 1024  # Maximum bytes per bus read of a binary block
+OSC_WAVEFORM_TIMEOUT_MS = 10000  # VISA timeout while a waveform is transferred
+OSC_WAVEFORM_MAX_POINTS = 0  # Points transferred per analysed waveform (0 = all; longer records are sparsed)
+OSC_FILTER_DECIMATE = False  # Average long captures down to 20x the filter cutoff before filtering (True = faster, averages differ slightly)
+
+# Oscilloscope sequence (segmented memory) acquisition
+OSC_SEQUENCE_MODE = False  # Phase current test default: capture all Iq_ref steps as segments of one acquisition
+OSC_SEQUENCE_TIMEOUT_S = 5.0  # Wait for the scope to finish the last segment after the last step
+OSC_STATUS_POLL_S = 0.02  # Interval between acquisition status polls (TRMD?)
+OSC_MEASUREMENT_TIMEOUT_S = 2.0  # Wait for the acquisition to stop before PAVA measurements
+
+# Analysis worker processes (AnalysisExecutor)
+ANALYSIS_MAX_WORKERS = 2  # Worker processes (one per oscilloscope channel analysed in parallel)
+ANALYSIS_SHARED_MIN_BYTES = 64 * 1024  # Job arguments at least this large are passed via shared memory
+
 # Signal processing gain factors
 ADC_A3_GAIN_FACTOR = 1.998  # Gain factor to apply to ADC_A3_mV signal for display in Signal View
 
@@ -48,6 +48,7 @@ Dependencies:
 - pyvisa: Oscilloscope communication (optional, for oscilloscope tests)
 """
 import sys
+import contextlib
 import json
 import time
 import os
@@ -60,6 +61,15 @@ from datetime import datetime
 from typing import Optional, Tuple, Dict, Any, List, Union, Callable
 from html import escape
 
+# Ensure repo root on sys.path FIRST so imports work correctly
+repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+# Start timing imports before any heavy module is loaded (--profile-startup)
+from host_gui.startup import StartupProfiler, start_warm_up
+_startup_profiler = StartupProfiler.from_argv(sys.argv)
+
 from PySide6 import QtCore, QtGui, QtWidgets
 try:
     import matplotlib
@@ -74,33 +84,16 @@ try:
             raise ImportError("Matplotlib Qt backend not available")
     from matplotlib.figure import Figure
     matplotlib_available = True
-    # Import and configure seaborn for enhanced plot styling
-    try:
-        import seaborn as sns
-        # Set seaborn style for all matplotlib plots
-        sns.set_style("whitegrid")
-        sns.set_palette("husl")
-        seaborn_available = True
-    except ImportError:
-        seaborn_available = False
+    # Seaborn "whitegrid"/"husl" look without importing seaborn (slow to import)
+    from host_gui.utils.plot_style import apply_plot_style
+    apply_plot_style()
 except Exception:
     matplotlib = None
     FigureCanvasQTAgg = None
     Figure = None
     matplotlib_available = False
-    seaborn_available = False
-try:
-    import cantools
-except Exception:
-    cantools = None
-
 import logging
 
-# Ensure repo root on sys.path FIRST so imports work correctly
-repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-if repo_root not in sys.path:
-    sys.path.insert(0, repo_root)
-
 # Configure logging early - this is the single place for logging configuration
 # Import config module to use centralized logging configuration
 try:
@@ -261,21 +254,10 @@ except ImportError:
     REGEX_NUMBER_SIMPLE = re.compile(r'([\d.]+)')
     REGEX_TRA = re.compile(r'TRA\s+(\w+)', re.IGNORECASE)
 
-# Import numpy for optimized array operations (optional)
-try:
-    import numpy as np
-    numpy_available = True
-except ImportError:
-    numpy = None
-    numpy_available = False
-
-# Import scipy for signal filtering (optional)
-try:
-    from scipy import signal
-    scipy_available = True
-except ImportError:
-    signal = None
-    scipy_available = False
+# numpy and scipy are imported on first use (host_gui.utils.signal_processing)
+import importlib.util
+numpy_available = importlib.util.find_spec('numpy') is not None
+scipy_available = importlib.util.find_spec('scipy') is not None
 
 
 # Utility functions moved to host_gui/utils/ - imported at top of file
@@ -287,18 +269,49 @@ except ImportError:
 
 from host_gui.test_runner import TestRunner
 from host_gui.base_gui import BaseGUI
+
+
+def _profile_stage(name: str):
+    """Return a timing context for a startup stage (no-op without --profile-startup)."""
+    if _startup_profiler is not None:
+        return _startup_profiler.stage(name)
+    return contextlib.nullcontext()
+
+
+def _on_window_shown() -> None:
+    """Run once the event loop is up and the main window is shown.
+
+    Heavy modules that are only needed later are imported in the background
+    from here, so they never delay the first paint.
+    """
+    profiler = _startup_profiler
+    if profiler is None:
+        start_warm_up()
+        return
+    profiler.uninstall()
+    elapsed = profiler.mark_interactive()
+    logger.info(f"Main window interactive after {elapsed * 1000:.0f} ms")
+    start_warm_up(profiler=profiler, on_done=lambda: logger.info(profiler.report()))
+
+
 def main():
     """Main entry point for the EOL Host GUI application.
     
     Initializes the Qt application, creates and shows the main window,
     then enters the Qt event loop. The application will run until
     the user closes the window or calls QApplication.quit().
+    Heavy optional modules are warmed up in the background once the window
+    is shown; run with --profile-startup to log import and initialisation times.
     """
     logger.info(f"Starting host GUI (cwd={os.getcwd()}, python={sys.executable})")
     # create QApplication and show main window
-    app = QtWidgets.QApplication(sys.argv)
-    win = BaseGUI()
-    win.showMaximized()
+    with _profile_stage('QApplication'):
+        app = QtWidgets.QApplication(sys.argv)
+    with _profile_stage('BaseGUI construction'):
+        win = BaseGUI()
+    with _profile_stage('show main window'):
+        win.showMaximized()
+    QtCore.QTimer.singleShot(0, _on_window_shown)
     logger.info('GUI shown maximized; entering Qt event loop')
     sys.exit(app.exec())
 
@@ -309,9 +322,15 @@ if __name__ == '__main__':
         logger.info('[host_gui] Running headless startup test')
         try:
             # create a temporary QApplication so QWidget construction succeeds without entering event loop
-            app = QtWidgets.QApplication([])
-            _ = BaseGUI()
+            with _profile_stage('QApplication'):
+                app = QtWidgets.QApplication([])
+            with _profile_stage('BaseGUI construction'):
+                _ = BaseGUI()
             logger.info('[host_gui] Headless startup OK')
+            if _startup_profiler is not None:
+                _startup_profiler.uninstall()
+                _startup_profiler.mark_interactive()
+                logger.info(_startup_profiler.report())
             # clean up
             try:
                 app.quit()
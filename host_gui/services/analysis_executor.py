@@ -0,0 +1,281 @@
+"""
+Shared executor for CPU-heavy post-processing (waveform and series analysis).
+
+Decoding, filtering and steady-state analysis of multi-megabyte oscilloscope
+records hold the GIL for a long time; on the test execution thread they
+compete with the Qt GUI thread and CAN decoding. AnalysisExecutor runs such
+jobs in a pool of worker processes and returns concurrent.futures.Future
+objects, so a test can retrieve the next waveform or actuate the next step
+while earlier data is analysed, and wait for the results when it needs them.
+
+Large inputs (bytes-like records, NumPy arrays) are not pickled through the
+pool's pipe: submit_shared() copies them once into a
+multiprocessing.shared_memory block, the worker maps the block and works on
+it in place, and the block is released when the job's future completes.
+
+Job functions must be module-level functions (picklable by reference) and
+should return small results (numbers, dicts); they must not return views of
+their shared inputs. If worker processes cannot be started, jobs run on a
+thread pool instead (same API, no shared-memory copies).
+
+Usage::
+
+    executor = get_shared_executor()
+    future = executor.submit_shared(analyze_waveform_steady_state, record, vertical_gain=2.0)
+    ...  # acquire the next waveform
+    result = future.result()
+"""
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+from host_gui.constants import ANALYSIS_MAX_WORKERS, ANALYSIS_SHARED_MIN_BYTES
+
+logger = logging.getLogger(__name__)
+
+# Check for optional dependencies
+try:
+    import numpy as np
+    numpy_available = True
+except ImportError:
+    np = None
+    numpy_available = False
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover - platforms without POSIX/Windows shared memory
+    shared_memory = None
+
+
+class SharedBuffer:
+    """Picklable reference to an argument placed in shared memory.
+
+    Attributes:
+        name: Shared memory block name
+        nbytes: Size of the data in bytes
+        dtype: NumPy dtype string for arrays, None for raw bytes
+        shape: Array shape (arrays only)
+    """
+
+    __slots__ = ('name', 'nbytes', 'dtype', 'shape')
+
+    def __init__(self, name: str, nbytes: int, dtype: Optional[str] = None, shape: Tuple[int, ...] = ()):
+        self.name = name
+        self.nbytes = nbytes
+        self.dtype = dtype
+        self.shape = shape
+
+    def __getstate__(self):
+        return (self.name, self.nbytes, self.dtype, self.shape)
+
+    def __setstate__(self, state):
+        self.name, self.nbytes, self.dtype, self.shape = state
+
+    def __repr__(self) -> str:
+        return f"SharedBuffer({self.name!r}, nbytes={self.nbytes}, dtype={self.dtype!r}, shape={self.shape})"
+
+
+def _attach(name: str) -> 'shared_memory.SharedMemory':
+    """Map an existing shared memory block without taking ownership of it."""
+    try:
+        # Python 3.13+: do not register the block with this process's resource tracker
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _share(value: Any) -> Optional[Tuple['shared_memory.SharedMemory', SharedBuffer]]:
+    """Copy a large bytes-like object or array into a new shared memory block.
+
+    Returns:
+        (block, reference), or None if the value is small or not shareable
+    """
+    if numpy_available and isinstance(value, np.ndarray):
+        if value.nbytes < ANALYSIS_SHARED_MIN_BYTES or value.dtype.hasobject:
+            return None
+        block = shared_memory.SharedMemory(create=True, size=max(value.nbytes, 1))
+        target = np.ndarray(value.shape, dtype=value.dtype, buffer=block.buf)
+        target[...] = value
+        del target
+        return block, SharedBuffer(block.name, value.nbytes, value.dtype.str, value.shape)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        view = memoryview(value).cast('B')
+        if view.nbytes < ANALYSIS_SHARED_MIN_BYTES:
+            return None
+        block = shared_memory.SharedMemory(create=True, size=view.nbytes)
+        block.buf[:view.nbytes] = view
+        return block, SharedBuffer(block.name, view.nbytes)
+    return None
+
+
+def _run_shared(fn: Callable, args: tuple, kwargs: dict) -> Any:
+    """Worker side of submit_shared(): map shared arguments and call fn."""
+    blocks = []
+
+    def resolve(value):
+        if not isinstance(value, SharedBuffer):
+            return value
+        block = _attach(value.name)
+        blocks.append(block)
+        if value.dtype is None:
+            return block.buf[:value.nbytes]
+        return np.ndarray(value.shape, dtype=np.dtype(value.dtype), buffer=block.buf)
+
+    try:
+        call_args = [resolve(arg) for arg in args]
+        call_kwargs = {key: resolve(value) for key, value in kwargs.items()}
+        result = fn(*call_args, **call_kwargs)
+        del call_args, call_kwargs
+        return result
+    finally:
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                # A view of the block is still referenced (e.g. returned); the
+                # mapping is released when the worker's references go away
+                logger.debug(f"Shared block {block.name} still referenced after job")
+
+
+class AnalysisExecutor:
+    """Process pool for analysis jobs, with shared-memory inputs.
+
+    The pool is started on first use (or by start()). Submitting never blocks
+    the caller; results and exceptions are delivered through futures.
+
+    Attributes:
+        max_workers: Number of worker processes
+        uses_processes: True once a process pool is running (False: thread fallback)
+    """
+
+    def __init__(self, max_workers: int = ANALYSIS_MAX_WORKERS, use_processes: bool = True):
+        """Initialize the executor (no workers are started yet).
+
+        Args:
+            max_workers: Number of worker processes (or threads in the fallback)
+            use_processes: False to always use threads (e.g. in tests or frozen builds)
+        """
+        self.max_workers = max(int(max_workers), 1)
+        self.use_processes = use_processes and shared_memory is not None
+        self.uses_processes = False
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> 'AnalysisExecutor':
+        """Start the worker pool now (otherwise it starts on the first submit)."""
+        self._get_pool()
+        return self
+
+    def _get_pool(self) -> Executor:
+        with self._lock:
+            if self._pool is not None:
+                return self._pool
+            if self.use_processes:
+                try:
+                    # 'spawn': workers must not inherit the GUI process's Qt and VISA threads
+                    context = multiprocessing.get_context('spawn')
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+                    self.uses_processes = True
+                    logger.info(f"AnalysisExecutor started {self.max_workers} worker process(es)")
+                    return self._pool
+                except Exception as e:
+                    logger.warning(f"Analysis worker processes unavailable ({e}), using threads")
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='Analysis')
+            self.uses_processes = False
+            return self._pool
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Run fn(*args, **kwargs) in a worker (arguments are pickled).
+
+        Args:
+            fn: Module-level function
+            *args, **kwargs: Its arguments
+
+        Returns:
+            Future with the result
+        """
+        return self._get_pool().submit(fn, *args, **kwargs)
+
+    def submit_shared(self, fn: Callable, *args, **kwargs) -> Future:
+        """Run fn in a worker, passing large bytes-like and array arguments via shared memory.
+
+        Bytes-like arguments arrive as memoryviews and arrays as ndarrays
+        backed by the shared block (both read-write, not copied again).
+        The blocks are released when the returned future completes.
+
+        Args:
+            fn: Module-level function
+            *args, **kwargs: Its arguments
+
+        Returns:
+            Future with the result
+        """
+        pool = self._get_pool()
+        if not self.uses_processes:
+            return pool.submit(fn, *args, **kwargs)
+        blocks = []
+
+        def share(value):
+            shared = _share(value)
+            if shared is None:
+                return value
+            blocks.append(shared[0])
+            return shared[1]
+
+        try:
+            shared_args = tuple(share(arg) for arg in args)
+            shared_kwargs = {key: share(value) for key, value in kwargs.items()}
+            future = pool.submit(_run_shared, fn, shared_args, shared_kwargs)
+        except Exception:
+            self._release(blocks)
+            raise
+        if blocks:
+            logger.debug(f"Submitted {getattr(fn, '__name__', fn)} with "
+                         f"{sum(block.size for block in blocks):,} bytes in shared memory")
+        future.add_done_callback(lambda _future: self._release(blocks))
+        return future
+
+    @staticmethod
+    def _release(blocks: List['shared_memory.SharedMemory']) -> None:
+        for block in blocks:
+            try:
+                block.close()
+                block.unlink()
+            except Exception as e:
+                logger.debug(f"Failed to release shared block {block.name}: {e}")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers (pending jobs are cancelled unless wait is True)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+            logger.info("AnalysisExecutor shut down")
+
+    def cleanup(self) -> None:
+        """Clean up resources. Call this when shutting down."""
+        self.shutdown(wait=False)
+
+
+_shared_executor: Optional[AnalysisExecutor] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_executor() -> AnalysisExecutor:
+    """Return the application-wide AnalysisExecutor (created on first call)."""
+    global _shared_executor
+    with _shared_lock:
+        if _shared_executor is None:
+            _shared_executor = AnalysisExecutor()
+        return _shared_executor
+
+
+def shutdown_shared_executor() -> None:
+    """Shut down the application-wide executor, if it was created."""
+    global _shared_executor
+    with _shared_lock:
+        executor, _shared_executor = _shared_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
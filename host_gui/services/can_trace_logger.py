@@ -4,18 +4,37 @@ CAN Trace Logger Service for logging CAN frames during test execution.
 This module provides a thread-safe CAN trace logger that captures all CAN frames
 (RX and TX) and writes them to a trace file. The logger includes periodic flushing
 to prevent data loss in case of GUI crashes.
+
+Two capture modes are supported:
+- continuous: every frame is written to the trace file (default)
+- triggered: frames are kept in an in-memory ring buffer and only a window
+  around each trigger (test failure, signal threshold crossing or manual
+  trigger) is persisted. Passing DUTs produce no trace file at all.
+  The ring is pruned by timestamp (pre-trigger history plus any open trigger
+  window); its frame cap only guards memory and evictions are counted as
+  dropped frames.
 """
+import math
 import os
 import threading
 import time
+from collections import deque
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List, Dict, Tuple
 from queue import Queue, Empty
 from backend.adapters.interface import Frame
 import logging
 
+from host_gui.constants import (
+    CAN_TRACE_PRE_TRIGGER_S, CAN_TRACE_POST_TRIGGER_S, CAN_TRACE_MAX_FRAME_RATE
+)
+
 logger = logging.getLogger(__name__)
 
+CAPTURE_MODE_CONTINUOUS = 'continuous'
+CAPTURE_MODE_TRIGGERED = 'triggered'
+CAPTURE_MODES = (CAPTURE_MODE_CONTINUOUS, CAPTURE_MODE_TRIGGERED)
+
 
 class CanTraceLogger:
     """Thread-safe CAN trace logger with periodic file flushing.
@@ -30,6 +49,7 @@ class CanTraceLogger:
     - Non-blocking frame logging (drops frames if queue is full)
     - Human-readable ASCII format
     - Automatic file naming with DUT UID, date, and time
+    - Optional triggered capture mode (pre/post-trigger ring buffer)
     """
     
     def __init__(self, log_dir: Optional[str] = None):
@@ -53,6 +73,8 @@ class CanTraceLogger:
         self._frame_queue = Queue(maxsize=10000)  # Thread-safe queue for frames (limit to prevent memory issues)
         # Use RLock to allow nested acquisitions (e.g., stop -> flush -> stats update)
         self._lock = threading.RLock()
+        # Serializes trigger window writes (file I/O is done outside self._lock)
+        self._write_lock = threading.Lock()
         
         # Flush thread
         self._flush_thread = None
@@ -62,6 +84,54 @@ class CanTraceLogger:
         # Statistics
         self._frames_logged = 0
         self._frames_dropped = 0
+        
+        # Triggered capture state
+        self._capture_mode = CAPTURE_MODE_CONTINUOUS
+        self._next_capture_mode = CAPTURE_MODE_CONTINUOUS
+        self._pre_trigger_s = CAN_TRACE_PRE_TRIGGER_S
+        self._post_trigger_s = CAN_TRACE_POST_TRIGGER_S
+        self._ring: deque = deque()
+        self._ring_max_frames = 0
+        self._ring_full_warned = False
+        self._session_header: List[str] = []
+        self._pending_trigger: Optional[Dict] = None
+        self._last_persisted_time = 0.0
+        self._trigger_count = 0
+        # Signal threshold triggers: (can_id, signal_name) -> list of [threshold, edge, last_value]
+        self._signal_triggers: Dict[Tuple[int, str], List[list]] = {}
+    
+    def set_capture_mode(self, mode: str, pre_trigger_s: Optional[float] = None,
+                         post_trigger_s: Optional[float] = None) -> None:
+        """Select continuous or triggered capture for the next logging session.
+        
+        Args:
+            mode: 'continuous' or 'triggered'
+            pre_trigger_s: Seconds of traffic before a trigger to persist (triggered mode)
+            post_trigger_s: Seconds of traffic after a trigger to persist (triggered mode)
+            
+        Raises:
+            ValueError: If mode or window lengths are invalid
+        """
+        if mode not in CAPTURE_MODES:
+            raise ValueError(f"Invalid capture mode: {mode} (expected one of {CAPTURE_MODES})")
+        if pre_trigger_s is not None and pre_trigger_s < 0:
+            raise ValueError(f"Pre-trigger window must be >= 0, got {pre_trigger_s}")
+        if post_trigger_s is not None and post_trigger_s < 0:
+            raise ValueError(f"Post-trigger window must be >= 0, got {post_trigger_s}")
+        
+        with self._lock:
+            if self._is_logging and mode != self._capture_mode:
+                logger.info(f"CAN trace capture mode change to '{mode}' takes effect on next session")
+            self._next_capture_mode = mode
+            if pre_trigger_s is not None:
+                self._pre_trigger_s = float(pre_trigger_s)
+            if post_trigger_s is not None:
+                self._post_trigger_s = float(post_trigger_s)
+    
+    def get_capture_mode(self) -> str:
+        """Get the capture mode of the active session (or of the next one when idle)."""
+        with self._lock:
+            return self._capture_mode if self._is_logging else self._next_capture_mode
     
     def start_logging(self, dut_uid: Optional[str] = None, test_name: Optional[str] = None) -> str:
         """Start logging CAN frames to a new trace file.
@@ -105,6 +175,10 @@ class CanTraceLogger:
             filename = f"{safe_uid}_{date_str}_{time_str}.log"
             self._log_file_path = os.path.join(self.log_dir, filename)
             
+            self._capture_mode = self._next_capture_mode
+            if self._capture_mode == CAPTURE_MODE_TRIGGERED:
+                return self._start_triggered_session(timestamp, dut_uid, test_name)
+            
             try:
                 # Open file in append mode (safer for crashes)
                 self._log_file = open(self._log_file_path, 'a', encoding='utf-8')
@@ -150,7 +224,8 @@ class CanTraceLogger:
         It processes frames in batches with time limits to ensure responsiveness.
         
         Returns:
-            Path to the log file, or None if not logging
+            Path to the log file, or None if not logging (or, in triggered
+            mode, if no trigger fired and nothing was written)
         """
         with self._lock:
             if not self._is_logging:
@@ -166,6 +241,9 @@ class CanTraceLogger:
             if flush_thread.is_alive():
                 logger.warning("Flush thread did not stop within timeout, continuing anyway")
         
+        if self._capture_mode == CAPTURE_MODE_TRIGGERED:
+            return self._stop_triggered_session()
+        
         # Flush any remaining frames in batches with time limit (outside lock)
         max_flush_time = 0.5  # Maximum time to spend flushing (500ms)
         start_time = time.time()
@@ -231,15 +309,8 @@ class CanTraceLogger:
         
         # Write frames to file
         try:
-            lines = []
-            for frame, direction, log_time in frames_to_write:
-                # Format: timestamp can_id direction data_hex
-                timestamp_str = datetime.fromtimestamp(log_time).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-                can_id_hex = f"0x{frame.can_id:03X}"
-                data_hex = ' '.join(f"{b:02X}" for b in frame.data) if frame.data else ""
-                
-                line = f"{timestamp_str} {can_id_hex} {direction} {data_hex}\n"
-                lines.append(line)
+            lines = [self._format_frame_line(frame, direction, log_time)
+                     for frame, direction, log_time in frames_to_write]
             
             # Write all lines at once (more efficient)
             self._log_file.write(''.join(lines))
@@ -266,6 +337,10 @@ class CanTraceLogger:
         if not self._is_logging:
             return
         
+        if self._capture_mode == CAPTURE_MODE_TRIGGERED:
+            self._append_to_ring(frame, direction, time.time())
+            return
+        
         try:
             # Non-blocking put - drop frame if queue is full (prevents blocking)
             self._frame_queue.put_nowait((frame, direction, time.time()))
@@ -283,7 +358,10 @@ class CanTraceLogger:
                     break  # Stop signal received
                 
                 # Flush pending frames (process in batches)
-                self._flush_pending_frames()
+                if self._capture_mode == CAPTURE_MODE_TRIGGERED:
+                    self._persist_due_trigger_window()
+                else:
+                    self._flush_pending_frames()
                 
             except Exception as e:
                 logger.error(f"Error in CAN trace flush loop: {e}", exc_info=True)
@@ -305,6 +383,273 @@ class CanTraceLogger:
             if frames_written == 0:
                 break  # No more frames to process
     
+    @staticmethod
+    def _format_frame_line(frame: Frame, direction: str, log_time: float) -> str:
+        """Format one frame as a trace line: timestamp can_id direction data_hex."""
+        timestamp_str = datetime.fromtimestamp(log_time).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+        can_id_hex = f"0x{frame.can_id:03X}"
+        data_hex = ' '.join(f"{b:02X}" for b in frame.data) if frame.data else ""
+        return f"{timestamp_str} {can_id_hex} {direction} {data_hex}\n"
+    
+    # ------------------------------------------------------------------
+    # Triggered capture mode
+    # ------------------------------------------------------------------
+    
+    def _append_to_ring(self, frame: Frame, direction: str, log_time: float) -> None:
+        """Add a frame to the ring and prune frames no window can still need.
+        
+        Frames older than the pre-trigger history are removed, except those
+        of an open trigger window (persisted by the flush thread). The frame
+        cap only applies beyond that; frames it evicts are counted as dropped.
+        """
+        ring = self._ring
+        ring.append((frame, direction, log_time))
+        horizon = log_time - self._pre_trigger_s
+        pending = self._pending_trigger
+        if pending is not None:
+            horizon = min(horizon, pending['start'])
+        try:
+            while ring[0][2] < horizon:
+                ring.popleft()
+            if len(ring) > self._ring_max_frames:
+                ring.popleft()
+                with self._lock:
+                    self._frames_dropped += 1
+                    warn = not self._ring_full_warned
+                    self._ring_full_warned = True
+                if warn:
+                    logger.warning(f"CAN trace ring full ({self._ring_max_frames} frames): "
+                                   f"dropping the oldest frames of the capture window")
+        except IndexError:
+            pass  # emptied by a concurrent caller
+    
+    def _start_triggered_session(self, timestamp: datetime, dut_uid: Optional[str],
+                                 test_name: Optional[str]) -> str:
+        """Arm the ring buffer for a triggered session (called with lock held).
+        
+        The trace file is only created when the first trigger window is persisted.
+        """
+        self._ring.clear()
+        # Memory guard: a pending window is persisted up to one flush interval after its deadline
+        self._ring_max_frames = math.ceil(
+            (self._pre_trigger_s + self._post_trigger_s + self._flush_interval) * CAN_TRACE_MAX_FRAME_RATE
+        )
+        self._ring_full_warned = False
+        self._pending_trigger = None
+        self._last_persisted_time = 0.0
+        self._trigger_count = 0
+        self._frames_logged = 0
+        self._frames_dropped = 0
+        self._session_header = [
+            f"# CAN Trace Log (triggered capture)",
+            f"# Started: {timestamp.isoformat()}",
+            f"# DUT UID: {dut_uid or 'N/A'}",
+            f"# Test: {test_name or 'N/A'}",
+            f"# Window: -{self._pre_trigger_s:g}s / +{self._post_trigger_s:g}s around each trigger",
+            f"# Format: timestamp can_id direction data_hex",
+            f"#",
+        ]
+        self._is_logging = True
+        
+        # Flush thread persists trigger windows once their post-trigger time has elapsed
+        self._stop_flush.clear()
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+        
+        logger.info(
+            f"CAN trace triggered capture armed (pre={self._pre_trigger_s:g}s, "
+            f"post={self._post_trigger_s:g}s): {os.path.basename(self._log_file_path)}"
+        )
+        return self._log_file_path
+    
+    def _stop_triggered_session(self) -> Optional[str]:
+        """Persist any pending window, close the file and reset state."""
+        self._persist_due_trigger_window(force=True)
+        
+        with self._write_lock, self._lock:
+            log_file = self._log_file
+            log_path = self._log_file_path if log_file else None
+            frames_logged = self._frames_logged
+            frames_dropped = self._frames_dropped
+            trigger_count = self._trigger_count
+            self._log_file = None
+            self._log_file_path = None
+            self._is_logging = False
+            self._pending_trigger = None
+            self._ring.clear()
+        
+        if log_file:
+            try:
+                footer_lines = [
+                    f"#",
+                    f"# CAN Trace Log Ended: {datetime.now().isoformat()}",
+                    f"# Triggers: {trigger_count}",
+                    f"# Total Frames Logged: {frames_logged}",
+                    f"# Frames Dropped: {frames_dropped}",
+                ]
+                log_file.write('\n'.join(footer_lines) + '\n')
+                log_file.flush()
+                log_file.close()
+            except Exception as e:
+                logger.error(f"Error closing CAN trace log file: {e}", exc_info=True)
+            logger.info(
+                f"CAN trace logging stopped: {os.path.basename(log_path)} "
+                f"({trigger_count} trigger(s), {frames_logged} frames)"
+            )
+        else:
+            logger.info("CAN trace triggered capture stopped: no triggers, nothing written")
+        return log_path
+    
+    def trigger(self, reason: str = 'manual', timestamp: Optional[float] = None) -> bool:
+        """Fire a capture trigger (thread-safe).
+        
+        Frames from ``pre_trigger_s`` before the trigger up to ``post_trigger_s``
+        after it are persisted to the trace file. A trigger that fires while a
+        previous window is still open extends that window instead of opening
+        a new one.
+        
+        Args:
+            reason: Human-readable trigger reason written to the trace file
+            timestamp: Trigger time (defaults to now)
+            
+        Returns:
+            True if the trigger was accepted, False if not in an active triggered session
+        """
+        trigger_time = time.time() if timestamp is None else float(timestamp)
+        with self._lock:
+            if not self._is_logging or self._capture_mode != CAPTURE_MODE_TRIGGERED:
+                return False
+            pending = self._pending_trigger
+            if pending is not None:
+                pending['reasons'].append((trigger_time, reason))
+                pending['deadline'] = max(pending['deadline'], trigger_time + self._post_trigger_s)
+            else:
+                self._pending_trigger = {
+                    'start': trigger_time - self._pre_trigger_s,
+                    'deadline': trigger_time + self._post_trigger_s,
+                    'reasons': [(trigger_time, reason)],
+                }
+            self._trigger_count += 1
+        logger.info(f"CAN trace trigger fired: {reason}")
+        return True
+    
+    def _persist_due_trigger_window(self, force: bool = False) -> int:
+        """Write the pending trigger window once its post-trigger time has elapsed.
+        
+        Args:
+            force: Persist the pending window immediately (used on stop)
+            
+        Returns:
+            Number of frames written
+        """
+        with self._write_lock:
+            # Snapshot the window under the lock; write it without blocking loggers and triggers
+            with self._lock:
+                pending = self._pending_trigger
+                if pending is None or (not force and time.time() < pending['deadline']):
+                    return 0
+                self._pending_trigger = None
+                start = max(pending['start'], self._last_persisted_time)
+                end = pending['deadline']
+                window = [item for item in list(self._ring) if start < item[2] <= end]
+                if window:
+                    self._last_persisted_time = window[-1][2]
+                log_file = self._log_file
+                log_path = self._log_file_path
+                header = self._session_header
+            
+            try:
+                if log_file is None:
+                    log_file = open(log_path, 'a', encoding='utf-8')
+                    log_file.write('\n'.join(header) + '\n')
+                    with self._lock:
+                        self._log_file = log_file
+                lines = [
+                    f"# Trigger at {datetime.fromtimestamp(t).isoformat()}: {reason}\n"
+                    for t, reason in pending['reasons']
+                ]
+                lines.extend(self._format_frame_line(frame, direction, log_time)
+                             for frame, direction, log_time in window)
+                lines.append(f"# End of trigger window ({len(window)} frames)\n")
+                log_file.write(''.join(lines))
+                log_file.flush()
+            except Exception as e:
+                logger.error(f"Error writing CAN trigger window to trace file: {e}", exc_info=True)
+                with self._lock:
+                    self._frames_dropped += len(window)
+                return 0
+            with self._lock:
+                self._frames_logged += len(window)
+        return len(window)
+    
+    def add_signal_trigger(self, can_id: int, signal_name: str, threshold: float,
+                           edge: str = 'rising') -> None:
+        """Register a trigger that fires when a decoded signal crosses a threshold.
+        
+        Args:
+            can_id: CAN ID of the message carrying the signal
+            signal_name: Signal name
+            threshold: Threshold value
+            edge: 'rising', 'falling' or 'both'
+            
+        Raises:
+            ValueError: If edge is invalid
+        """
+        if edge not in ('rising', 'falling', 'both'):
+            raise ValueError(f"Invalid trigger edge: {edge}")
+        with self._lock:
+            self._signal_triggers.setdefault((int(can_id), str(signal_name)), []).append(
+                [float(threshold), edge, None]
+            )
+    
+    def clear_signal_triggers(self) -> None:
+        """Remove all signal threshold triggers."""
+        with self._lock:
+            self._signal_triggers.clear()
+    
+    def has_signal_triggers(self) -> bool:
+        """Check whether any signal threshold trigger is registered."""
+        return bool(self._signal_triggers)
+    
+    def check_signal(self, can_id: int, signal_name: str, value) -> bool:
+        """Feed a decoded signal value and fire a trigger on threshold crossing.
+        
+        Args:
+            can_id: CAN ID of the message carrying the signal
+            signal_name: Signal name
+            value: Decoded signal value
+            
+        Returns:
+            True if a trigger fired
+        """
+        triggers = self._signal_triggers.get((can_id, signal_name))
+        if not triggers:
+            return False
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return False
+        
+        fired = False
+        for entry in triggers:
+            threshold, edge, last = entry
+            entry[2] = value
+            if last is None:
+                continue
+            rising = last < threshold <= value
+            falling = last > threshold >= value
+            if (edge == 'rising' and rising) or (edge == 'falling' and falling) or \
+                    (edge == 'both' and (rising or falling)):
+                fired = self.trigger(
+                    f"Signal 0x{can_id:X}:{signal_name} crossed {threshold:g} ({last:g} -> {value:g})"
+                ) or fired
+        return fired
+    
+    def get_trigger_count(self) -> int:
+        """Get the number of triggers fired in the current session."""
+        with self._lock:
+            return self._trigger_count
+    
     def is_logging(self) -> bool:
         """Check if logging is currently active."""
         with self._lock:
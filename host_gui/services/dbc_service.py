@@ -4,6 +4,7 @@ DBC Service for managing DBC (Database CAN) files and operations.
 This service encapsulates DBC file loading, parsing, message/signal lookup,
 and encoding/decoding operations using the cantools library.
 """
+import importlib.util
 import os
 import json
 import logging
@@ -12,13 +13,8 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
-# Import cantools (handle optional import)
-try:
-    import cantools
-    CANTOOLS_AVAILABLE = True
-except ImportError:
-    cantools = None
-    CANTOOLS_AVAILABLE = False
+# cantools is imported when the first DBC is loaded (slow to import)
+CANTOOLS_AVAILABLE = importlib.util.find_spec('cantools') is not None
 
 # Determine repo root for default paths
 repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
@@ -71,6 +67,7 @@ class DbcService:
         logger.info(f"Loading DBC file: {filepath}")
         
         try:
+            import cantools
             # Try newer API first, fallback to older
             try:
                 db = cantools.database.load_file(filepath)
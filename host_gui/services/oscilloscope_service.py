@@ -10,11 +10,34 @@ This service provides a high-level interface for:
 Supports Siglent SDS1104X-U and other USBTMC/TCPIP-compatible oscilloscopes.
 Connection priority: LAN (TCPIP) is preferred over USB (USBTMC).
 """
+import importlib.util
+import json
 import logging
 import os
 import re
+import threading
 import time
-from typing import Optional, List, Dict, Tuple, Any
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Optional, Iterable, Iterator, List, Dict, Tuple, Any
+
+from host_gui.constants import (
+    OSC_PROBE_TIMEOUT_LAN_MS, OSC_PROBE_TIMEOUT_USB_MS,
+    OSC_SCAN_MAX_WORKERS, OSC_IDN_CACHE_TTL_S, OSC_WAVEFORM_TIMEOUT_MS,
+    OSC_SEQUENCE_TIMEOUT_S, OSC_STATUS_POLL_S, OSC_MEASUREMENT_TIMEOUT_S,
+    OSC_QUERY_TIMEOUT_LAN_MS, OSC_QUERY_TIMEOUT_USB_MS
+)
+from host_gui.services.scpi_batch import ScpiBatch, ScpiBatchStats, SYNC_OPC
+from host_gui.services.scope_config import (
+    CHANNEL_KEYS, ConfigPlan, configuration_target, plan_configuration
+)
+from host_gui.services.scope_session import ScopeSession
+from host_gui.services.scope_simulator import SimulatedScope
+from host_gui.services.scope_state import ScopeStateCache
+from host_gui.services.scope_transfer import (
+    BlockTransferStats, read_block, sparsing_for, waveform_setup_command
+)
+from host_gui.utils.waveform_decoder import WaveformDecoder
 
 logger = logging.getLogger(__name__)
 
@@ -35,12 +58,11 @@ except ImportError:
     REGEX_NUMBER_SIMPLE = re.compile(r'([\d.]+)')
     REGEX_PAVA = re.compile(r'C\d+:PAVA\s+MEAN,([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)V?', re.IGNORECASE)
 
-try:
-    import pyvisa
-    pyvisa_available = True
-except ImportError:
-    pyvisa = None
-    pyvisa_available = False
+# PyVISA is imported when the resource manager is first needed (scan, identify,
+# connect), not at module import; the startup warm-up loads it in the background
+pyvisa = None
+pyvisa_available = importlib.util.find_spec('pyvisa') is not None
+if not pyvisa_available:
     logger.warning("PyVISA not available - oscilloscope functionality disabled")
 
 
@@ -48,30 +70,67 @@ class OscilloscopeService:
     """Service for managing oscilloscope connections via USB (USBTMC) and LAN (TCPIP).
     
     Attributes:
-        resource_manager: PyVISA ResourceManager instance (None if PyVISA unavailable)
+        resource_manager: PyVISA ResourceManager instance, created on first use (None if PyVISA unavailable)
         oscilloscope: Currently connected oscilloscope resource (None when disconnected)
+        session: ScopeSession wrapping the connected resource (health checks, reconnection)
         connected_resource: Resource string of currently connected oscilloscope
         available_resources: List of available oscilloscope resources (USB and LAN)
+        last_batch_stats: Statistics of the most recent SCPI batch (see batch())
+        state_cache: Last known value of every setting set or queried (see scope_state)
+        last_transfer_stats: Throughput of the most recent binary block transfer
     """
     
-    def __init__(self):
-        """Initialize the oscilloscope service."""
-        self.resource_manager: Optional[object] = None
+    def __init__(self, cache_path: Optional[str] = None):
+        """Initialize the oscilloscope service.
+        
+        Args:
+            cache_path: Optional JSON file persisting identified (known-good)
+                        resources across sessions
+        """
+        self._resource_manager: Optional[object] = None
+        self._resource_manager_failed = False
         self.oscilloscope: Optional[object] = None
+        self.session: Optional[ScopeSession] = None
         self.connected_resource: Optional[str] = None
         self.available_resources: List[str] = []
+        # resource -> (IDN string, time.time() of the successful query)
+        self._idn_cache: Dict[str, Tuple[str, float]] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_path = cache_path
+        self._scan_executor: Optional[ThreadPoolExecutor] = None
+        self._scan_future: Optional[Future] = None
+        # Statistics of the most recent SCPI batch (round trips, time saved)
+        self.last_batch_stats: Optional[ScpiBatchStats] = None
+        self.state_cache = ScopeStateCache()
+        self.last_transfer_stats: Optional[BlockTransferStats] = None
+        self._load_known_resources()
         
-        if pyvisa_available:
+        if not pyvisa_available:
+            logger.warning("OscilloscopeService initialized without PyVISA support")
+    
+    @property
+    def resource_manager(self) -> Optional[object]:
+        """PyVISA ResourceManager, created (importing PyVISA) on first use.
+        
+        None if PyVISA is not installed or the ResourceManager could not be created.
+        """
+        global pyvisa
+        if self._resource_manager is None and pyvisa_available and not self._resource_manager_failed:
             try:
-                self.resource_manager = pyvisa.ResourceManager()
-                logger.info("OscilloscopeService initialized with PyVISA")
+                if pyvisa is None:
+                    import pyvisa
+                self._resource_manager = pyvisa.ResourceManager()
+                logger.info("OscilloscopeService initialized PyVISA ResourceManager")
             except Exception as e:
                 logger.error(f"Failed to initialize PyVISA ResourceManager: {e}", exc_info=True)
-                self.resource_manager = None
-        else:
-            logger.warning("OscilloscopeService initialized without PyVISA support")
+                self._resource_manager_failed = True
+        return self._resource_manager
     
-    def scan_for_devices(self) -> List[str]:
+    @resource_manager.setter
+    def resource_manager(self, value: Optional[object]) -> None:
+        self._resource_manager = value
+    
+    def scan_for_devices(self, max_age: float = OSC_IDN_CACHE_TTL_S) -> List[str]:
         """Scan for available oscilloscopes via USB (USBTMC) and LAN (TCPIP).
         
         Uses multiple detection methods:
@@ -79,8 +138,16 @@ class OscilloscopeService:
         2. Check /dev/usbtmc* device files - fallback for USB if PyVISA doesn't auto-detect
         3. Direct USB device detection via pyusb - for constructing USB resource strings
         
+        Resources are identified (*IDN?) in parallel, each probe with its own
+        timeout, and identification results younger than ``max_age`` are
+        reused without opening the resource again. An unreachable instrument
+        therefore delays the scan by one probe timeout at most.
+        
         Connection priority: LAN (TCPIP) resources are listed first, followed by USB (USBTMC).
         
+        Args:
+            max_age: Maximum age in seconds of cached identification results to reuse
+        
         Returns:
             List of resource strings for available oscilloscopes (LAN first, then USB).
             Empty list if PyVISA unavailable or scan fails.
@@ -91,141 +158,46 @@ class OscilloscopeService:
             logger.warning("Cannot scan for devices: PyVISA not available")
             return []
         
+        start = time.perf_counter()
         try:
             # Method 1: List all resources via PyVISA
             resources = self.resource_manager.list_resources()
             logger.debug(f"PyVISA found {len(resources)} total resources")
             
-            # Filter for TCPIP/LAN devices (preferred connection method)
-            tcpip_resources = []
-            for resource in resources:
-                # Check if it's a TCPIP resource (TCPIP::*)
-                if resource.startswith('TCPIP') and '::' in resource:
-                    # Try to identify oscilloscopes
-                    try:
-                        # Open briefly to query identification
-                        temp_resource = self.resource_manager.open_resource(resource)
-                        try:
-                            temp_resource.timeout = 5000  # 5 second timeout for network
-                            # Query IDN (Identification) command
-                            idn = temp_resource.query('*IDN?')
-                            logger.info(f"Found LAN device: {resource} - {idn.strip()}")
-                            tcpip_resources.append(resource)
-                        except Exception as e:
-                            # Even if IDN fails, add it as TCPIP if it starts with TCPIP
-                            logger.debug(f"Found TCPIP resource (IDN query failed): {e}")
-                            tcpip_resources.append(resource)
-                        finally:
-                            temp_resource.close()
-                    except Exception as e:
-                        logger.debug(f"Could not query TCPIP resource {resource}: {e}")
-                        # Still add it as potential TCPIP device
-                        tcpip_resources.append(resource)
+            # TCPIP/LAN devices (preferred connection method), then USBTMC devices (USB:: or USB0::, USB1::, etc.)
+            tcpip_resources = [r for r in resources if r.startswith('TCPIP') and '::' in r]
+            usbtmc_resources = [r for r in resources if r.startswith('USB') and '::' in r]
             
-            # Filter for USBTMC devices (USB::* or USB0::*)
-            usbtmc_resources = []
-            for resource in resources:
-                # Check if it's a USBTMC resource (USB:: or USB0::, USB1::, etc.)
-                if resource.startswith('USB') and '::' in resource:
-                    # Try to identify oscilloscopes (Siglent, etc.)
-                    try:
-                        # Open briefly to query identification
-                        temp_resource = self.resource_manager.open_resource(resource)
-                        try:
-                            temp_resource.timeout = 2000  # 2 second timeout
-                            # Query IDN (Identification) command
-                            idn = temp_resource.query('*IDN?')
-                            logger.info(f"Found USBTMC device: {resource} - {idn.strip()}")
-                            usbtmc_resources.append(resource)
-                        except Exception as e:
-                            # Even if IDN fails, add it as USBTMC if it starts with USB
-                            logger.debug(f"Found USBTMC resource (IDN query failed): {e}")
-                            usbtmc_resources.append(resource)
-                        finally:
-                            temp_resource.close()
-                    except Exception as e:
-                        logger.debug(f"Could not query resource {resource}: {e}")
-                        # Still add it as potential USBTMC device
-                        if 'USBTMC' in str(resource) or resource.startswith('USB'):
-                            usbtmc_resources.append(resource)
+            # Identify all candidates in parallel. Resources are listed even if
+            # the IDN query fails (the GUI can still try to connect).
+            idns = self._probe_resources(tcpip_resources + usbtmc_resources, max_age)
+            for resource in tcpip_resources + usbtmc_resources:
+                kind = 'LAN' if resource.startswith('TCPIP') else 'USBTMC'
+                if idns.get(resource):
+                    logger.info(f"Found {kind} device: {resource} - {idns[resource]}")
+                else:
+                    logger.debug(f"Found {kind} resource (IDN query failed): {resource}")
             
             # Method 2: Check for /dev/usbtmc* device files if PyVISA didn't find USB devices
             # (This only applies to USB, not LAN)
             if not usbtmc_resources:
-                import glob
-                usbtmc_files = glob.glob('/dev/usbtmc*')
-                if usbtmc_files:
-                    logger.info(f"PyVISA didn't auto-detect, but found {len(usbtmc_files)} /dev/usbtmc* device file(s)")
-                    # Try to construct resource strings from device files
-                    # This requires querying the device to get vendor/product/serial
-                    for usbtmc_file in usbtmc_files:
-                        try:
-                            # Try direct file access to get IDN
-                            import struct
-                            with open(usbtmc_file, 'rb+', buffering=0) as f:
-                                cmd = b'*IDN?\n'
-                                f.write(cmd)
-                                
-                                # Read USBTMC response header (12 bytes)
-                                header = f.read(12)
-                                if len(header) == 12:
-                                    transfer_size = struct.unpack('>I', header[4:8])[0]
-                                    data_size = min(transfer_size, 256)
-                                    data = f.read(data_size)
-                                    idn = data.decode('ascii', errors='ignore').strip()
-                                    
-                                    if idn and ',' in idn:
-                                        parts = idn.split(',')
-                                        logger.info(f"Found device via {usbtmc_file}: {idn}")
-                                        
-                                        # Try to find USB device to get vendor/product IDs
-                                        try:
-                                            import usb.core
-                                            # Common Siglent vendor ID
-                                            dev = usb.core.find(idVendor=0xf4ec)
-                                            if dev:
-                                                vendor_id = f"{dev.idVendor:04x}"
-                                                product_id = f"{dev.idProduct:04x}"
-                                                serial = parts[2].strip() if len(parts) >= 3 else ""
-                                                
-                                                # Construct resource string
-                                                if serial:
-                                                    resource_str = f"USB0::{int(vendor_id, 16)}::{int(product_id, 16)}::{serial}::0::INSTR"
-                                                else:
-                                                    resource_str = f"USB0::{int(vendor_id, 16)}::{int(product_id, 16)}::INSTR"
-                                                
-                                                # Verify it works with PyVISA
-                                                try:
-                                                    test_resource = self.resource_manager.open_resource(resource_str)
-                                                    test_resource.timeout = 2000
-                                                    test_idn = test_resource.query('*IDN?')
-                                                    test_resource.close()
-                                                    usbtmc_resources.append(resource_str)
-                                                    logger.info(f"Verified resource string: {resource_str}")
-                                                except Exception:
-                                                    # If PyVISA doesn't work, still add the resource string
-                                                    # The GUI can try to connect anyway
-                                                    usbtmc_resources.append(resource_str)
-                                                    logger.debug(f"Resource string constructed but PyVISA verification failed")
-                                        except (ImportError, Exception) as e:
-                                            logger.debug(f"Could not construct resource string from USB device: {e}")
-                        except PermissionError:
-                            logger.warning(f"Permission denied accessing {usbtmc_file} - may need udev rules")
-                        except Exception as e:
-                            logger.debug(f"Could not access {usbtmc_file}: {e}")
+                usbtmc_resources = self._scan_usbtmc_device_files()
             
             # Combine resources: LAN first (preferred), then USB
             all_resources = tcpip_resources + usbtmc_resources
             self.available_resources = all_resources
+            self._save_known_resources()
             
             total_count = len(all_resources)
             lan_count = len(tcpip_resources)
             usb_count = len(usbtmc_resources)
+            elapsed_ms = (time.perf_counter() - start) * 1000
             
             if total_count > 0:
-                logger.info(f"Found {total_count} oscilloscope(s): {lan_count} LAN, {usb_count} USB")
+                logger.info(f"Found {total_count} oscilloscope(s): {lan_count} LAN, {usb_count} USB "
+                            f"(scan took {elapsed_ms:.0f} ms)")
             else:
-                logger.info("No oscilloscopes found")
+                logger.info(f"No oscilloscopes found (scan took {elapsed_ms:.0f} ms)")
             
             return all_resources
             
@@ -233,41 +205,265 @@ class OscilloscopeService:
             logger.error(f"Error scanning for oscilloscopes: {e}", exc_info=True)
             return []
     
+    def scan_async(self) -> Future:
+        """Run scan_for_devices() on a background thread.
+        
+        A scan requested while another one is running joins the running scan.
+        
+        Returns:
+            Future resolving to the list of resource strings
+        """
+        with self._cache_lock:
+            if self._scan_future is not None and not self._scan_future.done():
+                return self._scan_future
+            if self._scan_executor is None:
+                self._scan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='OscilloscopeScan')
+            self._scan_future = self._scan_executor.submit(self.scan_for_devices)
+            return self._scan_future
+    
+    def identify(self, resource: str, max_age: float = OSC_IDN_CACHE_TTL_S,
+                 timeout_ms: Optional[int] = None) -> Optional[str]:
+        """Return the *IDN? string of a resource, using the cache when fresh.
+        
+        Args:
+            resource: VISA resource string
+            max_age: Maximum age in seconds of a cached result to reuse
+            timeout_ms: Probe timeout (defaults to the LAN/USB probe timeout)
+            
+        Returns:
+            Stripped identification string, or None if the resource did not answer
+        """
+        cached = self.cached_identity(resource, max_age)
+        if cached is not None:
+            return cached
+        if self.resource_manager is None:
+            return None
+        if timeout_ms is None:
+            timeout_ms = OSC_PROBE_TIMEOUT_LAN_MS if resource.startswith('TCPIP') else OSC_PROBE_TIMEOUT_USB_MS
+        try:
+            # open_timeout bounds the connect itself (unreachable LAN hosts)
+            temp_resource = self.resource_manager.open_resource(resource, open_timeout=timeout_ms)
+        except Exception as e:
+            logger.debug(f"Could not open resource {resource}: {e}")
+            return None
+        try:
+            temp_resource.timeout = timeout_ms
+            idn = temp_resource.query('*IDN?').strip()
+        except Exception as e:
+            logger.debug(f"IDN query failed for {resource}: {e}")
+            return None
+        finally:
+            try:
+                temp_resource.close()
+            except Exception:
+                pass
+        self._remember_identity(resource, idn)
+        return idn
+    
+    def cached_identity(self, resource: str, max_age: Optional[float] = OSC_IDN_CACHE_TTL_S) -> Optional[str]:
+        """Return the cached *IDN? string of a resource (None if unknown or older than max_age)."""
+        with self._cache_lock:
+            entry = self._idn_cache.get(resource)
+        if entry is None:
+            return None
+        idn, verified_at = entry
+        if max_age is not None and time.time() - verified_at > max_age:
+            return None
+        return idn
+    
+    def known_resources(self) -> List[Tuple[str, str]]:
+        """Return identified resources from this and previous sessions.
+        
+        Available immediately (no I/O), so a GUI can offer the last known
+        instruments while a scan is still running.
+        
+        Returns:
+            List of (resource, IDN) tuples, LAN first, most recently verified first
+        """
+        with self._cache_lock:
+            entries = [(resource, idn, verified_at) for resource, (idn, verified_at) in self._idn_cache.items()]
+        entries.sort(key=lambda e: (not e[0].startswith('TCPIP'), -e[2]))
+        return [(resource, idn) for resource, idn, _ in entries]
+    
+    def _remember_identity(self, resource: str, idn: str) -> None:
+        if not idn:
+            return
+        with self._cache_lock:
+            self._idn_cache[resource] = (idn, time.time())
+    
+    def _probe_resources(self, resources: List[str], max_age: float) -> Dict[str, Optional[str]]:
+        """Identify resources concurrently, each probe bounded by its own timeout."""
+        results: Dict[str, Optional[str]] = {}
+        to_probe = []
+        for resource in resources:
+            cached = self.cached_identity(resource, max_age)
+            if cached is not None:
+                results[resource] = cached
+            else:
+                to_probe.append(resource)
+        if not to_probe:
+            return results
+        executor = ThreadPoolExecutor(max_workers=min(OSC_SCAN_MAX_WORKERS, len(to_probe)),
+                                      thread_name_prefix='OscilloscopeProbe')
+        try:
+            futures = {executor.submit(self.identify, resource, 0): resource for resource in to_probe}
+            # Deadline: open + query timeouts of the slowest probe, plus margin
+            deadline_s = 2 * max(OSC_PROBE_TIMEOUT_LAN_MS, OSC_PROBE_TIMEOUT_USB_MS) / 1000.0 + 1.0
+            done, not_done = wait(futures, timeout=deadline_s)
+            for future in done:
+                results[futures[future]] = future.result()
+            for future in not_done:
+                logger.warning(f"Oscilloscope probe of {futures[future]} exceeded {deadline_s:.0f} s deadline")
+                results[futures[future]] = None
+        finally:
+            # Do not wait for probes stuck past the deadline
+            executor.shutdown(wait=False)
+        return results
+    
+    def _load_known_resources(self) -> None:
+        """Load known-good resources persisted by a previous session."""
+        if not self._cache_path or not os.path.exists(self._cache_path):
+            return
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for resource, entry in data.get('resources', {}).items():
+                idn = entry.get('idn')
+                if idn:
+                    self._idn_cache[resource] = (idn, float(entry.get('verified_at', 0.0)))
+            logger.debug(f"Loaded {len(self._idn_cache)} known oscilloscope resource(s)")
+        except Exception as e:
+            logger.debug(f"Could not load known oscilloscope resources: {e}")
+    
+    def _save_known_resources(self) -> None:
+        """Persist identified resources for the next session."""
+        if not self._cache_path:
+            return
+        with self._cache_lock:
+            data = {'resources': {resource: {'idn': idn, 'verified_at': verified_at}
+                                  for resource, (idn, verified_at) in self._idn_cache.items()}}
+        if not data['resources'] and not os.path.exists(self._cache_path):
+            return
+        try:
+            os.makedirs(os.path.dirname(self._cache_path) or '.', exist_ok=True)
+            with open(self._cache_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            logger.debug(f"Could not save known oscilloscope resources: {e}")
+    
+    def _scan_usbtmc_device_files(self) -> List[str]:
+        """Construct USB resource strings from /dev/usbtmc* device files (Linux fallback)."""
+        usbtmc_resources: List[str] = []
+        import glob
+        usbtmc_files = glob.glob('/dev/usbtmc*')
+        if usbtmc_files:
+            logger.info(f"PyVISA didn't auto-detect, but found {len(usbtmc_files)} /dev/usbtmc* device file(s)")
+            # Try to construct resource strings from device files
+            # This requires querying the device to get vendor/product/serial
+            for usbtmc_file in usbtmc_files:
+                try:
+                    # Try direct file access to get IDN
+                    import struct
+                    with open(usbtmc_file, 'rb+', buffering=0) as f:
+                        cmd = b'*IDN?\n'
+                        f.write(cmd)
+                        
+                        # Read USBTMC response header (12 bytes)
+                        header = f.read(12)
+                        if len(header) == 12:
+                            transfer_size = struct.unpack('>I', header[4:8])[0]
+                            data_size = min(transfer_size, 256)
+                            data = f.read(data_size)
+                            idn = data.decode('ascii', errors='ignore').strip()
+                            
+                            if idn and ',' in idn:
+                                parts = idn.split(',')
+                                logger.info(f"Found device via {usbtmc_file}: {idn}")
+                                
+                                # Try to find USB device to get vendor/product IDs
+                                try:
+                                    import usb.core
+                                    # Common Siglent vendor ID
+                                    dev = usb.core.find(idVendor=0xf4ec)
+                                    if dev:
+                                        vendor_id = f"{dev.idVendor:04x}"
+                                        product_id = f"{dev.idProduct:04x}"
+                                        serial = parts[2].strip() if len(parts) >= 3 else ""
+                                        
+                                        # Construct resource string
+                                        if serial:
+                                            resource_str = f"USB0::{int(vendor_id, 16)}::{int(product_id, 16)}::{serial}::0::INSTR"
+                                        else:
+                                            resource_str = f"USB0::{int(vendor_id, 16)}::{int(product_id, 16)}::INSTR"
+                                        
+                                        # Verify it works with PyVISA. If it doesn't, still add the
+                                        # resource string - the GUI can try to connect anyway
+                                        usbtmc_resources.append(resource_str)
+                                        if self.identify(resource_str):
+                                            logger.info(f"Verified resource string: {resource_str}")
+                                        else:
+                                            logger.debug(f"Resource string constructed but PyVISA verification failed")
+                                except (ImportError, Exception) as e:
+                                    logger.debug(f"Could not construct resource string from USB device: {e}")
+                except PermissionError:
+                    logger.warning(f"Permission denied accessing {usbtmc_file} - may need udev rules")
+                except Exception as e:
+                    logger.debug(f"Could not access {usbtmc_file}: {e}")
+        return usbtmc_resources
+    
     def connect(self, resource: str) -> bool:
         """Connect to an oscilloscope.
         
+        The resource is held by a ScopeSession, which reconnects it after
+        VISA errors (see scope_session). Connecting to the resource that is
+        already connected reuses the session.
+        Resources starting with 'SIM' (e.g. OSC_SIMULATOR_RESOURCE) open the
+        built-in simulator (see scope_simulator), which needs no PyVISA.
+        
         Args:
             resource: Resource string (e.g., 'USB::0x1234::0x5678::INSTR')
             
         Returns:
             True if connection successful, False otherwise
         """
-        if not pyvisa_available or self.resource_manager is None:
+        simulated = resource.upper().startswith('SIM')
+        if not simulated and (not pyvisa_available or self.resource_manager is None):
             logger.error("Cannot connect: PyVISA not available")
             return False
         
         if self.oscilloscope is not None:
+            if resource == self.connected_resource and self.session is not None and self.session.healthy:
+                logger.info(f"Reusing oscilloscope session: {resource}")
+                return True
             logger.warning("Already connected to an oscilloscope, disconnecting first")
             self.disconnect()
         
         try:
             logger.info(f"Connecting to oscilloscope: {resource}")
-            self.oscilloscope = self.resource_manager.open_resource(resource)
-            
-            # Set timeout based on connection type
-            # LAN connections may need longer timeout due to network latency
-            if resource.startswith('TCPIP'):
-                self.oscilloscope.timeout = 10000  # 10 seconds for LAN
-                logger.debug("Using LAN timeout: 10000ms")
+            # Settings of a previous session (or another scope) are unknown now
+            self.state_cache.invalidate()
+            if simulated:
+                simulator = SimulatedScope()
+                opener = lambda: simulator
             else:
-                self.oscilloscope.timeout = 5000  # 5 seconds for USB
-                logger.debug("Using USB timeout: 5000ms")
+                opener = lambda: self.resource_manager.open_resource(resource)
+            
+            # Commands and queries use a short timeout (LAN needs longer due to
+            # network latency); waveform transfers set their own (OSC_WAVEFORM_TIMEOUT_MS)
+            timeout_ms = OSC_QUERY_TIMEOUT_LAN_MS if resource.startswith('TCPIP') else OSC_QUERY_TIMEOUT_USB_MS
+            logger.debug(f"Using query timeout: {timeout_ms}ms")
+            self.session = ScopeSession(opener, resource, timeout_ms, on_reconnect=self.state_cache.invalidate)
+            self.oscilloscope = self.session.open()
             
             # Query identification to verify connection
             try:
                 idn = self.oscilloscope.query('*IDN?')
                 logger.info(f"Connected to oscilloscope: {idn}")
                 self.connected_resource = resource
+                # Known-good for the next session
+                if not simulated:
+                    self._remember_identity(resource, idn.strip())
+                    self._save_known_resources()
                 return True
             except Exception as e:
                 logger.warning(f"Connected but IDN query failed: {e}")
@@ -277,6 +473,9 @@ class OscilloscopeService:
                 
         except Exception as e:
             logger.error(f"Failed to connect to oscilloscope {resource}: {e}", exc_info=True)
+            if self.session is not None:
+                self.session.close()
+            self.session = None
             self.oscilloscope = None
             self.connected_resource = None
             return False
@@ -292,7 +491,9 @@ class OscilloscopeService:
                 logger.warning(f"Error disconnecting oscilloscope: {e}", exc_info=True)
             finally:
                 self.oscilloscope = None
+                self.session = None
                 self.connected_resource = None
+                self.state_cache.invalidate()
     
     def is_connected(self) -> bool:
         """Check if connected to an oscilloscope.
@@ -320,6 +521,9 @@ class OscilloscopeService:
     def send_command(self, command: str) -> Optional[str]:
         """Send a SCPI command to the oscilloscope.
         
+        Queries of settings whose value is known are answered from the state
+        cache, and writes that would not change a known setting are skipped.
+        
         Args:
             command: SCPI command string
             
@@ -335,18 +539,316 @@ class OscilloscopeService:
             # This handles commands like "C4:PAVA? MEAN" which have parameters after '?'
             if '?' in command:
                 # Query command - expects response
-                return self.oscilloscope.query(command)
+                cached = self.state_cache.lookup(command)
+                if cached is not None:
+                    return cached
+                response = self.oscilloscope.query(command)
+                self.state_cache.store(command, response)
+                return response
             else:
                 # Write command - no response
+                if self.state_cache.is_redundant(command):
+                    self.state_cache.skipped_writes += 1
+                    logger.debug(f"Skipped unchanged setting '{command}'")
+                    return None
+                self.state_cache.note_write(command)
                 self.oscilloscope.write(command)
                 return None
         except Exception as e:
             logger.error(f"Error sending command '{command}': {e}", exc_info=True)
             return None
     
+    def batch(self, name: str = 'batch', sync: str = SYNC_OPC) -> ScpiBatch:
+        """Create a SCPI command batch for the connected oscilloscope.
+
+        Writes and queries added to the batch are sent as ';'-joined program
+        messages synchronised with a single *OPC? (see ScpiBatch). Use it as a
+        context manager; it executes when the block exits.
+
+        Args:
+            name: Label for the batch statistics log line
+            sync: SYNC_OPC (wait for completion) or SYNC_NONE
+
+        Returns:
+            ScpiBatch bound to the oscilloscope
+
+        Raises:
+            RuntimeError: If no oscilloscope is connected
+        """
+        if not self.is_connected():
+            raise RuntimeError("Cannot send commands: oscilloscope not connected")
+        return ScpiBatch(self.oscilloscope, name=name, sync=sync, on_executed=self._record_batch,
+                         state=self.state_cache)
+
+    def send_commands(self, commands: List[str], name: str = 'commands',
+                      legacy_delay: float = 0.0) -> Optional[ScpiBatchStats]:
+        """Send write commands in one transfer and wait until the scope has executed them.
+
+        Replaces the pattern ``send_command(cmd); time.sleep(delay)``.
+
+        Args:
+            commands: SCPI write commands
+            name: Label for the batch statistics log line
+            legacy_delay: Fixed sleep the sequential code used per command (statistics only)
+
+        Returns:
+            Batch statistics, or None if not connected
+        """
+        if not self.is_connected():
+            logger.error("Cannot send commands: not connected")
+            return None
+        with self.batch(name) as batch:
+            for command in commands:
+                batch.write(command, legacy_delay=legacy_delay)
+        return batch.stats
+
+    def invalidate_state(self) -> None:
+        """Forget all cached settings (e.g. after changes on the scope's front panel)."""
+        self.state_cache.invalidate()
+
+    def _record_batch(self, stats: ScpiBatchStats) -> None:
+        self.last_batch_stats = stats
+
+    def read_binary_block(self, command: Optional[str] = None,
+                          timeout_ms: Optional[int] = OSC_WAVEFORM_TIMEOUT_MS) -> Optional[bytearray]:
+        """Send a query and read its IEEE 488.2 binary block response.
+
+        The '#<n><length>' header is parsed first and the payload is read
+        chunk by chunk into one preallocated buffer (see scope_transfer).
+        The throughput is logged and kept in last_transfer_stats.
+
+        Args:
+            command: Query to send (e.g. 'C1:WF? ALL'); None reads a pending response
+            timeout_ms: VISA timeout during the transfer (None keeps the current one)
+
+        Returns:
+            Block payload (starting at WAVEDESC for direct binary responses),
+            or None if not connected or the transfer failed
+        """
+        if not self.is_connected():
+            logger.error("Cannot read binary block: not connected")
+            return None
+        try:
+            with self._transfer(timeout_ms) as instrument:
+                payload, stats = read_block(instrument, command)
+        except Exception as e:
+            logger.error(f"Error reading binary block for '{command}': {e}", exc_info=True)
+            return None
+        self.last_transfer_stats = stats
+        logger.info(stats.summary())
+        return payload
+
+    @contextmanager
+    def _transfer(self, timeout_ms: Optional[int]) -> Iterator[Any]:
+        """Hold the connection for a bulk transfer with its own timeout."""
+        if self.session is not None and self.oscilloscope is self.session:
+            with self.session.transfer(timeout_ms) as session:
+                yield session
+            return
+        original_timeout = getattr(self.oscilloscope, 'timeout', None)
+        try:
+            if timeout_ms is not None:
+                self.oscilloscope.timeout = timeout_ms
+            yield self.oscilloscope
+        finally:
+            if timeout_ms is not None and original_timeout is not None:
+                self.oscilloscope.timeout = original_timeout
+
+    def read_waveform(self, channel: int, max_points: int = 0, first_point: int = 0,
+                      num_points: int = 0, timeout_ms: Optional[int] = OSC_WAVEFORM_TIMEOUT_MS) -> Optional[bytearray]:
+        """Transfer a channel's waveform record (C{channel}:WF? ALL).
+
+        Only the requested points are transferred: the waveform setup (WFSU)
+        selects the first point, the number of points and a sparsing factor
+        that keeps the transfer at or below max_points. The setup goes through
+        the state cache, so it costs no transfer while it does not change.
+
+        Args:
+            channel: Channel number (1-4)
+            max_points: Maximum points to transfer (0 = all, no sparsing)
+            first_point: Index of the first acquired point to transfer
+            num_points: Acquired points to cover from first_point (0 = up to the end)
+            timeout_ms: VISA timeout during the transfer
+
+        Returns:
+            Waveform record starting at WAVEDESC, or None on failure
+        """
+        if not self.is_connected():
+            logger.error("Cannot read waveform: not connected")
+            return None
+        sparsing = 1
+        if max_points > 0:
+            window = num_points
+            if window <= 0:
+                response = self.send_command(f"SANU? C{channel}")
+                match = REGEX_NUMBER.search(response or '')
+                window = int(float(match.group(1))) - first_point if match else 0
+            sparsing = sparsing_for(window, max_points)
+        sent_points = -(-num_points // sparsing) if num_points > 0 else 0
+        self.send_commands([waveform_setup_command(first_point, sent_points, sparsing)], name='waveform setup')
+        if sparsing > 1:
+            logger.info(f"Transferring every {sparsing}. point of C{channel} (at most {max_points} points)")
+        return self.read_binary_block(f"C{channel}:WF? ALL", timeout_ms=timeout_ms)
+
+    def configure_sequence(self, segments: int) -> bool:
+        """Set up sequence (segmented memory) acquisition.
+
+        In sequence mode every trigger fills the next segment, and a single
+        acquisition (TRMD SINGLE) stops after the last segment.
+
+        Args:
+            segments: Number of segments (<= 1 turns sequence mode off)
+
+        Returns:
+            True if the scope accepted the setting
+        """
+        if not self.is_connected():
+            logger.error("Cannot configure sequence mode: not connected")
+            return False
+        command = f"SEQ ON,{int(segments)}" if segments > 1 else "SEQ OFF"
+        try:
+            self.send_commands([command], name='sequence setup')
+        except Exception as e:
+            logger.error(f"Failed to configure sequence mode ('{command}'): {e}")
+            return False
+        if segments > 1:
+            logger.info(f"Sequence acquisition enabled with {int(segments)} segments")
+        else:
+            logger.info("Sequence acquisition disabled")
+        return True
+
+    def wait_for_stop(self, timeout_s: float = OSC_SEQUENCE_TIMEOUT_S,
+                      poll_interval: float = OSC_STATUS_POLL_S) -> bool:
+        """Wait until a single or sequence acquisition has finished (TRMD? reports STOP).
+
+        Args:
+            timeout_s: Maximum time to wait
+            poll_interval: Time between TRMD? polls
+
+        Returns:
+            True if the acquisition stopped, False on timeout or if not connected
+        """
+        deadline = time.monotonic() + timeout_s
+        while self.is_connected():
+            response = self.send_command("TRMD?")
+            if response and 'STOP' in response.upper():
+                return True
+            if time.monotonic() >= deadline:
+                logger.warning(f"Acquisition did not stop within {timeout_s:.1f}s (TRMD? -> {response!r})")
+                return False
+            time.sleep(poll_interval)
+        return False
+
+    def read_sequence(self, channel: int, segments: int,
+                      timeout_ms: Optional[int] = OSC_WAVEFORM_TIMEOUT_MS) -> List[bytearray]:
+        """Transfer every segment of a sequence acquisition for one channel.
+
+        A single C{channel}:WF? ALL normally returns all segments in one
+        record (SUBARRAY_COUNT in the descriptor, decoded with
+        WaveformDecoder.decode_segments). If the scope only returns one
+        segment per record, the segments are read frame by frame from the
+        acquisition history (HSMD/FRAM). A sequence record with fewer
+        segments (an acquisition stopped early) is returned as it is.
+
+        Args:
+            channel: Channel number (1-4)
+            segments: Number of segments acquired
+            timeout_ms: VISA timeout per transfer
+
+        Returns:
+            Waveform records in acquisition order (empty list on failure)
+        """
+        record = self.read_waveform(channel, timeout_ms=timeout_ms)
+        if record is None:
+            return []
+        try:
+            count = WaveformDecoder(record).segment_count()
+        except ValueError as e:
+            logger.error(f"Invalid sequence record for C{channel}: {e}")
+            return []
+        if count >= segments:
+            return [record]
+        if count > 1:
+            logger.warning(f"C{channel} record holds {count} of {segments} segments (acquisition stopped early)")
+            return [record]
+
+        logger.info(f"C{channel} record holds {count} of {segments} segments, reading history frames")
+        records = []
+        try:
+            self.send_commands(["HSMD ON"], name='history mode')
+            for frame in range(1, segments + 1):
+                self.send_commands([f"FRAM {frame}"], name='history frame')
+                frame_record = self.read_waveform(channel, timeout_ms=timeout_ms)
+                if frame_record is None:
+                    return []
+                records.append(frame_record)
+        finally:
+            self.send_commands(["HSMD OFF"], name='history mode')
+        return records
+
+    @staticmethod
+    def _check_trace(channel: int, enabled: bool, readback: Optional[str], errors: List[str]) -> None:
+        """Compare a C{channel}:TRA? response with the requested display state."""
+        if readback is None:
+            errors.append(f"Channel {channel} display configuration failed: no TRA? response")
+            logger.error(f"Failed to read back channel {channel} display state")
+            return
+        readback_str = readback.strip().upper()
+        readback_enabled = 'ON' in readback_str or readback_str == '1' or 'TRUE' in readback_str
+        if readback_enabled != enabled:
+            errors.append(f"Channel {channel} display mismatch: set={enabled}, readback={readback_enabled}")
+            logger.warning(f"Channel {channel} display readback mismatch")
+        else:
+            logger.debug(f"Channel {channel} display verified: {enabled}")
+
+    @staticmethod
+    def _check_attenuation(channel: int, probe_attenuation: float, readback: Optional[str],
+                           errors: List[str]) -> None:
+        """Compare a C{channel}:ATTN? response with the configured probe attenuation."""
+        if readback is None:
+            errors.append(f"Channel {channel} probe attenuation verification failed: no ATTN? response")
+            logger.error(f"Failed to verify channel {channel} probe attenuation")
+            return
+        # Parse attenuation value - response may be "ATTN 811.965812" or just "811.965812"
+        attn_match = REGEX_ATTN.search(readback)
+        if attn_match:
+            value = attn_match.group(1)
+        else:
+            # Fallback: extract last number (matching phase_current_test_state_machine.py)
+            numbers = REGEX_NUMBER_SIMPLE.findall(readback)
+            value = numbers[-1] if numbers else None
+            if value is not None:
+                logger.info(f"Channel {channel} probe attenuation parsed from: {readback.strip()} (parsed: {value})")
+        try:
+            readback_att = float(value)
+        except (TypeError, ValueError):
+            errors.append(f"Channel {channel} probe attenuation readback invalid: {readback}")
+            logger.warning(f"Channel {channel} probe attenuation readback invalid: {readback}")
+            return
+        if abs(readback_att - probe_attenuation) > 0.5:
+            errors.append(f"Channel {channel} probe attenuation mismatch: expected={probe_attenuation}, actual={readback_att}")
+            logger.warning(f"Channel {channel} probe attenuation mismatch: expected={probe_attenuation}, actual={readback_att}")
+        else:
+            logger.debug(f"Channel {channel} probe attenuation verified: expected={probe_attenuation}, actual={readback_att}")
+
+    def _queue_channel(self, batch: ScpiBatch, channel: int, enabled: bool,
+                       legacy_delay: float = 0.0) -> Tuple[Any, Optional[Any]]:
+        """Add the display write and verification queries of one channel to a batch.
+
+        Returns:
+            Tuple (TRA? placeholder, ATTN? placeholder or None if disabled)
+        """
+        batch.write(f":C{channel}:TRA {'ON' if enabled else 'OFF'}", legacy_delay=legacy_delay)
+        tra = batch.query(f"C{channel}:TRA?")
+        attn = batch.query(f"C{channel}:ATTN?") if enabled else None
+        return tra, attn
+
     def configure_channel(self, channel: int, enabled: bool, probe_attenuation: float, unit: str) -> bool:
         """Configure a single oscilloscope channel.
         
+        The display write and the TRA?/ATTN? verification queries are sent
+        in one batched transfer.
+        
         Args:
             channel: Channel number (1-4)
             enabled: Enable/disable channel
@@ -365,69 +867,13 @@ class OscilloscopeService:
             return False
         
         try:
-            channel_name = f"C{channel}"
             errors = []
-            
-            # Configure channel display (enable/disable)
-            try:
-                disp_cmd = f":{channel_name}:TRA {'ON' if enabled else 'OFF'}"
-                self.oscilloscope.write(disp_cmd)
-                logger.debug(f"Sent command: {disp_cmd}")
-                
-                # Read back and verify using C{channel}:TRA? format
-                readback = self.oscilloscope.query(f"C{channel}:TRA?")
-                readback_str = readback.strip().upper()
-                readback_enabled = 'ON' in readback_str or readback_str == '1' or 'TRUE' in readback_str
-                if readback_enabled != enabled:
-                    errors.append(f"Channel {channel} display mismatch: set={enabled}, readback={readback_enabled}")
-                    logger.warning(f"Channel {channel} display readback mismatch")
-                else:
-                    logger.debug(f"Channel {channel} display verified: {enabled}")
-            except Exception as e:
-                errors.append(f"Channel {channel} display configuration failed: {e}")
-                logger.error(f"Failed to configure channel {channel} display: {e}", exc_info=True)
-            
-            if enabled:
-                # Verify probe attenuation (read only, compare against config)
-                try:
-                    # Read probe attenuation using C{channel}:ATTN? format
-                    readback = self.oscilloscope.query(f"C{channel}:ATTN?")
-                    # Parse attenuation value - response may be "ATTN 811.965812" or just "811.965812"
-                    attn_match = REGEX_ATTN.search(readback)
-                    print ("Attenuation match: ", attn_match)
-                    if attn_match:
-                        try:
-                            readback_att = float(attn_match.group(1))
-                            print ("Readback attenuation: ", readback_att)
-                            if abs(readback_att - probe_attenuation) > 0.5:
-                                errors.append(f"Channel {channel} probe attenuation mismatch: expected={probe_attenuation}, actual={readback_att}")
-                                logger.warning(f"Channel {channel} probe attenuation mismatch: expected={probe_attenuation}, actual={readback_att}")
-                            else:
-                                logger.debug(f"Channel {channel} probe attenuation verified: expected={probe_attenuation}, actual={readback_att}")
-                        except ValueError:
-                            errors.append(f"Channel {channel} probe attenuation readback invalid: {readback}")
-                            logger.warning(f"Channel {channel} probe attenuation readback invalid: {readback}")
-                    else:
-                        # Fallback: extract last number (matching phase_current_test_state_machine.py)
-                        numbers = REGEX_NUMBER_SIMPLE.findall(readback)
-                        if numbers:
-                            try:
-                                readback_att = float(numbers[-1])
-                                logger.info(f"Channel {channel} probe attenuation parsed from: {readback.strip()} (parsed: {readback_att})")
-                                if abs(readback_att - probe_attenuation) > 0.5:
-                                    errors.append(f"Channel {channel} probe attenuation mismatch: expected={probe_attenuation}, actual={readback_att}")
-                                    logger.warning(f"Channel {channel} probe attenuation mismatch: expected={probe_attenuation}, actual={readback_att}")
-                                else:
-                                    logger.debug(f"Channel {channel} probe attenuation verified: expected={probe_attenuation}, actual={readback_att}")
-                            except ValueError:
-                                errors.append(f"Channel {channel} probe attenuation readback invalid: {readback}")
-                                logger.warning(f"Channel {channel} probe attenuation readback invalid: {readback}")
-                        else:
-                            errors.append(f"Channel {channel} probe attenuation readback invalid: {readback}")
-                            logger.warning(f"Channel {channel} probe attenuation readback invalid: {readback}")
-                except Exception as e:
-                    errors.append(f"Channel {channel} probe attenuation verification failed: {e}")
-                    logger.error(f"Failed to verify channel {channel} probe attenuation: {e}", exc_info=True)
+            with self.batch(f"configure C{channel}") as batch:
+                tra, attn = self._queue_channel(batch, channel, enabled)
+            self._check_trace(channel, enabled, tra.value, errors)
+            if attn is not None:
+                # Probe attenuation is read only, compared against config
+                self._check_attenuation(channel, probe_attenuation, attn.value, errors)
             
             if errors:
                 logger.error(f"Channel {channel} configuration completed with errors: {errors}")
@@ -440,14 +886,52 @@ class OscilloscopeService:
             logger.error(f"Error configuring channel {channel}: {e}", exc_info=True)
             return False
     
- 
-    def apply_configuration(self, config: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    def plan_configuration(self, config: Dict[str, Any]) -> ConfigPlan:
+        """Compare a configuration with the known oscilloscope state (see scope_config).
+        
+        Args:
+            config: Configuration dictionary with 'channels' and optionally 'acquisition' keys
+        
+        Returns:
+            ConfigPlan listing the writes apply_configuration() would send
+        
+        Raises:
+            ValueError: If the configuration has no 'channels' key
+        """
+        return plan_configuration(configuration_target(config), self.state_cache)
+    
+    def read_state(self, headers: Iterable[str]) -> int:
+        """Read the settings whose value is not cached, in one exchange.
+        
+        Args:
+            headers: Setting headers (e.g. 'C1:TRA', 'TDIV')
+        
+        Returns:
+            Number of settings read
+        """
+        unknown = [header for header in dict.fromkeys(headers) if self.state_cache.get(header) is None]
+        if unknown and self.is_connected():
+            with self.batch('read state') as batch:
+                for header in unknown:
+                    batch.query(f"{header}?")
+        return len(unknown)
+    
+    def apply_configuration(self, config: Dict[str, Any], read_state: bool = False) -> Tuple[bool, List[str]]:
         """Apply full oscilloscope configuration from dictionary.
         
+        Only settings that differ from the known oscilloscope state are
+        written (see scope_config): the writes and the verification queries
+        not answered by the state cache are sent as one SCPI batch
+        synchronised with *OPC? (instead of one round trip and a fixed sleep
+        per command), so re-applying an unchanged configuration makes no
+        transfer at all and switching configurations takes one.
+        
         Args:
             config: Configuration dictionary with 'channels' and optionally 'acquisition' keys
                 - 'channels': Dict of channel configs (CH1, CH2, CH3, CH4)
                 - 'acquisition': Dict with 'timebase_ms' (optional)
+            read_state: Read settings with an unknown value first (one more
+                        exchange), so settings the scope already has are not rewritten
         
         Returns:
             Tuple of (success: bool, errors: List[str])
@@ -460,46 +944,60 @@ class OscilloscopeService:
         errors = []
         
         # Validate configuration structure
-        if 'channels' not in config:
-            return False, ["Configuration missing 'channels' key"]
+        try:
+            target = configuration_target(config)
+        except ValueError as e:
+            return False, [str(e)]
+        if read_state:
+            self.read_state(target.headers)
+        plan = plan_configuration(target, self.state_cache)
+        logger.info(f"Applying oscilloscope configuration '{config.get('name', '')}': {plan.summary()}")
         
-        # Configure each channel
         channels_config = config['channels']
-        for ch_key in ['CH1', 'CH2', 'CH3', 'CH4']:
-            if ch_key not in channels_config:
-                continue
-            
-            ch_config = channels_config[ch_key]
-            channel_num = int(ch_key[2])  # Extract number from 'CH1', 'CH2', etc.
-            
+        pending = []  # (ch_key, channel_num, ch_config, tra placeholder, attn placeholder)
+        tdiv = None
+        timebase_ms = None
+        try:
+            # The batch drops writes of settings the cache shows as unchanged
+            with self.batch('apply_configuration') as batch:
+                for ch_key in CHANNEL_KEYS:
+                    if ch_key not in channels_config:
+                        continue
+                    ch_config = channels_config[ch_key]
+                    channel_num = int(ch_key[2])  # Extract number from 'CH1', 'CH2', etc.
+                    enabled = ch_config.get('enabled', False)
+                    # legacy_delay: the sequential code slept 0.1 s after each channel
+                    tra, attn = self._queue_channel(batch, channel_num, enabled, legacy_delay=0.1)
+                    pending.append((ch_key, channel_num, ch_config, tra, attn))
+                
+                # Configure timebase (if present in config)
+                timebase_ms = config.get('acquisition', {}).get('timebase_ms')
+                if 'TDIV' in target.settings:
+                    batch.write(f"TDIV {target.settings['TDIV']}", legacy_delay=0.2)
+                    tdiv = batch.query("TDIV?")
+        except Exception as e:
+            logger.error(f"Failed to apply oscilloscope configuration: {e}", exc_info=True)
+            return False, [f"Failed to apply oscilloscope configuration: {e}"]
+        
+        for ch_key, channel_num, ch_config, tra, attn in pending:
+            channel_errors = []
             enabled = ch_config.get('enabled', False)
-            probe_attenuation = ch_config.get('probe_attenuation', 1.0)
-            unit = ch_config.get('unit', 'A')
-            
-            success = self.configure_channel(channel_num, enabled, probe_attenuation, unit)
-            if not success:
+            self._check_trace(channel_num, enabled, tra.value, channel_errors)
+            if attn is not None:
+                self._check_attenuation(channel_num, ch_config.get('probe_attenuation', 1.0),
+                                        attn.value, channel_errors)
+            if channel_errors:
+                logger.error(f"Channel {channel_num} configuration completed with errors: {channel_errors}")
                 errors.append(f"Failed to configure {ch_key}")
-            
-            # Small delay between channel configurations
-            time.sleep(0.1)
-        
-        # Configure timebase (if present in config)
-        if 'acquisition' in config:
-            acquisition_config = config['acquisition']
-            timebase_ms = acquisition_config.get('timebase_ms')
-            if timebase_ms is not None:
-                try:
-                    # Convert milliseconds to seconds for TDIV command
-                    timebase_sec = timebase_ms / 1000.0
-                    self.oscilloscope.write(f"TDIV {timebase_sec}")
-                    time.sleep(0.2)  # Delay for command processing
-                    
-                    # Optional: Verify with readback
-                    readback = self.oscilloscope.query("TDIV?")
-                    logger.debug(f"Timebase set to {timebase_ms}ms (TDIV={timebase_sec}s), readback: {readback}")
-                except Exception as e:
-                    errors.append(f"Failed to configure timebase: {e}")
-                    logger.error(f"Failed to configure timebase: {e}", exc_info=True)
+            else:
+                logger.info(f"Channel {channel_num} configured successfully: enabled={enabled}, "
+                            f"probe={ch_config.get('probe_attenuation', 1.0)}, unit={ch_config.get('unit', 'A')}")
+        
+        if tdiv is not None:
+            if tdiv.value is None:
+                errors.append("Failed to configure timebase: no TDIV? response")
+            else:
+                logger.debug(f"Timebase set to {timebase_ms}ms (TDIV={timebase_ms / 1000.0}s), readback: {tdiv.value}")
         
         overall_success = len(errors) == 0
         if overall_success:
@@ -559,16 +1057,17 @@ class OscilloscopeService:
         
         return None
     
-    def parse_pava_response(self, response: str) -> Tuple[Optional[float], Optional[str]]:
-        """Parse PAVA MEAN response to extract mean value in volts.
+    def parse_pava_response(self, response: str, parameter: str = 'MEAN') -> Tuple[Optional[float], Optional[str]]:
+        """Parse a PAVA response to extract the measured value.
         
         Expected format: "C4:PAVA MEAN,9.040000E+00V"
         
         Args:
             response: Raw response string from oscilloscope
+            parameter: Measured parameter (MEAN, MAX, MIN, PKPK, RMS, ...)
             
         Returns:
-            Tuple of (mean_value_volts, error_message)
+            Tuple of (value, error_message)
             If parsing succeeds, returns (value, None)
             If parsing fails, returns (None, error_message)
         """
@@ -577,9 +1076,13 @@ class OscilloscopeService:
         
         response = response.strip()
         
-        # Pattern: C{ch}:PAVA MEAN,{value}V
+        # Pattern: C{ch}:PAVA {parameter},{value}{unit}
         # Value can be in scientific notation: 9.040000E+00 or 9.04E+00 or 9.04
-        match = REGEX_PAVA.search(response)
+        if parameter.upper() == 'MEAN':
+            match = REGEX_PAVA.search(response)
+        else:
+            match = re.search(rf'PAVA\s+{re.escape(parameter)},\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)',
+                              response, re.IGNORECASE)
         
         if match:
             try:
@@ -602,91 +1105,100 @@ class OscilloscopeService:
         
         return None, f"Could not parse PAVA response: {response}"
     
-    def query_pava_mean(self, channel: int, retries: int = 3) -> Optional[float]:
-        """Query PAVA MEAN value for a channel.
+    def measure_pava(self, channels: Iterable[int], parameters: Iterable[str] = ('MEAN',),
+                     timeout_s: float = OSC_MEASUREMENT_TIMEOUT_S,
+                     retries: int = 3) -> Dict[int, Dict[str, Optional[float]]]:
+        """Measure PAVA parameters of several channels once the acquisition has stopped.
+        
+        The acquisition status (TRMD?) and all C{ch}:PAVA? queries are sent
+        in one batched exchange. If the scope is still acquiring, TRMD? is
+        polled until it reports STOP (see wait_for_stop()) and the
+        measurement is repeated, so no fixed delay is needed after STOP.
+        Values the scope could not provide yet (e.g. '****' while it is still
+        computing them after the stop) are re-queried every status poll
+        interval until timeout_s has passed.
         
         Args:
-            channel: Channel number (1-4)
-            retries: Number of retry attempts (default: 3)
+            channels: Channel numbers (1-4)
+            parameters: PAVA parameters to measure per channel (e.g. 'MEAN', 'PKPK')
+            timeout_s: Maximum time to wait for the acquisition to stop and
+                for values that could not be parsed
+            retries: Minimum measurement exchanges for values that could not
+                be parsed (made even after timeout_s)
             
         Returns:
-            Mean value in volts, or None if query fails
+            Dict channel -> {parameter: value or None}
         """
+        channels = list(dict.fromkeys(channels))
+        parameters = [parameter.upper() for parameter in parameters]
+        results = {channel: {parameter: None for parameter in parameters} for channel in channels}
         if not self.is_connected():
             logger.error("Cannot query PAVA: oscilloscope not connected")
-            return None
-        
-        if channel < 1 or channel > 4:
-            logger.error(f"Invalid channel number: {channel} (must be 1-4)")
-            return None
-        
-        cmd = f"C{channel}:PAVA? MEAN"
-        last_response = None
+            return results
+        pending = []
+        for channel in channels:
+            if channel < 1 or channel > 4:
+                logger.error(f"Invalid channel number: {channel} (must be 1-4)")
+                continue
+            pending.extend((channel, parameter) for parameter in parameters)
         
-        for attempt in range(retries):
+        deadline = time.monotonic() + timeout_s
+        stopped = False
+        attempt = 0
+        while pending and (attempt < max(retries, 1) or time.monotonic() < deadline):
+            if attempt > 0:
+                time.sleep(OSC_STATUS_POLL_S)
+                logger.debug(f"Re-measuring {pending} (attempt {attempt + 1})")
             try:
-                if attempt > 0:
-                    # Wait longer between retries
-                    time.sleep(0.5 * attempt)
-                    logger.debug(f"Retrying PAVA query for channel {channel} (attempt {attempt + 1}/{retries})")
-                
-                response = self.send_command(cmd)
-                last_response = response
-                
-                if response is None:
-                    logger.warning(f"No response from PAVA command for channel {channel} (attempt {attempt + 1}/{retries})")
-                    if attempt < retries - 1:
-                        continue
-                    else:
-                        logger.error(f"No response from PAVA command for channel {channel} after {retries} attempts")
-                        return None
-                
-                # Check if response is empty
-                if not response or not response.strip():
-                    logger.warning(f"Empty response from PAVA command for channel {channel} (attempt {attempt + 1}/{retries})")
-                    if attempt < retries - 1:
-                        continue
-                    else:
-                        logger.error(f"Empty response from PAVA command for channel {channel} after {retries} attempts")
-                        return None
-                
-                logger.debug(f"PAVA response for channel {channel}: {repr(response)}")
-                
-                value, error = self.parse_pava_response(response)
-                if error:
-                    logger.warning(f"Failed to parse PAVA response for channel {channel} (attempt {attempt + 1}/{retries}): {error}")
-                    logger.debug(f"Raw response was: {repr(response)}")
-                    if attempt < retries - 1:
-                        continue
-                    else:
-                        logger.error(f"Failed to parse PAVA response for channel {channel} after {retries} attempts: {error}")
-                        return None
-                
-                logger.info(f"PAVA MEAN for channel {channel}: {value} V")
-                return value
-                
+                with self.batch('PAVA measurement') as batch:
+                    status = None if stopped else batch.query("TRMD?")
+                    queries = {key: batch.query(f"C{key[0]}:PAVA? {key[1]}") for key in pending}
             except Exception as e:
-                logger.warning(f"Exception querying PAVA for channel {channel} (attempt {attempt + 1}/{retries}): {e}")
-                if attempt < retries - 1:
+                logger.warning(f"PAVA measurement exchange failed (attempt {attempt + 1}): {e}")
+                attempt += 1
+                continue
+            stopped = True
+            if status is not None and status.value and 'STOP' not in status.value.upper():
+                # Measured on a running acquisition: wait for the stop and measure again
+                if self.wait_for_stop(max(deadline - time.monotonic(), 0.0)):
                     continue
+                logger.warning("Acquisition still running, using the current PAVA values")
+            attempt += 1
+            for (channel, parameter), placeholder in queries.items():
+                value, error = self.parse_pava_response(placeholder.value, parameter)
+                if error:
+                    logger.debug(f"Failed to parse PAVA {parameter} for channel {channel}: {error}")
                 else:
-                    logger.error(f"Error querying PAVA for channel {channel} after {retries} attempts: {e}", exc_info=True)
-                    if last_response is not None:
-                        logger.debug(f"Last response was: {repr(last_response)}")
-                    return None
+                    results[channel][parameter] = value
+            pending = [(ch, p) for ch, p in pending if results[ch][p] is None]
         
-        logger.error(f"Failed to query PAVA for channel {channel} after {retries} attempts")
-        if last_response is not None:
-            logger.debug(f"Last response was: {repr(last_response)}")
-        return None
+        if pending:
+            logger.error(f"No valid PAVA value for {pending} after {attempt} attempts ({timeout_s:.1f}s)")
+        logger.info(f"PAVA measurement: {results}")
+        return results
+    
+    def query_pava_mean(self, channel: int, retries: int = 3) -> Optional[float]:
+        """Query PAVA MEAN value for a channel (see measure_pava()).
+        
+        Args:
+            channel: Channel number (1-4)
+            retries: Minimum measurement attempts (default: 3)
+            
+        Returns:
+            Mean value in volts, or None if query fails
+        """
+        return self.measure_pava([channel], ('MEAN',), retries=retries).get(channel, {}).get('MEAN')
     
     def cleanup(self) -> None:
         """Clean up resources. Call this when shutting down."""
         self.disconnect()
-        if self.resource_manager is not None:
+        if self._scan_executor is not None:
+            self._scan_executor.shutdown(wait=False)
+            self._scan_executor = None
+        if self._resource_manager is not None:
             try:
-                self.resource_manager.close()
+                self._resource_manager.close()
             except Exception:
                 pass
-            self.resource_manager = None
+            self._resource_manager = None
 
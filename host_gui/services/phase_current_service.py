@@ -6,8 +6,13 @@ phase current calibration tests with oscilloscope and CAN data collection.
 """
 import time
 import logging
-import struct
-from typing import Optional, Tuple, Dict, Any, List
+from collections import deque
+from concurrent.futures import Future, wait
+from typing import Optional, Tuple, Dict, Any, List, Deque
+
+from host_gui.constants import (
+    OSC_FILTER_DECIMATE, OSC_SEQUENCE_MODE, OSC_SEQUENCE_TIMEOUT_S, OSC_WAVEFORM_MAX_POINTS
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,30 +27,25 @@ except ImportError:
 try:
     import matplotlib
     matplotlib_available = True
-    # Import seaborn for enhanced plot styling
-    try:
-        import seaborn as sns
-        sns.set_style("whitegrid")
-        sns.set_palette("husl")
-        seaborn_available = True
-    except ImportError:
-        seaborn_available = False
+    from host_gui.utils.plot_style import apply_plot_style
+    apply_plot_style()
 except ImportError:
     matplotlib_available = False
-    seaborn_available = False
 
 # Import utility functions
 try:
-    from host_gui.utils import (
-        analyze_steady_state_can,
-        apply_lowpass_filter,
-        WaveformDecoder
-    )
+    from host_gui.utils import analyze_steady_state_can
+    from host_gui.utils.waveform_analysis import analyze_waveform_segments, analyze_waveform_steady_state
 except ImportError:
     logger.error("Failed to import utility functions for phase current service")
     analyze_steady_state_can = None
-    apply_lowpass_filter = None
-    WaveformDecoder = None
+    analyze_waveform_segments = None
+    analyze_waveform_steady_state = None
+
+try:
+    from host_gui.services.analysis_executor import get_shared_executor
+except ImportError:
+    get_shared_executor = None
 
 # Pre-compile regex patterns for oscilloscope command parsing
 import re
@@ -66,6 +66,11 @@ try:
 except ImportError:
     QtCore = None
 
+try:
+    from host_gui.widgets.live_plot import LivePlot
+except ImportError:
+    LivePlot = None
+
 
 class PhaseCurrentTestStateMachine:
     """State machine for Phase Current Calibration testing.
@@ -79,9 +84,20 @@ class PhaseCurrentTestStateMachine:
        - Send trigger message
        - Wait for test duration
        - Stop acquisition and logging
-       - Analyze steady state
-       - Store results
-    4. Disable test mode
+       - Retrieve waveforms and start the steady state analysis
+       - Store results of finished steps
+    4. Wait for the remaining analyses
+    5. Disable test mode
+    
+    The waveform analysis of each step runs in the analysis executor while
+    the next step is actuated and acquired; results are stored in Iq_ref
+    order. Waveforms are always retrieved before the next acquisition
+    starts, since it overwrites the oscilloscope's capture.
+    
+    In sequence mode (actuation 'osc_sequence_mode', default
+    OSC_SEQUENCE_MODE) the oscilloscope captures every step as one segment
+    of a single acquisition, and all segments are transferred and analysed
+    together after the last step.
     """
     
     def __init__(self, gui: Any, test: Dict[str, Any]):
@@ -107,12 +123,15 @@ class PhaseCurrentTestStateMachine:
             self.dbc_service = None
             self.signal_service = None
             logger.warning("GUI is None in PhaseCurrentTestStateMachine initialization")
+        # Waveform analysis runs in worker processes (shared with other test types)
+        self.analysis_executor = get_shared_executor() if get_shared_executor else None
         
         # Test parameters
         self.min_iq = self.act.get('min_iq')
         self.max_iq = self.act.get('max_iq')
         self.step_iq = self.act.get('step_iq')
         self.ipc_test_duration_ms = self.act.get('ipc_test_duration_ms', 1000)
+        self.sequence_mode = bool(self.act.get('osc_sequence_mode', OSC_SEQUENCE_MODE))
         
         # CAN message and signal configuration
         # Default to 272 (0x110) if not specified, matching test script
@@ -148,6 +167,11 @@ class PhaseCurrentTestStateMachine:
         self.plot_osc_v_avg: List[float] = []  # Oscilloscope Phase V averages (CH1)
         self.plot_can_w_avg: List[float] = []  # CAN Phase W averages
         self.plot_osc_w_avg: List[float] = []  # Oscilloscope Phase W averages (CH2)
+        # Valid (non-NaN) points already shown, extended incrementally per Iq_ref step
+        self._plot_v_valid: Tuple[List[float], List[float]] = ([], [])  # (osc, can)
+        self._plot_w_valid: Tuple[List[float], List[float]] = ([], [])
+        self._plot_points_done = 0
+        self._live_plot: Optional[Any] = None
         
         # Initialize live plots if matplotlib is available
         self._init_live_plots()
@@ -215,6 +239,14 @@ class PhaseCurrentTestStateMachine:
             # Update canvas
             self.gui.plot_canvas.draw()
             
+            # Blit new points over the cached background (axes, grid, y=x reference)
+            if LivePlot is not None:
+                previous = getattr(self.gui, '_live_plot', None)
+                if previous is not None:
+                    previous.close()
+                self._live_plot = LivePlot(self.gui.plot_canvas, [self.gui.plot_line_v, self.gui.plot_line_w])
+                self.gui._live_plot = self._live_plot
+            
             logger.info("Live plots initialized for Phase Current test")
         except Exception as e:
             logger.error(f"Failed to initialize live plots: {e}", exc_info=True)
@@ -231,18 +263,15 @@ class PhaseCurrentTestStateMachine:
             if not hasattr(self.gui, 'plot_axes_v') or not hasattr(self.gui, 'plot_axes_w'):
                 return
             
-            # Get current data lengths
-            num_points = len(self.plot_can_v_avg)
-            if num_points == 0:
+            # Only the points added since the last update are validated
+            num_points = min(len(self.plot_can_v_avg), len(self.plot_osc_v_avg),
+                             len(self.plot_can_w_avg), len(self.plot_osc_w_avg))
+            if num_points <= self._plot_points_done:
                 return
             
-            # Filter out NaN values for plotting
-            can_v_valid = []
-            osc_v_valid = []
-            can_w_valid = []
-            osc_w_valid = []
-            
-            for i in range(num_points):
+            osc_v_valid, can_v_valid = self._plot_v_valid
+            osc_w_valid, can_w_valid = self._plot_w_valid
+            for i in range(self._plot_points_done, num_points):
                 can_v = self.plot_can_v_avg[i]
                 osc_v = self.plot_osc_v_avg[i]
                 can_w = self.plot_can_w_avg[i]
@@ -260,22 +289,20 @@ class PhaseCurrentTestStateMachine:
                     not (isinstance(osc_w, float) and osc_w != osc_w)):  # osc_w is not NaN
                     can_w_valid.append(can_w)
                     osc_w_valid.append(osc_w)
+            self._plot_points_done = num_points
             
-            # Update Phase V plot (Oscilloscope on X, CAN on Y)
-            if can_v_valid and osc_v_valid:
-                self.gui.plot_line_v.set_data(osc_v_valid, can_v_valid)
-                self.gui.plot_axes_v.relim()
-                self.gui.plot_axes_v.autoscale()
-            
-            # Update Phase W plot (Oscilloscope on X, CAN on Y)
-            if can_w_valid and osc_w_valid:
-                self.gui.plot_line_w.set_data(osc_w_valid, can_w_valid)
-                self.gui.plot_axes_w.relim()
-                self.gui.plot_axes_w.autoscale()
+            # Oscilloscope on X, CAN on Y
+            self.gui.plot_line_v.set_data(osc_v_valid, can_v_valid)
+            self.gui.plot_line_w.set_data(osc_w_valid, can_w_valid)
             
-            # Update canvas
-            self.gui.plot_canvas.draw()
-            self.gui.plot_canvas.draw_idle()
+            if self._live_plot is not None and getattr(self.gui, '_live_plot', None) is self._live_plot:
+                self._live_plot.update()
+            else:
+                # No blitting engine (or the GUI re-initialized the plot) - full redraw
+                for ax in (self.gui.plot_axes_v, self.gui.plot_axes_w):
+                    ax.relim()
+                    ax.autoscale()
+                self.gui.plot_canvas.draw_idle()
             
         except Exception as e:
             logger.error(f"Failed to update live plots: {e}", exc_info=True)
@@ -298,144 +325,10 @@ class PhaseCurrentTestStateMachine:
             if not self.iq_ref_array:
                 return False, "No Iq_ref values to test"
             
-            # Step 3-10: Loop through Iq_ref values
-            for iq_ref in self.iq_ref_array:
-                logger.info(f"Testing Iq_ref = {iq_ref} A")
-                
-                # Step 3: Set vertical division
-                if not self._set_vertical_division(iq_ref):
-                    logger.warning(f"Failed to set vertical division for Iq_ref={iq_ref}, continuing...")
-                
-                # Step 4: Start oscilloscope acquisition and CAN logging
-                if not self._start_acquisition_and_logging():
-                    logger.warning(f"Failed to start acquisition for Iq_ref={iq_ref}, continuing...")
-                    continue
-                
-                # Step 5: Send trigger message
-                if not self._send_trigger_message(iq_ref):
-                    logger.warning(f"Failed to send trigger for Iq_ref={iq_ref}, continuing...")
-                    self._stop_acquisition_and_logging()
-                    continue
-                
-                # Step 6: Wait for test duration (collect CAN signals during wait)
-                wait_start = time.time()
-                wait_duration = self.ipc_test_duration_ms / 1000.0
-                poll_interval = 0.1  # Poll every 100ms
-                
-                logger.info(f"Starting signal collection for {wait_duration:.2f}s (CAN ID: {self.phase_current_can_id}, "
-                           f"Signals: {self.phase_current_v_signal}, {self.phase_current_w_signal})")
-                
-                while time.time() - wait_start < wait_duration:
-                    # Collect decoded signals from SignalService cache during wait
-                    # Note: Frames are decoded by _poll_frames() and cached in SignalService,
-                    # so we collect from the cache instead of competing for raw frames
-                    if self.collecting_can_data and self.signal_service:
-                        try:
-                            # Get latest signal values from cache
-                            v_timestamp, v_val = self.signal_service.get_latest_signal(
-                                self.phase_current_can_id, 
-                                self.phase_current_v_signal
-                            )
-                            w_timestamp, w_val = self.signal_service.get_latest_signal(
-                                self.phase_current_can_id,
-                                self.phase_current_w_signal
-                            )
-                            
-                            # Debug: Log if signals are missing
-                            if v_val is None:
-                                logger.debug(f"Phase V Current not found in cache (CAN ID: {self.phase_current_can_id}, Signal: {self.phase_current_v_signal})")
-                            if w_val is None:
-                                logger.debug(f"Phase W Current not found in cache (CAN ID: {self.phase_current_can_id}, Signal: {self.phase_current_w_signal})")
-                            
-                            # If both signals are available and we haven't collected this sample yet
-                            if v_val is not None and w_val is not None:
-                                # Use the most recent timestamp
-                                signal_timestamp = max(
-                                    v_timestamp or time.time(),
-                                    w_timestamp or time.time()
-                                )
-                                
-                                # Check if this is a new sample (avoid duplicates)
-                                # Compare with last collected sample if available
-                                is_new_sample = True
-                                if self.collected_signals:
-                                    last_timestamp, last_v, last_w = self.collected_signals[-1]
-                                    # If timestamps are very close (< 1ms), likely the same sample
-                                    if abs(signal_timestamp - last_timestamp) < 0.001:
-                                        is_new_sample = False
-                                
-                                if is_new_sample:
-                                    logger.info(f"Phase V Current: {v_val} A, Phase W Current: {w_val} A")
-                                    self.collected_signals.append((signal_timestamp, v_val, w_val))
-                                    
-                                    # Update real-time monitoring
-                                    if self.gui is not None:
-                                        try:
-                                            if hasattr(self.gui, 'update_monitor_signal_by_name') and callable(getattr(self.gui, 'update_monitor_signal_by_name', None)):
-                                                self.gui.update_monitor_signal_by_name('dut_phase_v_current', v_val)
-                                                self.gui.update_monitor_signal_by_name('dut_phase_w_current', w_val)
-                                        except Exception as e:
-                                            logger.debug(f"Failed to update phase current monitoring: {e}")
-                        except Exception as e:
-                            logger.warning(f"Failed to collect signals from cache: {e}", exc_info=True)
-                    
-                    # Process Qt events to keep UI responsive
-                    if self.gui is not None:
-                        try:
-                            if hasattr(self.gui, 'processEvents') and callable(getattr(self.gui, 'processEvents', None)):
-                                self.gui.processEvents()
-                            elif QtCore and hasattr(QtCore.QCoreApplication, 'processEvents'):
-                                QtCore.QCoreApplication.processEvents()
-                        except Exception as e:
-                            logger.debug(f"Failed to process Qt events: {e}")
-                    
-                    # Sleep to avoid excessive polling (frames are decoded by _poll_frames periodically)
-                    time.sleep(poll_interval)
-                
-                # Step 7: Stop oscilloscope and CAN logging
-                self._stop_acquisition_and_logging()
-                
-                # Step 8: Analyze data
-                osc_ch1_avg, osc_ch2_avg, can_v_avg, can_w_avg = self._analyze_data()
-                
-                # Step 9: Append results
-                # Note: id_ref is always 0.0 in current implementation
-                id_ref = 0.0
-                self.results.append({
-                    'iq_ref': iq_ref,
-                    'id_ref': id_ref,
-                    'osc_ch1_avg': osc_ch1_avg,
-                    'osc_ch2_avg': osc_ch2_avg,
-                    'can_v_avg': can_v_avg,
-                    'can_w_avg': can_w_avg
-                })
-                
-                # Store data for live plots
-                if can_v_avg is not None:
-                    self.plot_can_v_avg.append(can_v_avg)
-                else:
-                    self.plot_can_v_avg.append(float('nan'))
-                
-                if osc_ch1_avg is not None:
-                    self.plot_osc_v_avg.append(osc_ch1_avg)
-                else:
-                    self.plot_osc_v_avg.append(float('nan'))
-                
-                if can_w_avg is not None:
-                    self.plot_can_w_avg.append(can_w_avg)
-                else:
-                    self.plot_can_w_avg.append(float('nan'))
-                
-                if osc_ch2_avg is not None:
-                    self.plot_osc_w_avg.append(osc_ch2_avg)
-                else:
-                    self.plot_osc_w_avg.append(float('nan'))
-                
-                # Update live plots
-                self._update_live_plots()
-                
-                logger.info(f"Iq_ref={iq_ref}: OSC CH1={osc_ch1_avg}, CH2={osc_ch2_avg}, "
-                          f"CAN V={can_v_avg}, W={can_w_avg}")
+            # Step 3-10: Acquire and analyse every Iq_ref step, as segments of one
+            # sequence acquisition if enabled, otherwise one acquisition per step
+            if not (self.sequence_mode and self._run_sequence()):
+                self._run_steps()
             
             # Step 11: Disable test mode
             self._disable_test_mode()
@@ -527,6 +420,231 @@ class PhaseCurrentTestStateMachine:
             logger.error(f"Phase current test failed: {e}", exc_info=True)
             return False, f"Test execution error: {e}"
     
+    def _run_steps(self) -> None:
+        """Run each Iq_ref step as its own acquisition (Steps 3-10).
+        
+        Steps are pipelined: the waveforms of step N are analysed while
+        step N+1 is acquired.
+        """
+        pending_steps: Deque[Dict[str, Any]] = deque()
+        for iq_ref in self.iq_ref_array:
+            logger.info(f"Testing Iq_ref = {iq_ref} A")
+
+            # Step 3: Set vertical division
+            if not self._set_vertical_division(iq_ref):
+                logger.warning(f"Failed to set vertical division for Iq_ref={iq_ref}, continuing...")
+
+            # Step 4: Start oscilloscope acquisition and CAN logging
+            if not self._start_acquisition_and_logging():
+                logger.warning(f"Failed to start acquisition for Iq_ref={iq_ref}, continuing...")
+                continue
+
+            # Step 5: Send trigger message
+            if not self._send_trigger_message(iq_ref):
+                logger.warning(f"Failed to send trigger for Iq_ref={iq_ref}, continuing...")
+                self._stop_acquisition_and_logging()
+                continue
+
+            # Step 6: Wait for test duration (collect CAN signals during wait)
+            self._collect_can_signals(self.ipc_test_duration_ms / 1000.0, pending_steps)
+
+            # Step 7: Stop oscilloscope and CAN logging
+            self._stop_acquisition_and_logging()
+
+            # Step 8: Retrieve waveforms and start their analysis; the analysis
+            # continues while the next Iq_ref step is actuated and settles
+            pending_steps.append(self._start_step_analysis(iq_ref))
+
+            # Step 9: Append results of steps whose analysis has finished (in Iq_ref order)
+            self._record_completed_steps(pending_steps)
+
+        # Step 10: Wait for the remaining analyses
+        self._record_completed_steps(pending_steps, block=True)
+    
+    def _run_sequence(self) -> bool:
+        """Run all Iq_ref steps as the segments of one sequence acquisition.
+        
+        The scope is armed once for len(iq_ref_array) segments; each step's
+        trigger message starts the current that triggers the next segment.
+        Test mode is disabled after every step so each step starts from zero
+        current and produces its own trigger (the scope trigger must be set
+        up for this, and the timebase must cover the test duration). After
+        the last step, each channel's segments are transferred in one record
+        and analysed together. The vertical scale is shared by all segments
+        and is set for the largest |Iq_ref|.
+        
+        Returns:
+            False if sequence acquisition could not be set up (no step has run
+            and the caller falls back to one acquisition per step), True otherwise
+        """
+        osc = self.oscilloscope_service
+        if not osc or not osc.is_connected() or not analyze_waveform_segments:
+            logger.warning("Sequence acquisition not available, acquiring each Iq_ref step separately")
+            return False
+        
+        segments = len(self.iq_ref_array)
+        if not self._set_vertical_division(max(self.iq_ref_array, key=abs)):
+            logger.warning("Failed to set vertical division for sequence acquisition, continuing...")
+        if not osc.configure_sequence(segments):
+            return False
+        
+        try:
+            try:
+                osc.send_commands(["TRMD SINGLE"], name='arm sequence', legacy_delay=0.2)
+            except Exception as e:
+                logger.error(f"Failed to arm sequence acquisition: {e}")
+                return False
+            logger.info(f"Sequence acquisition armed for {segments} Iq_ref steps")
+            
+            can_averages: List[Tuple[Optional[float], Optional[float]]] = []
+            for index, iq_ref in enumerate(self.iq_ref_array):
+                logger.info(f"Testing Iq_ref = {iq_ref} A (segment {index + 1}/{segments})")
+                self._start_can_logging()
+                if not self._send_trigger_message(iq_ref):
+                    logger.warning(f"Failed to send trigger for Iq_ref={iq_ref}, continuing...")
+                    self.collecting_can_data = False
+                    can_averages.append((None, None))
+                    continue
+                self._collect_can_signals(self.ipc_test_duration_ms / 1000.0)
+                self.collecting_can_data = False
+                try:
+                    can_averages.append(self._analyze_can_data())
+                except Exception as e:
+                    logger.error(f"Failed to analyze CAN data: {e}", exc_info=True)
+                    can_averages.append((None, None))
+                # Back to zero current: the next step triggers the next segment
+                self._disable_test_mode()
+            
+            if not osc.wait_for_stop(OSC_SEQUENCE_TIMEOUT_S):
+                logger.warning("Not every Iq_ref step triggered a segment, stopping the acquisition")
+                osc.send_commands(["STOP"], name='stop acquisition', legacy_delay=0.2)
+            
+            # One transfer per channel; both channels are analysed in parallel
+            futures: Dict[int, List[Optional[Future]]] = {}
+            for channel in (1, 2):
+                futures[channel] = [self._submit_waveform_analysis(record, channel, analyze_waveform_segments)
+                                    for record in osc.read_sequence(channel, segments)]
+        finally:
+            osc.configure_sequence(0)
+        
+        ch1_averages = self._segment_averages(futures[1], 1, segments)
+        ch2_averages = self._segment_averages(futures[2], 2, segments)
+        for index, iq_ref in enumerate(self.iq_ref_array):
+            can_v_avg, can_w_avg = can_averages[index]
+            self._record_result(iq_ref, ch1_averages[index], ch2_averages[index], can_v_avg, can_w_avg)
+        return True
+    
+    def _segment_averages(self, futures: List[Optional[Future]], channel: int,
+                          segments: int) -> List[Optional[float]]:
+        """Collect the per-segment averages of a channel's sequence analysis.
+        
+        Returns:
+            One average (or None) per segment; all None if the number of
+            analysed segments does not match the number of steps, since the
+            segments could not be matched to their Iq_ref values
+        """
+        averages: List[Optional[float]] = []
+        for future in futures:
+            if future is None:
+                return [None] * segments
+            self._wait_for(future)
+            try:
+                results = future.result() or []
+            except Exception as e:
+                logger.error(f"Failed to analyze CH{channel} segments: {e}", exc_info=True)
+                return [None] * segments
+            averages.extend(result['avg'] if result else None for result in results)
+        if len(averages) != segments:
+            logger.error(f"CH{channel}: {len(averages)} segment(s) acquired for {segments} Iq_ref steps, "
+                         f"oscilloscope results discarded")
+            return [None] * segments
+        return averages
+    
+    def _collect_can_signals(self, wait_duration: float,
+                             pending_steps: Optional[Deque[Dict[str, Any]]] = None) -> None:
+        """Wait for the test duration, collecting phase current samples from the signal cache.
+        
+        Args:
+            wait_duration: Time to collect for, in seconds
+            pending_steps: Earlier steps whose results are recorded as soon as
+                their analysis finishes (see _record_completed_steps)
+        """
+        wait_start = time.time()
+        poll_interval = 0.1  # Poll every 100ms
+
+        logger.info(f"Starting signal collection for {wait_duration:.2f}s (CAN ID: {self.phase_current_can_id}, "
+                   f"Signals: {self.phase_current_v_signal}, {self.phase_current_w_signal})")
+
+        while time.time() - wait_start < wait_duration:
+            # Collect decoded signals from SignalService cache during wait
+            # Note: Frames are decoded by _poll_frames() and cached in SignalService,
+            # so we collect from the cache instead of competing for raw frames
+            if self.collecting_can_data and self.signal_service:
+                try:
+                    # Get latest signal values from cache
+                    v_timestamp, v_val = self.signal_service.get_latest_signal(
+                        self.phase_current_can_id, 
+                        self.phase_current_v_signal
+                    )
+                    w_timestamp, w_val = self.signal_service.get_latest_signal(
+                        self.phase_current_can_id,
+                        self.phase_current_w_signal
+                    )
+
+                    # Debug: Log if signals are missing
+                    if v_val is None:
+                        logger.debug(f"Phase V Current not found in cache (CAN ID: {self.phase_current_can_id}, Signal: {self.phase_current_v_signal})")
+                    if w_val is None:
+                        logger.debug(f"Phase W Current not found in cache (CAN ID: {self.phase_current_can_id}, Signal: {self.phase_current_w_signal})")
+
+                    # If both signals are available and we haven't collected this sample yet
+                    if v_val is not None and w_val is not None:
+                        # Use the most recent timestamp
+                        signal_timestamp = max(
+                            v_timestamp or time.time(),
+                            w_timestamp or time.time()
+                        )
+
+                        # Check if this is a new sample (avoid duplicates)
+                        # Compare with last collected sample if available
+                        is_new_sample = True
+                        if self.collected_signals:
+                            last_timestamp, last_v, last_w = self.collected_signals[-1]
+                            # If timestamps are very close (< 1ms), likely the same sample
+                            if abs(signal_timestamp - last_timestamp) < 0.001:
+                                is_new_sample = False
+
+                        if is_new_sample:
+                            logger.info(f"Phase V Current: {v_val} A, Phase W Current: {w_val} A")
+                            self.collected_signals.append((signal_timestamp, v_val, w_val))
+
+                            # Update real-time monitoring
+                            if self.gui is not None:
+                                try:
+                                    if hasattr(self.gui, 'update_monitor_signal_by_name') and callable(getattr(self.gui, 'update_monitor_signal_by_name', None)):
+                                        self.gui.update_monitor_signal_by_name('dut_phase_v_current', v_val)
+                                        self.gui.update_monitor_signal_by_name('dut_phase_w_current', w_val)
+                                except Exception as e:
+                                    logger.debug(f"Failed to update phase current monitoring: {e}")
+                except Exception as e:
+                    logger.warning(f"Failed to collect signals from cache: {e}", exc_info=True)
+
+            # Show the previous step's results as soon as its analysis finishes
+            self._record_completed_steps(pending_steps)
+
+            # Process Qt events to keep UI responsive
+            if self.gui is not None:
+                try:
+                    if hasattr(self.gui, 'processEvents') and callable(getattr(self.gui, 'processEvents', None)):
+                        self.gui.processEvents()
+                    elif QtCore and hasattr(QtCore.QCoreApplication, 'processEvents'):
+                        QtCore.QCoreApplication.processEvents()
+                except Exception as e:
+                    logger.debug(f"Failed to process Qt events: {e}")
+
+            # Sleep to avoid excessive polling (frames are decoded by _poll_frames periodically)
+            time.sleep(poll_interval)
+    
     def _validate_oscilloscope_settings(self) -> bool:
         """Validate oscilloscope settings against configuration.
         
@@ -551,19 +669,30 @@ class PhaseCurrentTestStateMachine:
             logger.error("Oscilloscope configuration is None")
             return False
         
+        # Query trace status and probe attenuation of the enabled channels and
+        # the timebase in one SCPI batch (one round trip instead of a query and
+        # a 0.2 s sleep each)
+        channel_queries = []
+        try:
+            with self.oscilloscope_service.batch('validate settings') as batch:
+                for ch_num in [1, 2]:
+                    ch_key = f'CH{ch_num}'
+                    channel_config = config.get('channels', {}).get(ch_key, {})
+                    if not channel_config.get('enabled', False):
+                        continue  # Skip disabled channels
+                    channel_queries.append((
+                        ch_num, channel_config,
+                        batch.query(f"C{ch_num}:TRA?", legacy_delay=0.2),
+                        batch.query(f"C{ch_num}:ATTN?", legacy_delay=0.2)))
+                tdiv_query = batch.query("TDIV?", legacy_delay=0.2)
+        except Exception as e:
+            logger.error(f"Failed to query oscilloscope settings: {e}")
+            return False
+        
         # Check enabled channels
-        for ch_num in [1, 2]:
-            ch_key = f'CH{ch_num}'
-            channel_config = config.get('channels', {}).get(ch_key, {})
-            expected_enabled = channel_config.get('enabled', False)
-            
-            if not expected_enabled:
-                continue  # Skip disabled channels
-            
-            # Query trace status
-            time.sleep(0.2)
+        for ch_num, channel_config, tra_query, attn_query in channel_queries:
             logger.debug(f"Checking trace status for channel {ch_num}")
-            tra_response = self.oscilloscope_service.send_command(f"C{ch_num}:TRA?")
+            tra_response = tra_query.value
             if tra_response is None:
                 errors.append(f"Channel {ch_num}: Failed to query trace status")
                 continue
@@ -576,8 +705,7 @@ class PhaseCurrentTestStateMachine:
                 errors.append(f"Channel {ch_num}: Expected enabled but trace is OFF")
             
             # Check probe attenuation
-            time.sleep(0.2)
-            attn_response = self.oscilloscope_service.send_command(f"C{ch_num}:ATTN?")
+            attn_response = attn_query.value
             logger.debug(f"Attenuation response: {attn_response}")
             if attn_response is None:
                 errors.append(f"Channel {ch_num}: Failed to query probe attenuation")
@@ -596,8 +724,7 @@ class PhaseCurrentTestStateMachine:
                 errors.append(f"Channel {ch_num}: Could not parse attenuation")
         
         # Check timebase
-        time.sleep(0.2)
-        tdiv_response = self.oscilloscope_service.send_command("TDIV?")
+        tdiv_response = tdiv_query.value
         logger.debug(f"Timebase response: {tdiv_response}")
         if tdiv_response is None:
             errors.append("Failed to query timebase")
@@ -677,13 +804,10 @@ class PhaseCurrentTestStateMachine:
         vdiv_value = abs(iq_ref) / 2.0
         
         try:
-            # Set C1:VDIV
-            self.oscilloscope_service.send_command(f"C1:VDIV {vdiv_value}")
-            time.sleep(0.2)
-            
-            # Set C2:VDIV
-            self.oscilloscope_service.send_command(f"C2:VDIV {vdiv_value}")
-            time.sleep(0.2)
+            # Set C1:VDIV and C2:VDIV in one transfer, synchronised with *OPC?
+            self.oscilloscope_service.send_commands(
+                [f"C1:VDIV {vdiv_value}", f"C2:VDIV {vdiv_value}"],
+                name='vertical division', legacy_delay=0.2)
             
             logger.info(f"Set vertical division to {vdiv_value} V/div for Iq_ref={iq_ref} A")
             return True
@@ -700,20 +824,21 @@ class PhaseCurrentTestStateMachine:
         # Start oscilloscope acquisition
         if self.oscilloscope_service and self.oscilloscope_service.is_connected():
             try:
-                self.oscilloscope_service.send_command("TRMD AUTO")
-                time.sleep(0.2)
+                self.oscilloscope_service.send_commands(["TRMD AUTO"], name='start acquisition', legacy_delay=0.2)
                 logger.info("Started oscilloscope acquisition")
             except Exception as e:
                 logger.error(f"Failed to start oscilloscope acquisition: {e}")
                 return False
         
-        # Start CAN data logging
+        self._start_can_logging()
+        return True
+    
+    def _start_can_logging(self) -> None:
+        """Start collecting phase current signals (clears the previous step's samples)."""
         if self.can_service and self.can_service.is_connected():
             self.collecting_can_data = True
             self.collected_signals = []
             logger.info("Started CAN data logging")
-        
-        return True
     
     def _send_trigger_message(self, iq_ref: float) -> bool:
         """Send trigger message with test enable and Iq_ref.
@@ -788,8 +913,7 @@ class PhaseCurrentTestStateMachine:
         # Stop oscilloscope
         if self.oscilloscope_service and self.oscilloscope_service.is_connected():
             try:
-                self.oscilloscope_service.send_command("STOP")
-                time.sleep(0.2)
+                self.oscilloscope_service.send_commands(["STOP"], name='stop acquisition', legacy_delay=0.2)
                 logger.info("Stopped oscilloscope acquisition")
             except Exception as e:
                 logger.warning(f"Failed to stop oscilloscope: {e}")
@@ -798,378 +922,233 @@ class PhaseCurrentTestStateMachine:
         self.collecting_can_data = False
         logger.info(f"Stopped CAN data logging (collected {len(self.collected_signals)} signal samples)")
     
-    def _analyze_data(self) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
-        """Analyze oscilloscope and CAN data to compute steady state averages.
+    def _start_step_analysis(self, iq_ref: float) -> Dict[str, Any]:
+        """Retrieve the data of the step just acquired and start its analysis.
+        
+        Both waveforms are transferred now (the next acquisition overwrites
+        them) and each is submitted to the analysis executor as soon as it is
+        retrieved. The CAN samples are analysed on this thread, since the
+        next step resets collected_signals.
         
+        Args:
+            iq_ref: Iq reference value of the step
+            
         Returns:
-            Tuple of (osc_ch1_avg, osc_ch2_avg, can_v_avg, can_w_avg)
+            Pending step dict with 'iq_ref', 'futures' (channel -> Future)
+            and 'can' (v_avg, w_avg)
         """
-        osc_ch1_avg = None
-        osc_ch2_avg = None
-        can_v_avg = None
-        can_w_avg = None
-        
-        # Analyze oscilloscope data
-        try:
-            osc_ch1_avg, osc_ch2_avg = self._analyze_oscilloscope_data()
-        except Exception as e:
-            logger.error(f"Failed to analyze oscilloscope data: {e}", exc_info=True)
+        futures: Dict[int, Optional[Future]] = {}
+        if self.oscilloscope_service and self.oscilloscope_service.is_connected():
+            try:
+                for channel in (1, 2):
+                    waveform_data = self._retrieve_channel_waveform(channel)
+                    if waveform_data:
+                        futures[channel] = self._submit_waveform_analysis(waveform_data, channel)
+            except Exception as e:
+                logger.error(f"Failed to analyze oscilloscope waveforms: {e}", exc_info=True)
         
-        # Analyze CAN data
+        can_avgs: Tuple[Optional[float], Optional[float]] = (None, None)
         try:
-            can_v_avg, can_w_avg = self._analyze_can_data()
+            can_avgs = self._analyze_can_data()
         except Exception as e:
             logger.error(f"Failed to analyze CAN data: {e}", exc_info=True)
         
-        return osc_ch1_avg, osc_ch2_avg, can_v_avg, can_w_avg
+        return {'iq_ref': iq_ref, 'futures': futures, 'can': can_avgs}
     
-    def _analyze_oscilloscope_data(self) -> Tuple[Optional[float], Optional[float]]:
-        """Retrieve and analyze oscilloscope waveforms.
-        
-        Returns:
-            Tuple of (ch1_avg, ch2_avg)
-        """
-        if not self.oscilloscope_service or not self.oscilloscope_service.is_connected():
-            return None, None
+    @staticmethod
+    def _step_analysis_done(step: Dict[str, Any]) -> bool:
+        """True if all waveform analyses of a pending step have finished."""
+        return all(future is None or future.done() for future in step['futures'].values())
+    
+    def _record_completed_steps(self, pending_steps: Deque[Dict[str, Any]], block: bool = False) -> None:
+        """Append the results of finished steps, in Iq_ref order.
         
-        ch1_avg = None
-        ch2_avg = None
+        Steps are only taken from the front of the queue, so a step whose
+        analysis finishes early waits for the steps before it.
         
-        try:
-            # Retrieve CH1 waveform
-            ch1_data = self._retrieve_channel_waveform(1)
-            if ch1_data:
-                ch1_avg = self._analyze_waveform(ch1_data, 1)
-            
-            # Retrieve CH2 waveform
-            ch2_data = self._retrieve_channel_waveform(2)
-            if ch2_data:
-                ch2_avg = self._analyze_waveform(ch2_data, 2)
-        except Exception as e:
-            logger.error(f"Failed to analyze oscilloscope waveforms: {e}", exc_info=True)
-        
-        return ch1_avg, ch2_avg
+        Args:
+            pending_steps: Steps started by _start_step_analysis, oldest first
+            block: Wait for every pending step (end of the test)
+        """
+        while pending_steps and (block or self._step_analysis_done(pending_steps[0])):
+            step = pending_steps.popleft()
+            futures = step['futures']
+            osc_ch1_avg = self._waveform_result(futures.get(1), 1)
+            osc_ch2_avg = self._waveform_result(futures.get(2), 2)
+            can_v_avg, can_w_avg = step['can']
+            self._record_result(step['iq_ref'], osc_ch1_avg, osc_ch2_avg, can_v_avg, can_w_avg)
+    
+    def _record_result(self, iq_ref: float, osc_ch1_avg: Optional[float], osc_ch2_avg: Optional[float],
+                       can_v_avg: Optional[float], can_w_avg: Optional[float]) -> None:
+        """Append one step's averages to the results and the live plots."""
+        # Note: id_ref is always 0.0 in current implementation
+        id_ref = 0.0
+        self.results.append({
+            'iq_ref': iq_ref,
+            'id_ref': id_ref,
+            'osc_ch1_avg': osc_ch1_avg,
+            'osc_ch2_avg': osc_ch2_avg,
+            'can_v_avg': can_v_avg,
+            'can_w_avg': can_w_avg
+        })
+        
+        # Store data for live plots
+        self.plot_can_v_avg.append(can_v_avg if can_v_avg is not None else float('nan'))
+        self.plot_osc_v_avg.append(osc_ch1_avg if osc_ch1_avg is not None else float('nan'))
+        self.plot_can_w_avg.append(can_w_avg if can_w_avg is not None else float('nan'))
+        self.plot_osc_w_avg.append(osc_ch2_avg if osc_ch2_avg is not None else float('nan'))
+        
+        # Update live plots
+        self._update_live_plots()
+        
+        logger.info(f"Iq_ref={iq_ref}: OSC CH1={osc_ch1_avg}, CH2={osc_ch2_avg}, "
+                    f"CAN V={can_v_avg}, W={can_w_avg}")
     
-    def _retrieve_channel_waveform(self, channel: int) -> Optional[bytes]:
+    def _retrieve_channel_waveform(self, channel: int) -> Optional[bytearray]:
         """Retrieve waveform data for a specific channel.
         
-        This method uses chunked reading to handle large waveform data transfers,
-        similar to the test script implementation. It supports both SCPI binary
-        block format and direct binary format.
+        The record is read into one preallocated buffer sized from the binary
+        block header (see OscilloscopeService.read_binary_block). Records longer
+        than OSC_WAVEFORM_MAX_POINTS (if set) are sparsed by the scope.
         
         Args:
             channel: Channel number (1 or 2)
             
         Returns:
-            Binary waveform data or None if retrieval fails
+            Binary waveform data (starting at WAVEDESC) or None if retrieval fails
         """
         if not self.oscilloscope_service or not self.oscilloscope_service.is_connected():
             logger.error("Oscilloscope not connected")
             return None
         
-        try:
-            logger.info(f"Retrieving Channel {channel} waveform data (C{channel}:WF? ALL)...")
-            
-            oscilloscope = self.oscilloscope_service.oscilloscope
-            
-            # Set timeout for large data transfer
-            original_timeout = oscilloscope.timeout
-            oscilloscope.timeout = 10000  # 10 seconds for large waveform data
-            
-            try:
-                # Send query command - waveform data is binary
-                oscilloscope.write(f"C{channel}:WF? ALL")
-                
-                # Read binary data - may need to read in chunks for large waveforms
-                raw_data = b''
-                max_reads = 1000  # Safety limit
-                
-                # Read first chunk to see format
-                try:
-                    first_chunk = oscilloscope.read_raw()
-                    raw_data += first_chunk
-                    logger.info(f"Read first chunk: {len(first_chunk)} bytes")
-                except Exception as e:
-                    logger.error(f"Failed to read first chunk: {e}")
-                    return None
-                
-                # Check if it's SCPI binary block format
-                if len(raw_data) >= 2 and raw_data[0] == ord('#'):
-                    # Parse length from SCPI header
-                    num_digits = int(chr(raw_data[1]))
-                    if 1 <= num_digits <= 9:
-                        length_str = raw_data[2:2+num_digits].decode('ascii')
-                        total_length = int(length_str)
-                        header_size = 2 + num_digits
-                        logger.info(f"SCPI binary block format: total length={total_length}, header={header_size}")
-                        
-                        # Read remaining data
-                        remaining = total_length + header_size - len(raw_data) + 1  # +1 for newline
-                        if remaining > 0:
-                            logger.info(f"Reading remaining {remaining} bytes...")
-                            read_count = 0
-                            while len(raw_data) < total_length + header_size + 1 and read_count < max_reads:
-                                try:
-                                    chunk = oscilloscope.read_raw()
-                                    if not chunk:
-                                        break
-                                    raw_data += chunk
-                                    read_count += 1
-                                    if read_count % 10 == 0:
-                                        logger.debug(f"Read {len(raw_data)} bytes so far...")
-                                except Exception as e:
-                                    logger.warning(f"Error reading chunk: {e}")
-                                    break
-                else:
-                    # Direct binary - read until we get WAVEDESC and then parse to determine length
-                    logger.info("Direct binary format, reading in chunks...")
-                    read_count = 0
-                    while read_count < max_reads:
-                        try:
-                            chunk = oscilloscope.read_raw()
-                            if not chunk:
-                                break
-                            raw_data += chunk
-                            read_count += 1
-                            # Check if we have enough to parse WAVEDESC
-                            if len(raw_data) >= 400:
-                                wavedesc_pos = raw_data.find(b'WAVEDESC')
-                                if wavedesc_pos >= 0:
-                                    # Try to parse WAVE_ARRAY_1 length to know how much more to read
-                                    try:
-                                        wave_array_1_offset = wavedesc_pos + 60
-                                        if len(raw_data) >= wave_array_1_offset + 4:
-                                            wave_array_1_length = struct.unpack('<I', 
-                                                raw_data[wave_array_1_offset:wave_array_1_offset + 4])[0]
-                                            wave_descriptor_length = struct.unpack('<I',
-                                                raw_data[wavedesc_pos + 36:wavedesc_pos + 40])[0]
-                                            user_text_length = struct.unpack('<I',
-                                                raw_data[wavedesc_pos + 40:wavedesc_pos + 44])[0]
-                                            
-                                            expected_total = (wavedesc_pos + wave_descriptor_length + 
-                                                             user_text_length + wave_array_1_length)
-                                            if len(raw_data) >= expected_total:
-                                                logger.info(f"Read complete waveform: {len(raw_data)} bytes")
-                                                break
-                                    except Exception:
-                                        pass
-                        except Exception as e:
-                            logger.debug(f"Read complete or error: {e}")
-                            break
-                
-                logger.info(f"Retrieved {len(raw_data)} bytes of raw data total")
-                
-                # Parse SCPI binary block format: #<n><length><data>
-                if len(raw_data) < 2 or raw_data[0] != ord('#'):
-                    # Data might be direct binary (no SCPI header)
-                    # Check if it starts with WAVEDESC
-                    if raw_data[:8].startswith(b'WAVEDESC'):
-                        logger.info("Waveform data is direct binary (starts with WAVEDESC)")
-                        return raw_data
-                    else:
-                        logger.warning("Waveform data doesn't start with '#' or 'WAVEDESC'")
-                        # Try to find WAVEDESC in the data
-                        wavedesc_pos = raw_data.find(b'WAVEDESC')
-                        if wavedesc_pos >= 0:
-                            logger.info(f"Found WAVEDESC at position {wavedesc_pos}, extracting from there")
-                            return raw_data[wavedesc_pos:]
-                        return raw_data
-                
-                # Parse SCPI binary block format
-                if raw_data[0] == ord('#'):
-                    # Extract length digits
-                    num_digits = int(chr(raw_data[1]))
-                    if num_digits < 1 or num_digits > 9:
-                        logger.warning(f"Invalid number of length digits: {num_digits}")
-                        return raw_data
-                    
-                    # Extract length
-                    length_str = raw_data[2:2+num_digits].decode('ascii')
-                    data_length = int(length_str)
-                    
-                    # Extract actual binary data (skip header: '#' + num_digits + length_str)
-                    header_size = 2 + num_digits
-                    waveform_data = raw_data[header_size:header_size + data_length]
-                    
-                    # Handle potential newline terminator (SCPI standard)
-                    if len(raw_data) > header_size + data_length:
-                        remaining = raw_data[header_size + data_length:]
-                        if remaining.startswith(b'\n') or remaining.startswith(b'\r\n'):
-                            logger.debug("Removed newline terminator from waveform data")
-                    
-                    if len(waveform_data) != data_length:
-                        logger.warning(f"Expected {data_length} bytes, got {len(waveform_data)} bytes")
-                        # Use what we have if it's close
-                        if abs(len(waveform_data) - data_length) <= 2:  # Allow small difference for terminator
-                            logger.info(f"Using {len(waveform_data)} bytes (close to expected {data_length})")
-                        else:
-                            logger.error(f"Data length mismatch too large, cannot proceed")
-                            return None
-                    
-                    logger.info(f"Extracted {len(waveform_data)} bytes of waveform data from SCPI binary block")
-                    return waveform_data
-                else:
-                    # Direct binary data (already handled above)
-                    return raw_data
-                
-            finally:
-                # Restore original timeout
-                oscilloscope.timeout = original_timeout
-                
-        except Exception as e:
-            logger.error(f"Error retrieving CH{channel} waveform: {e}", exc_info=True)
-            return None
+        logger.info(f"Retrieving Channel {channel} waveform data (C{channel}:WF? ALL)...")
+        waveform_data = self.oscilloscope_service.read_waveform(channel, max_points=OSC_WAVEFORM_MAX_POINTS)
+        if waveform_data is None:
+            logger.error(f"Error retrieving CH{channel} waveform")
+        return waveform_data
     
     def _analyze_waveform(self, waveform_data: bytes, channel: int) -> Optional[float]:
-        """Analyze waveform data to compute steady state average.
+        """Analyze waveform data to compute steady state average (blocking).
+        
+        Args:
+            waveform_data: Raw waveform data bytes
+            channel: Channel number (1 or 2)
+            
+        Returns:
+            Average voltage in steady state region, or None if analysis fails
+        """
+        return self._waveform_result(self._submit_waveform_analysis(waveform_data, channel), channel)
+    
+    def _submit_waveform_analysis(self, waveform_data: bytes, channel: int,
+                                  analysis: Optional[Any] = None) -> Optional[Future]:
+        """Start the steady-state analysis of a waveform (see analyze_waveform_steady_state).
         
         This method queries C{channel}:VDIV? and C{channel}:OFST? to get the
         vertical gain and offset, which are used to convert raw waveform values
         to physical voltage values using the formula:
         voltage = (vertical_gain * raw_value) / 25.0 - vertical_offset
         
+        Both values are normally answered from the oscilloscope service's
+        state cache (VDIV is read back when _set_vertical_division sets it).
+        Decoding, filtering and the steady-state search run in the analysis
+        executor (the record is passed via shared memory).
+        
         Args:
             waveform_data: Raw waveform data bytes
             channel: Channel number (1 or 2)
+            analysis: Analysis function (default analyze_waveform_steady_state;
+                analyze_waveform_segments for sequence records)
             
         Returns:
-            Average voltage in steady state region, or None if analysis fails
+            Future resolving to the analysis result, or None if the analysis
+            could not be started
         """
-        if not WaveformDecoder:
-            logger.error("WaveformDecoder not available")
+        analysis = analysis or analyze_waveform_steady_state
+        if not analysis:
+            logger.error("Waveform analysis not available")
             return None
         
-        try:
-            # Query vertical gain from C{channel}:VDIV?
-            vdiv_resp = self.oscilloscope_service.send_command(f"C{channel}:VDIV?")
-            vertical_gain = None
-            if vdiv_resp:
-                vdiv_match = REGEX_VDIV.search(vdiv_resp)
-                if vdiv_match:
-                    try:
-                        vertical_gain = float(vdiv_match.group(1))
-                        logger.info(f"CH{channel}: Queried VDIV = {vertical_gain} V/div")
-                    except ValueError:
-                        logger.warning(f"CH{channel}: Failed to parse VDIV response: {vdiv_resp}")
-                else:
-                    logger.warning(f"CH{channel}: VDIV response format not recognized: {vdiv_resp}")
-            else:
-                logger.warning(f"CH{channel}: No response from C{channel}:VDIV?")
-            
-            # Query vertical offset from C{channel}:OFST?
-            ofst_resp = self.oscilloscope_service.send_command(f"C{channel}:OFST?")
-            vertical_offset = None
-            if ofst_resp:
-                ofst_match = REGEX_OFST.search(ofst_resp)
-                if ofst_match:
-                    try:
-                        vertical_offset = float(ofst_match.group(1))
-                        logger.info(f"CH{channel}: Queried OFST = {vertical_offset} V")
-                    except ValueError:
-                        logger.warning(f"CH{channel}: Failed to parse OFST response: {ofst_resp}")
-                else:
-                    logger.warning(f"CH{channel}: OFST response format not recognized: {ofst_resp}")
-            else:
-                logger.warning(f"CH{channel}: No response from C{channel}:OFST?")
-            
-            # Decode waveform using queried vertical gain and offset
-            # If query failed, decoder will fall back to descriptor values
-            decoder = WaveformDecoder(waveform_data)
-            descriptor, time_values, voltage_values = decoder.decode(
-                vertical_gain=vertical_gain,
-                vertical_offset=vertical_offset
-            )
-            
-            # Log which values were used
-            if vertical_gain is not None:
-                logger.debug(f"CH{channel}: Using vertical gain from C{channel}:VDIV? = {vertical_gain} V/div")
-            else:
-                logger.debug(f"CH{channel}: Using vertical gain from descriptor = {descriptor.get('VERTICAL_GAIN', 'N/A')}")
-            
-            if vertical_offset is not None:
-                logger.debug(f"CH{channel}: Using vertical offset from C{channel}:OFST? = {vertical_offset} V")
-            else:
-                logger.debug(f"CH{channel}: Using vertical offset from descriptor = {descriptor.get('VERTICAL_OFFSET', 'N/A')}")
-            
-            if not voltage_values or len(voltage_values) < 10:
-                logger.warning(f"Insufficient waveform data for CH{channel}")
-                return None
-            
-            # Apply 10kHz low-pass filter (matching test script)
-            if not apply_lowpass_filter:
-                logger.warning("apply_lowpass_filter not available, using unfiltered data")
-                filtered_voltage_values = voltage_values
-            else:
+        # Query vertical gain from C{channel}:VDIV?
+        vdiv_resp = self.oscilloscope_service.send_command(f"C{channel}:VDIV?")
+        vertical_gain = None
+        if vdiv_resp:
+            vdiv_match = REGEX_VDIV.search(vdiv_resp)
+            if vdiv_match:
                 try:
-                    filtered_voltage_values = apply_lowpass_filter(
-                        time_values, voltage_values, cutoff_freq=10000.0
-                    )
-                    logger.info(f"CH{channel} filter applied: {len(filtered_voltage_values)} points")
-                except Exception as e:
-                    logger.warning(f"Failed to filter CH{channel}: {e}, using unfiltered data")
-                    filtered_voltage_values = voltage_values
-            
-            # Discard initial data points below threshold (after filtering)
-            voltage_threshold = 2.0  # Volts
-            initial_discard_end = 0
-            total_points = len(filtered_voltage_values)
-            
-            if numpy_available:
-                filtered_array = np.array(filtered_voltage_values)
-                abs_array = np.abs(filtered_array)
-                # Find first index where voltage exceeds threshold
-                mask = abs_array >= voltage_threshold
-                if np.any(mask):
-                    initial_discard_end = int(np.argmax(mask))
-                else:
-                    initial_discard_end = 0
+                    vertical_gain = float(vdiv_match.group(1))
+                    logger.info(f"CH{channel}: Queried VDIV = {vertical_gain} V/div")
+                except ValueError:
+                    logger.warning(f"CH{channel}: Failed to parse VDIV response: {vdiv_resp}")
             else:
-                # Manual search without numpy
-                for i in range(total_points):
-                    abs_voltage = abs(filtered_voltage_values[i])
-                    if abs_voltage >= voltage_threshold:
-                        initial_discard_end = i
-                        break
-            
-            # If no point exceeds threshold, use first point as start
-            if initial_discard_end == 0 and abs(filtered_voltage_values[0]) >= voltage_threshold:
-                initial_discard_end = 0
-            
-            # Log initial discard information
-            if initial_discard_end > 0:
-                logger.info(f"CH{channel}: Discarding initial {initial_discard_end} points with voltage < {voltage_threshold} V (after filtering)")
-                logger.debug(f"  Initial period: voltage range [{min(abs(v) for v in filtered_voltage_values[:initial_discard_end]):.6f}, "
-                            f"{max(abs(v) for v in filtered_voltage_values[:initial_discard_end]):.6f}] V")
-            
-            # Slice data to start from threshold beginning
-            analysis_start = initial_discard_end
-            filtered_voltage_values = filtered_voltage_values[analysis_start:]
-            time_values = time_values[analysis_start:]
-            
-            if not filtered_voltage_values or len(filtered_voltage_values) < 10:
-                logger.warning(f"CH{channel}: After filtering initial low voltage data, insufficient data points for steady state analysis")
-                return None
-            
-            # Analyze steady state using filtered and threshold-discarded data
-            if not analyze_steady_state_can:
-                logger.error("analyze_steady_state_can not available")
-                return None
-            
-            start_idx, end_idx, avg, std = analyze_steady_state_can(
-                time_values, filtered_voltage_values,
-                variance_threshold_percent=5.0,
-                skip_initial_percent=30.0
-            )
-            
-            if avg is not None:
-                logger.info(f"CH{channel} steady state: avg={avg:.6f} V, std={std:.6f} V")
-                return avg
+                logger.warning(f"CH{channel}: VDIV response format not recognized: {vdiv_resp}")
+        else:
+            logger.warning(f"CH{channel}: No response from C{channel}:VDIV?")
+        
+        # Query vertical offset from C{channel}:OFST?
+        ofst_resp = self.oscilloscope_service.send_command(f"C{channel}:OFST?")
+        vertical_offset = None
+        if ofst_resp:
+            ofst_match = REGEX_OFST.search(ofst_resp)
+            if ofst_match:
+                try:
+                    vertical_offset = float(ofst_match.group(1))
+                    logger.info(f"CH{channel}: Queried OFST = {vertical_offset} V")
+                except ValueError:
+                    logger.warning(f"CH{channel}: Failed to parse OFST response: {ofst_resp}")
             else:
-                logger.warning(f"Failed to find steady state for CH{channel}")
-                return None
+                logger.warning(f"CH{channel}: OFST response format not recognized: {ofst_resp}")
+        else:
+            logger.warning(f"CH{channel}: No response from C{channel}:OFST?")
+        
+        kwargs = {
+            'vertical_gain': vertical_gain,
+            'vertical_offset': vertical_offset,
+            'decimate': OSC_FILTER_DECIMATE,
+            'label': f"CH{channel}",
+        }
+        if self.analysis_executor is not None:
+            try:
+                return self.analysis_executor.submit_shared(analysis, waveform_data, **kwargs)
+            except Exception as e:
+                logger.warning(f"Failed to submit CH{channel} analysis: {e}, analyzing on this thread")
+        future = Future()
+        try:
+            future.set_result(analysis(waveform_data, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def _waveform_result(self, future: Optional[Future], channel: int) -> Optional[float]:
+        """Wait for a waveform analysis (keeping the GUI responsive) and return its average."""
+        if future is None:
+            return None
+        self._wait_for(future)
+        try:
+            result = future.result()
         except Exception as e:
             logger.error(f"Failed to analyze CH{channel} waveform: {e}", exc_info=True)
             return None
+        if not result:
+            return None
+        logger.info(f"CH{channel} steady state: avg={result['avg']:.6f} V, std={result['std']:.6f} V")
+        return result['avg']
+    
+    def _wait_for(self, future: Future) -> None:
+        """Block until a future is done, keeping the GUI responsive."""
+        while not wait([future], timeout=0.05).done:
+            self._process_events()
+    
+    def _process_events(self) -> None:
+        """Process Qt events if the test runs on the GUI thread."""
+        if self.gui is None:
+            return
+        try:
+            if hasattr(self.gui, 'processEvents') and callable(getattr(self.gui, 'processEvents', None)):
+                self.gui.processEvents()
+            elif QtCore and hasattr(QtCore.QCoreApplication, 'processEvents'):
+                QtCore.QCoreApplication.processEvents()
+        except Exception as e:
+            logger.debug(f"Failed to process Qt events: {e}")
     
     def _analyze_can_data(self) -> Tuple[Optional[float], Optional[float]]:
         """Analyze CAN data to compute steady state averages.
@@ -0,0 +1,115 @@
+"""
+Diff-based application of oscilloscope configurations.
+
+A configuration (see backend/data/oscilloscope_configs) is turned into the
+settings it requires (configuration_target()): the display state C{n}:TRA
+of every configured channel and the timebase TDIV. The probe attenuation
+C{n}:ATTN of enabled channels is only verified, as before.
+
+plan_configuration() compares the target with the known oscilloscope state
+(ScopeStateCache) and splits it into settings that must be written,
+settings that already have the target value and settings whose value is
+unknown. OscilloscopeService.apply_configuration() sends only the writes
+and the verification queries not answered by the cache, in one batch, so
+switching between saved configurations costs one exchange with the scope
+(none if nothing changes). With read_state=True the unknown settings are
+read first (one more exchange), so a setting the scope already has is not
+rewritten either.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from host_gui.services.scope_state import ScopeStateCache, response_value, same_value
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_KEYS = ('CH1', 'CH2', 'CH3', 'CH4')
+
+
+@dataclass
+class ConfigTarget:
+    """Settings a configuration requires.
+
+    Attributes:
+        settings: Header -> value to write (e.g. 'C1:TRA' -> 'ON', 'TDIV' -> '0.2')
+        expected: Header -> value that is verified but not written (C{n}:ATTN)
+    """
+    settings: Dict[str, str] = field(default_factory=dict)
+    expected: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def headers(self) -> List[str]:
+        return list(self.settings) + list(self.expected)
+
+
+@dataclass
+class ConfigPlan:
+    """Difference between a configuration target and the known scope state.
+
+    Attributes:
+        writes: Commands for settings that differ from the target or are unknown
+        unchanged: Headers already at the target value
+        unknown: Headers (settings and verified values) whose current value is not known
+    """
+    writes: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    unknown: List[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        return (f"{len(self.writes)} setting(s) to write, {len(self.unchanged)} unchanged, "
+                f"{len(self.unknown)} unknown")
+
+
+def configuration_target(config: Dict[str, Any]) -> ConfigTarget:
+    """Return the settings an oscilloscope configuration requires.
+
+    Args:
+        config: Configuration with 'channels' and optionally 'acquisition'
+
+    Raises:
+        ValueError: If the configuration has no 'channels' key
+    """
+    if 'channels' not in config:
+        raise ValueError("Configuration missing 'channels' key")
+    target = ConfigTarget()
+    for ch_key in CHANNEL_KEYS:
+        ch_config = config['channels'].get(ch_key)
+        if ch_config is None:
+            continue
+        channel = int(ch_key[2])
+        enabled = ch_config.get('enabled', False)
+        target.settings[f"C{channel}:TRA"] = 'ON' if enabled else 'OFF'
+        if enabled:
+            target.expected[f"C{channel}:ATTN"] = str(ch_config.get('probe_attenuation', 1.0))
+    timebase_ms = config.get('acquisition', {}).get('timebase_ms')
+    if timebase_ms is not None:
+        target.settings['TDIV'] = str(timebase_ms / 1000.0)
+    return target
+
+
+def plan_configuration(target: ConfigTarget, state: ScopeStateCache) -> ConfigPlan:
+    """Compare a configuration target with the cached oscilloscope state.
+
+    Settings with an unknown value are written (a blind write costs the same
+    exchange as reading the value first).
+
+    Args:
+        target: Settings from configuration_target()
+        state: Known oscilloscope state
+
+    Returns:
+        ConfigPlan with the writes needed to reach the target
+    """
+    plan = ConfigPlan()
+    for header, value in target.settings.items():
+        current = state.get(header)
+        if current is None:
+            plan.unknown.append(header)
+            plan.writes.append(f"{header} {value}")
+        elif same_value(response_value(header, current), value):
+            plan.unchanged.append(header)
+        else:
+            plan.writes.append(f"{header} {value}")
+    plan.unknown.extend(header for header in target.expected if state.get(header) is None)
+    return plan
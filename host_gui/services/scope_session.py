@@ -0,0 +1,293 @@
+"""
+Persistent oscilloscope session with health checks and fast reconnection.
+
+A VISA error (timeout, dropped LAN connection, USB reset) used to leave the
+open resource in an unknown state until the user disconnected and
+reconnected in the GUI. ScopeSession owns the resource and stands in for it
+(write(), query(), read_raw(), timeout, ...), so OscilloscopeService and
+ScpiBatch use it unchanged:
+
+- An operation that fails marks the session unhealthy. Recovery first tries
+  a device clear and an ``*OPC?`` probe on the open resource (flushes stale
+  output after a timeout); only if that fails is the resource reopened.
+  Reopening skips ``*IDN?`` because the identity is already known.
+- Failed reopen attempts are retried with exponential backoff. While the
+  session is down, operations fail immediately instead of each waiting for
+  the VISA timeout.
+- A background thread probes an idle session with ``*OPC?`` every
+  keepalive interval, so a dead connection is noticed and re-established
+  between tests rather than during the next measurement.
+
+Queries use the session's (short) timeout; bulk transfers hold the session
+exclusively with their own timeout (transfer()).
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from host_gui.constants import (
+    OSC_KEEPALIVE_S, OSC_RECONNECT_BACKOFF_S, OSC_RECONNECT_BACKOFF_MAX_S
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ScopeSession:
+    """Self-healing connection to one oscilloscope.
+
+    Args:
+        opener: Opens the resource and returns the instrument
+                (e.g. lambda: resource_manager.open_resource(resource))
+        resource: Resource string (for log messages)
+        timeout_ms: VISA timeout for commands and queries
+        keepalive_s: Idle time after which the session is probed (0 = no background thread)
+        backoff_s: Delay before the second reopen attempt (doubles per failure)
+        backoff_max_s: Longest delay between reopen attempts
+        on_reconnect: Called after the resource was reopened (the instrument
+                      may have been power-cycled, so cached settings are stale)
+
+    Attributes:
+        instrument: Currently open instrument (None while it cannot be opened)
+        healthy: False after a failed operation until the session has recovered
+        failures: Operations that failed
+        reconnects: Times the resource was reopened
+    """
+
+    def __init__(self, opener: Callable[[], Any], resource: str, timeout_ms: int,
+                 keepalive_s: float = OSC_KEEPALIVE_S, backoff_s: float = OSC_RECONNECT_BACKOFF_S,
+                 backoff_max_s: float = OSC_RECONNECT_BACKOFF_MAX_S,
+                 on_reconnect: Optional[Callable[[], None]] = None):
+        self._opener = opener
+        self.on_reconnect = on_reconnect
+        self.resource = resource
+        self._timeout_ms = timeout_ms
+        self.keepalive_s = keepalive_s
+        self.backoff_s = backoff_s
+        self.backoff_max_s = backoff_max_s
+        self.instrument = None
+        self.healthy = False
+        self.failures = 0
+        self.reconnects = 0
+        self._lock = threading.RLock()
+        self._backoff = backoff_s
+        self._next_attempt = 0.0
+        self._last_activity = time.monotonic()
+        self._closed = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def open(self) -> 'ScopeSession':
+        """Open the resource and start the health monitor.
+
+        Raises:
+            Exception: Whatever the opener raises if the resource cannot be opened
+        """
+        with self._lock:
+            self._closed.clear()
+            self.instrument = self._opener()
+            self.instrument.timeout = self._timeout_ms
+            self.healthy = True
+            self._last_activity = time.monotonic()
+        if self.keepalive_s > 0 and self._thread is None:
+            self._thread = threading.Thread(target=self._monitor, name='ScopeSessionMonitor', daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop the health monitor and close the resource."""
+        self._closed.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=max(self._timeout_ms / 1000.0, 1.0) + 1.0)
+            self._thread = None
+        with self._lock:
+            self._close_instrument()
+            self.healthy = False
+
+    # ------------------------------------------------------------------
+    # Instrument interface
+    # ------------------------------------------------------------------
+
+    @property
+    def timeout(self) -> int:
+        return self._timeout_ms
+
+    @timeout.setter
+    def timeout(self, value: int) -> None:
+        with self._lock:
+            self._timeout_ms = value
+            if self.instrument is not None:
+                self.instrument.timeout = value
+
+    def write(self, message: str) -> Any:
+        return self._call('write', message)
+
+    def query(self, message: str) -> str:
+        return self._call('query', message)
+
+    def read(self) -> str:
+        return self._call('read')
+
+    def read_raw(self, size: Optional[int] = None) -> bytes:
+        return self._call('read_raw', size) if size is not None else self._call('read_raw')
+
+    def clear(self) -> None:
+        self._call('clear')
+
+    def __getattr__(self, name: str) -> Any:
+        # Other resource attributes (visalib, session, ignore_warning, ...)
+        instrument = self.__dict__.get('instrument')
+        if instrument is None:
+            raise AttributeError(name)
+        return getattr(instrument, name)
+
+    @contextmanager
+    def transfer(self, timeout_ms: Optional[int] = None) -> Iterator[Any]:
+        """Hold the session for a multi-step transfer (e.g. a binary block read).
+
+        The health monitor does not probe during the transfer, and the
+        timeout is restored afterwards. A failure inside marks the session
+        unhealthy.
+
+        Args:
+            timeout_ms: VISA timeout during the transfer (None keeps the query timeout)
+
+        Yields:
+            The session (use it like the instrument)
+        """
+        with self._lock:
+            self._ensure_available()
+            query_timeout = self._timeout_ms
+            if timeout_ms is not None:
+                self.instrument.timeout = timeout_ms
+            try:
+                yield self
+            except Exception as e:
+                if self.healthy:  # not yet recorded by a failed operation inside
+                    self.mark_failed(e)
+                raise
+            finally:
+                if self.instrument is not None:
+                    self.instrument.timeout = query_timeout
+                self._last_activity = time.monotonic()
+
+    def mark_failed(self, error: Exception) -> None:
+        """Record a failed operation; recovery starts with the next operation or probe."""
+        with self._lock:
+            self.failures += 1
+            if self.healthy:
+                logger.warning(f"Oscilloscope session {self.resource} failed: {error}")
+            self.healthy = False
+        self._wake.set()
+
+    # ------------------------------------------------------------------
+    # Recovery
+    # ------------------------------------------------------------------
+
+    def _call(self, name: str, *args: Any) -> Any:
+        with self._lock:
+            self._ensure_available()
+            try:
+                result = getattr(self.instrument, name)(*args)
+            except Exception as e:
+                self.mark_failed(e)
+                raise
+            self._last_activity = time.monotonic()
+            return result
+
+    def _ensure_available(self) -> None:
+        """Recover an unhealthy session if a reconnect attempt is due, else fail fast."""
+        if self._closed.is_set():
+            raise IOError(f"Oscilloscope session {self.resource} is closed")
+        if self.healthy:
+            return
+        wait = self._next_attempt - time.monotonic()
+        if wait > 0 or not self._recover():
+            wait = max(self._next_attempt - time.monotonic(), 0.0)
+            raise IOError(f"Oscilloscope session {self.resource} is down (next reconnect attempt in {wait:.1f}s)")
+
+    def _probe(self) -> bool:
+        try:
+            return self.instrument.query('*OPC?').strip().endswith('1')
+        except Exception as e:
+            logger.debug(f"Oscilloscope probe failed: {e}")
+            return False
+
+    def _recover(self) -> bool:
+        """Device clear on the open resource, else reopen it. Caller holds the lock."""
+        if self.instrument is not None:
+            try:
+                clear = getattr(self.instrument, 'clear', None)
+                if callable(clear):
+                    clear()
+                if self._probe():
+                    self._recovered("device clear")
+                    return True
+            except Exception as e:
+                logger.debug(f"Device clear failed: {e}")
+        self._close_instrument()
+        try:
+            self.instrument = self._opener()
+            self.instrument.timeout = self._timeout_ms
+            if not self._probe():
+                raise IOError("no response to *OPC?")
+        except Exception as e:
+            self._close_instrument()
+            self._next_attempt = time.monotonic() + self._backoff
+            logger.warning(f"Reconnecting oscilloscope {self.resource} failed: {e} "
+                           f"(retry in {self._backoff:.1f}s)")
+            self._backoff = min(self._backoff * 2, self.backoff_max_s)
+            return False
+        self.reconnects += 1
+        self._recovered("reconnect")
+        if self.on_reconnect is not None:
+            try:
+                self.on_reconnect()
+            except Exception as e:
+                logger.warning(f"Reconnect callback failed: {e}")
+        return True
+
+    def _recovered(self, how: str) -> None:
+        self.healthy = True
+        self._backoff = self.backoff_s
+        self._next_attempt = 0.0
+        self._last_activity = time.monotonic()
+        logger.info(f"Oscilloscope session {self.resource} recovered ({how})")
+
+    def _close_instrument(self) -> None:
+        if self.instrument is not None:
+            try:
+                self.instrument.close()
+            except Exception as e:
+                logger.debug(f"Error closing oscilloscope resource: {e}")
+            self.instrument = None
+
+    def _monitor(self) -> None:
+        """Probe an idle session every keepalive interval and reconnect a failed one."""
+        while not self._closed.is_set():
+            if self.healthy:
+                wait = self._last_activity + self.keepalive_s - time.monotonic()
+            else:
+                wait = self._next_attempt - time.monotonic()
+            self._wake.wait(max(wait, 0.01))
+            self._wake.clear()
+            if self._closed.is_set():
+                break
+            # Skip while an operation is in progress (it shows the session is alive)
+            if not self._lock.acquire(blocking=False):
+                self._closed.wait(0.05)
+                continue
+            try:
+                now = time.monotonic()
+                if self.healthy:
+                    if now - self._last_activity >= self.keepalive_s:
+                        if self._probe():
+                            self._last_activity = now
+                        else:
+                            self.mark_failed(IOError("no response to keep-alive *OPC?"))
+                elif now >= self._next_attempt:
+                    self._recover()
+            finally:
+                self._lock.release()
@@ -0,0 +1,546 @@
+"""
+Simulated Siglent oscilloscope for offline testing and benchmarking.
+
+SimulatedScope behaves like an open PyVISA resource (write(), query(),
+read_raw(), timeout, close()) and implements the SCPI subset the
+application uses:
+
+- *IDN?, *OPC?, *RST and ';'-joined program messages (ScpiBatch)
+- channel settings C{n}:VDIV, OFST, ATTN, TRA, UNIT and TDIV (set and query)
+- acquisition control TRMD AUTO/NORM/SINGLE/STOP, STOP, ARM and TRMD?
+- C{n}:PAVA? MEAN/MAX/MIN/PKPK/RMS ('****' while the measurements are not
+  ready yet, see measurement_delay_s), SANU? C{n} and WFSU (first point,
+  points, sparsing)
+- C{n}:WF? ALL as an IEEE 488.2 block with a valid WAVEDESC record
+- sequence acquisition (SEQ ON,n) with trigger time array, and the
+  acquisition history (HSMD, FRAM)
+
+Each channel carries a step from 0 V to a configurable level with
+Gaussian noise (set_signal()), quantised to 8-bit samples with the
+channel's VDIV/OFST like the real scope. Every transfer can be delayed by
+a fixed latency and a bus bandwidth, so tests and benchmarks of the whole
+scope path (batching, caching, binary transfers, analysis) are
+reproducible without hardware.
+
+OscilloscopeService.connect() opens a SimulatedScope for resources that
+start with 'SIM' (e.g. OSC_SIMULATOR_RESOURCE). ScopeSimulatorServer serves
+one as a raw SCPI socket on localhost (like the scope's LAN port 5555):
+newline-terminated messages in, responses (text lines or WF? blocks) out,
+for tools running in another process.
+
+Usage::
+
+    service.connect(OSC_SIMULATOR_RESOURCE)
+    service.session.instrument.set_signal(1, level=2.5, noise=0.02)
+"""
+import logging
+import socketserver
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from host_gui.services.scope_state import split_command
+from host_gui.utils.waveform_decoder import WaveformDecoder
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    numpy_available = True
+except ImportError:
+    np = None
+    numpy_available = False
+
+SIMULATOR_IDN = "Siglent Technologies,SDS1104X-U,SIM0000000001,8.2.6.1.37R9"
+SIMULATOR_CHANNELS = 4
+HORIZONTAL_DIVISIONS = 14
+WAVEDESC_LENGTH = 346
+CODES_PER_DIV = 25.0  # 8-bit sample codes per vertical division
+
+
+@dataclass
+class SimulatedChannel:
+    """Settings and signal of one simulated channel.
+
+    The signal is 0 V before step_at (fraction of the record) and level
+    afterwards, plus Gaussian noise with the given standard deviation.
+    """
+    vdiv: float = 1.0
+    offset: float = 0.0
+    attn: float = 1.0
+    trace: bool = True
+    unit: str = 'V'
+    level: float = 0.0
+    noise: float = 0.0
+    step_at: float = 0.0
+
+
+@dataclass
+class _Frame:
+    """One acquisition: channel settings and signals at trigger time."""
+    serial: int
+    trigger_time: float
+    channels: Dict[int, SimulatedChannel] = field(default_factory=dict)
+
+
+def _number(value: str) -> float:
+    """Parse a SCPI numeric argument such as '2.00E+00V' or '1e-3'."""
+    text = value.strip().upper()
+    while text and text[-1].isalpha():
+        text = text[:-1]
+    return float(text)
+
+
+class SimulatedScope:
+    """In-process stand-in for a Siglent SDS1104X-U PyVISA resource.
+
+    Args:
+        points: Acquired points per channel and segment (SANU)
+        latency_s: Delay of every write and every read (bus turnaround)
+        bandwidth_bps: Bus throughput in bytes per second for responses (0 = unlimited)
+        auto_trigger: Single and sequence acquisitions trigger immediately;
+                      with False every trigger() call fills the next segment
+        sequence_in_one_record: WF? returns all segments of a sequence in one
+                                record; with False only the selected history
+                                frame is returned (like older firmware)
+        seed: Seed of the noise generator (same seed, same samples)
+        measurement_delay_s: PAVA? answers '****' for this long after an
+                             acquisition stopped (measurements still being computed)
+    """
+
+    def __init__(self, points: int = 140_000, latency_s: float = 0.0, bandwidth_bps: float = 0.0,
+                 auto_trigger: bool = True, sequence_in_one_record: bool = True, seed: int = 0,
+                 measurement_delay_s: float = 0.0):
+        if not numpy_available:
+            raise RuntimeError("NumPy is required for the oscilloscope simulator")
+        self.points = points
+        self.latency_s = latency_s
+        self.bandwidth_bps = bandwidth_bps
+        self.auto_trigger = auto_trigger
+        self.sequence_in_one_record = sequence_in_one_record
+        self.seed = seed
+        self.measurement_delay_s = measurement_delay_s
+        self.timeout = 5000  # ms, like a PyVISA resource (not used)
+        self.writes: List[str] = []  # every program message received
+        self.closed = False
+        self._lock = threading.RLock()
+        self._output = bytearray()
+        self._samples: Dict[Tuple[int, int], 'np.ndarray'] = {}
+        self.reset()
+
+    # ------------------------------------------------------------------
+    # Instrument state
+    # ------------------------------------------------------------------
+
+    def reset(self) -> None:
+        """Restore the power-on state (*RST); signal settings are kept."""
+        with self._lock:
+            signals = getattr(self, 'channels', {})
+            self.channels = {ch: SimulatedChannel() for ch in range(1, SIMULATOR_CHANNELS + 1)}
+            for ch, old in signals.items():
+                self.channels[ch].level, self.channels[ch].noise = old.level, old.noise
+                self.channels[ch].step_at = old.step_at
+            self.tdiv = 1e-3
+            self.trigger_mode = 'AUTO'
+            self.running = True
+            self.sequence_segments = 0
+            self.history_mode = False
+            self.history_frame = 0
+            self.waveform_setup = (1, 0, 0)  # sparsing, points, first point
+            self.settings: Dict[str, str] = {}
+            self.frames: List[_Frame] = []
+            self._stopped_at = 0.0  # time.monotonic() of the last acquisition stop
+            self._serial = 0
+            self._samples.clear()
+
+    def set_signal(self, channel: int, level: float, noise: float = 0.0, step_at: float = 0.0) -> None:
+        """Set the signal seen by a channel from the next acquisition on.
+
+        Args:
+            channel: Channel number (1-4)
+            level: Level after the step in volts (as displayed, probe included)
+            noise: Standard deviation of the added noise in volts
+            step_at: Position of the step from 0 V as a fraction of the record
+        """
+        with self._lock:
+            ch = self.channels[channel]
+            ch.level, ch.noise, ch.step_at = level, noise, step_at
+
+    def trigger(self) -> bool:
+        """Trigger the armed acquisition (fills the next sequence segment).
+
+        Returns:
+            True if an acquisition was waiting for a trigger
+        """
+        with self._lock:
+            if self.running and self.trigger_mode == 'SINGLE':
+                self._capture()
+                return True
+            return False
+
+    def _snapshot(self) -> _Frame:
+        self._serial += 1
+        channels = {ch: SimulatedChannel(**vars(settings)) for ch, settings in self.channels.items()}
+        return _Frame(self._serial, time.monotonic(), channels)
+
+    def _capture(self) -> None:
+        """Single/sequence acquisition: store one frame, stop after the last segment."""
+        self.frames.append(self._snapshot())
+        if len(self.frames) >= max(self.sequence_segments, 1):
+            self.running = False
+            self.trigger_mode = 'STOP'
+            self._stopped_at = time.monotonic()
+
+    def _arm(self) -> None:
+        self.frames = []
+        self._samples.clear()
+        self.trigger_mode = 'SINGLE'
+        self.running = True
+        if self.auto_trigger:
+            while self.running:
+                self._capture()
+
+    def _stop(self) -> None:
+        if self.running:
+            if self.trigger_mode == 'SINGLE':
+                # Stopping a sequence keeps the segments acquired so far
+                self.frames = self.frames or [self._snapshot()]
+            else:
+                self._samples.clear()
+                self.frames = [self._snapshot()]
+            self.running = False
+            self._stopped_at = time.monotonic()
+        self.trigger_mode = 'STOP'
+
+    def _current_frames(self) -> List[_Frame]:
+        """Frames a waveform transfer or measurement refers to."""
+        if self.running and self.trigger_mode != 'SINGLE':
+            # A running scope returns its latest acquisition
+            self._samples.clear()
+            self.frames = [self._snapshot()]
+        if not self.frames:
+            self.frames = [self._snapshot()]
+        if self.history_mode:
+            index = min(max(self.history_frame, 1), len(self.frames)) - 1
+            return [self.frames[index]]
+        if self.sequence_in_one_record:
+            return self.frames
+        return self.frames[-1:]
+
+    def _codes(self, frame: _Frame, channel: int) -> 'np.ndarray':
+        """8-bit sample codes of a channel in one frame (generated once)."""
+        key = (frame.serial, channel)
+        codes = self._samples.get(key)
+        if codes is None:
+            ch = frame.channels[channel]
+            volts = np.zeros(self.points, dtype=np.float64)
+            volts[int(self.points * min(max(ch.step_at, 0.0), 1.0)):] = ch.level
+            if ch.noise > 0:
+                rng = np.random.default_rng((self.seed, frame.serial, channel))
+                volts += rng.normal(0.0, ch.noise, self.points)
+            codes = np.clip(np.rint((volts + ch.offset) * CODES_PER_DIV / ch.vdiv), -128, 127).astype(np.int8)
+            self._samples[key] = codes
+        return codes
+
+    def _wavedesc(self, frames: List[_Frame], channel: int, first: int, sparsing: int,
+                  count: int) -> bytearray:
+        ch = frames[-1].channels[channel]
+        interval = self.tdiv * HORIZONTAL_DIVISIONS / self.points
+        segments = len(frames) if len(frames) > 1 else 0
+        desc = bytearray(WAVEDESC_LENGTH)
+        desc[0:8] = b'WAVEDESC'
+        desc[16:23] = b'WAVEACE'
+        struct.pack_into('<HH', desc, WaveformDecoder.COMM_TYPE_OFFSET, WaveformDecoder.COMM_TYPE_BYTE, 1)
+        struct.pack_into('<II', desc, WaveformDecoder.WAVE_DESCRIPTOR_OFFSET, WAVEDESC_LENGTH, 0)
+        struct.pack_into('<I', desc, WaveformDecoder.TRIGTIME_ARRAY_OFFSET,
+                         segments * WaveformDecoder.TRIGTIME_ENTRY.size)
+        struct.pack_into('<I', desc, WaveformDecoder.WAVE_ARRAY_1_OFFSET, count)
+        desc[76:92] = b'Siglent SDS1104X'
+        struct.pack_into('<I', desc, WaveformDecoder.WAVE_ARRAY_COUNT_OFFSET, count)
+        struct.pack_into('<II', desc, WaveformDecoder.FIRST_POINT_OFFSET, first, sparsing)
+        struct.pack_into('<I', desc, WaveformDecoder.SUBARRAY_COUNT_OFFSET, segments)
+        struct.pack_into('<ff', desc, WaveformDecoder.VERTICAL_GAIN_OFFSET, ch.vdiv, ch.offset)
+        struct.pack_into('<f', desc, WaveformDecoder.HORIZ_INTERVAL_OFFSET, interval)
+        struct.pack_into('<d', desc, WaveformDecoder.HORIZ_OFFSET_OFFSET, -self.tdiv * HORIZONTAL_DIVISIONS / 2)
+        return desc
+
+    def _waveform(self, channel: int) -> bytes:
+        """C{channel}:WF? ALL response: header, block with WAVEDESC record, newline."""
+        frames = self._current_frames()
+        sparsing, num_points, first = self.waveform_setup
+        sparsing = max(sparsing, 1)
+        first = min(first, self.points)
+        end = self.points if num_points <= 0 else min(self.points, first + num_points * sparsing)
+        samples = [self._codes(frame, channel)[first:end:sparsing] for frame in frames]
+        count = sum(len(s) for s in samples)
+        record = self._wavedesc(frames, channel, first, sparsing, count)
+        if len(frames) > 1:
+            # TRIGGER_TIME after the first segment, TRIGGER_OFFSET of the segment's first point
+            for frame in frames:
+                record += WaveformDecoder.TRIGTIME_ENTRY.pack(frame.trigger_time - frames[0].trigger_time,
+                                                              -self.tdiv * HORIZONTAL_DIVISIONS / 2)
+        for segment in samples:
+            record += segment.tobytes()
+        return b'C%d:WF ALL,#9%09d' % (channel, len(record)) + bytes(record) + b'\n'
+
+    def _measure(self, channel: int, parameter: str) -> Optional[float]:
+        """PAVA measurement on the last acquired frame (None if not supported or not ready)."""
+        if not self.running and time.monotonic() - self._stopped_at < self.measurement_delay_s:
+            return None
+        frame = self._current_frames()[-1]
+        ch = frame.channels[channel]
+        volts = self._codes(frame, channel).astype(np.float64) * (ch.vdiv / CODES_PER_DIV) - ch.offset
+        measurements = {
+            'MEAN': volts.mean, 'MAX': volts.max, 'MIN': volts.min, 'PKPK': np.ptp(volts).item,
+            'RMS': lambda: float(np.sqrt(np.mean(volts * volts))),
+        }
+        measure = measurements.get(parameter)
+        return None if measure is None else float(measure())
+
+    # ------------------------------------------------------------------
+    # SCPI parser
+    # ------------------------------------------------------------------
+
+    def _execute(self, unit: str) -> Optional[str]:
+        """Execute one command or query; returns the query response."""
+        header, argument = split_command(unit)
+        query = '?' in unit.split(None, 1)[0]
+        channel_prefix, _, name = header.rpartition(':')
+        channel = None
+        if channel_prefix[:1] == 'C' and channel_prefix[1:].isdigit():
+            channel = int(channel_prefix[1:])
+            if channel not in self.channels:
+                raise ValueError(f"Invalid channel in '{unit}'")
+        ch = self.channels.get(channel)
+
+        if header == '*IDN':
+            return SIMULATOR_IDN
+        if header == '*OPC':
+            return '1' if query else None
+        if header == '*RST':
+            self.reset()
+            return None
+        if ch is not None and name in ('VDIV', 'OFST', 'ATTN', 'TRA', 'UNIT'):
+            return self._channel_setting(channel, ch, name, argument, query)
+        if ch is not None and name == 'PAVA':
+            parameter = argument.upper() or 'MEAN'
+            value = self._measure(channel, parameter)
+            return f"C{channel}:PAVA {parameter},{'****' if value is None else f'{value:.6E}V'}"
+        if ch is not None and name == 'WF':
+            self._output += self._waveform(channel)
+            return None
+        if header == 'TDIV':
+            if query:
+                return f"TDIV {self.tdiv:.2E}S"
+            self.tdiv = _number(argument)
+            return None
+        if header == 'TRMD':
+            if query:
+                return f"TRMD {self.trigger_mode}"
+            mode = argument.upper()
+            if mode == 'STOP':
+                self._stop()
+            elif mode == 'SINGLE':
+                self._arm()
+            else:
+                self.trigger_mode, self.running = mode, True
+                self.frames = []
+            return None
+        if header == 'STOP':
+            self._stop()
+            return None
+        if header == 'ARM':
+            self._arm()
+            return None
+        if header == 'SANU':
+            return f"SANU {self.points:.2E}pts"
+        if header == 'WFSU':
+            if query:
+                sparsing, points, first = self.waveform_setup
+                return f"WFSU SP,{sparsing},NP,{points},FP,{first}"
+            values = argument.replace(' ', '').upper().split(',')
+            setup = dict(zip(values[0::2], values[1::2]))
+            sparsing, points, first = self.waveform_setup
+            self.waveform_setup = (int(setup.get('SP', sparsing)), int(setup.get('NP', points)),
+                                   int(setup.get('FP', first)))
+            return None
+        if header == 'SEQ':
+            if query:
+                return f"SEQ ON,{self.sequence_segments}" if self.sequence_segments else "SEQ OFF"
+            values = argument.upper().split(',')
+            enabled = values[0].strip() == 'ON'
+            self.sequence_segments = int(values[1]) if enabled and len(values) > 1 else 0
+            return None
+        if header == 'HSMD':
+            if query:
+                return f"HSMD {'ON' if self.history_mode else 'OFF'}"
+            self.history_mode = argument.upper() == 'ON'
+            return None
+        if header == 'FRAM':
+            if query:
+                return f"FRAM {self.history_frame}"
+            self.history_frame = int(_number(argument))
+            return None
+        # Other settings are stored and echoed back
+        if query:
+            if header not in self.settings:
+                raise IOError(f"Simulated scope has no response to '{unit}'")
+            return f"{header} {self.settings[header]}"
+        self.settings[header] = argument
+        return None
+
+    def _channel_setting(self, channel: int, ch: SimulatedChannel, name: str, argument: str,
+                         query: bool) -> Optional[str]:
+        if query:
+            value = {
+                'VDIV': f"{ch.vdiv:.2E}V", 'OFST': f"{ch.offset:.2E}V", 'ATTN': f"{ch.attn:g}",
+                'TRA': 'ON' if ch.trace else 'OFF', 'UNIT': ch.unit,
+            }[name]
+            return f"C{channel}:{name} {value}"
+        if name == 'VDIV':
+            ch.vdiv = _number(argument)
+        elif name == 'OFST':
+            ch.offset = _number(argument)
+        elif name == 'ATTN':
+            ch.attn = _number(argument)
+        elif name == 'TRA':
+            ch.trace = argument.upper() == 'ON'
+        else:
+            ch.unit = argument.upper()
+        return None
+
+    # ------------------------------------------------------------------
+    # PyVISA resource interface
+    # ------------------------------------------------------------------
+
+    def write(self, message: str) -> int:
+        """Execute a program message (units separated by ';').
+
+        Unread output of a previous query is discarded, like a real
+        instrument does when a new message arrives.
+        """
+        self._delay(0)
+        with self._lock:
+            self.writes.append(message)
+            self._output = bytearray()
+            responses = []
+            for unit in message.strip().split(';'):
+                if unit.strip():
+                    response = self._execute(unit.strip())
+                    if response is not None:
+                        responses.append(response)
+            if responses:
+                self._output += (';'.join(responses) + '\n').encode('ascii')
+        return len(message)
+
+    def read_raw(self, size: Optional[int] = None) -> bytes:
+        """Read up to size bytes of pending output (all of it if size is None)."""
+        with self._lock:
+            if not self._output:
+                raise IOError("Simulated scope timeout: no pending output")
+            size = len(self._output) if size is None else size
+            data = bytes(self._output[:size])
+            del self._output[:size]
+        self._delay(len(data))
+        return data
+
+    def read(self) -> str:
+        """Read one text response (up to and including the newline)."""
+        with self._lock:
+            end = self._output.find(b'\n')
+            size = len(self._output) if end < 0 else end + 1
+        return self.read_raw(size).decode('ascii', errors='replace')
+
+    def query(self, message: str) -> str:
+        self.write(message)
+        return self.read()
+
+    def clear(self) -> None:
+        """Device clear: discard pending output."""
+        with self._lock:
+            self._output = bytearray()
+
+    def close(self) -> None:
+        self.closed = True
+
+    def _delay(self, size: int) -> None:
+        delay = self.latency_s
+        if self.bandwidth_bps > 0:
+            delay += size / self.bandwidth_bps
+        if delay > 0:
+            time.sleep(delay)
+
+
+class _ScpiSocketHandler(socketserver.StreamRequestHandler):
+    """Newline-terminated program messages in, responses out."""
+
+    def handle(self) -> None:
+        scope = self.server.scope
+        for line in self.rfile:
+            message = line.decode('ascii', errors='replace').strip()
+            if not message:
+                continue
+            try:
+                scope.write(message)
+                output = scope.read_raw() if scope._output else b''
+            except Exception as e:
+                logger.warning(f"Simulated scope error for '{message}': {e}")
+                continue
+            if output:
+                self.wfile.write(output)
+                self.wfile.flush()
+
+
+class ScopeSimulatorServer:
+    """Serve a SimulatedScope as a raw SCPI socket on localhost.
+
+    Usage::
+
+        with ScopeSimulatorServer(SimulatedScope(latency_s=0.001)) as server:
+            host, port = server.address
+            # resource string for PyVISA: server.resource (TCPIP::host::port::SOCKET)
+    """
+
+    def __init__(self, scope: Optional[SimulatedScope] = None, host: str = '127.0.0.1', port: int = 0):
+        self.scope = scope if scope is not None else SimulatedScope()
+        self._server = socketserver.ThreadingTCPServer((host, port), _ScpiSocketHandler,
+                                                       bind_and_activate=False)
+        self._server.daemon_threads = True
+        self._server.allow_reuse_address = True
+        self._server.scope = self.scope
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    @property
+    def resource(self) -> str:
+        host, port = self.address
+        return f"TCPIP::{host}::{port}::SOCKET"
+
+    def start(self) -> Tuple[str, int]:
+        """Start serving in a background thread; returns (host, port)."""
+        self._server.server_bind()
+        self._server.server_activate()
+        self._thread = threading.Thread(target=self._server.serve_forever, name='ScopeSimulatorServer',
+                                        daemon=True)
+        self._thread.start()
+        logger.info(f"Oscilloscope simulator listening on {self.resource}")
+        return self.address
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> 'ScopeSimulatorServer':
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,180 @@
+"""
+Write-through cache of oscilloscope settings.
+
+Tests configure the same scope settings over and over: apply_configuration()
+runs before every test, the phase current test sets the vertical division
+for every setpoint and queries C{n}:VDIV? and C{n}:OFST? before decoding
+every waveform. ScopeStateCache remembers the last known response of every
+setting that was set or queried, so that:
+
+- queries of a known setting are answered from the cache (no transfer),
+- writes that would not change a setting are skipped,
+- writes are read back in the same transfer (see ScpiBatch), so the cache
+  holds the value the scope actually applied (the scope may round VDIV etc.).
+
+Only plain settings are cached (CACHED_PARAMETERS); actions and run state
+(TRMD, STOP, ARM, waveform and measurement queries) always go to the scope.
+The whole cache is invalidated on connect/disconnect and by commands that
+change many settings at once (*RST, recall, auto setup). Changes made on the
+scope's front panel are not seen until invalidate() is called.
+"""
+import logging
+import re
+import threading
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Settings (last header component) whose values are cached
+CACHED_PARAMETERS = frozenset({
+    'ATTN', 'BWL', 'CPL', 'MSIZ', 'OFST', 'TDIV', 'TRA', 'TRCP', 'TRDL',
+    'TRLV', 'TRSE', 'TRSL', 'UNIT', 'VDIV', 'WFSU',
+})
+
+# Commands that change many settings at once
+RESET_COMMANDS = frozenset({'*RST', '*RCL', 'RCL', 'ASET'})
+
+# Setting -> settings of the same channel that are rescaled when it changes
+DEPENDENT_PARAMETERS = {
+    'ATTN': ('VDIV', 'OFST', 'TRLV'),
+    'UNIT': ('VDIV', 'OFST', 'TRLV'),
+}
+
+_UNIT_SUFFIX = re.compile(r'[VSA]$', re.IGNORECASE)
+
+
+def split_command(command: str) -> Tuple[str, str]:
+    """Split a SCPI command into normalised header and argument string.
+
+    Examples: ':c1:vdiv 2' -> ('C1:VDIV', '2'), 'C1:TRA?' -> ('C1:TRA', '')
+    """
+    parts = command.strip().split(None, 1)
+    if not parts:
+        return '', ''
+    header = parts[0].lstrip(':').rstrip('?').upper()
+    return header, parts[1].strip() if len(parts) > 1 else ''
+
+
+def is_cacheable(header: str) -> bool:
+    """Return True if the setting addressed by ``header`` is cached."""
+    return header.rsplit(':', 1)[-1] in CACHED_PARAMETERS
+
+
+def affected_headers(header: str) -> Tuple[str, ...]:
+    """Return the header and the settings rescaled when it is written."""
+    prefix, _, name = header.rpartition(':')
+    dependents = DEPENDENT_PARAMETERS.get(name, ())
+    return (header,) + tuple(f"{prefix}:{dep}" if prefix else dep for dep in dependents)
+
+
+def response_value(header: str, response: str) -> str:
+    """Return the value part of a query response (drops an echoed header).
+
+    Args:
+        header: Normalised header (e.g. 'C1:VDIV')
+        response: Raw response (e.g. 'C1:VDIV 2.00E+00V' or '2.00E+00V')
+    """
+    parts = response.strip().split(None, 1)
+    if len(parts) == 2 and parts[0].lstrip(':').upper().endswith(header.rsplit(':', 1)[-1]):
+        return parts[1].strip()
+    return response.strip()
+
+
+def _as_number(text: str) -> Optional[float]:
+    try:
+        return float(_UNIT_SUFFIX.sub('', text.strip()))
+    except ValueError:
+        return None
+
+
+def same_value(a: str, b: str) -> bool:
+    """Compare two setting values ('2' equals '2.00E+00V'; 'ON' equals 'on')."""
+    if a.strip().upper() == b.strip().upper():
+        return True
+    x, y = _as_number(a), _as_number(b)
+    if x is None or y is None:
+        return False
+    return abs(x - y) <= 1e-9 * max(abs(x), abs(y), 1e-12)
+
+
+class ScopeStateCache:
+    """Last known response of every cached oscilloscope setting (thread-safe).
+
+    Attributes:
+        hits: Queries answered from the cache
+        skipped_writes: Writes skipped because the setting already had the value
+    """
+
+    def __init__(self):
+        self._values: Dict[str, str] = {}  # header -> raw query response
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.skipped_writes = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, header: str) -> Optional[str]:
+        """Return the cached response for a header (None if unknown)."""
+        with self._lock:
+            return self._values.get(header)
+
+    def lookup(self, command: str) -> Optional[str]:
+        """Return the cached response for a query command, counting the hit.
+
+        Args:
+            command: Query without arguments (e.g. 'C1:VDIV?')
+
+        Returns:
+            Cached response, or None if the query must be sent
+        """
+        header, args = split_command(command)
+        if args or not command.strip().endswith('?') or not is_cacheable(header):
+            return None
+        with self._lock:
+            response = self._values.get(header)
+            if response is not None:
+                self.hits += 1
+        return response
+
+    def is_redundant(self, command: str) -> bool:
+        """Return True if a write would not change the cached setting."""
+        header, value = split_command(command)
+        if '?' in command or not value or not is_cacheable(header):
+            return False
+        with self._lock:
+            response = self._values.get(header)
+        return response is not None and same_value(response_value(header, response), value)
+
+    def store(self, command: str, response: Optional[str]) -> None:
+        """Record the response of a query (None forgets the setting)."""
+        header, args = split_command(command)
+        if args or not is_cacheable(header):
+            return
+        with self._lock:
+            if response is None:
+                self._values.pop(header, None)
+            else:
+                self._values[header] = response.strip()
+
+    def note_write(self, command: str) -> None:
+        """Forget everything a write may have changed (until it is read back)."""
+        header, _ = split_command(command)
+        if header in RESET_COMMANDS:
+            self.invalidate()
+            return
+        if not is_cacheable(header):
+            return
+        with self._lock:
+            for affected in affected_headers(header):
+                self._values.pop(affected, None)
+
+    def invalidate(self, header: Optional[str] = None) -> None:
+        """Forget one setting, or all settings if header is None."""
+        with self._lock:
+            if header is None:
+                if self._values:
+                    logger.debug(f"Oscilloscope state cache invalidated ({len(self._values)} settings)")
+                self._values.clear()
+            else:
+                self._values.pop(split_command(header)[0], None)
@@ -0,0 +1,217 @@
+"""
+Binary block transfers from the oscilloscope.
+
+Waveforms (``C1:WF? ALL``) come back as an IEEE 488.2 definite-length
+arbitrary block: ``#<n><length><data>`` followed by a terminator, optionally
+preceded by a response header (``C1:WF ALL,``). Reading such a response with
+repeated read_raw() calls and ``data += chunk`` copies everything received
+so far on every chunk, which is quadratic for multi-megabyte records.
+
+read_block() parses the block header first, allocates the whole payload once
+and reads every chunk into its final position, so each byte is copied once.
+Responses without a block header that start with a WAVEDESC descriptor
+(direct binary) are sized from the descriptor instead.
+
+waveform_setup_command() builds the Siglent ``WFSU`` command that limits a
+transfer to the points that are needed (first point, number of points,
+sparsing), so long captures do not have to be transferred in full.
+"""
+import logging
+import math
+import struct
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from host_gui.constants import OSC_BLOCK_CHUNK_BYTES
+
+logger = logging.getLogger(__name__)
+
+# Bytes read first to locate the block header ('C1:WF ALL,#9000001346')
+_HEADER_PROBE_BYTES = 128
+# WAVEDESC fields needed to size a direct binary response
+_WAVEDESC_MIN_BYTES = 68
+# VISA status codes (see pyvisa.constants.StatusCode)
+_VI_SUCCESS = 0  # Read stopped at the END indicator
+_VI_SUCCESS_MAX_CNT = 0x3FFF0006  # Read stopped after the requested count
+
+
+@dataclass
+class BlockTransferStats:
+    """Throughput of one binary block transfer.
+
+    Attributes:
+        command: Query that produced the block
+        payload_bytes: Bytes of block data (without block header and terminator)
+        total_bytes: Bytes received including headers and terminator
+        reads: Number of bus reads
+        elapsed_s: Time from sending the query until the block was complete
+    """
+    command: str = ''
+    payload_bytes: int = 0
+    total_bytes: int = 0
+    reads: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def mb_per_s(self) -> float:
+        """Transfer rate in MB/s (10^6 bytes per second)."""
+        return self.total_bytes / self.elapsed_s / 1e6 if self.elapsed_s > 0 else 0.0
+
+    def summary(self) -> str:
+        """One-line description for logs and reports."""
+        return (f"Block transfer '{self.command}': {self.payload_bytes:,} bytes in {self.reads} read(s), "
+                f"{self.elapsed_s * 1000:.1f} ms ({self.mb_per_s:.2f} MB/s)")
+
+
+class _ChunkReader:
+    """Reads raw chunks from a VISA resource, tracking the END indicator.
+
+    With a PyVISA resource the library read is used directly, so a chunk
+    never extends past the requested count and END is reported exactly.
+    Other objects only need read_raw(size).
+    """
+
+    def __init__(self, instrument: Any):
+        self.instrument = instrument
+        self.visalib = getattr(instrument, 'visalib', None)
+        self.session = getattr(instrument, 'session', None)
+        self.reads = 0
+        self.received = 0
+        self.end = False  # END indicator seen (message complete)
+
+    def read(self, size: int) -> bytes:
+        if self.visalib is not None and self.session is not None:
+            data, status = self.visalib.read(self.session, size)
+            self.end = status == _VI_SUCCESS
+        else:
+            data = self.instrument.read_raw(size)
+            # Without a status, a short read means the message ended
+            self.end = len(data) < size
+        self.reads += 1
+        self.received += len(data)
+        if not data:
+            raise IOError("Oscilloscope returned no data")
+        return data
+
+    def drain(self) -> None:
+        """Discard the rest of the message (terminator) so the next query starts clean."""
+        while not self.end and self.visalib is not None:
+            self.read(_HEADER_PROBE_BYTES)
+
+
+def parse_block_header(data: bytes) -> Optional[Tuple[int, int]]:
+    """Locate an IEEE 488.2 definite-length block header.
+
+    Args:
+        data: Start of the response (may begin with a response header)
+
+    Returns:
+        Tuple of (payload start offset, payload length), or None if the header
+        is incomplete or not present
+
+    Raises:
+        ValueError: If the block is of indefinite length (#0)
+    """
+    pos = data.find(b'#')
+    if pos < 0 or pos + 2 > len(data):
+        return None
+    digits = data[pos + 1] - ord('0')
+    if digits == 0:
+        raise ValueError("Indefinite-length blocks (#0) are not supported")
+    if not 1 <= digits <= 9:
+        return None
+    start = pos + 2 + digits
+    if start > len(data):
+        return None
+    return start, int(data[pos + 2:start].decode('ascii'))
+
+
+def _wavedesc_length(data: bytes, pos: int) -> int:
+    """Size of a direct binary waveform from its WAVEDESC descriptor."""
+    # WAVE_DESCRIPTOR, USER_TEXT, RES_DESC1, TRIGTIME_ARRAY, RIS_TIME_ARRAY, RES_ARRAY1,
+    # WAVE_ARRAY_1, WAVE_ARRAY_2 (trigger times precede the samples of sequence records)
+    return sum(struct.unpack_from('<8I', data, pos + 36))
+
+
+def read_block(instrument: Any, command: Optional[str] = None,
+               chunk_size: int = OSC_BLOCK_CHUNK_BYTES) -> Tuple[bytearray, BlockTransferStats]:
+    """Send a query and read its binary block response into one preallocated buffer.
+
+    Args:
+        instrument: Open PyVISA resource (or any object with write() and read_raw(size))
+        command: Query to send first; None reads the response of a query already sent
+        chunk_size: Maximum bytes per bus read
+
+    Returns:
+        Tuple of (payload buffer, transfer statistics). For direct binary
+        responses the payload starts at WAVEDESC.
+
+    Raises:
+        IOError: If the response ends before the announced length
+        ValueError: If the response is neither a block nor a WAVEDESC record
+    """
+    stats = BlockTransferStats(command=command or '')
+    start_time = time.perf_counter()
+    reader = _ChunkReader(instrument)
+    ignore_warning = getattr(instrument, 'ignore_warning', None)
+    # Count-limited reads end with "max count" warnings, which are expected here
+    quiet = ignore_warning(_VI_SUCCESS_MAX_CNT) if callable(ignore_warning) else nullcontext()
+    with quiet:
+        if command:
+            instrument.write(command)
+        head = bytearray(reader.read(_HEADER_PROBE_BYTES))
+        while True:
+            wavedesc = head.find(b'WAVEDESC', 0, _HEADER_PROBE_BYTES + 8)
+            # Descriptor bytes may contain '#': only look for a block header before it
+            header = parse_block_header(head[:wavedesc if wavedesc >= 0 else _HEADER_PROBE_BYTES])
+            if header is not None:
+                start, length = header
+                break
+            if wavedesc >= 0 and len(head) >= wavedesc + _WAVEDESC_MIN_BYTES:
+                start, length = wavedesc, _wavedesc_length(head, wavedesc)
+                break
+            if reader.end or len(head) > _HEADER_PROBE_BYTES * 4:
+                raise ValueError(f"No binary block or WAVEDESC in response to '{command}': {bytes(head[:32])!r}")
+            head += reader.read(_HEADER_PROBE_BYTES)
+
+        payload = bytearray(length)
+        view = memoryview(payload)
+        filled = min(len(head) - start, length)
+        view[:filled] = head[start:start + filled]
+        while filled < length:
+            if reader.end:
+                raise IOError(f"Block ended after {filled} of {length} bytes")
+            chunk = reader.read(min(chunk_size, length - filled))
+            count = min(len(chunk), length - filled)
+            view[filled:filled + count] = chunk[:count]
+            filled += count
+        reader.drain()
+
+    stats.payload_bytes = length
+    stats.total_bytes = reader.received
+    stats.reads = reader.reads
+    stats.elapsed_s = time.perf_counter() - start_time
+    return payload, stats
+
+
+def sparsing_for(points: int, max_points: int) -> int:
+    """Smallest sparsing factor that keeps a transfer at or below max_points."""
+    if max_points <= 0 or points <= max_points:
+        return 1
+    return math.ceil(points / max_points)
+
+
+def waveform_setup_command(first_point: int = 0, num_points: int = 0, sparsing: int = 1) -> str:
+    """Build the WFSU command selecting which points C{n}:WF? transfers.
+
+    Args:
+        first_point: Index of the first point to send
+        num_points: Number of points to send (0 = all remaining)
+        sparsing: Send every n-th point (1 = every point)
+
+    Returns:
+        SCPI command, e.g. 'WFSU SP,4,NP,250000,FP,0'
+    """
+    return f"WFSU SP,{max(int(sparsing), 1)},NP,{max(int(num_points), 0)},FP,{max(int(first_point), 0)}"
@@ -0,0 +1,350 @@
+"""
+SCPI command batching for the oscilloscope.
+
+Sending one SCPI command per transfer and sleeping a fixed time "for command
+processing" after each one makes configuring a scope slow: every command
+costs a full bus round trip plus the sleep. ScpiBatch collects commands and
+sends them as IEEE 488.2 compound program messages (commands joined with
+';'), terminated by a single ``*OPC?`` query. The instrument answers ``*OPC?``
+only after all preceding commands have been executed, so the batch returns as
+soon as the scope is ready instead of after a worst-case sleep.
+
+Query responses in a compound message come back as one response message,
+separated by ';'. If the response cannot be split reliably, the affected
+queries are re-sent individually; if a transfer fails, its commands are sent
+one by one, so a batch never does less than the sequential code did.
+
+With a ScopeStateCache (see scope_state.py) the batch also answers queries
+of known settings from the cache, drops writes that would not change a
+setting and reads written settings back in the same transfer.
+
+Usage::
+
+    with oscilloscope_service.batch('channel setup') as batch:
+        batch.write('C1:TRA ON', legacy_delay=0.1)
+        tra = batch.query('C1:TRA?')
+    print(tra.value, batch.stats.round_trips)
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from host_gui.constants import SCPI_BATCH_MAX_BYTES
+from host_gui.services.scope_state import (
+    RESET_COMMANDS, ScopeStateCache, affected_headers, is_cacheable, same_value, split_command
+)
+
+logger = logging.getLogger(__name__)
+
+# Synchronisation modes
+SYNC_OPC = 'opc'  # Append *OPC? and wait for its '1'
+SYNC_NONE = 'none'  # Fire and forget (writes only)
+
+
+@dataclass
+class ScpiBatchStats:
+    """Round-trip accounting for one executed batch.
+
+    Attributes:
+        name: Batch label used in log messages
+        commands: Number of commands (writes and queries) in the batch
+        round_trips: Transfers that waited for a response or were sent separately
+        sequential_round_trips: Transfers the same commands take when sent one by one
+        replaced_delay_s: Fixed sleeps the sequential code used after these commands
+        elapsed_s: Wall time spent executing the batch
+        fallback: True if any part of the batch had to be sent command by command
+        cache_hits: Queries answered from the state cache
+        skipped_writes: Writes dropped because the setting already had the value
+    """
+    name: str = ''
+    commands: int = 0
+    round_trips: int = 0
+    sequential_round_trips: int = 0
+    replaced_delay_s: float = 0.0
+    elapsed_s: float = 0.0
+    fallback: bool = False
+    cache_hits: int = 0
+    skipped_writes: int = 0
+
+    @property
+    def round_trips_saved(self) -> int:
+        """Transfers saved compared with sending every command separately."""
+        return max(self.sequential_round_trips - self.round_trips, 0)
+
+    @property
+    def time_saved_s(self) -> float:
+        """Estimated time saved: replaced sleeps plus saved round trips at the measured rate."""
+        per_trip = self.elapsed_s / self.round_trips if self.round_trips else 0.0
+        return self.replaced_delay_s + self.round_trips_saved * per_trip
+
+    def summary(self) -> str:
+        """One-line description for logs and reports."""
+        return (f"SCPI batch '{self.name}': {self.commands} command(s) in {self.round_trips} round trip(s) "
+                f"({self.round_trips_saved} saved), {self.elapsed_s * 1000:.1f} ms, "
+                f"~{self.time_saved_s * 1000:.0f} ms saved vs. sequential"
+                + (f", {self.cache_hits} cached" if self.cache_hits else "")
+                + (f", {self.skipped_writes} unchanged skipped" if self.skipped_writes else "")
+                + (" [fallback]" if self.fallback else ""))
+
+
+class BatchQuery:
+    """Placeholder for a query response, filled in when the batch executes.
+
+    Attributes:
+        command: The query command
+        value: Response string (None until executed, or if the query failed)
+    """
+
+    __slots__ = ('command', 'value')
+
+    def __init__(self, command: str):
+        self.command = command
+        self.value: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"BatchQuery({self.command!r}, value={self.value!r})"
+
+
+def _program_unit(command: str) -> str:
+    """Return a command in a form that is parsed from the root inside a compound message.
+
+    Per IEEE 488.2 a header following ';' is resolved relative to the previous
+    header's path, so hierarchical headers (``C1:TRA``) get a leading ':'.
+    Common commands (``*OPC?``) and single-level headers (``TDIV``) are kept.
+    """
+    command = command.strip()
+    if command.startswith((':', '*')):
+        return command
+    header = command.split(None, 1)[0]
+    if ':' in header:
+        return ':' + command
+    return command
+
+
+class ScpiBatch:
+    """Collects SCPI writes and queries and executes them in as few transfers as possible.
+
+    The batch executes when the ``with`` block exits without an exception (or
+    when execute() is called). Commands keep their order; transfers are split
+    so no program message exceeds ``max_bytes``.
+    """
+
+    def __init__(self, instrument: Any, name: str = 'batch', sync: str = SYNC_OPC,
+                 max_bytes: int = SCPI_BATCH_MAX_BYTES,
+                 on_executed: Optional[Callable[[ScpiBatchStats], None]] = None,
+                 state: Optional[ScopeStateCache] = None):
+        """Initialize an empty batch.
+
+        Args:
+            instrument: Open PyVISA resource (needs write() and query())
+            name: Label used in log messages
+            sync: SYNC_OPC to wait for completion with *OPC?, SYNC_NONE to not wait
+            max_bytes: Maximum length of one compound program message
+            on_executed: Optional callable receiving the statistics after execution
+            state: Optional settings cache used to skip redundant writes and queries
+        """
+        if sync not in (SYNC_OPC, SYNC_NONE):
+            raise ValueError(f"Unknown SCPI batch sync mode: {sync!r}")
+        self.instrument = instrument
+        self.name = name
+        self.sync = sync
+        self.max_bytes = max_bytes
+        self.on_executed = on_executed
+        self.state = state
+        self.stats = ScpiBatchStats(name=name)
+        self._items: List[Any] = []  # str (write) or BatchQuery
+        self._executed = False
+        self._written: Dict[str, str] = {}  # Cacheable header -> value written in this batch
+        self._read_back: Set[str] = set()  # Written headers queried after their last write
+        self._dirty: Set[str] = set()  # Headers whose cached value is stale within this batch
+        self._reset = False  # A *RST-like command is queued; the cache no longer applies
+        self._reset_index = 0  # Responses of items before this index predate the reset
+
+    def __enter__(self) -> 'ScpiBatch':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.execute()
+        return False
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def write(self, command: str, legacy_delay: float = 0.0) -> 'ScpiBatch':
+        """Queue a write command.
+
+        Args:
+            command: SCPI command without response
+            legacy_delay: Sleep the sequential code used after this command (statistics only)
+
+        Returns:
+            The batch (for chaining)
+        """
+        self.stats.replaced_delay_s += legacy_delay
+        self.stats.sequential_round_trips += 1
+        if self.state is not None:
+            header, value = split_command(command)
+            if is_cacheable(header) and value:
+                if header in self._written:
+                    redundant = same_value(self._written[header], value)
+                else:
+                    redundant = (not self._reset and header not in self._dirty
+                                 and self.state.is_redundant(command))
+                if redundant:
+                    self.stats.skipped_writes += 1
+                    self.state.skipped_writes += 1
+                    return self
+                self._written[header] = value
+                self._read_back.discard(header)
+                self._dirty.update(affected_headers(header))
+            elif header in RESET_COMMANDS:
+                self._reset = True
+                self._reset_index = len(self._items) + 1
+                self._written.clear()
+                self._read_back.clear()
+                self._dirty.clear()
+        self._items.append(command)
+        return self
+
+    def query(self, command: str, legacy_delay: float = 0.0) -> BatchQuery:
+        """Queue a query command.
+
+        Args:
+            command: SCPI query (contains '?')
+            legacy_delay: Sleep the sequential code used before/after this query (statistics only)
+
+        Returns:
+            BatchQuery whose value is set when the batch executes
+        """
+        placeholder = BatchQuery(command)
+        self.stats.replaced_delay_s += legacy_delay
+        self.stats.sequential_round_trips += 1
+        if self.state is not None:
+            header, _ = split_command(command)
+            if header in self._written:
+                self._read_back.add(header)
+            elif not self._reset and header not in self._dirty:
+                cached = self.state.lookup(command)
+                if cached is not None:
+                    placeholder.value = cached
+                    self.stats.cache_hits += 1
+                    return placeholder
+        self._items.append(placeholder)
+        return placeholder
+
+    def execute(self) -> ScpiBatchStats:
+        """Send the queued commands and fill in query responses.
+
+        Returns:
+            Statistics of this batch (also logged)
+        """
+        if self._executed:
+            return self.stats
+        self._executed = True
+        # Sent sequentially, every command is its own transfer
+        self.stats.commands = self.stats.sequential_round_trips
+        if not self._items:
+            if self.stats.commands:
+                logger.debug(self.stats.summary())
+            if self.on_executed is not None and self.stats.commands:
+                self.on_executed(self.stats)
+            return self.stats
+        start = time.perf_counter()
+        queries = [item for item in self._items[self._reset_index:] if isinstance(item, BatchQuery)]
+        if self.state is not None:
+            for item in self._items:
+                if not isinstance(item, BatchQuery):
+                    self.state.note_write(item)
+            if self.sync == SYNC_OPC or queries:
+                # Read written settings back in the same transfer so the cache
+                # holds the value the scope actually applied
+                for header in self._written:
+                    if header not in self._read_back:
+                        readback = BatchQuery(f"{header}?")
+                        self._items.append(readback)
+                        queries.append(readback)
+        for chunk in self._chunks():
+            self._send_chunk(chunk)
+        if self.state is not None:
+            for placeholder in queries:
+                self.state.store(placeholder.command, placeholder.value)
+        self.stats.elapsed_s = time.perf_counter() - start
+        logger.info(self.stats.summary())
+        if self.on_executed is not None:
+            self.on_executed(self.stats)
+        return self.stats
+
+    def _chunks(self) -> List[List[Any]]:
+        """Split queued items into program messages of at most max_bytes."""
+        suffix = len(';*OPC?') if self.sync == SYNC_OPC else 0
+        chunks: List[List[Any]] = []
+        current: List[Any] = []
+        length = 0
+        for item in self._items:
+            unit = _program_unit(item.command if isinstance(item, BatchQuery) else item)
+            added = len(unit) + (1 if current else 0)
+            if current and length + added + suffix > self.max_bytes:
+                chunks.append(current)
+                current, length = [], 0
+                added = len(unit)
+            current.append(item)
+            length += added
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _send_chunk(self, chunk: List[Any]) -> None:
+        """Send one compound program message and distribute its responses."""
+        queries = [item for item in chunk if isinstance(item, BatchQuery)]
+        units = [_program_unit(item.command if isinstance(item, BatchQuery) else item) for item in chunk]
+        wait_opc = self.sync == SYNC_OPC
+        if wait_opc:
+            units.append('*OPC?')
+        message = ';'.join(units)
+        try:
+            if not queries and not wait_opc:
+                self.instrument.write(message)
+                self.stats.round_trips += 1
+                return
+            response = self.instrument.query(message)
+            self.stats.round_trips += 1
+        except Exception as e:
+            logger.warning(f"SCPI batch '{self.name}' transfer failed ({e}), sending commands individually")
+            self._send_individually(chunk)
+            return
+
+        parts = [part.strip() for part in (response or '').strip().split(';')]
+        expected = len(queries) + (1 if wait_opc else 0)
+        if len(parts) == expected:
+            for placeholder, part in zip(queries, parts):
+                placeholder.value = part
+            return
+        # Response count does not match (e.g. a response contained ';'): the
+        # writes were executed, only the queries need to be repeated.
+        logger.debug(f"SCPI batch '{self.name}': expected {expected} response(s), got {len(parts)}: {response!r}")
+        self.stats.fallback = True
+        for placeholder in queries:
+            self._query_one(placeholder)
+
+    def _send_individually(self, chunk: List[Any]) -> None:
+        """Sequential fallback: one transfer per command."""
+        self.stats.fallback = True
+        for item in chunk:
+            if isinstance(item, BatchQuery):
+                self._query_one(item)
+                continue
+            try:
+                self.instrument.write(item)
+            except Exception as e:
+                logger.error(f"Error sending command '{item}': {e}")
+            self.stats.round_trips += 1
+
+    def _query_one(self, placeholder: BatchQuery) -> None:
+        try:
+            placeholder.value = self.instrument.query(placeholder.command).strip()
+        except Exception as e:
+            logger.error(f"Error sending command '{placeholder.command}': {e}")
+            placeholder.value = None
+        self.stats.round_trips += 1
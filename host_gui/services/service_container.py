@@ -6,7 +6,10 @@ and their dependencies, implementing the Dependency Injection pattern to
 reduce coupling and improve testability.
 """
 import logging
-from typing import Optional, Dict, Any
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Optional, Dict, Any, Callable, Iterable, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -20,18 +23,30 @@ class ServiceContainer:
     lifecycle. Services are initialized lazily and can be accessed by
     components that need them.
     
+    Lazy services can also be warmed up concurrently (warm_up()): each
+    factory runs on a thread pool as soon as the services it depends on are
+    ready, and get() blocks only if the requested service is still being
+    initialized. Initialization time of every service is recorded and logged.
+    
     Attributes:
         _services: Dictionary mapping service names to service instances
         _initialized: Set of service names that have been initialized
+        timings: Dictionary mapping service names to initialization time in seconds
     """
     
     def __init__(self):
         """Initialize the service container."""
         self._services: Dict[str, Any] = {}
         self._initialized: set = set()
+        self._dependencies: Dict[str, Tuple[str, ...]] = {}
+        self._futures: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.RLock()
+        self.timings: Dict[str, float] = {}
         logger.info("ServiceContainer initialized")
     
-    def register(self, name: str, service: Any, lazy: bool = False) -> None:
+    def register(self, name: str, service: Any, lazy: bool = False,
+                 depends_on: Optional[Iterable[str]] = None) -> None:
         """Register a service with the container.
         
         Args:
@@ -39,47 +54,210 @@ class ServiceContainer:
             service: Service instance or callable factory function
             lazy: If True, service is created lazily on first access
                   If False, service is stored as-is
+            depends_on: Names of services that must be ready before the
+                        factory runs (lazy services only)
         """
-        if lazy and callable(service):
-            # Store factory function for lazy initialization
-            self._services[name] = ('factory', service)
-        else:
-            # Store service instance directly
-            self._services[name] = ('instance', service)
-            self._initialized.add(name)
+        with self._lock:
+            if lazy and callable(service):
+                # Store factory function for lazy initialization
+                self._services[name] = ('factory', service)
+                self._initialized.discard(name)
+                self._dependencies[name] = tuple(depends_on or ())
+            else:
+                # Store service instance directly
+                self._services[name] = ('instance', service)
+                self._initialized.add(name)
+                self._dependencies.pop(name, None)
+            self._futures.pop(name, None)
         
         logger.debug(f"Registered service: {name} (lazy={lazy})")
     
-    def get(self, name: str) -> Optional[Any]:
+    def get(self, name: str, timeout: Optional[float] = None) -> Optional[Any]:
         """Get a service instance by name.
         
+        If the service is being warmed up, waits until it is ready. A lazy
+        service that has not been started is initialized on the calling thread.
+        
         Args:
             name: Name identifier for the service
+            timeout: Maximum time in seconds to wait for a warming-up service
+                     (None waits until it is ready)
             
         Returns:
-            Service instance or None if not found
+            Service instance or None if not found, initialization failed or
+            the service is still initializing after timeout
         """
-        if name not in self._services:
+        entry = self._services.get(name)
+        if entry is None:
             logger.warning(f"Service not found: {name}")
             return None
         
-        service_type, service_value = self._services[name]
+        service_type, service_value = entry
+        if service_type == 'instance':
+            return service_value
         
-        if service_type == 'factory':
-            # Lazy initialization
-            if name not in self._initialized:
-                try:
-                    logger.debug(f"Lazy initializing service: {name}")
-                    service_value = service_value()  # Call factory function
-                    self._services[name] = ('instance', service_value)
-                    self._initialized.add(name)
-                except Exception as e:
-                    logger.error(f"Failed to initialize service {name}: {e}", exc_info=True)
-                    return None
+        with self._lock:
+            future = self._futures.get(name)
+            if future is None:
+                # Not warming up - initialize on this thread
+                future = Future()
+                self._futures[name] = future
+                run_inline = True
             else:
-                _, service_value = self._services[name]
+                run_inline = False
+        
+        if run_inline:
+            logger.debug(f"Lazy initializing service: {name}")
+            for dependency in self._dependencies.get(name, ()):
+                self.get(dependency, timeout)
+            self._run_factory(name, future)
+        elif not future.done():
+            start = time.perf_counter()
+            wait([future], timeout)
+            if not future.done():
+                # The factory is still running; a later get() returns the service
+                logger.warning(f"Service {name} still initializing after {timeout}s")
+                return None
+            logger.debug(f"Waited {(time.perf_counter() - start) * 1000:.0f} ms for service {name}")
+        
+        try:
+            return future.result(0)
+        except Exception as e:
+            logger.error(f"Failed to initialize service {name}: {e}")
+            return None
+    
+    def warm_up(self, names: Optional[Iterable[str]] = None,
+                max_workers: Optional[int] = None) -> Dict[str, Future]:
+        """Initialize lazy services concurrently on a thread pool.
+        
+        Each factory is submitted once all of its dependencies are ready, so
+        independent services initialize in parallel and no worker blocks on
+        another service. Returns immediately.
+        
+        Args:
+            names: Services to warm up (defaults to all lazy services);
+                   their dependencies are included automatically
+            max_workers: Thread pool size (defaults to the number of services)
+            
+        Returns:
+            Dictionary mapping service names to futures resolving to the instances
+        """
+        with self._lock:
+            pending = []
+            stack = list(names) if names is not None else [
+                n for n, (kind, _) in self._services.items() if kind == 'factory']
+            while stack:
+                name = stack.pop()
+                if name in pending or name not in self._services:
+                    continue
+                if self._services[name][0] != 'factory' or name in self._futures:
+                    continue
+                pending.append(name)
+                stack.extend(self._dependencies.get(name, ()))
+            if not pending:
+                return dict(self._futures)
+            for name in pending:
+                self._futures[name] = Future()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_workers or max(len(pending), 1),
+                    thread_name_prefix='ServiceWarmUp')
+            for name in pending:
+                self._schedule(name)
+            return dict(self._futures)
+    
+    def _schedule(self, name: str) -> None:
+        """Submit a warming-up service once its dependencies are ready."""
+        waiting = [self._futures[dep] for dep in self._dependencies.get(name, ())
+                   if dep in self._futures and not self._futures[dep].done()]
+        if waiting:
+            remaining = [len(waiting)]
+            counter_lock = threading.Lock()
+            
+            def _dependency_done(_future):
+                with counter_lock:
+                    remaining[0] -= 1
+                    ready = remaining[0] == 0
+                if ready:
+                    self._submit(name)
+            
+            for dep_future in waiting:
+                dep_future.add_done_callback(_dependency_done)
+        else:
+            self._submit(name)
+    
+    def _submit(self, name: str) -> None:
+        future = self._futures.get(name)
+        if future is None or future.done():
+            return
+        try:
+            self._executor.submit(self._run_factory, name, future)
+        except RuntimeError:
+            # Executor shut down (container cleared) - initialize on demand instead
+            self._run_factory(name, future)
+    
+    def _run_factory(self, name: str, future: Future) -> None:
+        """Run a service factory, store the instance and resolve its future."""
+        if not future.set_running_or_notify_cancel():
+            return
+        entry = self._services.get(name)
+        if entry is None or entry[0] != 'factory':
+            future.set_result(entry[1] if entry else None)
+            return
+        start = time.perf_counter()
+        try:
+            for dependency in self._dependencies.get(name, ()):
+                dep_future = self._futures.get(dependency)
+                if dep_future is not None and dep_future.done() and dep_future.exception() is not None:
+                    raise RuntimeError(f"dependency {dependency} failed: {dep_future.exception()}")
+            service = entry[1]()  # Call factory function
+        except Exception as e:
+            logger.error(f"Failed to initialize service {name}: {e}", exc_info=True)
+            future.set_exception(e)
+            return
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            if self._services.get(name) is entry:
+                self._services[name] = ('instance', service)
+                self._initialized.add(name)
+            self.timings[name] = elapsed
+        logger.info(f"Initialized service {name} in {elapsed * 1000:.1f} ms")
+        future.set_result(service)
+    
+    def is_ready(self, name: str) -> bool:
+        """Return True if the service is registered and initialized."""
+        return name in self._initialized
+    
+    def when_ready(self, name: str, callback: Callable[[Optional[Any]], None]) -> bool:
+        """Call ``callback(service)`` once a service is ready.
         
-        return service_value
+        The callback runs on the thread that finishes the initialization (a
+        warm-up worker), or immediately if the service is already ready.
+        It receives None if initialization failed.
+        
+        Args:
+            name: Name identifier for the service
+            callback: Callable taking the service instance
+            
+        Returns:
+            False if the service is not registered
+        """
+        if name not in self._services:
+            return False
+        with self._lock:
+            future = self._futures.get(name)
+        if future is None:
+            callback(self.get(name))
+            return True
+        
+        def _done(done_future):
+            try:
+                callback(None if done_future.exception() else done_future.result())
+            except Exception as e:
+                logger.warning(f"when_ready callback for {name} failed: {e}", exc_info=True)
+        
+        future.add_done_callback(_done)
+        return True
     
     def has(self, name: str) -> bool:
         """Check if a service is registered.
@@ -99,16 +277,22 @@ class ServiceContainer:
             name: Name identifier for the service
         """
         if name in self._services:
-            # If service has cleanup method, call it
-            service = self.get(name)
+            # If service has cleanup method, call it (never start a lazy service just to clean it up)
+            service_type, service = self._services[name]
+            if service_type == 'factory':
+                future = self._futures.get(name)
+                service = self.get(name) if future is not None else None
             if service is not None and hasattr(service, 'cleanup'):
                 try:
                     service.cleanup()
                 except Exception as e:
                     logger.warning(f"Error cleaning up service {name}: {e}", exc_info=True)
             
-            del self._services[name]
-            self._initialized.discard(name)
+            with self._lock:
+                self._services.pop(name, None)
+                self._futures.pop(name, None)
+                self._dependencies.pop(name, None)
+                self._initialized.discard(name)
             logger.debug(f"Removed service: {name}")
     
     def clear(self) -> None:
@@ -119,19 +303,30 @@ class ServiceContainer:
         
         self._services.clear()
         self._initialized.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         logger.info("ServiceContainer cleared")
     
-    def initialize_services(self, config: Optional[Dict[str, Any]] = None) -> None:
+    def initialize_services(self, config: Optional[Dict[str, Any]] = None,
+                            warm_up: bool = False) -> None:
         """Initialize core services with default configuration.
         
-        This method creates and registers the core services used by the
-        application: CanService, DbcService, and SignalService.
+        This method registers the core services used by the application as
+        lazy factories: CanService, DbcService, SignalService (depends on
+        DbcService), OscilloscopeService and 'oscilloscope_resources', the
+        start-up oscilloscope scan result (depends on OscilloscopeService), and
+        'analysis_executor', the shared AnalysisExecutor for post-processing.
         
         Args:
             config: Optional configuration dictionary with service parameters:
                 - can_channel: CAN channel/interface (defaults to env or default)
                 - can_bitrate: CAN bitrate in kbps (defaults to env or default)
                 - dbc_dir: Directory for DBC file storage (optional)
+                - dbc_path: DBC file to load at startup (optional)
+                - oscilloscope: False to skip the oscilloscope service
+                - oscilloscope_cache_path: JSON file of known-good oscilloscope resources (optional)
+            warm_up: If True, start concurrent initialization immediately
         """
         if config is None:
             config = {}
@@ -150,26 +345,60 @@ class ServiceContainer:
         if CanService is not None:
             can_channel = config.get('can_channel', CAN_CHANNEL_DEFAULT)
             can_bitrate = config.get('can_bitrate', CAN_BITRATE_DEFAULT)
-            can_service = CanService(channel=can_channel, bitrate=can_bitrate)
-            self.register('can_service', can_service)
+            self.register('can_service', lambda: CanService(channel=can_channel, bitrate=can_bitrate), lazy=True)
             logger.info(f"Registered CanService with channel={can_channel}, bitrate={can_bitrate}kbps")
         
         # Register DbcService
         if DbcService is not None:
-            # DbcService doesn't take dbc_dir parameter in constructor, uses default
-            dbc_service = DbcService()
-            self.register('dbc_service', dbc_service)
+            dbc_path = config.get('dbc_path')
+            
+            def _create_dbc_service():
+                # DbcService doesn't take dbc_dir parameter in constructor, uses default
+                dbc_service = DbcService()
+                if dbc_path:
+                    try:
+                        dbc_service.load_dbc_file(dbc_path)
+                    except Exception as e:
+                        logger.warning(f"Failed to load DBC {dbc_path} at startup: {e}")
+                return dbc_service
+            
+            self.register('dbc_service', _create_dbc_service, lazy=True)
             logger.info("Registered DbcService with default configuration")
         
         # Register SignalService (depends on DbcService)
         if SignalService is not None:
-            dbc_service = self.get('dbc_service')
-            if dbc_service is not None:
-                signal_service = SignalService(dbc_service)
-                self.register('signal_service', signal_service)
+            if self.has('dbc_service'):
+                self.register('signal_service', lambda: SignalService(self.get('dbc_service')),
+                              lazy=True, depends_on=['dbc_service'])
                 logger.info("Registered SignalService")
             else:
                 logger.warning("Cannot register SignalService: DbcService not available")
+        
+        # Register OscilloscopeService (creating the VISA ResourceManager and scanning are slow)
+        if config.get('oscilloscope', True):
+            try:
+                from host_gui.services.oscilloscope_service import OscilloscopeService
+            except ImportError:
+                OscilloscopeService = None
+                logger.warning("OscilloscopeService not available - PyVISA may not be installed")
+            if OscilloscopeService is not None:
+                cache_path = config.get('oscilloscope_cache_path')
+                self.register('oscilloscope_service', lambda: OscilloscopeService(cache_path=cache_path), lazy=True)
+                self.register('oscilloscope_resources',
+                              lambda: self.get('oscilloscope_service').scan_for_devices(),
+                              lazy=True, depends_on=['oscilloscope_service'])
+                logger.info("Registered OscilloscopeService")
+        
+        # Register the shared analysis executor (worker processes start on first use)
+        try:
+            from host_gui.services.analysis_executor import get_shared_executor
+            self.register('analysis_executor', get_shared_executor, lazy=True)
+            logger.info("Registered AnalysisExecutor")
+        except ImportError as e:
+            logger.warning(f"AnalysisExecutor not available: {e}")
+        
+        if warm_up:
+            self.warm_up()
     
     def get_can_service(self):
         """Convenience method to get CanService."""
@@ -183,6 +412,14 @@ class ServiceContainer:
         """Convenience method to get SignalService."""
         return self.get('signal_service')
     
+    def get_oscilloscope_service(self):
+        """Convenience method to get OscilloscopeService."""
+        return self.get('oscilloscope_service')
+    
+    def get_analysis_executor(self):
+        """Convenience method to get the shared AnalysisExecutor."""
+        return self.get('analysis_executor')
+    
     def __repr__(self) -> str:
         """String representation of the container."""
         services = ', '.join(self._services.keys())
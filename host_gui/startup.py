@@ -0,0 +1,210 @@
+"""
+Startup profiling and background warm-up for the EOL Host GUI.
+
+The main window only needs PySide6, matplotlib (live plot) and the core
+services to become interactive. Modules that are used later (filtering,
+report export, DBC parsing) are imported on first use, or by a background
+warm-up thread started once the main window is shown, so that the first
+test or report does not pay their import cost either.
+
+StartupProfiler backs the ``--profile-startup`` command line option: it
+times every first-time import made on the main thread (self time, grouped
+per package), named initialisation stages (e.g. main window construction)
+and the warm-up imports, and reports them as one table.
+"""
+import builtins
+import importlib
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Command line option enabling the startup report
+PROFILE_STARTUP_OPTION = '--profile-startup'
+
+# Modules imported in the background after the main window is shown (none of
+# them may be imported at module level on the startup path; numpy is already
+# loaded by matplotlib)
+WARM_UP_MODULES = (
+    'scipy.signal',
+    'cantools',
+    'pyvisa',
+    'reportlab.platypus',
+    'matplotlib.backends.backend_pdf',
+)
+
+# Packages whose modules are reported individually instead of per package
+_OWN_PACKAGES = ('host_gui', 'backend')
+
+
+def _group_name(module_name: str) -> str:
+    """Return the report row a module's import time is attributed to."""
+    parts = module_name.split('.')
+    if parts[0] in _OWN_PACKAGES:
+        return '.'.join(parts[:2])
+    return parts[0]
+
+
+class StartupProfiler:
+    """Collects import and initialisation timings during application startup.
+
+    Attributes:
+        imports: {package or own module: seconds} self time of first-time imports
+        stages: List of (stage name, seconds) in the order they completed
+        warm_up: List of (module name, seconds) imported by the warm-up thread
+    """
+
+    def __init__(self):
+        self._t0 = time.perf_counter()
+        self.imports: Dict[str, float] = {}
+        self.stages: List[Tuple[str, float]] = []
+        self.warm_up: List[Tuple[str, float]] = []
+        self.time_to_interactive: Optional[float] = None
+        self._original_import = None
+        self._thread_id = threading.get_ident()
+        self._stack: List[float] = []  # Child import time of each open import
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_argv(cls, argv: Sequence[str]) -> Optional['StartupProfiler']:
+        """Create and install a profiler if ``--profile-startup`` is in argv.
+
+        Args:
+            argv: Command line arguments
+
+        Returns:
+            Installed StartupProfiler, or None if profiling was not requested
+        """
+        if PROFILE_STARTUP_OPTION not in argv:
+            return None
+        profiler = cls()
+        profiler.install()
+        return profiler
+
+    def install(self) -> None:
+        """Start timing imports made on the current thread."""
+        if self._original_import is not None:
+            return
+        self._thread_id = threading.get_ident()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self) -> None:
+        """Stop timing imports."""
+        if self._original_import is None:
+            return
+        if builtins.__import__ is self._timed_import:
+            builtins.__import__ = self._original_import
+        self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        if (original is None or level or name in sys.modules
+                or threading.get_ident() != self._thread_id):
+            return (original or importlib.__import__)(name, globals, locals, fromlist, level)
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            key = _group_name(name)
+            self.imports[key] = self.imports.get(key, 0.0) + elapsed - children
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time an initialisation stage (imports inside it are also counted per module)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, time.perf_counter() - start))
+
+    def mark_interactive(self) -> float:
+        """Record the time from profiler creation until the window is interactive."""
+        self.time_to_interactive = time.perf_counter() - self._t0
+        return self.time_to_interactive
+
+    def record_warm_up(self, module_name: str, seconds: float) -> None:
+        """Record one background warm-up import (thread-safe)."""
+        with self._lock:
+            self.warm_up.append((module_name, seconds))
+
+    def report(self, top: int = 20) -> str:
+        """Format the collected timings as a text table.
+
+        Args:
+            top: Number of slowest import rows to include
+
+        Returns:
+            Multi-line report
+        """
+        lines = ['Startup profile']
+        if self.time_to_interactive is not None:
+            lines.append(f"  time to interactive window: {self.time_to_interactive * 1000:8.1f} ms")
+        if self.stages:
+            lines.append('  initialisation stages:')
+            for name, seconds in self.stages:
+                lines.append(f"    {name:<40} {seconds * 1000:8.1f} ms")
+        if self.imports:
+            total = sum(self.imports.values())
+            lines.append(f"  imports on main thread (self time, total {total * 1000:.1f} ms):")
+            ranked = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)
+            for name, seconds in ranked[:top]:
+                lines.append(f"    {name:<40} {seconds * 1000:8.1f} ms")
+        with self._lock:
+            warm_up = list(self.warm_up)
+        if warm_up:
+            lines.append('  background warm-up imports:')
+            for name, seconds in warm_up:
+                lines.append(f"    {name:<40} {seconds * 1000:8.1f} ms")
+        return '\n'.join(lines)
+
+
+def start_warm_up(modules: Sequence[str] = WARM_UP_MODULES,
+                  profiler: Optional[StartupProfiler] = None,
+                  on_done: Optional[Callable[[], None]] = None) -> threading.Thread:
+    """Import modules on a background daemon thread.
+
+    Missing optional modules are skipped. Module imports are serialised by
+    Python's import lock, so code on the GUI thread that needs one of these
+    modules simply waits for (or reuses) the warm-up import.
+
+    Args:
+        modules: Module names to import
+        profiler: Optional profiler receiving per-module timings
+        on_done: Optional callable invoked on the warm-up thread when finished
+
+    Returns:
+        The started thread
+    """
+    def _run():
+        for module_name in modules:
+            if module_name in sys.modules:
+                continue
+            start = time.perf_counter()
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                logger.debug(f"Warm-up import of {module_name} skipped: {e}")
+                continue
+            elapsed = time.perf_counter() - start
+            logger.debug(f"Warm-up imported {module_name} in {elapsed * 1000:.1f} ms")
+            if profiler is not None:
+                profiler.record_warm_up(module_name, elapsed)
+        if on_done is not None:
+            try:
+                on_done()
+            except Exception as e:
+                logger.debug(f"Warm-up completion callback failed: {e}")
+
+    thread = threading.Thread(target=_run, name='StartupWarmUp', daemon=True)
+    thread.start()
+    return thread
@@ -123,41 +123,34 @@ class TestRunner:
             # Use thread-safe wrappers that check thread context
             if plot_update_callback is None and hasattr(gui, '_update_plot'):
                 def _thread_safe_plot_update(dac: float, fb: float, name: Optional[str] = None):
-                    """Thread-safe wrapper for plot update."""
+                    """Thread-safe wrapper for plot update (never waits for the GUI to redraw)."""
                     if gui is None:
                         return
                     try:
                         current_thread = QtCore.QThread.currentThread()
                         main_thread = QtCore.QCoreApplication.instance().thread()
+                        stream = getattr(gui, 'plot_stream', None)
+                        if stream is not None:
+                            # Queue the point; the GUI drains the stream once per frame
+                            stream.push(dac, fb, name)
+                            if current_thread == main_thread:
+                                # Refresh timer cannot fire while the GUI thread runs the test
+                                gui._drain_plot_stream()
+                            return
                         
                         if current_thread == main_thread:
                             # Main thread - call directly
-                            gui._update_plot(dac, fb, name)
+                            gui._update_plot(dac, fb, name or '')
                         else:
-                            # Background thread - use BlockingQueuedConnection to ensure immediate update
-                            # This blocks until the main thread processes the update, ensuring real-time plot updates
-                            try:
-                                QtCore.QMetaObject.invokeMethod(
-                                    gui,
-                                    '_update_plot',
-                                    QtCore.Qt.ConnectionType.BlockingQueuedConnection,
-                                    QtCore.Q_ARG(float, dac),
-                                    QtCore.Q_ARG(float, fb),
-                                    QtCore.Q_ARG(str, name or '')
-                                )
-                            except Exception as e:
-                                # If BlockingQueuedConnection fails (e.g., deadlock risk), fall back to QueuedConnection
-                                logger.debug(f"BlockingQueuedConnection failed, falling back to QueuedConnection: {e}")
-                                QtCore.QMetaObject.invokeMethod(
-                                    gui,
-                                    '_update_plot',
-                                    QtCore.Qt.ConnectionType.QueuedConnection,
-                                    QtCore.Q_ARG(float, dac),
-                                    QtCore.Q_ARG(float, fb),
-                                    QtCore.Q_ARG(str, name or '')
-                                )
-                                # Small sleep to allow main thread to process the queue
-                                time.sleep(0.005)  # 5ms sleep to allow main thread to process
+                            # Background thread without a plot stream - queue the slot call
+                            QtCore.QMetaObject.invokeMethod(
+                                gui,
+                                '_update_plot',
+                                QtCore.Qt.ConnectionType.QueuedConnection,
+                                QtCore.Q_ARG(float, dac),
+                                QtCore.Q_ARG(float, fb),
+                                QtCore.Q_ARG(str, name or '')
+                            )
                     except Exception as e:
                         logger.debug(f"Failed to update plot: {e}")
                 self.plot_update_callback = _thread_safe_plot_update
@@ -170,6 +163,11 @@ class TestRunner:
                     if gui is None:
                         return
                     try:
+                        stream = getattr(gui, 'plot_stream', None)
+                        if stream is not None:
+                            # Keep the clear ordered with points already queued
+                            stream.push_clear()
+                            return
                         current_thread = QtCore.QThread.currentThread()
                         main_thread = QtCore.QCoreApplication.instance().thread()
                         
@@ -256,6 +254,34 @@ class TestRunner:
             except Exception as e:
                 logger.debug(f"Failed to reset monitor signals: {e}")
 
+    def _flush_plot_stream(self, wait: bool = False) -> None:
+        """Apply plot points queued in the GUI plot stream.
+        
+        On the GUI thread the stream is drained directly (the refresh timer cannot fire
+        while a test blocks the event loop). From the test thread nothing is done unless
+        ``wait`` is set, in which case the call blocks once until the GUI has drained the
+        stream, so the GUI plot arrays are complete.
+        
+        Args:
+            wait: Block until the GUI thread has applied all queued points
+        """
+        gui = self.gui
+        if gui is None or getattr(gui, 'plot_stream', None) is None:
+            return
+        try:
+            current_thread = QtCore.QThread.currentThread()
+            main_thread = QtCore.QCoreApplication.instance().thread()
+            if current_thread == main_thread:
+                gui._drain_plot_stream()
+            elif wait:
+                QtCore.QMetaObject.invokeMethod(
+                    gui,
+                    '_drain_plot_stream',
+                    QtCore.Qt.ConnectionType.BlockingQueuedConnection
+                )
+        except Exception as e:
+            logger.debug(f"Failed to flush plot stream: {e}")
+
     def update_monitor_signal(self, key: str, value: Optional[float]) -> None:
         """Update real-time monitor label for the specified key.
         
@@ -1293,28 +1319,9 @@ class TestRunner:
                                         except Exception as e:
                                             logger.debug(f"Error updating plot with batched point: {e}")
                                     
-                                    # After queuing all plot updates via BlockingQueuedConnection,
-                                    # they have already been processed in the main thread with draw()
-                                    # Force a single canvas update after all batched points are added
-                                    # Use direct access if in main thread
-                                    if self.gui is not None and hasattr(self.gui, 'plot_canvas') and self.gui.plot_canvas is not None:
-                                        try:
-                                            current_thread = QtCore.QThread.currentThread()
-                                            main_thread = QtCore.QCoreApplication.instance().thread()
-                                            
-                                            if current_thread == main_thread:
-                                                # Main thread - update directly with immediate draw
-                                                if hasattr(self.gui, 'plot_line') and self.gui.plot_line is not None:
-                                                    if hasattr(self.gui, 'plot_dac_voltages') and hasattr(self.gui, 'plot_feedback_values'):
-                                                        self.gui.plot_line.set_data(self.gui.plot_dac_voltages, self.gui.plot_feedback_values)
-                                                if hasattr(self.gui, 'plot_axes') and self.gui.plot_axes is not None:
-                                                    self.gui.plot_axes.relim()
-                                                    self.gui.plot_axes.autoscale()
-                                                # Use draw() for immediate update during test
-                                                self.gui.plot_canvas.draw()
-                                            # Background thread: updates already processed via BlockingQueuedConnection
-                                        except Exception as e:
-                                            logger.debug(f"Error finalizing batched plot update: {e}")
+                                    # Points are drawn by the GUI plot refresh timer; only when
+                                    # running on the GUI thread (timer cannot fire) drain directly
+                                    self._flush_plot_stream()
                                 except Exception as e:
                                     logger.debug(f"Error updating plot with batched points: {e}")
                                 batched_data_points.clear()
@@ -1334,26 +1341,7 @@ class TestRunner:
                                 except Exception as e:
                                     logger.debug(f"Error updating plot with final batched point: {e}")
                             
-                            # Force final canvas update after all points are added
-                            # Updates already processed via BlockingQueuedConnection, just ensure final redraw
-                            if self.gui is not None and hasattr(self.gui, 'plot_canvas') and self.gui.plot_canvas is not None:
-                                try:
-                                    current_thread = QtCore.QThread.currentThread()
-                                    main_thread = QtCore.QCoreApplication.instance().thread()
-                                    
-                                    if current_thread == main_thread:
-                                        # Main thread - update directly with immediate draw
-                                        if hasattr(self.gui, 'plot_line') and self.gui.plot_line is not None:
-                                            if hasattr(self.gui, 'plot_dac_voltages') and hasattr(self.gui, 'plot_feedback_values'):
-                                                self.gui.plot_line.set_data(self.gui.plot_dac_voltages, self.gui.plot_feedback_values)
-                                        if hasattr(self.gui, 'plot_axes') and self.gui.plot_axes is not None:
-                                            self.gui.plot_axes.relim()
-                                            self.gui.plot_axes.autoscale()
-                                        # Use draw() for immediate update
-                                        self.gui.plot_canvas.draw()
-                                    # Background thread: updates already processed via BlockingQueuedConnection
-                                except Exception as e:
-                                    logger.debug(f"Error finalizing final batched plot update: {e}")
+                            self._flush_plot_stream()
                         except Exception as e:
                             logger.debug(f"Error flushing batched plot points: {e}")
                         batched_data_points.clear()
@@ -1996,6 +1984,8 @@ class TestRunner:
                 # This prevents plot data from being lost when the next test clears the plot arrays
                 if test.get('type') == 'Analog Sweep Test':
                     test_name = test.get('name', '<unnamed>')
+                    # Make sure every queued point has reached the GUI plot arrays
+                    self._flush_plot_stream(wait=True)
                     try:
                         if self.gui is not None and hasattr(self.gui, 'plot_dac_voltages') and hasattr(self.gui, 'plot_feedback_values'):
                             if self.gui.plot_dac_voltages and self.gui.plot_feedback_values:
@@ -3320,11 +3310,11 @@ class TestRunner:
                     
                     if not is_on:
                         logger.info(f"Channel {channel_num} is OFF, turning ON...")
-                        self.oscilloscope_service.send_command(f"C{channel_num}:TRA ON")
-                        time.sleep(0.2)  # Small delay for command processing
-                        
-                        # Verify it's now ON
-                        tra_response = self.oscilloscope_service.send_command(f"C{channel_num}:TRA?")
+                        # Enable and read back in one transfer (synchronised with *OPC?)
+                        with self.oscilloscope_service.batch('enable channel') as batch:
+                            batch.write(f"C{channel_num}:TRA ON", legacy_delay=0.2)
+                            tra_query = batch.query(f"C{channel_num}:TRA?")
+                        tra_response = tra_query.value
                         if tra_response is None:
                             return False, f"Failed to verify channel {channel_num} trace status after enabling"
                         
@@ -3354,8 +3344,7 @@ class TestRunner:
                 # Step 2: Send TRMD AUTO and start logging CAN feedback signal
                 logger.info("DC Bus Sensing Test: Starting oscilloscope acquisition (TRMD AUTO)...")
                 try:
-                    self.oscilloscope_service.send_command("TRMD AUTO")
-                    time.sleep(0.2)  # Small delay for command processing
+                    self.oscilloscope_service.send_commands(["TRMD AUTO"], name='start acquisition', legacy_delay=0.2)
                 except Exception as e:
                     return False, f"Failed to start oscilloscope acquisition: {e}"
                 
@@ -3401,18 +3390,16 @@ class TestRunner:
                 collecting_can_data = False
                 logger.info("DC Bus Sensing Test: Stopping oscilloscope acquisition...")
                 try:
-                    # Use *STOP as per requirements (not just STOP)
-                    self.oscilloscope_service.send_command("*STOP")
-                    # Wait longer for acquisition to fully stop and data to be processed
-                    time.sleep(0.5)  # Increased delay for command processing
+                    # Use *STOP as per requirements (not just STOP); *OPC? returns
+                    # once the acquisition has stopped
+                    self.oscilloscope_service.send_commands(["*STOP"], name='stop acquisition', legacy_delay=0.5)
                 except Exception as e:
                     logger.warning(f"Failed to stop oscilloscope acquisition: {e} (continuing with analysis)")
                 
-                # Step 5: Obtain average from oscilloscope
-                # Note: PAVA command may need additional time after STOP for oscilloscope to process data
+                # Step 5: Obtain average from oscilloscope (measure_pava waits until
+                # the acquisition has stopped instead of a fixed delay)
                 logger.info(f"DC Bus Sensing Test: Querying oscilloscope average (C{channel_num}:PAVA? MEAN)...")
-                time.sleep(0.3)  # Additional delay before querying PAVA
-                osc_avg = self.oscilloscope_service.query_pava_mean(channel_num)
+                osc_avg = self.oscilloscope_service.measure_pava([channel_num])[channel_num]['MEAN']
                 if osc_avg is None:
                     return False, f"Failed to obtain average value from oscilloscope channel {channel_num}"
                 
@@ -5000,14 +4987,12 @@ class TestRunner:
                 # 3) Initialize trim value at DUT
                 # 4) Send initial current setpoint (first from array)
                 # 5) Trigger test at DUT
-                # 6) Collect data for first setpoint (wait, acquire, collect, analyze)
-                # 7) For each remaining setpoint (starting from second):
+                # 6-7) For each setpoint (the first one was sent in step 4):
                 #    a. Send current setpoint
-                #    b. Wait pre-acquisition time
-                #    c. Start CAN logging and oscilloscope acquisition
-                #    d. Collect data during acquisition time
-                #    e. Stop data collection
-                #    f. Calculate averages and update plot
+                #    b. Calculate averages of the previous setpoint (PAVA) and update plot
+                #       while the DUT settles at this one
+                #    c. Wait for the rest of the pre-acquisition time
+                #    d. Start oscilloscope acquisition, collect CAN data, stop
                 # 8) Disable test mode
                 # 9) Calculate gain error and adjustment factor (point-by-point method, same as Phase Current Test)
                 # 10) Determine pass/fail
@@ -5196,10 +5181,10 @@ class TestRunner:
                     
                     # Set and verify timebase
                     logger.info(f"Setting oscilloscope timebase to {osc_timebase}...")
-                    self.oscilloscope_service.send_command(f"TDIV {osc_timebase}")
-                    time.sleep(0.2)
-                    
-                    tdiv_response = self.oscilloscope_service.send_command("TDIV?")
+                    with self.oscilloscope_service.batch('timebase') as batch:
+                        batch.write(f"TDIV {osc_timebase}", legacy_delay=0.2)
+                        tdiv_query = batch.query("TDIV?")
+                    tdiv_response = tdiv_query.value
                     if tdiv_response is None:
                         return False, "Failed to verify oscilloscope timebase"
                     
@@ -5220,11 +5205,11 @@ class TestRunner:
                     
                     if not is_on:
                         logger.info(f"Channel {channel_num} is OFF, turning ON...")
-                        self.oscilloscope_service.send_command(f"C{channel_num}:TRA ON")
-                        time.sleep(0.2)
-                        
-                        # Verify it's now ON
-                        tra_response = self.oscilloscope_service.send_command(f"C{channel_num}:TRA?")
+                        # Enable and read back in one transfer (synchronised with *OPC?)
+                        with self.oscilloscope_service.batch('enable channel') as batch:
+                            batch.write(f"C{channel_num}:TRA ON", legacy_delay=0.2)
+                            tra_query = batch.query(f"C{channel_num}:TRA?")
+                        tra_response = tra_query.value
                         if tra_response is None:
                             return False, f"Failed to verify channel {channel_num} trace status after enabling"
                         
@@ -5467,107 +5452,15 @@ class TestRunner:
                 except Exception as e:
                     return False, f"Failed to send test trigger: {e}"
                 
-                # Step 6: Collect data for first setpoint
                 test_name = test.get('name', '<unnamed>')
-                logger.info(f"Collecting data for first setpoint: {first_setpoint}A")
-                
-                # 6a. Wait for pre-acquisition time
-                logger.info(f"Waiting {pre_acq_ms}ms for current to stabilize...")
-                _nb_sleep(pre_acq_ms / 1000.0)
-                
-                # 6b. Start data acquisition
-                logger.info(f"Starting data acquisition for {acq_ms}ms...")
-                can_feedback_values = []
-                collecting_can_data = True
-                
-                try:
-                    # Start oscilloscope acquisition
-                    self.oscilloscope_service.send_command("TRMD AUTO")
-                    time.sleep(0.2)
-                except Exception as e:
-                    logger.warning(f"Failed to start oscilloscope acquisition: {e}, continuing...")
-                
-                # 6c. Collect data during acquisition time
-                start_time = time.time()
-                end_time = start_time + (acq_ms / 1000.0)
-                
-                while time.time() < end_time and collecting_can_data:
-                    try:
-                        if self.signal_service is not None:
-                            ts_fb, fb_val = self.signal_service.get_latest_signal(feedback_msg_id, feedback_signal)
-                        elif self.gui is not None:
-                            ts_fb, fb_val = self.gui.get_latest_signal(feedback_msg_id, feedback_signal)
-                        else:
-                            ts_fb, fb_val = (None, None)
-                        
-                        if fb_val is not None:
-                            try:
-                                fb_float = float(fb_val)
-                                can_feedback_values.append(fb_float)
-                            except (ValueError, TypeError):
-                                pass
-                    except Exception as e:
-                        logger.debug(f"Error reading CAN feedback signal: {e}")
-                    
-                    time.sleep(SLEEP_INTERVAL_SHORT)
-                
-                # 6d. Stop data acquisition
-                collecting_can_data = False
-                logger.info("Stopping data acquisition...")
-                try:
-                    self.oscilloscope_service.send_command("STOP")
-                    time.sleep(0.5)  # Wait for acquisition to stop
-                except Exception as e:
-                    logger.warning(f"Failed to stop oscilloscope acquisition: {e}")
-                
-                # 6e. Analyze data and update plot for first setpoint
-                if not can_feedback_values:
-                    logger.warning(f"No CAN data collected at first setpoint {first_setpoint}A, skipping...")
-                else:
-                    # Calculate CAN average
-                    can_avg = sum(can_feedback_values) / len(can_feedback_values)
-                    
-                    # Query oscilloscope average
-                    time.sleep(0.3)  # Additional delay before querying PAVA
-                    osc_avg = self.oscilloscope_service.query_pava_mean(channel_num)
-                    if osc_avg is None:
-                        logger.warning(f"Failed to obtain oscilloscope average at first setpoint {first_setpoint}A, skipping...")
-                    else:
-                        # Validate oscilloscope data quality
-                        try:
-                            osc_avg_float = float(osc_avg)
-                            # Validate value is in reasonable range for output current (0-50A typical)
-                            if not (0.0 <= abs(osc_avg_float) <= 60.0):
-                                logger.warning(f"Output Current Calibration: Oscilloscope average {osc_avg_float}A at setpoint {first_setpoint}A is outside typical range (0-60A)")
-                            osc_avg = osc_avg_float
-                        except (ValueError, TypeError) as e:
-                            logger.warning(f"Output Current Calibration: Oscilloscope returned invalid average value: {osc_avg} (expected numeric value)")
-                            osc_avg = None
-                        
-                        if osc_avg is not None:
-                            # Validate CAN average is in reasonable range
-                            if not (0.0 <= abs(can_avg) <= 60.0):
-                                logger.warning(f"Output Current Calibration: CAN average {can_avg}A at setpoint {first_setpoint}A is outside typical range (0-60A)")
-                            
-                            # Store data
-                            can_averages.append(can_avg)
-                            osc_averages.append(osc_avg)
-                            setpoint_values.append(first_setpoint)
-                        
-                        logger.info(f"First setpoint {first_setpoint}A: CAN avg={can_avg:.4f}A, Osc avg={osc_avg:.4f}A")
-                        
-                        # Update plot
-                        if self.plot_update_callback is not None:
-                            self.plot_update_callback(osc_avg, can_avg, test_name)
-                        
-                        if self.label_update_callback is not None:
-                            self.label_update_callback(f"Output Current Calibration: Setpoint 1/{len(current_setpoints)} ({first_setpoint}A) - CAN: {can_avg:.3f}A, Osc: {osc_avg:.3f}A")
                 
-                # Step 7: Iterate through remaining current setpoints (starting from second)
-                for setpoint_idx, setpoint in enumerate(current_setpoints[1:], start=1):
-                    logger.info(f"Testing setpoint {setpoint_idx + 1}/{len(current_setpoints)}: {setpoint}A")
-                    
-                    # 7a. Send current setpoint
+                # Steps 6-7 and 13-14 run each sweep as a pipeline: once the
+                # oscilloscope has stopped on setpoint N, setpoint N+1 is sent and
+                # the PAVA query for setpoint N runs while the DUT settles at the
+                # new setpoint (the stopped capture is not affected). Results are
+                # stored and plotted in setpoint order.
+                def _send_setpoint(setpoint: float, log_prefix: str) -> bool:
+                    """Send a current setpoint to the DUT. Returns True if it was sent."""
                     try:
                         signal_values = _build_signal_values_dict({current_setpoint_signal: setpoint})
                         frame_data = self.dbc_service.encode_message(trigger_msg, signal_values)
@@ -5582,8 +5475,8 @@ class TestRunner:
                             frame = Frame(can_id=test_trigger_source, data=frame_data)
                         
                         if not self.can_service.send_frame(frame):
-                            logger.warning(f"Failed to send current setpoint {setpoint}A, continuing...")
-                            continue
+                            logger.warning(f"{log_prefix}Failed to send current setpoint {setpoint}A, continuing...")
+                            return False
                         
                         # Track sent command value for monitoring (thread-safe)
                         if self.gui is not None and hasattr(self.gui, 'track_sent_command_value'):
@@ -5604,32 +5497,26 @@ class TestRunner:
                             except Exception:
                                 pass
                         
-                        logger.info(f"Sent current setpoint: {setpoint}A")
+                        logger.info(f"{log_prefix}Sent current setpoint: {setpoint}A")
+                        return True
                     except Exception as e:
-                        logger.warning(f"Failed to send current setpoint {setpoint}A: {e}, continuing...")
-                        continue
-                    
-                    # 7b. Wait for pre-acquisition time
-                    logger.info(f"Waiting {pre_acq_ms}ms for current to stabilize...")
-                    _nb_sleep(pre_acq_ms / 1000.0)
-                    
-                    # 7c. Start data acquisition
-                    logger.info(f"Starting data acquisition for {acq_ms}ms...")
+                        logger.warning(f"{log_prefix}Failed to send current setpoint {setpoint}A: {e}, continuing...")
+                        return False
+                
+                def _acquire_setpoint(log_prefix: str) -> list:
+                    """Run one oscilloscope acquisition and return the CAN feedback values read during it."""
+                    logger.info(f"{log_prefix}Starting data acquisition for {acq_ms}ms...")
                     can_feedback_values = []
-                    collecting_can_data = True
                     
                     try:
                         # Start oscilloscope acquisition
-                        self.oscilloscope_service.send_command("TRMD AUTO")
-                        time.sleep(0.2)
+                        self.oscilloscope_service.send_commands(["TRMD AUTO"], name='start acquisition', legacy_delay=0.2)
                     except Exception as e:
                         logger.warning(f"Failed to start oscilloscope acquisition: {e}, continuing...")
                     
-                    # 7d. Collect data during acquisition time
-                    start_time = time.time()
-                    end_time = start_time + (acq_ms / 1000.0)
-                    
-                    while time.time() < end_time and collecting_can_data:
+                    # Collect data during acquisition time
+                    end_time = time.time() + (acq_ms / 1000.0)
+                    while time.time() < end_time:
                         try:
                             if self.signal_service is not None:
                                 ts_fb, fb_val = self.signal_service.get_latest_signal(feedback_msg_id, feedback_signal)
@@ -5640,8 +5527,7 @@ class TestRunner:
                             
                             if fb_val is not None:
                                 try:
-                                    fb_float = float(fb_val)
-                                    can_feedback_values.append(fb_float)
+                                    can_feedback_values.append(float(fb_val))
                                 except (ValueError, TypeError):
                                     pass
                         except Exception as e:
@@ -5649,58 +5535,89 @@ class TestRunner:
                         
                         time.sleep(SLEEP_INTERVAL_SHORT)
                     
-                    # 7e. Stop data acquisition
-                    collecting_can_data = False
-                    logger.info("Stopping data acquisition...")
+                    # Stop data acquisition
+                    logger.info(f"{log_prefix}Stopping data acquisition...")
                     try:
-                        self.oscilloscope_service.send_command("STOP")
-                        time.sleep(0.5)  # Wait for acquisition to stop
+                        # *OPC? returns once the acquisition has stopped
+                        self.oscilloscope_service.send_commands(["STOP"], name='stop acquisition', legacy_delay=0.5)
                     except Exception as e:
                         logger.warning(f"Failed to stop oscilloscope acquisition: {e}")
-                    
-                    # 7f. Analyze data and update plot
+                    return can_feedback_values
+                
+                def _record_setpoint(setpoint_idx: int, setpoint: float, can_feedback_values: list,
+                                     sweep: Optional[str], can_out: list, osc_out: list, setpoint_out: list) -> None:
+                    """Average one setpoint's data (CAN values and oscilloscope PAVA), store it and update the plot."""
+                    log_prefix = f"{sweep}: " if sweep else ""
                     if not can_feedback_values:
-                        logger.warning(f"No CAN data collected at setpoint {setpoint}A, skipping...")
-                        continue
+                        logger.warning(f"{log_prefix}No CAN data collected at setpoint {setpoint}A, skipping...")
+                        return
                     
                     # Calculate CAN average
                     can_avg = sum(can_feedback_values) / len(can_feedback_values)
                     
-                    # Query oscilloscope average
-                    time.sleep(0.3)  # Additional delay before querying PAVA
-                    osc_avg = self.oscilloscope_service.query_pava_mean(channel_num)
+                    # Query oscilloscope average (the oscilloscope is stopped on this setpoint's capture)
+                    osc_avg = self.oscilloscope_service.measure_pava([channel_num])[channel_num]['MEAN']
                     if osc_avg is None:
-                        logger.warning(f"Failed to obtain oscilloscope average at setpoint {setpoint}A, skipping...")
-                        continue
+                        logger.warning(f"{log_prefix}Failed to obtain oscilloscope average at setpoint {setpoint}A, skipping...")
+                        return
                     
                     # Validate oscilloscope data quality
                     try:
-                        osc_avg_float = float(osc_avg)
-                        # Validate value is in reasonable range for output current (0-50A typical)
-                        if not (0.0 <= abs(osc_avg_float) <= 60.0):
-                            logger.warning(f"Output Current Calibration: Oscilloscope average {osc_avg_float}A at setpoint {setpoint}A is outside typical range (0-60A)")
-                        osc_avg = osc_avg_float
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Output Current Calibration: Oscilloscope returned invalid average value at setpoint {setpoint}A: {osc_avg} (expected numeric value)")
-                        continue
-                    
-                    # Validate CAN average is in reasonable range
+                        osc_avg = float(osc_avg)
+                    except (ValueError, TypeError):
+                        logger.warning(f"Output Current Calibration: {log_prefix}Oscilloscope returned invalid average value at setpoint {setpoint}A: {osc_avg} (expected numeric value)")
+                        return
+                    # Validate values are in reasonable range for output current (0-50A typical)
+                    if not (0.0 <= abs(osc_avg) <= 60.0):
+                        logger.warning(f"Output Current Calibration: {log_prefix}Oscilloscope average {osc_avg}A at setpoint {setpoint}A is outside typical range (0-60A)")
                     if not (0.0 <= abs(can_avg) <= 60.0):
-                        logger.warning(f"Output Current Calibration: CAN average {can_avg}A at setpoint {setpoint}A is outside typical range (0-60A)")
+                        logger.warning(f"Output Current Calibration: {log_prefix}CAN average {can_avg}A at setpoint {setpoint}A is outside typical range (0-60A)")
                     
                     # Store data
-                    can_averages.append(can_avg)
-                    osc_averages.append(osc_avg)
-                    setpoint_values.append(setpoint)
+                    can_out.append(can_avg)
+                    osc_out.append(osc_avg)
+                    setpoint_out.append(setpoint)
                     
-                    logger.info(f"Setpoint {setpoint}A: CAN avg={can_avg:.4f}A, Osc avg={osc_avg:.4f}A")
+                    logger.info(f"{log_prefix}Setpoint {setpoint}A: CAN avg={can_avg:.4f}A, Osc avg={osc_avg:.4f}A")
                     
                     # Update plot
                     if self.plot_update_callback is not None:
                         self.plot_update_callback(osc_avg, can_avg, test_name)
                     
                     if self.label_update_callback is not None:
-                        self.label_update_callback(f"Output Current Calibration: Setpoint {setpoint_idx + 1}/{len(current_setpoints)} ({setpoint}A) - CAN: {can_avg:.3f}A, Osc: {osc_avg:.3f}A")
+                        title = f"Output Current Calibration ({sweep})" if sweep else "Output Current Calibration"
+                        self.label_update_callback(f"{title}: Setpoint {setpoint_idx + 1}/{len(current_setpoints)} ({setpoint}A) - CAN: {can_avg:.3f}A, Osc: {osc_avg:.3f}A")
+                
+                def _run_setpoint_sweep(sweep: Optional[str], can_out: list, osc_out: list, setpoint_out: list) -> None:
+                    """Collect data for every setpoint (the first one must already be sent and the test triggered)."""
+                    log_prefix = f"{sweep}: " if sweep else ""
+                    pending = None  # (index, setpoint, CAN values) of the last acquisition, waiting for PAVA
+                    for setpoint_idx, setpoint in enumerate(current_setpoints):
+                        logger.info(f"{log_prefix}Testing setpoint {setpoint_idx + 1}/{len(current_setpoints)}: {setpoint}A")
+                        
+                        # a. Send current setpoint (the first one was sent before the test trigger)
+                        sent = setpoint_idx == 0 or _send_setpoint(setpoint, log_prefix)
+                        settle_end = time.time() + pre_acq_ms / 1000.0
+                        
+                        # b. Obtain the previous setpoint's result while the DUT settles
+                        if pending is not None:
+                            _record_setpoint(*pending, sweep, can_out, osc_out, setpoint_out)
+                            pending = None
+                        if not sent:
+                            continue
+                        
+                        # c. Wait for the rest of the pre-acquisition time
+                        logger.info(f"{log_prefix}Waiting {pre_acq_ms}ms for current to stabilize...")
+                        _nb_sleep(max(0.0, settle_end - time.time()))
+                        
+                        # d. Acquire; averaging and the PAVA query follow during the next settling time
+                        pending = (setpoint_idx, setpoint, _acquire_setpoint(log_prefix))
+                    
+                    if pending is not None:
+                        _record_setpoint(*pending, sweep, can_out, osc_out, setpoint_out)
+                
+                # Steps 6-7: Collect data for every setpoint (pipelined, see above)
+                _run_setpoint_sweep(None, can_averages, osc_averages, setpoint_values)
                 
                 # Step 8: Disable test mode (end of first sweep)
                 logger.info("Disabling test mode at DUT (end of first sweep)...")
@@ -5916,203 +5833,8 @@ class TestRunner:
                 except Exception as e:
                     return False, f"Failed to send test trigger for second sweep: {e}"
                 
-                # Step 13: Collect Data for First Setpoint (Second Sweep)
-                logger.info(f"Second Sweep: Collecting data for first setpoint: {first_setpoint}A")
-                
-                # 13a. Wait for pre-acquisition time
-                logger.info(f"Second Sweep: Waiting {pre_acq_ms}ms for current to stabilize...")
-                _nb_sleep(pre_acq_ms / 1000.0)
-                
-                # 13b. Start data acquisition
-                logger.info(f"Second Sweep: Starting data acquisition for {acq_ms}ms...")
-                can_feedback_values = []
-                collecting_can_data = True
-                
-                try:
-                    # Start oscilloscope acquisition
-                    self.oscilloscope_service.send_command("TRMD AUTO")
-                    time.sleep(0.2)
-                except Exception as e:
-                    logger.warning(f"Failed to start oscilloscope acquisition: {e}, continuing...")
-                
-                # 13c. Collect data during acquisition time
-                start_time = time.time()
-                end_time = start_time + (acq_ms / 1000.0)
-                
-                while time.time() < end_time and collecting_can_data:
-                    try:
-                        if self.signal_service is not None:
-                            ts_fb, fb_val = self.signal_service.get_latest_signal(feedback_msg_id, feedback_signal)
-                        elif self.gui is not None:
-                            ts_fb, fb_val = self.gui.get_latest_signal(feedback_msg_id, feedback_signal)
-                        else:
-                            ts_fb, fb_val = (None, None)
-                        
-                        if fb_val is not None:
-                            try:
-                                fb_float = float(fb_val)
-                                can_feedback_values.append(fb_float)
-                            except (ValueError, TypeError):
-                                pass
-                    except Exception as e:
-                        logger.debug(f"Error reading CAN feedback signal: {e}")
-                    
-                    time.sleep(SLEEP_INTERVAL_SHORT)
-                
-                # 13d. Stop data acquisition
-                collecting_can_data = False
-                logger.info("Second Sweep: Stopping data acquisition...")
-                try:
-                    self.oscilloscope_service.send_command("STOP")
-                    time.sleep(0.5)  # Wait for acquisition to stop
-                except Exception as e:
-                    logger.warning(f"Failed to stop oscilloscope acquisition: {e}")
-                
-                # 13e. Analyze data and update plot for first setpoint (second sweep)
-                if not can_feedback_values:
-                    logger.warning(f"Second Sweep: No CAN data collected at first setpoint {first_setpoint}A, skipping...")
-                else:
-                    # Calculate CAN average
-                    can_avg = sum(can_feedback_values) / len(can_feedback_values)
-                    
-                    # Query oscilloscope average
-                    time.sleep(0.3)  # Additional delay before querying PAVA
-                    osc_avg = self.oscilloscope_service.query_pava_mean(channel_num)
-                    if osc_avg is None:
-                        logger.warning(f"Second Sweep: Failed to obtain oscilloscope average at first setpoint {first_setpoint}A, skipping...")
-                    else:
-                        # Store data
-                        second_can_averages.append(can_avg)
-                        second_osc_averages.append(osc_avg)
-                        second_setpoint_values.append(first_setpoint)
-                        
-                        logger.info(f"Second Sweep - First setpoint {first_setpoint}A: CAN avg={can_avg:.4f}A, Osc avg={osc_avg:.4f}A")
-                        
-                        # Update plot
-                        if self.plot_update_callback is not None:
-                            self.plot_update_callback(osc_avg, can_avg, test_name)
-                        
-                        if self.label_update_callback is not None:
-                            self.label_update_callback(f"Output Current Calibration (Second Sweep): Setpoint 1/{len(current_setpoints)} ({first_setpoint}A) - CAN: {can_avg:.3f}A, Osc: {osc_avg:.3f}A")
-                
-                # Step 14: For each remaining current setpoint in the array (second sweep, starting from the second setpoint)
-                for setpoint_idx, setpoint in enumerate(current_setpoints[1:], start=1):
-                    logger.info(f"Second Sweep: Testing setpoint {setpoint_idx + 1}/{len(current_setpoints)}: {setpoint}A")
-                    
-                    # 14a. Send current setpoint
-                    try:
-                        signal_values = _build_signal_values_dict({current_setpoint_signal: setpoint})
-                        frame_data = self.dbc_service.encode_message(trigger_msg, signal_values)
-                        if AdapterFrame is not None:
-                            frame = AdapterFrame(can_id=test_trigger_source, data=frame_data)
-                        else:
-                            # Fallback if AdapterFrame not available
-                            class Frame:
-                                def __init__(self, can_id, data):
-                                    self.can_id = can_id
-                                    self.data = data
-                            frame = Frame(can_id=test_trigger_source, data=frame_data)
-                        
-                        if not self.can_service.send_frame(frame):
-                            logger.warning(f"Second Sweep: Failed to send current setpoint {setpoint}A, continuing...")
-                            continue
-                        
-                        logger.info(f"Second Sweep: Sent current setpoint: {setpoint}A")
-                    except Exception as e:
-                        logger.warning(f"Second Sweep: Failed to send current setpoint {setpoint}A: {e}, continuing...")
-                        continue
-                    
-                    # 14b. Wait for pre-acquisition time
-                    logger.info(f"Second Sweep: Waiting {pre_acq_ms}ms for current to stabilize...")
-                    _nb_sleep(pre_acq_ms / 1000.0)
-                    
-                    # 14c. Start data acquisition
-                    logger.info(f"Second Sweep: Starting data acquisition for {acq_ms}ms...")
-                    can_feedback_values = []
-                    collecting_can_data = True
-                    
-                    try:
-                        # Start oscilloscope acquisition
-                        self.oscilloscope_service.send_command("TRMD AUTO")
-                        time.sleep(0.2)
-                    except Exception as e:
-                        logger.warning(f"Failed to start oscilloscope acquisition: {e}, continuing...")
-                    
-                    # 14d. Collect data during acquisition time
-                    start_time = time.time()
-                    end_time = start_time + (acq_ms / 1000.0)
-                    
-                    while time.time() < end_time and collecting_can_data:
-                        try:
-                            if self.signal_service is not None:
-                                ts_fb, fb_val = self.signal_service.get_latest_signal(feedback_msg_id, feedback_signal)
-                            elif self.gui is not None:
-                                ts_fb, fb_val = self.gui.get_latest_signal(feedback_msg_id, feedback_signal)
-                            else:
-                                ts_fb, fb_val = (None, None)
-                            
-                            if fb_val is not None:
-                                try:
-                                    fb_float = float(fb_val)
-                                    can_feedback_values.append(fb_float)
-                                except (ValueError, TypeError):
-                                    pass
-                        except Exception as e:
-                            logger.debug(f"Error reading CAN feedback signal: {e}")
-                        
-                        time.sleep(SLEEP_INTERVAL_SHORT)
-                    
-                    # 14e. Stop data acquisition
-                    collecting_can_data = False
-                    logger.info("Second Sweep: Stopping data acquisition...")
-                    try:
-                        self.oscilloscope_service.send_command("STOP")
-                        time.sleep(0.5)  # Wait for acquisition to stop
-                    except Exception as e:
-                        logger.warning(f"Failed to stop oscilloscope acquisition: {e}")
-                    
-                    # 14f. Analyze data and update plot
-                    if not can_feedback_values:
-                        logger.warning(f"Second Sweep: No CAN data collected at setpoint {setpoint}A, skipping...")
-                        continue
-                    
-                    # Calculate CAN average
-                    can_avg = sum(can_feedback_values) / len(can_feedback_values)
-                    
-                    # Query oscilloscope average
-                    time.sleep(0.3)  # Additional delay before querying PAVA
-                    osc_avg = self.oscilloscope_service.query_pava_mean(channel_num)
-                    if osc_avg is None:
-                        logger.warning(f"Second Sweep: Failed to obtain oscilloscope average at setpoint {setpoint}A, skipping...")
-                        continue
-                    
-                    # Validate oscilloscope data quality (same as first sweep)
-                    try:
-                        osc_avg_float = float(osc_avg)
-                        if not (0.0 <= abs(osc_avg_float) <= 60.0):
-                            logger.warning(f"Output Current Calibration: Second sweep oscilloscope average {osc_avg_float}A at setpoint {setpoint}A is outside typical range (0-60A)")
-                        osc_avg = osc_avg_float
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Output Current Calibration: Second sweep oscilloscope returned invalid average value at setpoint {setpoint}A: {osc_avg} (expected numeric value)")
-                        continue
-                    
-                    # Validate CAN average is in reasonable range
-                    if not (0.0 <= abs(can_avg) <= 60.0):
-                        logger.warning(f"Output Current Calibration: Second sweep CAN average {can_avg}A at setpoint {setpoint}A is outside typical range (0-60A)")
-                    
-                    # Store data
-                    second_can_averages.append(can_avg)
-                    second_osc_averages.append(osc_avg)
-                    second_setpoint_values.append(setpoint)
-                    
-                    logger.info(f"Second Sweep - Setpoint {setpoint}A: CAN avg={can_avg:.4f}A, Osc avg={osc_avg:.4f}A")
-                    
-                    # Update plot
-                    if self.plot_update_callback is not None:
-                        self.plot_update_callback(osc_avg, can_avg, test_name)
-                    
-                    if self.label_update_callback is not None:
-                        self.label_update_callback(f"Output Current Calibration (Second Sweep): Setpoint {setpoint_idx + 1}/{len(current_setpoints)} ({setpoint}A) - CAN: {can_avg:.3f}A, Osc: {osc_avg:.3f}A")
+                # Steps 13-14: Collect data for every setpoint of the second sweep (pipelined)
+                _run_setpoint_sweep('Second Sweep', second_can_averages, second_osc_averages, second_setpoint_values)
                 
                 # Step 15: Disable test mode (end of second sweep)
                 logger.info("Disabling test mode at DUT (end of second sweep)...")
@@ -6337,27 +6059,19 @@ class TestRunner:
             waited += poll_interval
             fb = test.get('feedback_signal')
             try:
-                # Legacy: Access frame table directly if GUI is available
+                # Legacy: Access frame table model directly if GUI is available
                 # This should be refactored to use a callback or service method in the future
-                if self.gui is None or not hasattr(self.gui, 'frame_table'):
+                if self.gui is None or not hasattr(self.gui, 'frame_model'):
                     continue
                 
-                rows = self.gui.frame_table.rowCount()
-                for r in range(max(0, rows-10), rows):
+                # recent_frames() is thread-safe (copies under the model lock)
+                for frame in self.gui.frame_model.recent_frames(10):
                     try:
-                        can_id_item = self.gui.frame_table.item(r,1)
-                        data_item = self.gui.frame_table.item(r,3)
-                        if can_id_item is None or data_item is None:
-                            continue
                         try:
-                            row_can = int(can_id_item.text())
+                            row_can = int(frame.can_id)
                         except Exception:
-                            try:
-                                row_can = int(can_id_item.text(), 0)
-                            except Exception:
-                                continue
-                        raw_hex = data_item.text()
-                        raw = bytes.fromhex(raw_hex) if raw_hex else b''
+                            continue
+                        raw = bytes(getattr(frame, 'data', b'') or b'')
                         # Phase 1: Use services if available
                         dbc_available = (self.dbc_service is not None and self.dbc_service.is_loaded())
                         if dbc_available and fb:
@@ -0,0 +1,35 @@
+"""Synthetic Siglent WF? ALL records shared by the waveform tests."""
+import struct
+
+import numpy as np
+
+from host_gui.utils.waveform_decoder import WaveformDecoder
+
+WAVEDESC_LENGTH = 346
+
+
+def wavedesc_record(samples, comm_type=0, gain=1.0, offset=0.0, interval=1e-6, t0=0.0,
+                    first_point=0, sparsing=0, trigger_times=(), prefix=b'', suffix=b''):
+    """Build a WF? ALL record: 346-byte WAVEDESC, trigger time array and samples.
+
+    Args:
+        samples: Sample codes (8-bit for comm_type 0, 16-bit for comm_type 1)
+        trigger_times: (trigger time, trigger offset) per segment of a sequence record
+        prefix: Bytes before the descriptor (e.g. a '#9...' block header)
+        suffix: Bytes after the samples (e.g. the response terminator)
+    """
+    data = np.asarray(samples).astype('<i1' if comm_type == 0 else '<i2').tobytes()
+    trigtime = b''.join(WaveformDecoder.TRIGTIME_ENTRY.pack(*entry) for entry in trigger_times)
+    desc = bytearray(WAVEDESC_LENGTH)
+    desc[0:8] = b'WAVEDESC'
+    struct.pack_into('<H', desc, WaveformDecoder.COMM_TYPE_OFFSET, comm_type)
+    struct.pack_into('<I', desc, WaveformDecoder.WAVE_DESCRIPTOR_OFFSET, len(desc))
+    struct.pack_into('<I', desc, WaveformDecoder.TRIGTIME_ARRAY_OFFSET, len(trigtime))
+    struct.pack_into('<I', desc, WaveformDecoder.WAVE_ARRAY_1_OFFSET, len(data))
+    struct.pack_into('<I', desc, WaveformDecoder.WAVE_ARRAY_COUNT_OFFSET, len(samples))
+    struct.pack_into('<II', desc, WaveformDecoder.FIRST_POINT_OFFSET, first_point, sparsing)
+    struct.pack_into('<I', desc, WaveformDecoder.SUBARRAY_COUNT_OFFSET, len(trigger_times))
+    struct.pack_into('<ff', desc, WaveformDecoder.VERTICAL_GAIN_OFFSET, gain, offset)
+    struct.pack_into('<f', desc, WaveformDecoder.HORIZ_INTERVAL_OFFSET, interval)
+    struct.pack_into('<d', desc, WaveformDecoder.HORIZ_OFFSET_OFFSET, t0)
+    return prefix + bytes(desc) + trigtime + data + suffix
@@ -0,0 +1,50 @@
+import numpy as np
+
+from _records import wavedesc_record
+from host_gui.services.analysis_executor import AnalysisExecutor, _run_shared, _share
+from host_gui.utils.waveform_analysis import analyze_waveform_steady_state
+
+
+def _record(points=200_000, interval=1e-6):
+    """WAVEDESC record of a 0 -> 100 count step with noise (8-bit samples)."""
+    rng = np.random.default_rng(0)
+    samples = np.where(np.arange(points) < points // 5, 0, 100) + rng.integers(-3, 4, points)
+    return bytearray(wavedesc_record(samples, interval=interval))
+
+
+def test_shared_arguments_round_trip_in_place():
+    record = _record()
+    block, ref = _share(record)
+    try:
+        assert ref.nbytes == len(record) and ref.dtype is None
+        expected = analyze_waveform_steady_state(record, decimate=True)
+        assert _run_shared(analyze_waveform_steady_state, (ref,), {'decimate': True}) == expected
+        assert abs(expected['avg'] - 4.0) < 0.01  # 100 counts * 1 V/div / 25
+        array = np.arange(50_000, dtype=np.float32)
+        array_block, array_ref = _share(array)
+        assert _run_shared(np.sum, (array_ref,), {'dtype': np.float64}) == array.sum(dtype=np.float64)
+        AnalysisExecutor._release([array_block])
+        assert _share(b'small') is None
+    finally:
+        AnalysisExecutor._release([block])
+
+
+def test_executor_runs_jobs_in_worker_processes():
+    record = _record()
+    expected = analyze_waveform_steady_state(record, decimate=True)
+    executor = AnalysisExecutor(max_workers=2)
+    try:
+        futures = [executor.submit_shared(analyze_waveform_steady_state, record, decimate=True, label=f"CH{ch}")
+                   for ch in (1, 2)]
+        assert executor.uses_processes
+        assert [f.result(timeout=60) for f in futures] == [expected, expected]
+        assert executor.submit(np.mean, [1.0, 3.0]).result(timeout=60) == 2.0
+    finally:
+        executor.shutdown()
+
+    threads = AnalysisExecutor(use_processes=False)
+    try:
+        assert threads.submit_shared(analyze_waveform_steady_state, record, decimate=True).result() == expected
+        assert not threads.uses_processes
+    finally:
+        threads.shutdown()
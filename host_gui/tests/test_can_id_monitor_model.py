@@ -0,0 +1,29 @@
+from PySide6 import QtWidgets
+
+from backend.adapters.interface import Frame
+from host_gui.widgets.can_id_monitor_model import CanIdMonitorModel
+
+
+def test_can_id_model_one_row_per_id_and_mux():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    model = CanIdMonitorModel()
+    frames = []
+    for i in range(10):
+        t = i * 0.010
+        frames.append(Frame(can_id=0x200, data=bytes([i, 0, 0]), timestamp=t))
+        # IPC status (0xFA) is multiplexed on byte 1
+        frames.append(Frame(can_id=0xFA, data=bytes([1, 101, i]), timestamp=t))
+        frames.append(Frame(can_id=0xFA, data=bytes([1, 102, i]), timestamp=t))
+    model.record_frames(frames)
+    # rows only appear on refresh
+    assert model.rowCount() == 0
+    model.refresh()
+    assert model.rowCount() == 3
+    assert [model.data(model.index(r, 0)) for r in range(3)] == ['0x0FA', '0x0FA', '0x200']
+    assert [model.data(model.index(r, 1)) for r in range(3)] == ['101', '102', '']
+    assert model.data(model.index(2, 4)) == '10'
+    assert model.data(model.index(2, 2)) == '3'
+    assert model.data(model.index(2, 3)) == '09 00 00'
+    assert abs(float(model.data(model.index(2, 5))) - 10.0) < 0.01
+    model.clear()
+    assert model.rowCount() == 0
@@ -0,0 +1,114 @@
+import time
+from types import SimpleNamespace
+
+from backend.adapters.interface import Frame
+from host_gui.services import can_trace_logger
+from host_gui.services.can_trace_logger import CanTraceLogger
+
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_triggered_mode_without_trigger_writes_nothing(tmp_path):
+    tl = CanTraceLogger(log_dir=str(tmp_path))
+    tl.set_capture_mode('triggered', pre_trigger_s=1.0, post_trigger_s=0.0)
+    tl.start_logging(dut_uid='DUT1')
+    for i in range(100):
+        tl.log_frame(Frame(can_id=0x100, data=bytes([i])))
+    assert tl.stop_logging() is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_triggered_mode_persists_window_around_trigger(tmp_path):
+    tl = CanTraceLogger(log_dir=str(tmp_path))
+    tl.set_capture_mode('triggered', pre_trigger_s=0.5, post_trigger_s=0.0)
+    tl.start_logging(dut_uid='DUT2', test_name='seq')
+    # old frame falls outside the pre-trigger window
+    tl._ring.append((Frame(can_id=0x1, data=b'\x01'), 'RX', time.time() - 10.0))
+    tl.log_frame(Frame(can_id=0x2, data=b'\x02'))
+    tl.log_frame(Frame(can_id=0x3, data=b'\x03'), direction='TX')
+    assert tl.trigger('Test failed: X')
+    path = tl.stop_logging()
+    assert path is not None
+    text = _read(path)
+    assert 'Test failed: X' in text
+    assert '0x002 RX 02' in text
+    assert '0x003 TX 03' in text
+    assert '0x001' not in text
+    assert '# Triggers: 1' in text
+
+
+class _FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+def _log_at_rate(tl, clock, frame, rate, start, duration):
+    for i in range(int(rate * duration)):
+        clock.now = start + i / rate
+        tl.log_frame(frame)
+
+
+def test_triggered_mode_keeps_full_window_above_legacy_frame_cap(tmp_path, monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(can_trace_logger, 'time', SimpleNamespace(time=clock.time))
+    tl = CanTraceLogger(log_dir=str(tmp_path))
+    tl.set_capture_mode('triggered', pre_trigger_s=5.0, post_trigger_s=2.0)
+    tl.start_logging(dut_uid='DUT4')
+    frame = Frame(can_id=0x123, data=b'\x00')
+    rate = 25000  # 175k frames in the 7 s window (the old ring kept 100k)
+    _log_at_rate(tl, clock, frame, rate, 1000.0, 8.0)
+    assert len(tl._ring) <= 5.0 * rate + 1  # pruned to the pre-trigger history
+    assert tl.trigger('Test failed: high rate', timestamp=1008.0)
+    _log_at_rate(tl, clock, frame, rate, 1008.0, 2.0)
+    path = tl.stop_logging()
+    text = _read(path)
+    times = [1000.0 + i / rate for i in range(8 * rate)] + [1008.0 + i / rate for i in range(2 * rate)]
+    expected = sum(1003.0 < t <= 1010.0 for t in times)
+    assert expected > 100000
+    assert f'# End of trigger window ({expected} frames)' in text
+    assert '# Frames Dropped: 0' in text
+
+
+def test_triggered_mode_counts_frames_evicted_by_memory_cap(tmp_path, monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(can_trace_logger, 'time', SimpleNamespace(time=clock.time))
+    monkeypatch.setattr(can_trace_logger, 'CAN_TRACE_MAX_FRAME_RATE', 1000)
+    tl = CanTraceLogger(log_dir=str(tmp_path))
+    tl.set_capture_mode('triggered', pre_trigger_s=1.0, post_trigger_s=0.0)
+    tl.start_logging(dut_uid='DUT5')
+    cap = tl._ring_max_frames
+    assert cap == 3000  # (pre + post + flush interval) * max rate
+    _log_at_rate(tl, clock, Frame(can_id=0x124, data=b'\x00'), 5000, 1000.0, 1.0)
+    assert len(tl._ring) == cap
+    assert tl.trigger('Test failed: cap', timestamp=1001.0)
+    text = _read(tl.stop_logging())
+    assert f'# End of trigger window ({cap} frames)' in text
+    assert f'# Frames Dropped: {5000 - cap}' in text
+
+
+def test_signal_threshold_trigger_fires_on_crossing(tmp_path):
+    tl = CanTraceLogger(log_dir=str(tmp_path))
+    tl.set_capture_mode('triggered', pre_trigger_s=1.0, post_trigger_s=0.0)
+    tl.add_signal_trigger(0xFA, 'DC_Bus_V', 400.0, edge='rising')
+    tl.start_logging()
+    assert not tl.check_signal(0xFA, 'DC_Bus_V', 390.0)
+    assert not tl.check_signal(0xFA, 'DC_Bus_V', 395.0)
+    assert tl.check_signal(0xFA, 'DC_Bus_V', 405.0)
+    assert not tl.check_signal(0xFA, 'DC_Bus_V', 410.0)
+    assert tl.get_trigger_count() == 1
+    tl.stop_logging()
+
+
+def test_continuous_mode_ignores_trigger(tmp_path):
+    tl = CanTraceLogger(log_dir=str(tmp_path))
+    tl.start_logging(dut_uid='DUT3')
+    tl.log_frame(Frame(can_id=0x10, data=b'\xAA'))
+    assert not tl.trigger('manual')
+    path = tl.stop_logging()
+    assert '0x010 RX AA' in _read(path)
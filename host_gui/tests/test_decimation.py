@@ -0,0 +1,31 @@
+import numpy as np
+
+from host_gui.utils.decimation import decimate_for_display, lttb_indices, minmax_indices
+
+
+def test_minmax_keeps_peaks_and_endpoints():
+    y = np.sin(np.linspace(0, 20, 100000))
+    y[31337] = 5.0
+    y[70001] = -7.0
+    idx = minmax_indices(y, 1000)
+    assert len(idx) <= 1000
+    assert idx[0] == 0 and idx[-1] == len(y) - 1
+    assert np.all(np.diff(idx) > 0)
+    assert 31337 in idx and 70001 in idx
+
+
+def test_lttb_returns_requested_number_of_points():
+    x = np.arange(50000, dtype=float)
+    y = np.random.default_rng(0).normal(size=50000)
+    y[12345] = 100.0
+    idx = lttb_indices(x, y, 500)
+    assert len(idx) == 500
+    assert np.all(np.diff(idx) > 0)
+    assert 12345 in idx
+
+
+def test_decimate_for_display_passes_small_series_through():
+    xs, ys = [1.0, 2.0], [3.0, 4.0]
+    assert decimate_for_display(xs, ys) == (xs, ys)
+    dx, dy = decimate_for_display(list(range(10000)), [float(i % 7) for i in range(10000)], max_points=100)
+    assert isinstance(dx, list) and len(dx) == len(dy) <= 100
@@ -0,0 +1,27 @@
+from PySide6 import QtCore, QtWidgets
+
+from backend.adapters.interface import Frame
+from host_gui.widgets.frame_table_model import FrameTableModel
+
+
+def _frames(start, n):
+    return [Frame(can_id=start + i, data=bytes([i & 0xFF]), timestamp=float(start + i)) for i in range(n)]
+
+
+def test_frame_model_ring_buffer_keeps_latest_rows():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    model = FrameTableModel(capacity=5)
+    model.append_frames(_frames(0, 3))
+    assert model.rowCount() == 3
+    model.append_frames(_frames(3, 4))
+    assert model.rowCount() == 5
+    # oldest two frames dropped, rows stay in arrival order
+    assert [f.can_id for f in model.recent_frames(5)] == [2, 3, 4, 5, 6]
+    assert model.data(model.index(0, 1)) == '2'
+    assert model.data(model.index(4, 3)) == '03'
+    # a batch larger than capacity keeps only its tail
+    model.append_frames(_frames(100, 12))
+    assert [f.can_id for f in model.recent_frames(3)] == [109, 110, 111]
+    assert model.headerData(3, QtCore.Qt.Horizontal) == 'data'
+    model.clear()
+    assert model.rowCount() == 0
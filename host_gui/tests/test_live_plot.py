@@ -0,0 +1,42 @@
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from host_gui.widgets.live_plot import LivePlot
+
+
+def _canvas():
+    fig = Figure(figsize=(4, 3))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.axline((0, 0), slope=1, color='gray', linestyle='--')
+    line, = ax.plot([], [], 'bo')
+    return canvas, ax, line
+
+
+def test_live_plot_blits_new_points_and_rescales_with_headroom():
+    canvas, ax, line = _canvas()
+    live = LivePlot(canvas, [line])
+    xs, ys = [], []
+    for i in range(1, 41):
+        xs.append(float(i))
+        ys.append(float(i))
+        line.set_data(xs, ys)
+        live.update()
+    # view grows geometrically, so full redraws are O(log n); the rest are blits
+    assert live.full_draws <= 12
+    assert live.blits + live.full_draws == 40
+    x0, x1 = ax.get_xlim()
+    assert x0 < 1.0 and x1 >= 40.0
+    # no new points -> nothing to draw
+    blits = live.blits
+    live.update()
+    assert live.blits == blits
+
+
+def test_live_plot_close_restores_normal_drawing():
+    canvas, ax, line = _canvas()
+    live = LivePlot(canvas, [line])
+    assert line.get_animated()
+    assert live.tracks([line])
+    live.close()
+    assert not line.get_animated()
@@ -0,0 +1,39 @@
+from PySide6 import QtWidgets
+
+from host_gui.models.signal_value import SignalValue
+from host_gui.widgets.monitor_subscriptions import MonitorSubscriptions, make_signal_handle
+
+
+def _sv(msg_id, name, value):
+    return SignalValue(signal_name=name, value=value, message_id=msg_id, timestamp=1.0)
+
+
+def test_monitor_subscriptions_push_only_changed_values_in_one_batch():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    subs = MonitorSubscriptions()
+    batches = []
+    subs.values_changed.connect(batches.append)
+
+    assert subs.subscribe('dut_dc_bus_voltage', 0xFA, 'DC_Bus_V')
+    assert subs.subscribe('fan_tach_signal', '0x10', 'Fan_Tach')
+    assert not subs.subscribe('bad', 'not-an-id', 'X')
+
+    subs.offer([_sv(0xFA, 'DC_Bus_V', 400.0), _sv(0xFA, 'Other', 1), _sv(0x10, 'Fan_Tach', 1200)])
+    subs.offer([_sv(0xFA, 'DC_Bus_V', 401.0)])
+    assert subs.flush() == 2
+    assert batches == [{'dut_dc_bus_voltage': 401.0, 'fan_tach_signal': 1200}]
+
+    # unchanged values and unsubscribed signals produce no batch
+    subs.offer([_sv(0xFA, 'DC_Bus_V', 401.0), _sv(0x20, 'Idle', 5)])
+    assert subs.flush() == 0
+    assert len(batches) == 1
+
+    subs.clear()
+    assert not subs.has_subscriptions()
+    subs.offer([_sv(0xFA, 'DC_Bus_V', 402.0)])
+    assert subs.flush() == 0
+
+
+def test_make_signal_handle_matches_signal_value_key():
+    assert make_signal_handle('250', 'DC_Bus_V') == _sv(250, 'DC_Bus_V', 0).key
+    assert make_signal_handle(None, 'DC_Bus_V') is None
@@ -0,0 +1,81 @@
+import threading
+import time
+
+from host_gui.services.oscilloscope_service import OscilloscopeService
+
+
+class FakeInstrument:
+    def __init__(self, rm, name):
+        self.rm = rm
+        self.name = name
+        self.timeout = None
+
+    def query(self, command):
+        delay, idn = self.rm.devices[self.name]
+        self.rm.record(self.name)
+        time.sleep(delay)
+        if idn is None:
+            raise TimeoutError('VI_ERROR_TMO')
+        return idn + '\n'
+
+    def close(self):
+        pass
+
+
+class FakeResourceManager:
+    def __init__(self, devices):
+        self.devices = devices  # resource -> (delay, idn or None)
+        self.queries = []
+        self._lock = threading.Lock()
+
+    def record(self, name):
+        with self._lock:
+            self.queries.append(name)
+
+    def list_resources(self):
+        return tuple(self.devices)
+
+    def open_resource(self, name, open_timeout=None):
+        return FakeInstrument(self, name)
+
+
+def _service(devices, cache_path=None):
+    service = OscilloscopeService(cache_path=cache_path)
+    service.resource_manager = FakeResourceManager(devices)
+    return service
+
+
+def test_scan_probes_in_parallel_and_caches_identities(tmp_path):
+    devices = {
+        'USB0::62700::4119::SDS1::0::INSTR': (0.3, 'Siglent Technologies,SDS1104X-U,SDS1,1.0'),
+        'TCPIP::10.0.0.5::INSTR': (0.3, None),  # unreachable: probe fails but is still listed
+        'TCPIP::10.0.0.7::INSTR': (0.3, 'Siglent Technologies,SDS2104X,SDS2,1.0'),
+    }
+    cache = tmp_path / 'scopes.json'
+    service = _service(devices, str(cache))
+    start = time.perf_counter()
+    found = service.scan_for_devices()
+    assert time.perf_counter() - start < 0.8  # serial probing would take ~0.9 s
+    assert found == ['TCPIP::10.0.0.5::INSTR', 'TCPIP::10.0.0.7::INSTR', 'USB0::62700::4119::SDS1::0::INSTR']
+    assert service.identify('TCPIP::10.0.0.7::INSTR').startswith('Siglent')
+
+    # Fresh identities are reused; only the failed probe is repeated
+    service.resource_manager.queries.clear()
+    service.scan_for_devices()
+    assert service.resource_manager.queries == ['TCPIP::10.0.0.5::INSTR']
+
+    # Known-good resources are available immediately in the next session
+    next_session = OscilloscopeService(cache_path=str(cache))
+    assert [r for r, _ in next_session.known_resources()] == [
+        'TCPIP::10.0.0.7::INSTR', 'USB0::62700::4119::SDS1::0::INSTR']
+
+
+def test_identity_cache_expires_and_scan_async_joins_running_scan():
+    devices = {'USB0::1::2::S::0::INSTR': (0.05, 'Vendor,Model,S,1')}
+    service = _service(devices)
+    first = service.scan_async()
+    assert service.scan_async() is first
+    assert first.result(5) == ['USB0::1::2::S::0::INSTR']
+    assert service.cached_identity('USB0::1::2::S::0::INSTR', max_age=60) == 'Vendor,Model,S,1'
+    assert service.cached_identity('USB0::1::2::S::0::INSTR', max_age=-1) is None
+    service.cleanup()
@@ -0,0 +1,135 @@
+import struct
+from collections import deque
+from concurrent.futures import Future
+
+from host_gui.constants import OSC_SIMULATOR_RESOURCE
+from host_gui.services import phase_current_service
+from host_gui.services.oscilloscope_service import OscilloscopeService
+from host_gui.services.phase_current_service import PhaseCurrentTestStateMachine
+
+
+def _step(iq_ref, can=(1.0, 2.0)):
+    futures = {1: Future(), 2: Future()}
+    return {'iq_ref': iq_ref, 'futures': futures, 'can': can}
+
+
+def _finish(step, ch1, ch2):
+    step['futures'][1].set_result({'avg': ch1, 'std': 0.0})
+    step['futures'][2].set_result(None if ch2 is None else {'avg': ch2, 'std': 0.0})
+
+
+def test_pipelined_steps_are_recorded_in_order():
+    machine = PhaseCurrentTestStateMachine(None, {'actuation': {}})
+    first, second = _step(5.0), _step(10.0, can=(None, None))
+    pending = deque([first, second])
+
+    # The later step finishing first is held back until the earlier one is done
+    _finish(second, 0.4, None)
+    machine._record_completed_steps(pending)
+    assert machine.results == [] and len(pending) == 2
+
+    _finish(first, 0.2, 0.3)
+    machine._record_completed_steps(pending)
+    assert not pending
+    assert [r['iq_ref'] for r in machine.results] == [5.0, 10.0]
+    assert machine.results[0]['osc_ch1_avg'] == 0.2 and machine.results[0]['can_w_avg'] == 2.0
+    assert machine.results[1]['osc_ch2_avg'] is None
+    assert machine.plot_osc_v_avg == [0.2, 0.4] and machine.plot_can_v_avg[1] != machine.plot_can_v_avg[1]
+
+    # At the end of the test the remaining steps are waited for
+    last = _step(15.0)
+    last['futures'][2] = None
+    pending.append(last)
+    last['futures'][1].set_result({'avg': 0.6, 'std': 0.0})
+    machine._record_completed_steps(pending, block=True)
+    assert [r['iq_ref'] for r in machine.results] == [5.0, 10.0, 15.0]
+
+
+class _FakeDbc:
+    """Encodes the test command as (enable, Iq_ref)."""
+
+    def is_loaded(self):
+        return True
+
+    def find_message_by_id(self, can_id):
+        return {'frame_id': can_id}
+
+    def encode_message(self, message, values):
+        return struct.pack('<Bf', values['Mctrl_Phase_I_Test_Enable'], values['Mctrl_Set_Iq_Ref'])
+
+
+class _FakeDut:
+    """CAN service of a DUT whose phase currents trigger the simulated scope."""
+
+    def __init__(self, scope, lost=()):
+        self.scope = scope
+        self.lost = set(lost)  # Iq_ref steps whose current never reaches the scope
+        self.sent = []
+
+    def is_connected(self):
+        return True
+
+    def send_frame(self, frame):
+        enable, iq_ref = struct.unpack('<Bf', frame.data)
+        self.sent.append((enable, iq_ref))
+        if enable and iq_ref not in self.lost:
+            self.scope.set_signal(1, level=iq_ref, noise=0.02, step_at=0.2)
+            self.scope.set_signal(2, level=-iq_ref, noise=0.02, step_at=0.2)
+            assert self.scope.trigger()
+        return True
+
+
+def _sequence_machine(tmp_path, lost=()):
+    service = OscilloscopeService(cache_path=str(tmp_path / 'resources.json'))
+    assert service.connect(OSC_SIMULATOR_RESOURCE)
+    scope = service.session.instrument
+    scope.points, scope.auto_trigger = 2_000, False
+    machine = PhaseCurrentTestStateMachine(None, {'actuation': {
+        'min_iq': 2.0, 'max_iq': 4.0, 'step_iq': 2.0, 'ipc_test_duration_ms': 0, 'osc_sequence_mode': True}})
+    machine.oscilloscope_service = service
+    machine.can_service = _FakeDut(scope, lost)
+    machine.dbc_service = _FakeDbc()
+    machine.analysis_executor = None
+    assert machine._prepare_iq_ref_array() and machine.iq_ref_array == [2.0, 4.0, -2.0, -4.0]
+    return machine, scope
+
+
+def _units(scope):
+    return [unit.strip() for message in scope.writes for unit in message.split(';')]
+
+
+def test_sequence_mode_captures_every_step_as_a_segment(tmp_path):
+    machine, scope = _sequence_machine(tmp_path)
+    assert machine._run_sequence()
+
+    # Armed once, one trigger and one disable per step, no forced stop
+    units = _units(scope)
+    assert units.index('SEQ ON,4') < units.index('TRMD SINGLE')
+    assert machine.can_service.sent == [(1, 2.0), (0, 0.0), (1, 4.0), (0, 0.0),
+                                        (1, -2.0), (0, 0.0), (1, -4.0), (0, 0.0)]
+    assert [frame.channels[1].level for frame in scope.frames] == [2.0, 4.0, -2.0, -4.0]
+    assert 'STOP' not in units
+    assert 'SEQ OFF' in units[units.index('TRMD SINGLE'):]
+    assert scope.sequence_segments == 0
+
+    assert [r['iq_ref'] for r in machine.results] == [2.0, 4.0, -2.0, -4.0]
+    for result in machine.results:
+        assert abs(result['osc_ch1_avg'] - result['iq_ref']) < 0.05
+        assert abs(result['osc_ch2_avg'] + result['iq_ref']) < 0.05
+
+
+def test_sequence_mode_discards_scope_results_when_a_segment_is_missing(tmp_path, monkeypatch):
+    monkeypatch.setattr(phase_current_service, 'OSC_SEQUENCE_TIMEOUT_S', 0.2)
+    machine, scope = _sequence_machine(tmp_path, lost={4.0})
+    assert machine._run_sequence()
+
+    # The acquisition waits for a fourth trigger until the timeout, then is stopped
+    units = _units(scope)
+    assert 'STOP' in units[units.index('TRMD SINGLE'):]
+    assert len(scope.frames) == 3
+    assert 'SEQ OFF' in units[units.index('STOP'):]
+    assert scope.sequence_segments == 0
+
+    # Three segments cannot be matched to four Iq_ref steps
+    assert [r['iq_ref'] for r in machine.results] == [2.0, 4.0, -2.0, -4.0]
+    assert all(r['osc_ch1_avg'] is None and r['osc_ch2_avg'] is None for r in machine.results)
@@ -0,0 +1,34 @@
+import threading
+
+from host_gui.utils.plot_stream import PlotDataStream, PLOT_CLEAR, PLOT_POINT
+
+
+def test_plot_stream_keeps_order_of_points_and_clears():
+    stream = PlotDataStream()
+    stream.push(1.0, 10.0, 'sweep')
+    stream.push_clear()
+    stream.push(2.0, 20.0)
+    assert len(stream) == 3
+    items = stream.drain(max_items=2)
+    assert [i[0] for i in items] == [PLOT_POINT, PLOT_CLEAR]
+    assert items[0] == (PLOT_POINT, 1.0, 10.0, 'sweep')
+    assert stream.drain() == [(PLOT_POINT, 2.0, 20.0, '')]
+    assert stream.drain() == []
+    assert stream.pushed_count == 2
+
+
+def test_plot_stream_producer_thread_never_waits_for_consumer():
+    stream = PlotDataStream()
+
+    def produce():
+        for i in range(5000):
+            stream.push(float(i), float(i))
+
+    t = threading.Thread(target=produce)
+    t.start()
+    received = []
+    while t.is_alive() or len(stream):
+        received.extend(x for _, x, _, _ in stream.drain())
+    t.join()
+    received.extend(x for _, x, _, _ in stream.drain())
+    assert received == [float(i) for i in range(5000)]
@@ -0,0 +1,113 @@
+import time
+
+import pytest
+
+from host_gui.constants import OSC_SIMULATOR_RESOURCE
+from host_gui.services.oscilloscope_service import OscilloscopeService
+from host_gui.services.scope_session import ScopeSession
+
+
+class FlakyScope:
+    """Instrument that stops answering when ``dead`` is set."""
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.timeout = None
+        self.dead = False
+        self.cleared = 0
+        self.closed = False
+
+    def _check(self):
+        if self.dead or self.registry['unplugged']:
+            raise IOError("VI_ERROR_TMO")
+
+    def write(self, message):
+        self._check()
+
+    def query(self, message):
+        self._check()
+        return '1' if message == '*OPC?' else 'C1:VDIV 1.00E+00V'
+
+    def clear(self):
+        self.cleared += 1
+        self._check()
+
+    def close(self):
+        self.closed = True
+
+
+def _opener(registry):
+    def open_resource():
+        if registry['unplugged']:
+            raise IOError("VI_ERROR_RSRC_NFOUND")
+        registry['opened'].append(FlakyScope(registry))
+        return registry['opened'][-1]
+    return open_resource
+
+
+def test_session_recovers_with_device_clear_then_reopen():
+    registry = {'unplugged': False, 'opened': []}
+    reconnected = []
+    session = ScopeSession(_opener(registry), 'TCPIP::scope::INSTR', 3000, keepalive_s=0,
+                           backoff_s=0.05, on_reconnect=lambda: reconnected.append(True)).open()
+    first = registry['opened'][0]
+    assert first.timeout == 3000
+
+    # A single timeout: the device clear is enough, no reopen
+    first.dead = True
+    with pytest.raises(IOError):
+        session.query('C1:VDIV?')
+    first.dead = False
+    assert not session.healthy
+    assert session.query('C1:VDIV?') == 'C1:VDIV 1.00E+00V'
+    assert first.cleared == 1 and len(registry['opened']) == 1 and not reconnected
+
+    # Connection lost: reopen fails and is retried with backoff, calls fail fast meanwhile
+    registry['unplugged'] = True
+    with pytest.raises(IOError):
+        session.write('TRMD AUTO')
+    start = time.monotonic()
+    with pytest.raises(IOError, match='down'):
+        session.write('TRMD AUTO')
+    with pytest.raises(IOError, match='down'):
+        session.write('TRMD AUTO')
+    assert time.monotonic() - start < 0.5 and first.closed
+    assert session._backoff == 0.1
+
+    registry['unplugged'] = False
+    time.sleep(0.06)
+    session.write('TRMD AUTO')
+    assert session.healthy and session.reconnects == 1 and reconnected == [True]
+    assert session.instrument is registry['opened'][-1] and session.instrument.timeout == 3000
+
+    with session.transfer(timeout_ms=10000) as instrument:
+        assert instrument.instrument.timeout == 10000
+    assert session.instrument.timeout == 3000
+    session.close()
+
+
+def test_keepalive_reconnects_idle_session():
+    registry = {'unplugged': False, 'opened': []}
+    session = ScopeSession(_opener(registry), 'USB::scope::INSTR', 2000, keepalive_s=0.05,
+                           backoff_s=0.05).open()
+    try:
+        registry['opened'][0].dead = True
+        deadline = time.monotonic() + 5.0
+        while session.reconnects == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert session.reconnects == 1 and session.healthy and session.failures == 1
+        assert len(registry['opened']) == 2
+    finally:
+        session.close()
+    assert registry['opened'][-1].closed
+
+
+def test_connect_reuses_healthy_session(tmp_path):
+    service = OscilloscopeService(cache_path=str(tmp_path / 'resources.json'))
+    assert service.connect(OSC_SIMULATOR_RESOURCE)
+    session = service.session
+    service.send_command("C1:VDIV?")
+    assert service.connect(OSC_SIMULATOR_RESOURCE)
+    assert service.session is session and service.state_cache.lookup("C1:VDIV?") is not None
+    service.disconnect()
+    assert service.session is None and session.instrument is None
@@ -0,0 +1,158 @@
+import json
+import socket
+import threading
+import time
+from pathlib import Path
+
+from host_gui.constants import OSC_SIMULATOR_RESOURCE
+from host_gui.services.oscilloscope_service import OscilloscopeService
+from host_gui.services.scope_simulator import ScopeSimulatorServer, SimulatedScope
+from host_gui.services.scope_transfer import parse_block_header
+from host_gui.utils.waveform_decoder import WaveformDecoder
+
+
+def _service(tmp_path):
+    service = OscilloscopeService(cache_path=str(tmp_path / 'resources.json'))
+    assert service.connect(OSC_SIMULATOR_RESOURCE)
+    assert 'SDS1104X-U' in service.get_device_info()
+    return service
+
+
+def test_simulator_serves_settings_measurements_and_waveforms(tmp_path):
+    service = _service(tmp_path)
+    scope = service.session.instrument
+    scope.points = 10_000
+    scope.set_signal(1, level=2.0, noise=0.02, step_at=0.2)
+    scope.channels[1].attn = 10.0  # probe setting made on the scope
+
+    ok, errors = service.apply_configuration({
+        'channels': {'CH1': {'enabled': True, 'probe_attenuation': 10.0, 'unit': 'V'},
+                     'CH2': {'enabled': False, 'probe_attenuation': 1.0, 'unit': 'V'}},
+        'acquisition': {'timebase_ms': 2.0},
+    })
+    assert ok, errors
+    assert not scope.channels[2].trace and scope.tdiv == 0.002
+
+    service.send_command("C1:VDIV 0.5")
+    service.send_command("TRMD AUTO")
+    service.send_command("STOP")
+    assert service.send_command("TRMD?").strip() == "TRMD STOP"
+    mean = service.query_pava_mean(1)
+    assert abs(mean - 1.6) < 0.01  # 80 % of the record at 2 V
+
+    record = service.read_waveform(1, max_points=2_500)
+    descriptor, time_axis, volts = WaveformDecoder(record).decode_arrays()
+    assert descriptor['SPARSING_FACTOR'] == 4 and len(volts) == 2_500
+    assert abs(float(volts[1_000:].mean()) - 2.0) < 0.01
+    assert abs(time_axis.interval - 4 * 0.002 * 14 / 10_000) < 1e-12
+    service.disconnect()
+    assert scope.closed
+
+
+def test_simulator_sequence_and_history_frames(tmp_path):
+    service = _service(tmp_path)
+    scope = service.session.instrument
+    scope.points, scope.auto_trigger = 1_000, False
+    assert service.configure_sequence(3)
+    service.send_command("TRMD SINGLE")
+    for level in (1.0, 2.0, 3.0):
+        scope.set_signal(1, level=level)
+        assert scope.trigger()
+    assert service.wait_for_stop(timeout_s=1.0)
+
+    records = service.read_sequence(1, 3)
+    descriptor, segments = WaveformDecoder(records[0]).decode_segments()
+    assert len(records) == 1 and len(descriptor['TRIGGER_TIMES']) == 3
+    assert [round(float(volts.mean()), 2) for _, volts in segments] == [1.0, 2.0, 3.0]
+
+    # Firmware returning one segment per record: read from the history
+    scope.sequence_in_one_record = False
+    records = service.read_sequence(1, 3)
+    assert [round(float(WaveformDecoder(r).decode_arrays()[2].mean()), 2) for r in records] == [1.0, 2.0, 3.0]
+    assert not scope.history_mode
+
+
+def test_measure_pava_waits_for_stop_and_batches_channels(tmp_path):
+    service = _service(tmp_path)
+    scope = service.session.instrument
+    scope.points, scope.auto_trigger = 1_000, False
+    scope.set_signal(1, level=0.4)
+    scope.set_signal(2, level=-0.2)
+    service.send_command("TRMD SINGLE")
+    timer = threading.Timer(0.1, scope.trigger)
+    timer.start()
+    try:
+        results = service.measure_pava([1, 2], ('MEAN', 'PKPK'), timeout_s=2.0)
+    finally:
+        timer.join()
+    assert results == {1: {'MEAN': 0.4, 'PKPK': 0.0}, 2: {'MEAN': -0.2, 'PKPK': 0.0}}
+
+    # Stopped: status and all measurements in one exchange
+    sent = len(scope.writes)
+    assert service.measure_pava([1, 2], ('MEAN', 'AMPL'), timeout_s=0.0, retries=2)[2] == {'MEAN': -0.2, 'AMPL': None}
+    assert len(scope.writes) - sent == 2  # one exchange, plus one retry of the unsupported AMPL
+    assert 'TRMD?' in scope.writes[sent] and 'C2:PAVA? MEAN' in scope.writes[sent]
+    assert service.query_pava_mean(1) == 0.4
+
+
+def test_measure_pava_repolls_values_not_ready_until_timeout(tmp_path):
+    service = _service(tmp_path)
+    scope = service.session.instrument
+    scope.points, scope.auto_trigger = 1_000, False
+    scope.measurement_delay_s = 0.3  # '****' for 300 ms after the stop
+    scope.set_signal(1, level=0.4)
+    service.send_command("TRMD SINGLE")
+    assert scope.trigger()
+
+    assert service.measure_pava([1], ('MEAN',), timeout_s=3.0) == {1: {'MEAN': 0.4}}
+    # Only available once the delay has passed: polled more often than the 3 retries
+    assert time.monotonic() - scope._stopped_at >= scope.measurement_delay_s
+    assert sum('C1:PAVA? MEAN' in message for message in scope.writes) > 3
+
+
+def test_switching_saved_configurations_writes_only_changes(tmp_path):
+    config_dir = Path(__file__).resolve().parents[2] / 'backend' / 'data' / 'oscilloscope_configs'
+    configs = [json.loads(path.read_text()) for path in sorted(config_dir.glob('oscilloscope_config*.json'))]
+    service = _service(tmp_path)
+    scope = service.session.instrument
+    scope.latency_s = 0.005
+    for channel, attn in ((1, 811.965812), (2, 811.965812), (3, 100.0), (4, 10.0)):
+        scope.channels[channel].attn = attn
+    assert service.apply_configuration(configs[0])[0]
+
+    for config in configs[1:] + configs[:1]:
+        plan = service.plan_configuration(config)
+        sent = len(scope.writes)
+        start = time.perf_counter()
+        ok, errors = service.apply_configuration(config)
+        assert time.perf_counter() - start < 1.0
+        assert ok or errors == ['Failed to configure CH3']  # config 4 expects a 133.3:1 probe on CH3
+        assert len(scope.writes) - sent == (1 if plan.writes or plan.unknown else 0)
+        assert all(command in scope.writes[-1] for command in plan.writes)
+    assert service.plan_configuration(configs[0]).writes == []
+
+    # Cold cache: the state is read once and nothing the scope already has is rewritten
+    service.invalidate_state()
+    sent = len(scope.writes)
+    assert service.apply_configuration(configs[0], read_state=True) == (True, [])
+    assert len(scope.writes) - sent == 1 and 'TRA ' not in scope.writes[-1]
+
+
+def test_simulator_socket_server_round_trip():
+    scope = SimulatedScope(points=500)
+    scope.set_signal(2, level=-1.0)
+    with ScopeSimulatorServer(scope) as server, socket.create_connection(server.address, timeout=5) as sock:
+        stream = sock.makefile('rwb')
+        stream.write(b"C2:VDIV 0.5;:C2:VDIV?;*OPC?\n")
+        stream.flush()
+        assert stream.readline() == b"C2:VDIV 5.00E-01V;1\n"
+        stream.write(b"C2:PAVA? MEAN\n")
+        stream.flush()
+        assert stream.readline() == b"C2:PAVA MEAN,-1.000000E+00V\n"
+        stream.write(b"C2:WF? ALL\n")
+        stream.flush()
+        head = stream.read(21)
+        start, length = parse_block_header(head)
+        record = stream.read(length)
+        assert stream.read(1) == b'\n'
+        assert WaveformDecoder(record).decode_arrays()[2].min() == -1.0
@@ -0,0 +1,99 @@
+from _records import wavedesc_record
+from host_gui.services.oscilloscope_service import OscilloscopeService
+from host_gui.services.scope_transfer import read_block, waveform_setup_command
+from host_gui.utils.waveform_decoder import WaveformDecoder
+
+
+class FakeScope:
+    """Serves C{n}:WF? ALL as 'C1:WF ALL,#9<len><record>\\n', honouring WFSU sparsing."""
+
+    def __init__(self, points=10000, block=True):
+        self.samples = [(i % 200) - 100 for i in range(points)]
+        self.settings = {'WFSU': 'SP,0,NP,0,FP,0'}
+        self.block = block
+        self.pending = b''
+        self.transfers = []
+        self.reads = []
+
+    def _execute(self, unit):
+        if unit == '*OPC?':
+            return '1'
+        if unit == 'SANU? C1':
+            return f"SANU {len(self.samples):.2E}pts"
+        if unit.endswith('?'):
+            header = unit.rstrip('?')
+            return f"{header} {self.settings[header]}"
+        header, value = unit.split(None, 1)
+        self.settings[header] = value
+        return None
+
+    def write(self, message):
+        self.transfers.append(message)
+        if message.endswith('WF? ALL'):
+            fields = self.settings['WFSU'].split(',')
+            sparsing, first = max(int(fields[1]), 1), int(fields[5])
+            record = wavedesc_record(self.samples[first::sparsing], first_point=first, sparsing=sparsing)
+            self.pending = (b'C1:WF ALL,#9%09d' % len(record) + record if self.block else record) + b'\n'
+            return
+        for unit in message.split(';'):
+            self._execute(unit)
+
+    def query(self, message):
+        self.transfers.append(message)
+        responses = [r for r in (self._execute(unit) for unit in message.split(';')) if r is not None]
+        return ';'.join(responses) + '\n'
+
+    def read_raw(self, size=None):
+        size = len(self.pending) if size is None else size
+        data, self.pending = self.pending[:size], self.pending[size:]
+        self.reads.append(len(data))
+        return data
+
+
+def test_read_block_fills_preallocated_buffer_in_bounded_chunks():
+    for block in (True, False):  # '#9' block with response header, or direct binary
+        scope = FakeScope(points=5000, block=block)
+        payload, stats = read_block(scope, 'C1:WF? ALL', chunk_size=1000)
+        assert isinstance(payload, bytearray)
+        assert bytes(payload) == wavedesc_record(scope.samples, sparsing=1)
+        assert stats.payload_bytes == len(payload) and stats.reads == len(scope.reads)
+        assert max(scope.reads) <= 1000 and stats.reads == 7
+        _, _, volts = WaveformDecoder(payload).decode()
+        assert [round(v * 25.0) for v in volts[:3]] == [-100, -99, -98]
+
+
+def test_read_waveform_transfers_only_needed_points():
+    scope = FakeScope(points=10000)
+    service = OscilloscopeService()
+    service.oscilloscope = scope
+
+    record = service.read_waveform(1, max_points=2500)
+    assert scope.settings['WFSU'] == 'SP,4,NP,0,FP,0'
+    descriptor, times, volts = WaveformDecoder(record).decode()
+    assert len(volts) == 2500 and abs(times[1] - times[0] - 4e-6) < 1e-12
+    assert service.last_transfer_stats.payload_bytes == len(record)
+
+    # An unchanged waveform setup costs no transfer (state cache)
+    transfers = len(scope.transfers)
+    service.read_waveform(1, max_points=2500)
+    assert len(scope.transfers) == transfers + 2  # SANU? and WF?
+
+    # Full records reset the setup
+    record = service.read_waveform(1)
+    assert waveform_setup_command() == 'WFSU SP,1,NP,0,FP,0' and scope.settings['WFSU'] == 'SP,1,NP,0,FP,0'
+    assert len(WaveformDecoder(record).decode()[2]) == 10000
+
+
+def test_read_sequence_falls_back_to_history_frames():
+    scope = FakeScope(points=2000)
+    scope.settings['TRMD'] = 'STOP'
+    service = OscilloscopeService()
+    service.oscilloscope = scope
+
+    assert service.configure_sequence(3) and scope.settings['SEQ'] == 'ON,3'
+    assert service.wait_for_stop(timeout_s=0.1)
+    # Each record holds a single segment: the three frames are read from the history
+    records = service.read_sequence(1, 3)
+    assert len(records) == 3 and all(WaveformDecoder(r).segment_count() == 1 for r in records)
+    assert scope.settings['FRAM'] == '3' and scope.settings['HSMD'] == 'OFF'
+    assert service.configure_sequence(0) and scope.settings['SEQ'] == 'OFF'
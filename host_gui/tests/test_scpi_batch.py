@@ -0,0 +1,118 @@
+from host_gui.services.oscilloscope_service import OscilloscopeService
+from host_gui.services.scpi_batch import ScpiBatch
+
+
+class FakeScope:
+    """Executes ';'-joined program messages against a dict of settings."""
+
+    def __init__(self, split_responses=True):
+        self.settings = {'C1:TRA': 'OFF', 'C2:TRA': 'OFF', 'C1:ATTN': '10', 'C2:ATTN': '10', 'TDIV': '1.00E-03',
+                         'C1:VDIV': '1.00E+00V', 'C1:OFST': '0.00E+00V'}
+        self.transfers = []
+        self.split_responses = split_responses
+
+    def _execute(self, unit):
+        unit = unit.lstrip(':')
+        if unit == '*OPC?':
+            return '1'
+        if '?' in unit:
+            header = unit.rstrip('?')
+            return f"{header} {self.settings[header]}"
+        if unit == '*RST':
+            self.settings.update({'C1:VDIV': '1.00E+00V', 'C1:OFST': '0.00E+00V'})
+            return None
+        header, value = unit.split(None, 1)
+        if header.endswith('VDIV'):
+            value = f"{round(float(value), 1):.2E}V"  # the scope rounds to its fine steps
+        self.settings[header] = value
+        return None
+
+    def write(self, message):
+        self.transfers.append(message)
+        for unit in message.split(';'):
+            self._execute(unit)
+
+    def query(self, message):
+        self.transfers.append(message)
+        responses = [r for r in (self._execute(unit) for unit in message.split(';')) if r is not None]
+        if not self.split_responses and len(responses) > 1:
+            return ' '.join(responses) + '\n'  # not splittable on ';'
+        return ';'.join(responses) + '\n'
+
+
+def _service(scope):
+    service = OscilloscopeService()
+    service.oscilloscope = scope
+    return service
+
+
+def test_apply_configuration_uses_one_round_trip():
+    scope = FakeScope()
+    service = _service(scope)
+    config = {
+        'channels': {
+            'CH1': {'enabled': True, 'probe_attenuation': 10.0, 'unit': 'A'},
+            'CH2': {'enabled': False, 'probe_attenuation': 10.0, 'unit': 'V'},
+        },
+        'acquisition': {'timebase_ms': 2.0},
+    }
+    ok, errors = service.apply_configuration(config)
+    assert ok, errors
+    assert len(scope.transfers) == 1
+    assert scope.transfers[0].endswith(';*OPC?')
+    assert scope.settings['C1:TRA'] == 'ON' and scope.settings['TDIV'] == '0.002'
+    stats = service.last_batch_stats
+    assert stats.commands == 7 and stats.round_trips == 1 and stats.round_trips_saved == 6
+    assert abs(stats.replaced_delay_s - 0.4) < 1e-9  # 2 channels x 0.1 s + TDIV 0.2 s
+    assert stats.time_saved_s >= stats.replaced_delay_s
+
+    # Attenuation mismatch is still reported
+    config['channels']['CH1']['probe_attenuation'] = 1.0
+    ok, errors = service.apply_configuration(config)
+    assert not ok and errors == ['Failed to configure CH1']
+
+
+def test_batch_chunks_and_falls_back_when_responses_cannot_be_split():
+    scope = FakeScope()
+    with ScpiBatch(scope, max_bytes=20) as batch:
+        batch.write('C1:TRA ON')
+        batch.write('C2:TRA ON')
+        tra = batch.query('C2:TRA?')
+    assert len(scope.transfers) == 3
+    assert all(len(t) <= 20 for t in scope.transfers)
+    assert tra.value == 'C2:TRA ON'
+
+    scope = FakeScope(split_responses=False)
+    with ScpiBatch(scope) as batch:
+        batch.write('TDIV 5E-3')
+        tdiv = batch.query('TDIV?')
+    assert tdiv.value == 'TDIV 5E-3'
+    assert batch.stats.fallback and batch.stats.round_trips == 2
+
+
+def test_state_cache_skips_unchanged_settings_and_known_queries():
+    scope = FakeScope()
+    service = _service(scope)
+    config = {'channels': {'CH1': {'enabled': True, 'probe_attenuation': 10.0}},
+              'acquisition': {'timebase_ms': 2.0}}
+    assert service.apply_configuration(config)[0]
+    assert len(scope.transfers) == 1
+    # Re-applying an unchanged configuration is answered from the cache
+    assert service.apply_configuration(config)[0]
+    assert len(scope.transfers) == 1
+    assert service.last_batch_stats.skipped_writes == 2 and service.last_batch_stats.cache_hits == 3
+
+    # Writes are read back in the same transfer; the cache holds the applied value
+    service.send_commands(['C1:VDIV 2.04'])
+    assert len(scope.transfers) == 2
+    assert service.send_command('C1:VDIV?') == 'C1:VDIV 2.00E+00V'
+    assert service.send_command('C1:OFST?').strip() == 'C1:OFST 0.00E+00V'
+    assert service.send_command('C1:OFST?').strip() == 'C1:OFST 0.00E+00V'
+    assert len(scope.transfers) == 3
+    service.send_commands(['C1:VDIV 2.0'])  # unchanged
+    assert len(scope.transfers) == 3
+
+    # *RST invalidates everything
+    service.send_command('*RST')
+    assert service.send_command('C1:VDIV?').strip() == 'C1:VDIV 1.00E+00V'
+    assert len(scope.transfers) == 5
@@ -0,0 +1,35 @@
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / 'scripts'
+
+# Scripts that load host_gui modules by file path instead of as a package
+SCRIPTS = (
+    'configure_siglent_oscilloscope',
+    'phase_current_test_state_machine',
+    'retrieve_waveform_data',
+    'test_pava_command',
+    'verify_attenuation',
+)
+# Scripts that load OscilloscopeService in main() (see load_oscilloscope_service)
+SERVICE_LOADERS = ('test_pava_command', 'verify_attenuation')
+
+
+def test_scripts_load_oscilloscope_service_outside_the_repository(tmp_path):
+    # Run from another directory with a clean sys.path, like a user starting the script
+    code = (
+        "import importlib.util, sys\n"
+        f"for name in {SCRIPTS!r}:\n"
+        f"    spec = importlib.util.spec_from_file_location(name, {str(SCRIPTS_DIR)!r} + '/' + name + '.py')\n"
+        "    module = importlib.util.module_from_spec(spec)\n"
+        "    spec.loader.exec_module(module)\n"
+        f"    if name in {SERVICE_LOADERS!r}:\n"
+        "        assert module.load_oscilloscope_service().__name__ == 'OscilloscopeService'\n"
+        "    print(name, 'ok')\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, timeout=120,
+                            cwd=str(tmp_path))
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split().count('ok') == len(SCRIPTS)
@@ -0,0 +1,69 @@
+import logging
+import threading
+import time
+
+from host_gui.services.service_container import ServiceContainer
+
+
+def test_warm_up_runs_independent_services_concurrently_and_respects_dependencies():
+    container = ServiceContainer()
+    started = {}
+    both_running = threading.Barrier(2, timeout=5)
+
+    def slow(name):
+        def factory():
+            started[name] = time.perf_counter()
+            both_running.wait()  # Fails unless the two independent services overlap
+            return name
+        return factory
+
+    def dependent():
+        assert container.is_ready('a')
+        return 'c'
+
+    container.register('a', slow('a'), lazy=True)
+    container.register('b', slow('b'), lazy=True)
+    container.register('c', dependent, lazy=True, depends_on=['a'])
+    container.register('d', lambda: 'd', lazy=True)
+
+    futures = container.warm_up(['b', 'c'])
+    assert set(futures) == {'a', 'b', 'c'}
+    assert container.get('c', timeout=5) == 'c'
+    assert container.get('b', timeout=5) == 'b'
+    assert set(container.timings) == {'a', 'b', 'c'}
+    # Not warmed up: initialized on first get()
+    assert not container.is_ready('d')
+    assert container.get('d') == 'd'
+    container.clear()
+
+
+def test_get_returns_none_for_failed_service_and_its_dependents():
+    container = ServiceContainer()
+
+    def broken():
+        raise RuntimeError('no hardware')
+
+    container.register('scope', broken, lazy=True)
+    container.register('scan', lambda: container.get('scope').scan(), lazy=True, depends_on=['scope'])
+    notified = []
+    done = threading.Event()
+    container.warm_up()
+    container.when_ready('scan', lambda service: (notified.append(service), done.set()))
+    assert container.get('scope', timeout=5) is None
+    assert container.get('scan', timeout=5) is None
+    assert done.wait(5) and notified == [None]
+    container.clear()
+
+
+def test_get_timeout_on_running_factory_is_not_reported_as_failure(caplog):
+    container = ServiceContainer()
+    release = threading.Event()
+    container.register('slow', lambda: release.wait(5) and 'slow', lazy=True)
+    container.warm_up()
+    with caplog.at_level(logging.DEBUG, logger='host_gui.services.service_container'):
+        assert container.get('slow', timeout=0.05) is None
+    assert any('still initializing after 0.05s' in r.getMessage() for r in caplog.records)
+    assert not any(r.levelno >= logging.ERROR for r in caplog.records)
+    release.set()
+    assert container.get('slow', timeout=5) == 'slow'
+    container.clear()
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from host_gui.utils import signal_analysis
+from host_gui.utils.signal_analysis import (
+    analyze_steady_state_can, detect_steady_state_regions, robust_statistics
+)
+
+
+def _reference(values, window_size=None, threshold=5.0, skip=30.0):
+    """The original per-window implementation (np.mean/np.std of every slice)."""
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    w = window_size or max(10, min(2000, n // 100))
+    lo, hi = max(int(n * skip / 100.0), w), n - w
+    if lo >= hi:
+        lo, hi = w, n - w
+    if lo >= hi:
+        lo, hi = 0, n
+
+    def cv(m, s, ref):
+        return abs(s / m) * 100 if abs(ref) > 1e-10 else s * 100
+
+    wins = [(float(np.std(values[i:i + w])), i, float(np.mean(values[i:i + w]))) for i in range(lo, hi)]
+    ok = [x for x in wins if cv(x[2], x[0], x[2]) < threshold]
+    _, best, best_mean = min(ok or wins, key=lambda x: (x[0], x[1]))
+    start, end = best, best + w
+    for i in range(best - 1, max(0, best - w), -1):
+        if cv(np.mean(values[i:end]), np.std(values[i:end]), best_mean) < threshold * 1.5:
+            start = i
+        else:
+            break
+    for i in range(end, min(n, end + w)):
+        if cv(np.mean(values[start:i + 1]), np.std(values[start:i + 1]), best_mean) < threshold * 1.5:
+            end = i + 1
+        else:
+            break
+    return start, end, float(np.mean(values[start:end])), float(np.std(values[start:end]))
+
+
+def _signals():
+    rng = np.random.default_rng(1)
+    n = 3000
+    t = np.arange(n)
+    yield np.where(t < 900, t / 90.0, 10.0) + rng.normal(0, 0.05, n)  # ramp then plateau
+    yield np.round(np.where(t < 1500, 5.0, 8.0) + rng.normal(0, 0.2, n), 1)  # quantized steps
+    yield rng.normal(0, 1.0, n)  # zero mean: no window meets the CV threshold
+    yield np.full(n, 3.3)  # constant
+    yield 12.0 + 0.5 * np.sin(t / 40.0) + rng.normal(0, 0.01, n)
+
+
+@pytest.mark.parametrize('numpy_path', [True, False])
+def test_matches_original_implementation(monkeypatch, numpy_path):
+    if not numpy_path:
+        monkeypatch.setattr(signal_analysis, 'numpy_available', False)
+    for values in _signals():
+        data = values if numpy_path else values.tolist()
+        start, end, avg, std = analyze_steady_state_can(None, data)
+        ref = _reference(values)
+        assert (start, end) == ref[:2]
+        assert avg == pytest.approx(ref[2], abs=1e-9) and std == pytest.approx(ref[3], abs=1e-9)
+
+
+def test_one_million_points_is_fast():
+    import time
+    rng = np.random.default_rng(2)
+    values = np.concatenate((np.linspace(0, 10, 200_000), 10 + rng.normal(0, 0.05, 800_000)))
+    start = time.perf_counter()
+    result = analyze_steady_state_can(None, values)
+    assert time.perf_counter() - start < 2.0  # the per-window loop took minutes
+    assert result[2] == pytest.approx(10.0, abs=0.01)
+
+
+def test_detect_steady_state_regions_finds_plateau_between_ramps():
+    rng = np.random.default_rng(3)
+    profile = np.concatenate((np.zeros(200), np.linspace(0, 20, 300), np.full(1500, 20.0), np.linspace(20, 0, 300)))
+    timestamps = np.arange(len(profile)) * 0.01
+    phase_v = profile + rng.normal(0, 0.02, len(profile))
+    phase_w = -profile + rng.normal(0, 0.02, len(profile))
+    ramp_up_end, ramp_down_start = detect_steady_state_regions([phase_v, phase_w.tolist()], timestamps)
+    assert 500 <= ramp_up_end <= 650 and 1850 <= ramp_down_start <= 2000
+    assert robust_statistics(phase_v[ramp_up_end:ramp_down_start]).mean == pytest.approx(20.0, abs=0.1)
+    assert detect_steady_state_regions([np.zeros(5), np.zeros(5)]) == (None, None)
+
+
+@pytest.mark.parametrize('numpy_path', [True, False])
+def test_robust_statistics_ignore_spikes(monkeypatch, numpy_path):
+    if not numpy_path:
+        monkeypatch.setattr(signal_analysis, 'numpy_available', False)
+    values = [1.0, 2.0, 3.0, 4.0, 100.0]
+    stats = robust_statistics(values)
+    assert (stats.count, stats.median, stats.mad, stats.minimum, stats.maximum) == (5, 3.0, 1.0, 1.0, 100.0)
+    assert stats.mean == pytest.approx(22.0) and stats.sigma == pytest.approx(1.4826)
+    assert robust_statistics([]) is None
@@ -0,0 +1,44 @@
+import numpy as np
+from scipy import signal
+
+from host_gui.utils.signal_processing import apply_lowpass_filter, lowpass_decimate, lowpass_sos
+from host_gui.utils.waveform_decoder import TimeAxis
+
+
+def _capture(points=200_000, interval=1e-6):
+    rng = np.random.default_rng(0)
+    volts = np.where(np.arange(points) < points // 5, 0.0, 10.0) + rng.normal(0, 0.5, points)
+    return TimeAxis(0.0, interval, points), volts
+
+
+def test_sos_filter_matches_filtfilt_and_reuses_design():
+    axis, volts = _capture()
+    b, a = signal.butter(4, 10000.0 / 500000.0)
+    expected = signal.filtfilt(b, a, volts)
+
+    lowpass_sos.cache_clear()
+    filtered = apply_lowpass_filter(axis, volts, cutoff_freq=10000.0)
+    assert np.allclose(filtered, expected, atol=1e-6)
+    assert apply_lowpass_filter(list(axis[:1000]), volts[:1000].tolist(), cutoff_freq=10000.0) is not None
+    assert lowpass_sos.cache_info().misses == 1 and lowpass_sos.cache_info().hits == 1
+
+    # float32 arrays stay float32 and can be filtered in place
+    volts32 = volts.astype(np.float32)
+    result = apply_lowpass_filter(axis, volts32, cutoff_freq=10000.0, inplace=True)
+    assert result is volts32 and result.dtype == np.float32
+    assert np.max(np.abs(result - expected)) < 1e-3
+
+
+def test_lowpass_decimate_reduces_rate_and_keeps_steady_level():
+    axis, volts = _capture()
+    reduced_time, filtered = lowpass_decimate(axis, volts.astype(np.float32), cutoff_freq=10000.0)
+    # 1 MS/s with a 10 kHz cutoff: blocks of 5 samples (200 kS/s = 20x cutoff)
+    assert len(filtered) == len(reduced_time) == 40_000 and filtered.dtype == np.float32
+    assert abs(reduced_time[1] - reduced_time[0] - 5e-6) < 1e-12
+    full = apply_lowpass_filter(axis, volts, cutoff_freq=10000.0)
+    assert abs(float(np.mean(filtered[20_000:])) - float(np.mean(full[100_000:]))) < 1e-3
+
+    # No reduction possible: plain filter on the original axis
+    slow = TimeAxis(0.0, 1e-4, 1000)
+    same_time, same = lowpass_decimate(slow, volts[:1000], cutoff_freq=1000.0)
+    assert same_time is slow and len(same) == 1000
@@ -0,0 +1,32 @@
+from PySide6 import QtWidgets
+
+from host_gui.models.signal_value import SignalValue
+from host_gui.widgets.signal_table_model import SignalTableModel
+
+
+def test_signal_model_coalesces_updates_until_refresh():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    model = SignalTableModel()
+    changes = []
+    model.dataChanged.connect(lambda tl, br, roles=None: changes.append((tl.row(), br.row())))
+
+    for i in range(50):
+        model.update_signals([
+            SignalValue('Throttle1Voltage', i, 250, 'IP_Status_Data', timestamp=1.0 + i),
+            SignalValue('BrakeVoltage', 2 * i, 250, 'IP_Status_Data', timestamp=1.0 + i),
+        ])
+    # nothing is shown before the display refresh
+    assert model.rowCount() == 0
+    model.refresh()
+    assert model.rowCount() == 2
+    assert model.data(model.index(0, 4)) == '49'
+    assert model.data(model.index(1, 4)) == '98'
+    assert changes == []
+
+    for i in range(100):
+        model.update_signals([SignalValue('BrakeVoltage', i, 250, 'IP_Status_Data', timestamp=2.0)])
+    model.refresh()
+    # a single dataChanged for the whole burst
+    assert changes == [(1, 1)]
+    assert model.data(model.index(1, 4)) == '99'
+    assert model.get_row('250:BrakeVoltage') == 1
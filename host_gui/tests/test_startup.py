@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+import threading
+
+from host_gui.startup import WARM_UP_MODULES, StartupProfiler, start_warm_up
+from host_gui.utils.plot_style import PLOT_PALETTE, apply_plot_style
+
+
+def test_startup_profiler_times_imports_and_stages():
+    assert StartupProfiler.from_argv(['main.py']) is None
+    profiler = StartupProfiler.from_argv(['main.py', '--profile-startup'])
+    try:
+        sys.modules.pop('colorsys', None)
+        with profiler.stage('window'):
+            import colorsys  # noqa: F401
+    finally:
+        profiler.uninstall()
+    assert 'colorsys' in profiler.imports
+    assert [name for name, _ in profiler.stages] == ['window']
+    profiler.mark_interactive()
+    report = profiler.report()
+    assert 'time to interactive window' in report and 'colorsys' in report
+
+
+def test_start_warm_up_imports_in_background_and_skips_missing():
+    profiler = StartupProfiler()
+    done = threading.Event()
+    sys.modules.pop('this_module_does_not_exist', None)
+    sys.modules.pop('wave', None)
+    thread = start_warm_up(('this_module_does_not_exist', 'wave'), profiler=profiler, on_done=done.set)
+    thread.join(10)
+    assert done.is_set()
+    assert 'wave' in sys.modules
+    assert [name for name, _ in profiler.warm_up] == ['wave']
+
+
+def test_warm_up_modules_are_not_imported_by_startup_path():
+    # A module already imported when the main window shows makes its warm-up entry dead
+    code = ("import sys, host_gui.main, host_gui.services.oscilloscope_service; "
+            f"print([m for m in {WARM_UP_MODULES!r} if m in sys.modules])")
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, timeout=120,
+                            cwd=os.path.join(os.path.dirname(__file__), '..', '..'), env=env)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == '[]'
+
+
+def test_apply_plot_style_sets_whitegrid_palette_without_seaborn():
+    import matplotlib
+    assert apply_plot_style()
+    assert matplotlib.rcParams['axes.grid'] is True
+    assert matplotlib.rcParams['axes.prop_cycle'].by_key()['color'] == PLOT_PALETTE
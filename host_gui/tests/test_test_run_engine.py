@@ -27,8 +27,8 @@ def test_run_single_with_sim_adapter():
     gui._on_run_selected()
     # allow GUI loop to process
     time.sleep(0.2)
-    # we expect the frame_table to have at least one row (loopback)
-    assert gui.frame_table.rowCount() >= 1
+    # we expect the frame table model to have at least one row (loopback)
+    assert gui.frame_table.model().rowCount() >= 1
     # cleanup
     try:
         gui.toggle_adapter()
@@ -0,0 +1,106 @@
+import struct
+
+import numpy as np
+import pytest
+
+from _records import wavedesc_record
+from host_gui.services.scope_transfer import _wavedesc_length
+from host_gui.utils.signal_analysis import analyze_steady_state_can
+from host_gui.utils.signal_processing import apply_lowpass_filter
+from host_gui.utils.waveform_analysis import analyze_waveform_segments, analyze_waveform_steady_state
+from host_gui.utils.waveform_decoder import WAVEDESC_FIELDS, TimeAxis, WaveDescriptor, WaveformDecoder
+
+
+def _waveform(samples, comm_type=0, gain=0.5, offset=0.1, interval=1e-6, t0=-0.01, prefix=b'#9000000000'):
+    """WF? ALL response with a block header and terminator (see wavedesc_record)."""
+    return wavedesc_record(samples, comm_type=comm_type, gain=gain, offset=offset, interval=interval, t0=t0,
+                           prefix=prefix, suffix=b'\n\n')
+
+
+def test_decode_arrays_matches_list_decode_without_copying():
+    samples = [-128, -1, 0, 1, 50, 127] * 20
+    for comm_type in (0, 1):
+        data = bytearray(_waveform(samples, comm_type=comm_type))
+        descriptor, times, volts = WaveformDecoder(data).decode(vertical_gain=2.0)
+        _, axis, arr = WaveformDecoder(memoryview(data)).decode_arrays(vertical_gain=2.0)
+        assert isinstance(axis, TimeAxis) and arr.dtype == np.float32
+        assert np.allclose(arr, volts, atol=1e-5)
+        assert np.allclose(np.asarray(axis), times)
+        assert np.allclose(arr[:2], [2.0 * -128 / 25.0 - descriptor['VERTICAL_OFFSET'],
+                                     2.0 * -1 / 25.0 - descriptor['VERTICAL_OFFSET']], atol=1e-5)
+
+
+def test_time_axis_behaves_like_a_sequence():
+    axis = TimeAxis(-1.0, 0.5, 10)
+    assert len(axis) == 10 and axis[0] == -1.0 and axis[-1] == 3.5
+    tail = axis[4:]
+    assert isinstance(tail, TimeAxis) and len(tail) == 6 and tail[0] == 1.0
+    assert list(axis[::3]) == [-1.0, 0.5, 2.0, 3.5]
+    assert np.asarray(axis).dtype == np.float64
+
+
+def test_filter_and_steady_state_accept_arrays():
+    n = 5000
+    axis = TimeAxis(0.0, 1e-6, n)
+    rng = np.random.default_rng(0)
+    volts = (np.where(np.arange(n) < 500, 0.0, 10.0) + rng.normal(0, 0.01, n)).astype(np.float32)
+    filtered = apply_lowpass_filter(axis, volts, cutoff_freq=10000.0)
+    assert isinstance(filtered, np.ndarray) and len(filtered) == n
+    start, end, avg, std = analyze_steady_state_can(axis, filtered)
+    assert start is not None and abs(avg - 10.0) < 0.05
+
+
+def test_decimated_steady_state_matches_full_rate():
+    # 400 kpt at 1 MS/s is decimated by 5: the steady-state window must still span 2 ms
+    n = 400_000
+    t = np.arange(n) / 1e6
+    rng = np.random.default_rng(1)
+    volts = np.where(t < 0.05, 0.0, 6.0 + 0.5 * np.sin(2 * np.pi * 50 * t)) + rng.normal(0, 0.1, n)
+    codes = np.clip(np.rint(volts * 12.5), -128, 127).astype(int).tolist()
+    record = _waveform(codes, gain=2.0, offset=0.0, t0=0.0)
+    full = analyze_waveform_steady_state(record)
+    decimated = analyze_waveform_steady_state(record, decimate=True)
+    assert abs(decimated['avg'] - full['avg']) < 0.01
+    for key in ('start', 'end', 'discarded', 'points'):
+        assert abs(decimated[key] - full[key]) <= 20
+
+
+def test_decode_segments_splits_sequence_record():
+    segments, points, interval = 3, 4000, 1e-6
+    levels = [25, 50, -75]  # counts: 1 V, 2 V, -3 V at 1 V/div
+    samples = np.concatenate([np.where(np.arange(points) < 500, 0, level) for level in levels]).astype(np.int8)
+    record = wavedesc_record(samples, interval=interval, trigger_times=[(0.5 * i, -1e-3) for i in range(segments)])
+
+    decoder = WaveformDecoder(record)
+    assert decoder.segment_count() == segments
+    descriptor, parts = decoder.decode_segments()
+    assert descriptor['TRIGGER_TIMES'] == [0.0, 0.5, 1.0]
+    assert [len(volts) for _, volts in parts] == [points] * segments
+    axis, volts = parts[2]
+    assert axis.offset == -1e-3 and abs(axis.interval - interval) < 1e-12 and volts[-1] == -3.0
+
+    # Sized correctly as a direct binary transfer (trigger times included)
+    assert _wavedesc_length(record, 0) == len(record)
+
+    results = analyze_waveform_segments(bytearray(record), voltage_threshold=0.5)
+    assert [round(result['avg'], 3) for result in results] == [1.0, 2.0, -3.0]
+    # A normal record is a single segment
+    assert len(WaveformDecoder(_waveform([1, 2, 3] * 200, prefix=b'')).decode_segments()[1]) == 1
+
+
+def test_wave_descriptor_parses_every_field_on_demand():
+    record = bytearray(_waveform([1, 2, 3] * 200, prefix=b''))
+    record[76:84] = b'SDS1104X'
+    struct.pack_into('<dBBBBH', record, 296, 12.5, 30, 14, 18, 10, 2026)
+    struct.pack_into('<f', record, 328, 10.0)
+    descriptor = WaveformDecoder(record).decode_arrays()[0]
+    assert isinstance(descriptor, WaveDescriptor) and 'INSTRUMENT_NAME' not in repr(descriptor)
+    assert descriptor['INSTRUMENT_NAME'] == 'SDS1104X' and descriptor['PROBE_ATT'] == 10.0
+    assert descriptor['TRIGGER_TIME'] == {'seconds': 12.5, 'minutes': 30, 'hours': 14,
+                                          'days': 18, 'months': 10, 'year': 2026}
+    full = descriptor.to_dict()
+    assert list(full) == list(WAVEDESC_FIELDS) and full['DESCRIPTOR_NAME'] == 'WAVEDESC'
+    descriptor['TRIGGER_TIMES'] = [0.0]
+    assert len(descriptor) == len(WAVEDESC_FIELDS) + 1 and descriptor.get('UNKNOWN') is None
+    with pytest.raises(ValueError):
+        WaveDescriptor(bytes(record[:200]))['VERTUNIT']
@@ -2,19 +2,35 @@
 Utility modules for signal processing, analysis, and waveform decoding.
 
 This package contains:
-- signal_analysis: Functions for analyzing signal steady-state behavior
+- signal_analysis: Steady-state detection and robust statistics of signals
 - signal_processing: Functions for filtering and processing signals
-- waveform_decoder: Classes for decoding oscilloscope waveform data
+- waveform_decoder: Classes for decoding oscilloscope waveform data (lists or NumPy arrays)
+  and the lazily parsed WAVEDESC descriptor
+- plot_stream: Non-blocking plot data channel from the test thread to the GUI
+- decimation: Min/max and LTTB reduction of long series for plotting
+- plot_style: Application matplotlib style (applied without importing seaborn)
 """
 
-from host_gui.utils.signal_analysis import analyze_steady_state_can
-from host_gui.utils.signal_processing import apply_lowpass_filter, apply_moving_average_filter
-from host_gui.utils.waveform_decoder import WaveformDecoder
+from host_gui.utils.signal_analysis import (
+    RobustStats, analyze_steady_state_can, detect_steady_state_regions, robust_statistics
+)
+from host_gui.utils.signal_processing import apply_lowpass_filter, apply_moving_average_filter, lowpass_decimate
+from host_gui.utils.waveform_decoder import TimeAxis, WaveDescriptor, WaveformDecoder
+from host_gui.utils.plot_stream import PlotDataStream
+from host_gui.utils.decimation import decimate_for_display
 
 __all__ = [
     'analyze_steady_state_can',
+    'detect_steady_state_regions',
+    'robust_statistics',
+    'RobustStats',
     'apply_lowpass_filter',
     'apply_moving_average_filter',
+    'lowpass_decimate',
     'WaveformDecoder',
+    'TimeAxis',
+    'WaveDescriptor',
+    'PlotDataStream',
+    'decimate_for_display',
 ]
 
@@ -0,0 +1,146 @@
+"""
+Decimation utilities for plotting long series at display resolution.
+
+A plot cannot show more than a few points per pixel column, so series are
+reduced before they are handed to matplotlib:
+
+- min/max: the series is split into buckets (in sample order) and the
+  minimum and maximum of each bucket are kept in their original order.
+  Peaks and glitches survive exactly; cost is O(N).
+- LTTB (largest-triangle-three-buckets): one point per bucket, chosen to
+  maximise the triangle area with its neighbours. Keeps the visual shape
+  with fewer points than min/max; cost is O(N).
+
+Both methods return a subset of the original points (first and last point
+always included), so decimated plots never show values that were not
+measured.
+"""
+import logging
+from typing import Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Check for optional dependencies
+try:
+    import numpy as np
+    numpy_available = True
+except ImportError:
+    np = None
+    numpy_available = False
+
+# Default display budget: roughly two points per pixel column of a report/live plot
+DEFAULT_MAX_POINTS = 2000
+
+ArrayLike = Union[Sequence[float], 'np.ndarray']
+
+
+def minmax_indices(y: ArrayLike, max_points: int) -> 'np.ndarray':
+    """Return sorted indices keeping the min and max of each bucket.
+
+    Args:
+        y: Series values
+        max_points: Upper bound on the number of indices returned (>= 4)
+
+    Returns:
+        Sorted integer index array (all indices if no reduction is needed)
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= max_points or max_points < 4:
+        return np.arange(n)
+    # Two points per bucket, first and last sample kept separately
+    n_buckets = (max_points - 2) // 2
+    edges = np.linspace(1, n - 1, n_buckets + 1).astype(np.int64)
+    starts = edges[:-1]
+    # Buckets are contiguous, equally sized slices - reduceat gives per-bucket extremes
+    body = y[:n - 1]  # Excludes the last sample so the final bucket ends at n - 1
+    nan = np.isnan(body)
+    mins = np.minimum.reduceat(np.where(nan, np.inf, body), starts)
+    maxs = np.maximum.reduceat(np.where(nan, -np.inf, body), starts)
+    # Locate the extreme within each bucket (first occurrence)
+    bucket_of = np.repeat(np.arange(n_buckets), np.diff(edges))
+    inner = y[1:n - 1]
+    idx = np.arange(1, n - 1)
+    is_min = inner == mins[bucket_of]
+    is_max = inner == maxs[bucket_of]
+    min_idx = np.full(n_buckets, -1, dtype=np.int64)
+    max_idx = np.full(n_buckets, -1, dtype=np.int64)
+    # Reverse assignment so the first occurrence wins
+    min_idx[bucket_of[is_min][::-1]] = idx[is_min][::-1]
+    max_idx[bucket_of[is_max][::-1]] = idx[is_max][::-1]
+    keep = np.concatenate(([0], min_idx[min_idx >= 0], max_idx[max_idx >= 0], [n - 1]))
+    return np.unique(keep)
+
+
+def lttb_indices(x: ArrayLike, y: ArrayLike, max_points: int) -> 'np.ndarray':
+    """Return sorted indices selected by largest-triangle-three-buckets.
+
+    Args:
+        x: X values (e.g. time), same length as y
+        y: Series values
+        max_points: Number of points to keep (>= 3)
+
+    Returns:
+        Sorted integer index array (all indices if no reduction is needed)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= max_points or max_points < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point)
+        if i + 2 < len(edges):
+            nlo, nhi = edges[i + 1], edges[i + 2]
+            avg_x = x[nlo:nhi].mean()
+            avg_y = y[nlo:nhi].mean()
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        bx = x[lo:hi]
+        by = y[lo:hi]
+        area = np.abs((x[a] - avg_x) * (by - y[a]) - (x[a] - bx) * (avg_y - y[a]))
+        a = lo + int(np.nanargmax(area)) if np.any(np.isfinite(area)) else lo
+        selected[i + 1] = a
+    return selected
+
+
+def decimate_for_display(x: ArrayLike, y: ArrayLike, max_points: int = DEFAULT_MAX_POINTS,
+                         method: str = 'minmax') -> Tuple[ArrayLike, ArrayLike]:
+    """Reduce an (x, y) series to at most ``max_points`` points for plotting.
+
+    Series that already fit are returned unchanged (same objects), so callers
+    can use this unconditionally.
+
+    Args:
+        x: X values
+        y: Y values (same length as x)
+        max_points: Display budget (e.g. ~2x the plot width in pixels)
+        method: 'minmax' (keeps every peak) or 'lttb' (keeps visual shape)
+
+    Returns:
+        Tuple (x, y) of the decimated series (lists if lists were passed in)
+    """
+    n = min(len(x), len(y))
+    if n <= max_points:
+        return x, y
+    if not numpy_available:
+        # Plain stride as a last resort (peaks may be lost)
+        step = -(-n // max_points)
+        return x[:n:step], y[:n:step]
+    if method == 'lttb':
+        idx = lttb_indices(x[:n], y[:n], max_points)
+    elif method == 'minmax':
+        idx = minmax_indices(y[:n], max_points)
+    else:
+        raise ValueError(f"Unknown decimation method: {method!r}")
+    x_arr = np.asarray(x)[idx]
+    y_arr = np.asarray(y)[idx]
+    if isinstance(x, list):
+        return x_arr.tolist(), y_arr.tolist()
+    return x_arr, y_arr
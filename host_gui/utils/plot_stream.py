@@ -0,0 +1,69 @@
+"""
+Non-blocking plot data channel between the test thread and the GUI.
+
+The test thread pushes plot points (and clear requests) without waiting for
+the GUI; the GUI drains the stream on a frame-rate-limited timer and redraws
+once per frame. Items are kept in a collections.deque, whose append() and
+popleft() are atomic, so neither side takes a lock and measurement timing
+does not depend on how fast the GUI renders.
+"""
+from collections import deque
+from typing import Any, List, Optional, Tuple
+
+# Item kinds
+PLOT_POINT = 'point'
+PLOT_CLEAR = 'clear'
+
+
+class PlotDataStream:
+    """Single-producer/single-consumer queue of plot updates.
+
+    Items are tuples (kind, x, y, name); clear requests keep their order
+    relative to points so a new test never draws into the previous plot.
+    """
+
+    def __init__(self):
+        self._items: deque = deque()
+        self._pushed = 0
+
+    def push(self, x: float, y: float, name: Optional[str] = None) -> None:
+        """Queue a data point (never blocks).
+
+        Args:
+            x: X value (e.g. DAC voltage, oscilloscope value)
+            y: Y value (e.g. feedback value, CAN value)
+            name: Optional test name for the plot title
+        """
+        self._items.append((PLOT_POINT, x, y, name or ''))
+        self._pushed += 1
+
+    def push_clear(self) -> None:
+        """Queue a plot clear request, ordered after all points pushed so far."""
+        self._items.append((PLOT_CLEAR, None, None, ''))
+
+    def drain(self, max_items: Optional[int] = None) -> List[Tuple[str, Any, Any, str]]:
+        """Remove and return queued items in push order.
+
+        Args:
+            max_items: Optional upper bound on items returned (None = all queued)
+
+        Returns:
+            List of (kind, x, y, name) tuples
+        """
+        items = []
+        popleft = self._items.popleft
+        limit = len(self._items) if max_items is None else min(max_items, len(self._items))
+        for _ in range(limit):
+            try:
+                items.append(popleft())
+            except IndexError:
+                break
+        return items
+
+    @property
+    def pushed_count(self) -> int:
+        """Total number of points pushed since creation."""
+        return self._pushed
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,75 @@
+"""
+Plot styling shared by the live plots and report images.
+
+The application uses seaborn's "whitegrid" axes style with the "husl" colour
+palette. Importing seaborn only to set these rcParams costs well over a
+second at startup (it pulls in scipy.stats and pandas), so the resulting
+rcParams are applied directly to matplotlib instead.
+"""
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# rcParams of seaborn.axes_style("whitegrid") (seaborn 0.13)
+PLOT_STYLE_RC = {
+    'axes.axisbelow': True,
+    'axes.edgecolor': '.8',
+    'axes.facecolor': 'white',
+    'axes.grid': True,
+    'axes.labelcolor': '.15',
+    'axes.spines.bottom': True,
+    'axes.spines.left': True,
+    'axes.spines.right': True,
+    'axes.spines.top': True,
+    'figure.facecolor': 'white',
+    'font.family': ['sans-serif'],
+    'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans', 'Bitstream Vera Sans', 'sans-serif'],
+    'grid.color': '.8',
+    'grid.linestyle': '-',
+    'lines.solid_capstyle': 'round',
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+    'text.color': '.15',
+    'xtick.bottom': False,
+    'xtick.color': '.15',
+    'xtick.direction': 'out',
+    'xtick.top': False,
+    'ytick.color': '.15',
+    'ytick.direction': 'out',
+    'ytick.left': False,
+    'ytick.right': False,
+}
+
+# seaborn.color_palette("husl") (6 colours)
+PLOT_PALETTE = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
+
+_applied = False
+_lock = threading.Lock()
+
+
+def apply_plot_style() -> bool:
+    """Apply the application plot style to matplotlib's rcParams (once).
+
+    Returns:
+        True if the style is applied, False if matplotlib is not available
+    """
+    global _applied
+    if _applied:
+        return True
+    with _lock:
+        if _applied:
+            return True
+        try:
+            import matplotlib
+            from cycler import cycler
+        except ImportError:
+            return False
+        try:
+            matplotlib.rcParams.update(PLOT_STYLE_RC)
+            matplotlib.rcParams['axes.prop_cycle'] = cycler(color=PLOT_PALETTE)
+        except Exception as e:
+            logger.debug(f"Failed to apply plot style: {e}")
+            return False
+        _applied = True
+        return True
@@ -3,9 +3,18 @@ Signal analysis utilities for steady-state detection and statistical analysis.
 
 This module provides functions for analyzing signal data to identify steady-state
 regions and compute statistical properties.
+
+analyze_steady_state_can() finds the most stable window of one signal.
+detect_steady_state_regions() splits a ramp-up / steady / ramp-down
+recording of one or more signals (e.g. phase V and W currents) using
+moving standard deviations and rates of change against robust thresholds
+(median + k * median absolute deviation); every step is vectorized.
+robust_statistics() summarizes a region (mean/std and median/MAD).
 """
 import logging
-from typing import Optional, Tuple, List
+import statistics
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple, List, Union
 
 logger = logging.getLogger(__name__)
 
@@ -18,18 +27,86 @@ except ImportError:
     numpy_available = False
 
 
+def _cv_percent(mean, std, reference_mean):
+    """Coefficient of variation in percent (std * 100 if the reference mean is ~0)."""
+    if numpy_available and isinstance(mean, np.ndarray):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(np.abs(reference_mean) > 1e-10, np.abs(std / mean) * 100, std * 100)
+    if abs(reference_mean) > 1e-10:
+        return abs(std / mean) * 100 if mean != 0 else float('inf')
+    return std * 100
+
+
+def _first_failure(ok) -> int:
+    """Return the number of leading True entries of a boolean sequence."""
+    if numpy_available and isinstance(ok, np.ndarray):
+        return int(np.argmin(ok)) if not ok.all() else len(ok)
+    for i, flag in enumerate(ok):
+        if not flag:
+            return i
+    return len(ok)
+
+
+class _PrefixStats:
+    """Prefix sums giving the mean and population std of any slice in O(1).
+
+    Values are shifted by their mean before summing so that the variance
+    (E[x^2] - E[x]^2) does not lose precision to a large DC level.
+    """
+
+    def __init__(self, values):
+        if numpy_available:
+            data = np.asarray(values, dtype=np.float64)
+            self.shift = float(data.mean()) if len(data) else 0.0
+            centered = data - self.shift
+            self.s1 = np.concatenate(([0.0], np.cumsum(centered)))
+            self.s2 = np.concatenate(([0.0], np.cumsum(centered * centered)))
+            # Rounding noise of the variance estimate (used to treat near-equal stds as ties)
+            self.var_eps = 64 * np.finfo(np.float64).eps * float(np.max(centered * centered, initial=0.0))
+        else:
+            self.shift = sum(values) / len(values) if len(values) else 0.0
+            self.s1 = [0.0]
+            self.s2 = [0.0]
+            for v in values:
+                c = v - self.shift
+                self.s1.append(self.s1[-1] + c)
+                self.s2.append(self.s2[-1] + c * c)
+            self.var_eps = 64 * 2.220446049250313e-16 * max((max(values) - self.shift) ** 2,
+                                                              (min(values) - self.shift) ** 2)
+
+    def window(self, starts, stops):
+        """Mean and std of values[starts:stops] (arrays with NumPy, scalars otherwise)."""
+        if numpy_available and (isinstance(starts, np.ndarray) or isinstance(stops, np.ndarray)):
+            n = (stops - starts).astype(np.float64)
+            m1 = (self.s1[stops] - self.s1[starts]) / n
+            var = np.maximum((self.s2[stops] - self.s2[starts]) / n - m1 * m1, 0.0)
+            var = np.where(var <= self.var_eps, 0.0, var)
+            return m1 + self.shift, np.sqrt(var)
+        n = stops - starts
+        m1 = (self.s1[stops] - self.s1[starts]) / n
+        var = max((self.s2[stops] - self.s2[starts]) / n - m1 * m1, 0.0)
+        if var <= self.var_eps:
+            var = 0.0
+        return m1 + self.shift, var ** 0.5
+
+
 def analyze_steady_state_can(
-    timestamps: List[float],
-    values: List[float],
+    timestamps: Union[List[float], 'np.ndarray'],
+    values: Union[List[float], 'np.ndarray'],
     window_size: Optional[int] = None,
     variance_threshold_percent: float = 5.0,
     skip_initial_percent: float = 30.0
 ) -> Tuple[Optional[int], Optional[int], Optional[float], Optional[float]]:
     """Analyze CAN signal data to find steady state region and compute average.
     
+    The mean, standard deviation and coefficient of variation of every
+    candidate window are computed at once from prefix sums (O(N) instead of
+    O(N * window_size)); the backward/forward extension of the selected
+    window uses the same prefix sums.
+    
     Args:
-        timestamps: List of timestamps in seconds
-        values: List of signal values
+        timestamps: List, numpy array or TimeAxis of timestamps in seconds
+        values: List or numpy array of signal values
         window_size: Size of rolling window for variance calculation. If None, uses 1% of data points.
         variance_threshold_percent: Maximum coefficient of variation (std/mean * 100) for steady state
         skip_initial_percent: Percentage of initial data to skip when looking for steady state
@@ -37,7 +114,7 @@ def analyze_steady_state_can(
     Returns:
         Tuple of (start_index, end_index, average_value, std_deviation) or (None, None, None, None) if insufficient data
     """
-    if not values or len(values) < 10:
+    if values is None or len(values) < 10:
         logger.warning("Insufficient data points for steady state analysis")
         return (None, None, None, None)
     
@@ -60,144 +137,311 @@ def analyze_steady_state_can(
         search_start = 0
         search_end = num_points
     
-    # Find region with lowest variance
-    best_start = search_start
-    best_variance = float('inf')
-    best_mean = 0.0
+    if not numpy_available:
+        values = list(values)
+    stats = _PrefixStats(values)
     
+    # Statistics of every candidate window [start, start + window_size)
+    # (windows are clipped at the end of the data, as slicing did)
     if numpy_available:
-        values_array = np.array(values, dtype=np.float64)
-        for start_idx in range(search_start, search_end):
-            window_data = values_array[start_idx:start_idx + window_size]
-            window_mean = float(np.mean(window_data))
-            window_std = float(np.std(window_data))
-            
-            # Use coefficient of variation (CV) = std/mean * 100
-            if abs(window_mean) > 1e-10:
-                cv = abs(window_std / window_mean) * 100
-            else:
-                cv = window_std * 100
-            
-            if cv < variance_threshold_percent and window_std < best_variance:
-                best_variance = window_std
-                best_start = start_idx
-                best_mean = window_mean
+        starts = np.arange(search_start, search_end)
+        stops = np.minimum(starts + window_size, num_points)
+        means, stds = stats.window(starts, stops)
+        cvs = _cv_percent(means, stds, means)
+        
+        # Region with lowest std among windows below the CV threshold; if no
+        # region met the threshold, the region with lowest std overall.
+        # Variances equal within rounding noise count as ties; the first wins.
+        candidates = cvs < variance_threshold_percent
+        pool = stds * stds if not candidates.any() else np.where(candidates, stds * stds, np.inf)
+        best = int(np.argmax(pool <= float(pool.min()) + stats.var_eps))
+        best_start = int(starts[best])
+        best_mean = float(means[best])
     else:
-        # Manual calculation without numpy
+        # Same selection with running comparisons (variances within rounding noise are ties)
+        best_start = search_start
+        best_var = float('inf')
+        best_mean = 0.0
+        fallback = (float('inf'), search_start, 0.0)
         for start_idx in range(search_start, search_end):
-            window_data = values[start_idx:start_idx + window_size]
-            window_mean = sum(window_data) / len(window_data)
-            window_variance = sum((x - window_mean) ** 2 for x in window_data) / len(window_data)
-            window_std = window_variance ** 0.5
-            
-            if abs(window_mean) > 1e-10:
-                cv = abs(window_std / window_mean) * 100
-            else:
-                cv = window_std * 100
-            
-            if cv < variance_threshold_percent and window_std < best_variance:
-                best_variance = window_std
-                best_start = start_idx
-                best_mean = window_mean
-    
-    # If no region met the threshold, use the region with lowest variance
-    if best_variance == float('inf'):
-        if numpy_available:
-            values_array = np.array(values, dtype=np.float64)
-            for start_idx in range(search_start, search_end):
-                window_data = values_array[start_idx:start_idx + window_size]
-                window_std = float(np.std(window_data))
-                if window_std < best_variance:
-                    best_variance = window_std
-                    best_start = start_idx
-                    best_mean = float(np.mean(window_data))
-        else:
-            for start_idx in range(search_start, search_end):
-                window_data = values[start_idx:start_idx + window_size]
-                window_mean = sum(window_data) / len(window_data)
-                window_variance = sum((x - window_mean) ** 2 for x in window_data) / len(window_data)
-                window_std = window_variance ** 0.5
-                if window_std < best_variance:
-                    best_variance = window_std
-                    best_start = start_idx
-                    best_mean = window_mean
+            window_mean, window_std = stats.window(start_idx, min(start_idx + window_size, num_points))
+            window_var = window_std * window_std
+            cv = _cv_percent(window_mean, window_std, window_mean)
+            if cv < variance_threshold_percent and window_var < best_var - stats.var_eps:
+                best_var, best_start, best_mean = window_var, start_idx, window_mean
+            if window_var < fallback[0] - stats.var_eps:
+                fallback = (window_var, start_idx, window_mean)
+        if best_var == float('inf'):
+            best_var, best_start, best_mean = fallback
     
     # Extend steady state region forward and backward
+    relaxed = variance_threshold_percent * 1.5  # Slightly relaxed for extension
     steady_start = best_start
     steady_end = best_start + window_size
+    data_end = min(steady_end, num_points)  # steady_end may point past the data
     
-    # Extend backward
-    if numpy_available:
-        values_array = np.array(values, dtype=np.float64)
-        for i in range(best_start - 1, max(0, best_start - window_size), -1):
-            test_window = values_array[i:steady_end]
-            test_mean = float(np.mean(test_window))
-            test_std = float(np.std(test_window))
-            if abs(best_mean) > 1e-10:
-                cv = abs(test_std / test_mean) * 100
-            else:
-                cv = test_std * 100
-            if cv < variance_threshold_percent * 1.5:  # Slightly relaxed for extension
-                steady_start = i
-            else:
-                break
-    else:
-        for i in range(best_start - 1, max(0, best_start - window_size), -1):
-            test_window = values[i:steady_end]
-            test_mean = sum(test_window) / len(test_window)
-            test_variance = sum((x - test_mean) ** 2 for x in test_window) / len(test_window)
-            test_std = test_variance ** 0.5
-            if abs(best_mean) > 1e-10:
-                cv = abs(test_std / test_mean) * 100
-            else:
-                cv = test_std * 100
-            if cv < variance_threshold_percent * 1.5:
-                steady_start = i
-            else:
-                break
-    
-    # Extend forward
-    if numpy_available:
-        for i in range(steady_end, min(num_points, steady_end + window_size)):
-            test_window = values_array[steady_start:i + 1]
-            test_mean = float(np.mean(test_window))
-            test_std = float(np.std(test_window))
-            if abs(best_mean) > 1e-10:
-                cv = abs(test_std / test_mean) * 100
-            else:
-                cv = test_std * 100
-            if cv < variance_threshold_percent * 1.5:
-                steady_end = i + 1
-            else:
-                break
-    else:
-        for i in range(steady_end, min(num_points, steady_end + window_size)):
-            test_window = values[steady_start:i + 1]
-            test_mean = sum(test_window) / len(test_window)
-            test_variance = sum((x - test_mean) ** 2 for x in test_window) / len(test_window)
-            test_std = test_variance ** 0.5
-            if abs(best_mean) > 1e-10:
-                cv = abs(test_std / test_mean) * 100
-            else:
-                cv = test_std * 100
-            if cv < variance_threshold_percent * 1.5:
-                steady_end = i + 1
-            else:
-                break
+    # Extend backward: windows [i, steady_end) for i = best_start - 1 down to
+    # max(0, best_start - window_size) + 1, stopping at the first failure
+    back_lo = max(0, best_start - window_size)
+    if best_start - 1 > back_lo:
+        if numpy_available:
+            firsts = np.arange(best_start - 1, back_lo, -1)
+            test_mean, test_std = stats.window(firsts, np.full(len(firsts), data_end))
+            ok = _cv_percent(test_mean, test_std, np.full(len(firsts), best_mean)) < relaxed
+        else:
+            firsts = list(range(best_start - 1, back_lo, -1))
+            ok = []
+            for i in firsts:
+                test_mean, test_std = stats.window(i, data_end)
+                ok.append(_cv_percent(test_mean, test_std, best_mean) < relaxed)
+        accepted = _first_failure(ok)
+        if accepted:
+            steady_start = int(firsts[accepted - 1])
+    
+    # Extend forward: windows [steady_start, i + 1) for i = steady_end .. steady_end + window_size - 1
+    forward_hi = min(num_points, steady_end + window_size)
+    if forward_hi > steady_end:
+        if numpy_available:
+            lasts = np.arange(steady_end, forward_hi)
+            test_mean, test_std = stats.window(np.full(len(lasts), steady_start), lasts + 1)
+            ok = _cv_percent(test_mean, test_std, np.full(len(lasts), best_mean)) < relaxed
+        else:
+            lasts = list(range(steady_end, forward_hi))
+            ok = []
+            for i in lasts:
+                test_mean, test_std = stats.window(steady_start, i + 1)
+                ok.append(_cv_percent(test_mean, test_std, best_mean) < relaxed)
+        accepted = _first_failure(ok)
+        if accepted:
+            steady_end = int(lasts[accepted - 1]) + 1
     
     # Calculate final average and std
-    steady_data = values[steady_start:steady_end]
-    if not steady_data:
+    if min(steady_end, num_points) <= steady_start:
         return (None, None, None, None)
     
     if numpy_available:
-        steady_array = np.array(steady_data, dtype=np.float64)
+        steady_array = np.asarray(values, dtype=np.float64)[steady_start:steady_end]
         avg = float(np.mean(steady_array))
         std = float(np.std(steady_array))
     else:
+        steady_data = values[steady_start:steady_end]
         avg = sum(steady_data) / len(steady_data)
         variance = sum((x - avg) ** 2 for x in steady_data) / len(steady_data)
         std = variance ** 0.5
     
     return (steady_start, steady_end, avg, std)
 
+
+# Scale from the median absolute deviation to the standard deviation of normal data
+MAD_TO_SIGMA = 1.4826
+
+
+@dataclass
+class RobustStats:
+    """Summary statistics of a signal region.
+
+    Attributes:
+        count: Number of values
+        mean: Arithmetic mean
+        std: Population standard deviation
+        median: Median
+        mad: Median absolute deviation from the median
+        minimum: Smallest value
+        maximum: Largest value
+    """
+    count: int
+    mean: float
+    std: float
+    median: float
+    mad: float
+    minimum: float
+    maximum: float
+
+    @property
+    def sigma(self) -> float:
+        """Standard deviation estimated from the MAD (insensitive to spikes)."""
+        return MAD_TO_SIGMA * self.mad
+
+
+def median_absolute_deviation(values: Union[List[float], 'np.ndarray']) -> Tuple[float, float]:
+    """Return (median, median absolute deviation) of the values ((0.0, 0.0) if empty)."""
+    if len(values) == 0:
+        return 0.0, 0.0
+    if numpy_available:
+        data = np.asarray(values, dtype=np.float64)
+        median = float(np.median(data))
+        return median, float(np.median(np.abs(data - median)))
+    median = statistics.median(values)
+    return median, statistics.median(abs(x - median) for x in values)
+
+
+def robust_statistics(values: Union[List[float], 'np.ndarray']) -> Optional[RobustStats]:
+    """Compute mean, standard deviation, median, MAD and range of the values.
+
+    Args:
+        values: List or numpy array of signal values
+
+    Returns:
+        RobustStats, or None if there are no values
+    """
+    if values is None or len(values) == 0:
+        return None
+    median, mad = median_absolute_deviation(values)
+    if numpy_available:
+        data = np.asarray(values, dtype=np.float64)
+        return RobustStats(len(data), float(data.mean()), float(data.std()), median, mad,
+                           float(data.min()), float(data.max()))
+    mean = sum(values) / len(values)
+    std = (sum((x - mean) ** 2 for x in values) / len(values)) ** 0.5
+    return RobustStats(len(values), mean, std, median, mad, min(values), max(values))
+
+
+def _window_sums(flags: 'np.ndarray') -> 'np.ndarray':
+    """Prefix sums of a boolean array: sums[j] - sums[i] = number of True in flags[i:j]."""
+    return np.concatenate(([0], np.cumsum(flags, dtype=np.int64)))
+
+
+def _first_run_end(flags: 'np.ndarray', length: int) -> Optional[int]:
+    """Index of the last element of the first run of `length` consecutive True values."""
+    if length <= 0 or len(flags) < length:
+        return None
+    sums = _window_sums(flags)
+    hits = np.flatnonzero(sums[length:] - sums[:-length] == length)
+    return int(hits[0]) + length - 1 if len(hits) else None
+
+
+def detect_steady_state_regions(
+    signals: Sequence[Union[List[float], 'np.ndarray']],
+    timestamps: Optional[Union[List[float], 'np.ndarray']] = None,
+    current_threshold: float = 1.0,
+    mad_factor: float = 2.0
+) -> Tuple[Optional[int], Optional[int]]:
+    """Find the steady-state region between the ramp-up and the ramp-down.
+    
+    Leading samples where every signal is below current_threshold are
+    discarded. For the rest, the centered moving standard deviation (window
+    5 % of the data) and the absolute rate of change of each signal are
+    averaged over the signals; a sample is stable when both are at most
+    median + mad_factor * MAD of their series. The steady state starts
+    before the first run of max(3, window / 2) stable samples and ends after
+    the last such run. If no run is found, a sustained low (ramp-up) or high
+    (ramp-down) rate of change is used, then 10 % / 90 % of the data.
+    
+    Args:
+        signals: Signals of equal length (e.g. [phase_v_values, phase_w_values])
+        timestamps: Sample times (None = unit spacing)
+        current_threshold: Initial samples with all signals below this magnitude are discarded
+        mad_factor: Number of MADs above the median still counted as stable
+        
+    Returns:
+        Tuple of (ramp_up_end_index, ramp_down_start_index) or (None, None)
+        if there is too little data
+    
+    Raises:
+        RuntimeError: If NumPy is not available
+    """
+    if not numpy_available:
+        raise RuntimeError("NumPy is required for steady state region detection")
+    data = [np.asarray(values, dtype=np.float64) for values in signals]
+    total_points = min(len(values) for values in data) if data else 0
+    if total_points < 10:
+        logger.warning(f"Insufficient data points ({total_points}) for steady state detection")
+        return None, None
+    data = [values[:total_points] for values in data]
+    
+    # Discard the initial low current period (before any signal reaches the threshold)
+    above = np.zeros(total_points, dtype=bool)
+    for values in data:
+        above |= np.abs(values) >= current_threshold
+    analysis_start = int(np.argmax(above)) if above.any() else 0
+    if analysis_start > 0:
+        logger.info(f"Discarding initial {analysis_start} points with current < {current_threshold} A")
+    analysis = [values[analysis_start:] for values in data]
+    n = total_points - analysis_start
+    if n < 10:
+        logger.warning(f"Insufficient data points ({n}) after discarding initial low current period")
+        return None, None
+    
+    # Window for moving statistics: 5 % of the data (at least 5 points, at most 25 %)
+    window_size = min(max(5, int(n * 0.05)), n // 4)
+    logger.info(f"Analyzing {n} data points (after discarding {analysis_start} initial points) "
+                f"with window size {window_size}")
+    
+    # Centered moving std (windows clipped at the ends) and rate of change, averaged over signals
+    index = np.arange(n)
+    half_window = window_size // 2
+    starts = np.maximum(index - half_window, 0)
+    stops = np.minimum(index + half_window + 1, n)
+    dt = 1.0
+    if timestamps is not None and len(timestamps) >= total_points:
+        dt = np.diff(np.asarray(timestamps[analysis_start:total_points], dtype=np.float64))
+        dt = np.where(dt > 0, dt, 1.0)
+    combined_std = np.zeros(n)
+    combined_rate = np.zeros(n)
+    for values in analysis:
+        combined_std += _PrefixStats(values).window(starts, stops)[1]
+        combined_rate[1:] += np.abs(np.diff(values) / dt)
+    combined_std /= len(analysis)
+    combined_rate /= len(analysis)
+    
+    # Robust stability thresholds: median + k * MAD
+    median_std, mad_std = median_absolute_deviation(combined_std)
+    median_rate, mad_rate = median_absolute_deviation(combined_rate)
+    std_threshold = median_std + mad_factor * mad_std
+    rate_threshold = median_rate + mad_factor * mad_rate
+    logger.debug(f"Stability thresholds - Std: {std_threshold:.4f}, Rate: {rate_threshold:.4f}")
+    
+    stable = (combined_std <= std_threshold) & (combined_rate <= rate_threshold)
+    required = max(3, window_size // 2)
+    
+    # Ramp-up end: before the first run of stable points
+    ramp_up_end = None
+    run_end = _first_run_end(stable[window_size:n - window_size], required)
+    if run_end is not None:
+        ramp_up_end = window_size + run_end - required
+    if ramp_up_end is None:
+        # First point (in the first half) from which the rate stays low for `required` points
+        rate_ok = _window_sums(combined_rate <= rate_threshold)
+        first = np.arange(window_size, n // 2)
+        last = np.minimum(first + required, n)
+        hits = np.flatnonzero(rate_ok[last] - rate_ok[first] == last - first)
+        if len(hits):
+            ramp_up_end = int(first[hits[0]])
+    if ramp_up_end is None:
+        ramp_up_end = max(1, int(n * 0.1))
+        logger.warning(f"Could not detect ramp-up end, using conservative estimate: {ramp_up_end}")
+    
+    # Ramp-down start: after the last run of stable points (searching back from the end)
+    ramp_down_start = None
+    lowest = ramp_up_end + window_size + 1
+    highest = n - window_size
+    if highest >= lowest:
+        run_end = _first_run_end(stable[lowest:highest + 1][::-1], required)
+        if run_end is not None:
+            ramp_down_start = highest - run_end + required
+        if ramp_down_start is None:
+            # Last point from which the rate stays high (a sustained increase)
+            rate_high = _window_sums(combined_rate > rate_threshold)
+            first = np.arange(highest, lowest - 1, -1)
+            last = np.minimum(first + required, n)
+            hits = np.flatnonzero((combined_rate[first] > rate_threshold * 1.5) &
+                                  (rate_high[last] - rate_high[first] == last - first))
+            if len(hits):
+                ramp_down_start = int(first[hits[0]])
+    if ramp_down_start is None:
+        ramp_down_start = min(n - 1, int(n * 0.9))
+        logger.warning(f"Could not detect ramp-down start, using conservative estimate: {ramp_down_start}")
+    
+    if ramp_up_end >= ramp_down_start:
+        # Use middle 60% of remaining data as fallback
+        ramp_up_end = int(n * 0.2)
+        ramp_down_start = int(n * 0.8)
+        logger.warning("Steady state region too small, using fallback boundaries")
+    
+    ramp_up_end += analysis_start
+    ramp_down_start += analysis_start
+    steady_points = ramp_down_start - ramp_up_end
+    logger.info(f"Steady state detection: ramp-up end {ramp_up_end} ({ramp_up_end / total_points * 100:.1f}%), "
+                f"ramp-down start {ramp_down_start} ({ramp_down_start / total_points * 100:.1f}%), "
+                f"{steady_points} steady points ({steady_points / total_points * 100:.1f}%)")
+    return ramp_up_end, ramp_down_start
@@ -3,9 +3,19 @@ Signal processing utilities for filtering and smoothing signals.
 
 This module provides functions for applying digital filters to signal data,
 including low-pass Butterworth filters and moving average filters.
+
+Low-pass filters are designed once per (sampling rate, cutoff, order) and
+applied as second-order sections with sosfiltfilt, which stays stable at the
+low normalized cutoffs of long captures (10 kHz at MS/s rates) where the
+(b, a) form loses precision. NumPy arrays are filtered in their own float
+type (float32 captures stay float32 when that is accurate enough) and can be
+filtered in place. lowpass_decimate() averages blocks of samples down to a
+rate still well above the cutoff before filtering, which is several times
+faster on long captures.
 """
 import logging
-from typing import Union, List
+from functools import lru_cache
+from typing import Optional, Tuple, Union, List
 
 logger = logging.getLogger(__name__)
 
@@ -14,36 +24,120 @@ try:
     import numpy as np
     numpy_available = True
 except ImportError:
-    numpy = None
+    np = None
     numpy_available = False
 
-try:
-    from scipy import signal
-    scipy_available = True
-except ImportError:
-    signal = None
-    scipy_available = False
+# scipy.signal is slow to import; check availability now, import on first filter
+import importlib.util
+
+scipy_available = importlib.util.find_spec('scipy') is not None
+signal = None
+
+# lowpass_decimate() keeps at least this many samples per cutoff period
+DECIMATE_MIN_RATE_FACTOR = 20
+# Below this normalized cutoff (1 = Nyquist) float32 sections are not accurate
+# enough; float32 data is then filtered in float64 and converted back
+FLOAT32_MIN_NORMALIZED_CUTOFF = 0.05
+
+
+def _scipy_signal():
+    """Import scipy.signal on first use and return it."""
+    global signal
+    if signal is None:
+        from scipy import signal as scipy_signal
+        signal = scipy_signal
+    return signal
+
+
+@lru_cache(maxsize=32)
+def lowpass_sos(sampling_freq: float, cutoff_freq: float, filter_order: int = 4,
+                dtype: str = 'float64') -> 'np.ndarray':
+    """Design a low-pass Butterworth filter as second-order sections (cached).
+
+    Args:
+        sampling_freq: Sampling frequency in Hz
+        cutoff_freq: Cutoff frequency in Hz (below Nyquist)
+        filter_order: Filter order
+        dtype: Coefficient type ('float64' or 'float32')
+
+    Returns:
+        SOS array of shape (n_sections, 6), shared between callers (do not modify)
+    """
+    normalized_cutoff = cutoff_freq / (sampling_freq / 2.0)
+    sos = _scipy_signal().butter(filter_order, normalized_cutoff, btype='low', output='sos').astype(dtype)
+    logger.debug(f"Designed low-pass filter: cutoff={cutoff_freq:.2f} Hz, order={filter_order}, "
+                 f"sampling_freq={sampling_freq:.2f} Hz ({dtype})")
+    return sos
+
+
+def _sample_interval(time_values) -> Optional[float]:
+    """Return the sample interval of a time axis (None if it cannot be determined)."""
+    if len(time_values) < 2:
+        logger.warning("Need at least 2 time points to calculate sampling frequency, returning unfiltered data")
+        return None
+    # Only the first two and the last time value are needed (no conversion of
+    # the whole axis; a TimeAxis computes them on demand)
+    dt = float(time_values[1]) - float(time_values[0])
+    if dt <= 0:
+        # Try to calculate from average
+        dt = (float(time_values[-1]) - float(time_values[0])) / (len(time_values) - 1)
+        if dt <= 0:
+            logger.warning("Invalid time values for filtering, returning unfiltered data")
+            return None
+    return dt
+
+
+def _sosfiltfilt(voltages: 'np.ndarray', sampling_freq: float, cutoff_freq: float,
+                 filter_order: int) -> 'np.ndarray':
+    """Zero-phase low-pass filter of a float array, returned in the array's float type."""
+    # Check if cutoff frequency is valid (must be less than Nyquist frequency)
+    nyquist_freq = sampling_freq / 2.0
+    if cutoff_freq >= nyquist_freq:
+        logger.warning(f"Cutoff frequency {cutoff_freq} Hz is >= Nyquist frequency {nyquist_freq:.2f} Hz")
+        logger.warning(f"Reducing cutoff to {nyquist_freq * 0.9:.2f} Hz")
+        cutoff_freq = nyquist_freq * 0.9
+    
+    work_dtype = voltages.dtype
+    if work_dtype == np.float32 and cutoff_freq / nyquist_freq < FLOAT32_MIN_NORMALIZED_CUTOFF:
+        work_dtype = np.dtype(np.float64)
+    # Rounded key: the same capture settings reuse the same design
+    sos = lowpass_sos(float(f"{sampling_freq:.9g}"), float(f"{cutoff_freq:.9g}"), filter_order,
+                      work_dtype.name)
+    filtered = _scipy_signal().sosfiltfilt(sos, voltages.astype(work_dtype, copy=False))
+    return filtered.astype(voltages.dtype, copy=False)
+
+
+def _as_float_array(values) -> Tuple['np.ndarray', bool]:
+    """Return (float ndarray, True if the input was not an ndarray)."""
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == 'f':
+            return values, False
+        return values.astype(np.float64), False
+    return np.asarray(values, dtype=np.float64), True
 
 
 def apply_lowpass_filter(
     time_values: Union[List[float], 'np.ndarray'],
     voltage_values: Union[List[float], 'np.ndarray'],
     cutoff_freq: float = 10000.0,
-    filter_order: int = 4
+    filter_order: int = 4,
+    inplace: bool = False
 ) -> Union[List[float], 'np.ndarray']:
     """Apply a low-pass Butterworth filter to the voltage waveform.
     
     This function matches the filtering used in the test script to reduce noise
-    before steady state analysis.
+    before steady state analysis (zero-phase, second-order sections).
     
     Args:
-        time_values: List or numpy array of time values in seconds
+        time_values: List, numpy array or TimeAxis of time values in seconds
+            (only the sample interval is used)
         voltage_values: List or numpy array of voltage values to filter
         cutoff_freq: Cutoff frequency in Hz (default 10kHz, matching test script)
         filter_order: Filter order (default 4)
+        inplace: Write the result into voltage_values (float numpy arrays only)
         
     Returns:
-        Filtered voltage values (same type as input)
+        Filtered voltage values (same type as input; float arrays keep their dtype)
     """
     # Check if voltage_values is empty or has insufficient data
     # Handle both list and numpy array cases
@@ -60,61 +154,27 @@ def apply_lowpass_filter(
         # Fallback to simple moving average
         return apply_moving_average_filter(voltage_values, window_size=10)
     
-    # Convert to numpy arrays if needed
-    if not isinstance(voltage_values, np.ndarray):
-        voltages = np.array(voltage_values, dtype=np.float64)
-        return_list = True
-    else:
-        voltages = voltage_values.astype(np.float64) if voltage_values.dtype != np.float64 else voltage_values
-        return_list = False
-    
-    if not isinstance(time_values, np.ndarray):
-        times = np.array(time_values, dtype=np.float64)
-    else:
-        times = time_values.astype(np.float64) if time_values.dtype != np.float64 else time_values
-    
-    # Calculate sampling frequency
-    if len(time_values) < 2:
-        logger.warning("Need at least 2 time points to calculate sampling frequency, returning unfiltered data")
+    dt = _sample_interval(time_values)
+    if dt is None:
         return voltage_values
-    
-    dt = times[1] - times[0]
-    if dt <= 0:
-        # Try to calculate from average
-        dt = (times[-1] - times[0]) / (len(times) - 1)
-        if dt <= 0:
-            logger.warning("Invalid time values for filtering, returning unfiltered data")
-            return voltage_values
-    
     sampling_freq = 1.0 / dt
-    
-    # Check if cutoff frequency is valid (must be less than Nyquist frequency)
-    nyquist_freq = sampling_freq / 2.0
-    if cutoff_freq >= nyquist_freq:
-        logger.warning(f"Cutoff frequency {cutoff_freq} Hz is >= Nyquist frequency {nyquist_freq:.2f} Hz")
-        logger.warning(f"Reducing cutoff to {nyquist_freq * 0.9:.2f} Hz")
-        cutoff_freq = nyquist_freq * 0.9
-    
-    # Normalize cutoff frequency (0 to 1, where 1 is Nyquist)
-    normalized_cutoff = cutoff_freq / nyquist_freq
+    voltages, return_list = _as_float_array(voltage_values)
     
     logger.info(f"Applying low-pass filter: cutoff={cutoff_freq:.2f} Hz, "
                f"order={filter_order}, sampling_freq={sampling_freq:.2f} Hz")
     
     try:
-        # Design Butterworth low-pass filter
-        b, a = signal.butter(filter_order, normalized_cutoff, btype='low', analog=False)
+        filtered_voltages = _sosfiltfilt(voltages, sampling_freq, cutoff_freq, filter_order)
         
-        # Apply filter using filtfilt for zero-phase filtering
-        filtered_voltages = signal.filtfilt(b, a, voltages)
-        
-        logger.info(f"Filter applied successfully using filtfilt (zero-phase filtering), "
+        logger.info(f"Filter applied successfully using sosfiltfilt (zero-phase filtering), "
                    f"filtered {len(filtered_voltages)} points")
         
         if return_list:
             return filtered_voltages.tolist()
-        else:
-            return filtered_voltages
+        if inplace and voltages is voltage_values:
+            voltage_values[...] = filtered_voltages
+            return voltage_values
+        return filtered_voltages
         
     except Exception as e:
         logger.error(f"Error applying filter: {e}", exc_info=True)
@@ -122,6 +182,59 @@ def apply_lowpass_filter(
         return voltage_values
 
 
+def lowpass_decimate(
+    time_values: Union[List[float], 'np.ndarray'],
+    voltage_values: Union[List[float], 'np.ndarray'],
+    cutoff_freq: float = 10000.0,
+    filter_order: int = 4,
+    min_rate_factor: float = DECIMATE_MIN_RATE_FACTOR
+) -> Tuple[Union[List[float], 'np.ndarray'], Union[List[float], 'np.ndarray']]:
+    """Low-pass filter a long capture at a reduced sample rate.
+    
+    When the sample rate is far above the cutoff, blocks of q samples are
+    averaged first (q chosen so that at least min_rate_factor samples per
+    cutoff period remain; the block average also suppresses noise above the
+    new Nyquist frequency) and the Butterworth filter then runs on 1/q of the
+    data. A trailing partial block is dropped. Without NumPy/SciPy, or when
+    no reduction is possible, this is apply_lowpass_filter().
+    
+    Args:
+        time_values: List, numpy array or TimeAxis of time values in seconds
+        voltage_values: List or numpy array of voltage values
+        cutoff_freq: Cutoff frequency in Hz
+        filter_order: Filter order
+        min_rate_factor: Minimum ratio of the reduced sample rate to the cutoff
+        
+    Returns:
+        Tuple of (time values, filtered voltages) at the reduced rate: a
+        TimeAxis and an array of the input's float type, or two lists for
+        list input
+    """
+    if (voltage_values is None or len(voltage_values) < 10 or not numpy_available
+            or not scipy_available):
+        return time_values, apply_lowpass_filter(time_values, voltage_values, cutoff_freq, filter_order)
+    dt = _sample_interval(time_values)
+    if dt is None:
+        return time_values, voltage_values
+    factor = int((1.0 / dt) // (min_rate_factor * cutoff_freq))
+    if factor < 2 or len(voltage_values) // factor < 10:
+        return time_values, apply_lowpass_filter(time_values, voltage_values, cutoff_freq, filter_order)
+    
+    from host_gui.utils.waveform_decoder import TimeAxis
+    
+    voltages, return_list = _as_float_array(voltage_values)
+    blocks = len(voltages) // factor
+    reduced = voltages[:blocks * factor].reshape(blocks, factor).mean(axis=1, dtype=np.float64)
+    reduced = reduced.astype(voltages.dtype, copy=False)
+    # Each block average belongs to the centre of its block
+    reduced_time = TimeAxis(float(time_values[0]) + dt * (factor - 1) / 2.0, dt * factor, blocks)
+    logger.info(f"Decimating by {factor} before filtering: {len(voltages)} -> {blocks} points")
+    filtered = apply_lowpass_filter(reduced_time, reduced, cutoff_freq, filter_order, inplace=True)
+    if return_list:
+        return reduced_time.tolist(), filtered.tolist()
+    return reduced_time, filtered
+
+
 def apply_moving_average_filter(voltage_values: Union[List[float], 'np.ndarray'], window_size: int = 10) -> Union[List[float], 'np.ndarray']:
     """Apply a simple moving average filter (fallback when scipy is not available).
     
@@ -0,0 +1,180 @@
+"""
+Steady-state analysis of an oscilloscope waveform record.
+
+analyze_waveform_steady_state() is the complete post-processing of one
+channel of the phase current test: decode the WF? ALL record, apply the
+10 kHz low-pass filter, discard the initial samples below the threshold and
+find the steady-state region. It only takes plain arguments and returns a
+plain dict, so it can run in a worker process (see AnalysisExecutor).
+analyze_waveform_segments() does the same for every segment of a sequence
+acquisition record.
+"""
+import logging
+from typing import Any, Dict, List, Optional
+
+from host_gui.utils.signal_analysis import analyze_steady_state_can
+from host_gui.utils.signal_processing import apply_lowpass_filter, lowpass_decimate
+from host_gui.utils.waveform_decoder import WaveformDecoder
+
+logger = logging.getLogger(__name__)
+
+# Check for optional dependencies
+try:
+    import numpy as np
+    numpy_available = True
+except ImportError:
+    np = None
+    numpy_available = False
+
+
+def analyze_waveform_steady_state(
+    waveform_data,
+    vertical_gain: Optional[float] = None,
+    vertical_offset: Optional[float] = None,
+    cutoff_freq: float = 10000.0,
+    voltage_threshold: float = 2.0,
+    decimate: bool = False,
+    label: str = 'waveform'
+) -> Optional[Dict[str, Any]]:
+    """Decode a waveform record and compute its steady-state average.
+
+    Args:
+        waveform_data: Record from C{n}:WF? ALL (bytes-like, not copied)
+        vertical_gain: Gain from C{n}:VDIV? (None = descriptor value)
+        vertical_offset: Offset from C{n}:OFST? (None = descriptor value)
+        cutoff_freq: Low-pass cutoff in Hz
+        voltage_threshold: Initial samples below this magnitude are discarded
+        decimate: Average down to 20x the cutoff before filtering (lowpass_decimate;
+                  the steady-state window and result indices stay in full-rate samples)
+        label: Channel name used in log messages
+
+    Returns:
+        Dict with 'avg', 'std', 'start', 'end' (full-rate sample indices after
+        the discarded samples), 'discarded' and 'points', or None if no steady
+        state was found
+    """
+    # Array-native decode: float32 samples and a lazy time axis
+    decoder = WaveformDecoder(waveform_data)
+    decode = decoder.decode_arrays if numpy_available else decoder.decode
+    descriptor, time_values, voltage_values = decode(
+        vertical_gain=vertical_gain,
+        vertical_offset=vertical_offset
+    )
+    return _analyze_samples(time_values, voltage_values, cutoff_freq, voltage_threshold, decimate, label)
+
+
+def analyze_waveform_segments(
+    waveform_data,
+    vertical_gain: Optional[float] = None,
+    vertical_offset: Optional[float] = None,
+    cutoff_freq: float = 10000.0,
+    voltage_threshold: float = 2.0,
+    decimate: bool = False,
+    label: str = 'waveform'
+) -> List[Optional[Dict[str, Any]]]:
+    """Compute the steady-state average of every segment of a sequence record.
+    
+    Args:
+        waveform_data: Sequence record from C{n}:WF? ALL (bytes-like, not copied)
+        vertical_gain: Gain from C{n}:VDIV? (None = descriptor value)
+        vertical_offset: Offset from C{n}:OFST? (None = descriptor value)
+        cutoff_freq: Low-pass cutoff in Hz
+        voltage_threshold: Initial samples below this magnitude are discarded
+        decimate: Average down to 20x the cutoff before filtering (lowpass_decimate;
+                  the steady-state window and result indices stay in full-rate samples)
+        label: Channel name used in log messages
+    
+    Returns:
+        One result per segment, in acquisition order (see
+        analyze_waveform_steady_state; None where no steady state was found)
+    """
+    descriptor, segments = WaveformDecoder(waveform_data).decode_segments(
+        vertical_gain=vertical_gain,
+        vertical_offset=vertical_offset
+    )
+    logger.info(f"{label}: {len(segments)} segment(s) of {len(segments[0][1]) if segments else 0} points")
+    return [_analyze_samples(time_values, voltage_values, cutoff_freq, voltage_threshold, decimate,
+                             f"{label} segment {index + 1}")
+            for index, (time_values, voltage_values) in enumerate(segments)]
+
+
+def _analyze_samples(time_values, voltage_values, cutoff_freq: float, voltage_threshold: float,
+                     decimate: bool, label: str) -> Optional[Dict[str, Any]]:
+    """Filter decoded samples, discard the initial low part and find the steady state."""
+    if len(voltage_values) < 10:
+        logger.warning(f"Insufficient waveform data for {label}")
+        return None
+
+    # Apply 10kHz low-pass filter (matching test script)
+    full_points = len(voltage_values)
+    full_time_values = time_values
+    try:
+        if decimate:
+            time_values, filtered_voltage_values = lowpass_decimate(
+                time_values, voltage_values, cutoff_freq=cutoff_freq
+            )
+        else:
+            # The decoded array is not used elsewhere: filter it in place
+            filtered_voltage_values = apply_lowpass_filter(
+                time_values, voltage_values, cutoff_freq=cutoff_freq, inplace=True
+            )
+        logger.info(f"{label} filter applied: {len(filtered_voltage_values)} points")
+    except Exception as e:
+        logger.warning(f"Failed to filter {label}: {e}, using unfiltered data")
+        time_values = full_time_values
+        filtered_voltage_values = voltage_values
+    # Samples averaged per filtered sample (1 unless lowpass_decimate reduced the rate)
+    factor = 1
+    if len(filtered_voltage_values) < full_points:
+        factor = max(1, round((time_values[1] - time_values[0]) / (full_time_values[1] - full_time_values[0])))
+
+    # Discard initial data points below threshold (after filtering)
+    initial_discard_end = 0
+    if numpy_available:
+        filtered_voltage_values = np.asarray(filtered_voltage_values)
+        mask = np.abs(filtered_voltage_values) >= voltage_threshold
+        if np.any(mask):
+            initial_discard_end = int(np.argmax(mask))
+    else:
+        for i, value in enumerate(filtered_voltage_values):
+            if abs(value) >= voltage_threshold:
+                initial_discard_end = i
+                break
+
+    if initial_discard_end > 0:
+        logger.info(f"{label}: Discarding initial {initial_discard_end} points with voltage < "
+                    f"{voltage_threshold} V (after filtering)")
+
+    # Slice data to start from threshold beginning
+    filtered_voltage_values = filtered_voltage_values[initial_discard_end:]
+    time_values = time_values[initial_discard_end:]
+
+    if len(filtered_voltage_values) < 10:
+        logger.warning(f"{label}: After filtering initial low voltage data, insufficient data points "
+                       f"for steady state analysis")
+        return None
+
+    # The steady-state window spans the same time as at full rate (1% of the
+    # full-rate points, 10 to 2000 samples); indices are reported at full rate
+    window_size = None
+    if factor > 1:
+        full_window = max(10, min(2000, len(filtered_voltage_values) * factor // 100))
+        window_size = max(10, full_window // factor)
+    start_idx, end_idx, avg, std = analyze_steady_state_can(
+        time_values, filtered_voltage_values,
+        window_size=window_size,
+        variance_threshold_percent=5.0,
+        skip_initial_percent=30.0
+    )
+    if avg is None:
+        logger.warning(f"Failed to find steady state for {label}")
+        return None
+    logger.info(f"{label} steady state: avg={avg:.6f} V, std={std:.6f} V")
+    return {
+        'avg': float(avg),
+        'std': float(std),
+        'start': start_idx * factor,
+        'end': end_idx * factor,
+        'discarded': initial_discard_end * factor,
+        'points': len(filtered_voltage_values) * factor,
+    }
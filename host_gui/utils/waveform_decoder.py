@@ -3,10 +3,27 @@ Waveform decoder for oscilloscope data.
 
 This module provides classes for decoding binary waveform data from oscilloscopes,
 specifically supporting the WAVEDESC format used by Siglent oscilloscopes.
+
+WaveformDecoder.decode_arrays() is the array-native path for long captures
+(1-14 Mpts): samples are read with np.frombuffer directly from the received
+buffer (no copy), scaled in one vectorized pass and returned as a float32
+array, and the time axis is a lazy TimeAxis instead of millions of floats.
+decode() returns Python lists as before.
+
+decode_segments() splits a sequence (segmented memory) record, which holds
+the samples of every segment back to back after the trigger time array,
+into one (TimeAxis, voltages) pair per segment.
+
+The descriptor returned by the decoder is a WaveDescriptor: a mapping of
+every WAVEDESC field (WAVEDESC_FIELDS) that unpacks a field from the record
+the first time it is read, so decoding only pays for the dozen fields it
+uses while scripts can still show INSTRUMENT_NAME, TRIGGER_TIME, etc.
 """
+import operator
 import struct
 import logging
-from typing import Optional, Tuple, List, Dict
+from collections.abc import MutableMapping
+from typing import Any, Iterator, Optional, Tuple, List, Dict, Union
 
 logger = logging.getLogger(__name__)
 
@@ -15,10 +32,192 @@ try:
     import numpy as np
     numpy_available = True
 except ImportError:
-    numpy = None
+    np = None
     numpy_available = False
 
 
+class TimeAxis:
+    """Evenly spaced sample times computed on demand: t[i] = offset + i * interval.
+
+    Behaves like a read-only sequence: len(), integer indexing (float) and
+    slicing (another TimeAxis). np.asarray(axis) materializes a float64 array.
+
+    Attributes:
+        offset: Time of the first sample in seconds
+        interval: Sample interval in seconds
+    """
+
+    __slots__ = ('offset', 'interval', '_length')
+
+    def __init__(self, offset: float, interval: float, length: int):
+        self.offset = float(offset)
+        self.interval = float(interval)
+        self._length = max(int(length), 0)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[float, 'TimeAxis']:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            return TimeAxis(self.offset + start * self.interval, self.interval * step,
+                            len(range(start, stop, step)))
+        i = operator.index(index)
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError('TimeAxis index out of range')
+        return self.offset + i * self.interval
+
+    def __iter__(self) -> Iterator[float]:
+        offset, interval = self.offset, self.interval
+        for i in range(self._length):
+            yield offset + i * interval
+
+    def __array__(self, dtype=None, copy=None):
+        values = np.arange(self._length, dtype=np.float64) * self.interval + self.offset
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def tolist(self) -> List[float]:
+        """Return the sample times as a list of floats."""
+        if numpy_available:
+            return self.__array__().tolist()
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"TimeAxis(offset={self.offset!r}, interval={self.interval!r}, length={self._length})"
+
+
+# WAVEDESC block layout: field -> (byte offset, little-endian struct format).
+# 's' fields are NUL-padded strings (unit definitions are 48-byte strings);
+# TRIGGER_TIME is a time_stamp (seconds, minutes, hours, days, months, year).
+WAVEDESC_FIELDS: Dict[str, Tuple[int, str]] = {
+    'DESCRIPTOR_NAME': (0, '16s'),
+    'TEMPLATE_NAME': (16, '16s'),
+    'COMM_TYPE': (32, 'H'),
+    'COMM_ORDER': (34, 'H'),
+    'WAVE_DESCRIPTOR': (36, 'I'),
+    'USER_TEXT': (40, 'I'),
+    'RES_DESC1': (44, 'I'),
+    'TRIGTIME_ARRAY': (48, 'I'),
+    'RIS_TIME_ARRAY': (52, 'I'),
+    'RES_ARRAY1': (56, 'I'),
+    'WAVE_ARRAY_1': (60, 'I'),
+    'WAVE_ARRAY_2': (64, 'I'),
+    'RES_ARRAY2': (68, 'I'),
+    'RES_ARRAY3': (72, 'I'),
+    'INSTRUMENT_NAME': (76, '16s'),
+    'INSTRUMENT_NUMBER': (92, 'I'),
+    'TRACE_LABEL': (96, '16s'),
+    'RESERVED1': (112, 'H'),
+    'RESERVED2': (114, 'H'),
+    'WAVE_ARRAY_COUNT': (116, 'I'),
+    'PNTS_PER_SCREEN': (120, 'I'),
+    'FIRST_VALID_PNT': (124, 'I'),
+    'LAST_VALID_PNT': (128, 'I'),
+    'FIRST_POINT': (132, 'I'),
+    'SPARSING_FACTOR': (136, 'I'),
+    'SEGMENT_INDEX': (140, 'I'),
+    'SUBARRAY_COUNT': (144, 'I'),
+    'SWEEPS_PER_ACQ': (148, 'I'),
+    'POINTS_PER_PAIR': (152, 'H'),
+    'PAIR_OFFSET': (154, 'H'),
+    'VERTICAL_GAIN': (156, 'f'),
+    'VERTICAL_OFFSET': (160, 'f'),
+    'MAX_VALUE': (164, 'f'),
+    'MIN_VALUE': (168, 'f'),
+    'NOMINAL_BITS': (172, 'H'),
+    'NOM_SUBARRAY_COUNT': (174, 'H'),
+    'HORIZ_INTERVAL': (176, 'f'),
+    'HORIZ_OFFSET': (180, 'd'),
+    'PIXEL_OFFSET': (188, 'd'),
+    'VERTUNIT': (196, '48s'),
+    'HORUNIT': (244, '48s'),
+    'HORIZ_UNCERTAINTY': (292, 'f'),
+    'TRIGGER_TIME': (296, 'dBBBBH'),
+    'ACQ_DURATION': (312, 'f'),
+    'RECORD_TYPE': (316, 'H'),
+    'PROCESSING_DONE': (318, 'H'),
+    'RESERVED5': (320, 'H'),
+    'RIS_SWEEPS': (322, 'H'),
+    'TIMEBASE': (324, 'H'),
+    'VERT_COUPLING': (326, 'H'),
+    'PROBE_ATT': (328, 'f'),
+    'FIXED_VERT_GAIN': (332, 'H'),
+    'BANDWIDTH_LIMIT': (334, 'H'),
+    'VERTICAL_VERNIER': (336, 'f'),
+    'ACQ_VERT_OFFSET': (340, 'f'),
+    'WAVE_SOURCE': (344, 'H'),
+}
+
+_FIELD_STRUCTS = {name: (offset, struct.Struct('<' + fmt)) for name, (offset, fmt) in WAVEDESC_FIELDS.items()}
+_TIME_STAMP_KEYS = ('seconds', 'minutes', 'hours', 'days', 'months', 'year')
+
+
+class WaveDescriptor(MutableMapping):
+    """WAVEDESC fields of a waveform record, unpacked on first access.
+
+    Reading a field unpacks it from the record and caches the value; other
+    keys (e.g. 'TRIGGER_TIMES' added by decode_segments) can be stored like
+    in a dict. Iterating yields every WAVEDESC field, so dict(descriptor)
+    parses the whole block. The descriptor references the record buffer;
+    use to_dict() to keep the values without it.
+
+    Args:
+        waveform_data: Record from C{n}:WF? ALL (bytes-like, not copied)
+        start: Offset of the WAVEDESC block in waveform_data
+
+    Raises:
+        ValueError: (on access) If the record ends before the field
+    """
+
+    def __init__(self, waveform_data, start: int = 0):
+        self._data = waveform_data
+        self._start = start
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        if key not in _FIELD_STRUCTS:
+            raise KeyError(key)
+        offset, field = _FIELD_STRUCTS[key]
+        position = self._start + offset
+        if position + field.size > len(self._data):
+            raise ValueError(f"Waveform data too short for WAVEDESC field {key}: {len(self._data)} bytes")
+        values = field.unpack_from(self._data, position)
+        if key == 'TRIGGER_TIME':
+            value = dict(zip(_TIME_STAMP_KEYS, values))
+        elif isinstance(values[0], bytes):
+            value = values[0].split(b'\x00', 1)[0].decode('ascii', errors='ignore')
+        else:
+            value = values[0]
+        self._values[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._values[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from WAVEDESC_FIELDS
+        yield from (key for key in list(self._values) if key not in WAVEDESC_FIELDS)
+
+    def __len__(self) -> int:
+        return len(WAVEDESC_FIELDS) + sum(1 for key in self._values if key not in WAVEDESC_FIELDS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return all fields (and added keys) as a plain dict."""
+        return dict(self)
+
+    def __repr__(self) -> str:
+        return f"WaveDescriptor({self._values!r}, parsed {len(self._values)} of {len(self)})"
+
+
 class WaveformDecoder:
     """Simplified waveform decoder for oscilloscope data.
     
@@ -31,10 +230,13 @@ class WaveformDecoder:
     TEMPLATE_NAME_OFFSET = 16
     WAVE_DESCRIPTOR_OFFSET = 36
     USER_TEXT_OFFSET = 40
-    TRIGTIME_ARRAY_OFFSET = 44
+    TRIGTIME_ARRAY_OFFSET = 48
     RIS_TIME_ARRAY_OFFSET = 52
     WAVE_ARRAY_1_OFFSET = 60
     WAVE_ARRAY_COUNT_OFFSET = 116
+    FIRST_POINT_OFFSET = 132
+    SPARSING_FACTOR_OFFSET = 136
+    SUBARRAY_COUNT_OFFSET = 144
     COMM_TYPE_OFFSET = 32
     COMM_ORDER_OFFSET = 34
     VERTICAL_GAIN_OFFSET = 156
@@ -45,21 +247,33 @@ class WaveformDecoder:
     COMM_TYPE_BYTE = 0
     COMM_TYPE_WORD = 1
     
+    # Trigger time array entry per segment: TRIGGER_TIME, TRIGGER_OFFSET (doubles)
+    TRIGTIME_ENTRY = struct.Struct('<dd')
+    
     def __init__(self, waveform_data: bytes):
         """Initialize decoder with waveform binary data.
         
         Args:
-            waveform_data: Raw binary data from C1:WF? ALL command
+            waveform_data: Raw binary data from C1:WF? ALL command (bytes,
+                           bytearray or memoryview; it is not copied)
         """
         self.waveform_data = waveform_data
         self.wavedesc_start = 0
         
         # Find WAVEDESC start if not at beginning
-        if not waveform_data[:8].startswith(b'WAVEDESC'):
-            pos = waveform_data.find(b'WAVEDESC')
+        if bytes(waveform_data[:8]) != b'WAVEDESC':
+            # Searching a memoryview needs bytes-like find(); the header is near the start
+            search = waveform_data if hasattr(waveform_data, 'find') else bytes(waveform_data[:4096])
+            pos = search.find(b'WAVEDESC')
             if pos >= 0:
                 self.wavedesc_start = pos
     
+    def segment_count(self) -> int:
+        """Number of segments in the record (1 unless it is a sequence record)."""
+        if len(self.waveform_data) < self.wavedesc_start + self.SUBARRAY_COUNT_OFFSET + 4:
+            raise ValueError(f"Waveform data too short: {len(self.waveform_data)} bytes")
+        return max(self._parse_wavedesc()['SUBARRAY_COUNT'], 1)
+    
     def decode(self, vertical_gain: Optional[float] = None, vertical_offset: Optional[float] = None) -> Tuple[Dict, List[float], List[float]]:
         """Decode waveform data.
         
@@ -70,6 +284,103 @@ class WaveformDecoder:
         Returns:
             Tuple of (descriptor_dict, time_values, voltage_values)
         """
+        if numpy_available:
+            descriptor, time_axis, voltages = self.decode_arrays(vertical_gain, vertical_offset)
+            return descriptor, time_axis.tolist(), voltages.tolist()
+        
+        descriptor, data_array_start, num_points, data_size = self._locate_samples()
+        data_format = 'b' if data_size == 1 else 'h'
+        raw_data_points = struct.unpack_from(f'<{num_points}{data_format}', self.waveform_data, data_array_start)
+        vertical_gain, vertical_offset = self._scaling(descriptor, vertical_gain, vertical_offset)
+        voltage_values = [(vertical_gain * dp) / 25.0 - vertical_offset for dp in raw_data_points]
+        horiz_offset, horiz_interval = self._timing(descriptor)
+        time_values = [(i * horiz_interval) + horiz_offset for i in range(num_points)]
+        return descriptor, time_values, voltage_values
+    
+    def decode_arrays(self, vertical_gain: Optional[float] = None, vertical_offset: Optional[float] = None,
+                      dtype: str = 'float32') -> Tuple[Dict, TimeAxis, 'np.ndarray']:
+        """Decode waveform data into NumPy arrays without intermediate Python objects.
+        
+        Args:
+            vertical_gain: Optional vertical gain from C1:VDIV? command
+            vertical_offset: Optional vertical offset from C1:OFST? command
+            dtype: Floating point type of the returned voltages
+            
+        Returns:
+            Tuple of (descriptor_dict, TimeAxis, voltage ndarray)
+        
+        Raises:
+            ValueError: If the data is invalid
+            RuntimeError: If NumPy is not available
+        """
+        if not numpy_available:
+            raise RuntimeError("NumPy is required for array decoding")
+        descriptor, data_array_start, num_points, data_size = self._locate_samples()
+        # View the samples in place (int8/int16, little endian)
+        raw = np.frombuffer(self.waveform_data, dtype='<i1' if data_size == 1 else '<i2',
+                            count=num_points, offset=data_array_start)
+        vertical_gain, vertical_offset = self._scaling(descriptor, vertical_gain, vertical_offset)
+        
+        # Convert raw values to physical voltage values using:
+        # voltage = (vertical_gain * raw_value) / 25.0 - vertical_offset
+        # where:
+        # - vertical_gain is from C{channel}:VDIV? (V/div) or descriptor
+        # - vertical_offset is from C{channel}:OFST? (V) or descriptor
+        # - raw_value is the signed integer from the waveform data
+        # - The /25.0 factor converts the raw value to the correct scale
+        voltages = np.multiply(raw, vertical_gain / 25.0, dtype=dtype)
+        voltages -= vertical_offset
+        
+        time_axis = TimeAxis(*self._timing(descriptor), num_points)
+        return descriptor, time_axis, voltages
+    
+    def decode_segments(self, vertical_gain: Optional[float] = None, vertical_offset: Optional[float] = None,
+                        dtype: str = 'float32') -> Tuple[Dict, List[Tuple[TimeAxis, 'np.ndarray']]]:
+        """Decode a sequence acquisition record into its segments.
+        
+        The record's samples are decoded once (decode_arrays) and split into
+        SUBARRAY_COUNT equal segments (views, not copies). Each segment's time
+        axis starts at its TRIGGER_OFFSET from the trigger time array; the
+        trigger times (seconds after the first segment's trigger) are added
+        to the descriptor as 'TRIGGER_TIMES'. A normal record is one segment.
+        
+        Args:
+            vertical_gain: Optional vertical gain from C1:VDIV? command
+            vertical_offset: Optional vertical offset from C1:OFST? command
+            dtype: Floating point type of the returned voltages
+            
+        Returns:
+            Tuple of (descriptor_dict, list of (TimeAxis, voltage ndarray) per segment)
+        
+        Raises:
+            ValueError: If the data is invalid
+            RuntimeError: If NumPy is not available
+        """
+        descriptor, time_axis, voltages = self.decode_arrays(vertical_gain, vertical_offset, dtype)
+        count = max(descriptor['SUBARRAY_COUNT'], 1)
+        points = len(voltages) // count
+        
+        trigger_times = [0.0] * count
+        offsets = [time_axis.offset] * count
+        entries = descriptor['TRIGTIME_ARRAY'] // self.TRIGTIME_ENTRY.size
+        if entries >= count > 1:
+            start = self.wavedesc_start + descriptor['WAVE_DESCRIPTOR'] + descriptor['USER_TEXT']
+            for i in range(count):
+                trigger_times[i], trigger_offset = self.TRIGTIME_ENTRY.unpack_from(
+                    self.waveform_data, start + i * self.TRIGTIME_ENTRY.size)
+                offsets[i] = trigger_offset + descriptor.get('FIRST_POINT', 0) * descriptor['HORIZ_INTERVAL']
+        descriptor['TRIGGER_TIMES'] = trigger_times
+        
+        segments = [(TimeAxis(offsets[i], time_axis.interval, points), voltages[i * points:(i + 1) * points])
+                    for i in range(count)]
+        return descriptor, segments
+    
+    def _locate_samples(self) -> Tuple[Dict, int, int, int]:
+        """Parse the descriptor and locate the data array.
+        
+        Returns:
+            Tuple of (descriptor, data array start offset, number of points, bytes per point)
+        """
         if len(self.waveform_data) < self.wavedesc_start + 400:
             raise ValueError(f"Waveform data too short: {len(self.waveform_data)} bytes")
         
@@ -79,18 +390,17 @@ class WaveformDecoder:
         # Determine data format
         comm_type = descriptor['COMM_TYPE']
         if comm_type == self.COMM_TYPE_BYTE:
-            data_format = 'b'  # signed byte
-            data_size = 1
+            data_size = 1  # signed byte
         elif comm_type == self.COMM_TYPE_WORD:
-            data_format = 'h'  # signed short (16-bit)
-            data_size = 2
+            data_size = 2  # signed short (16-bit)
         else:
             raise ValueError(f"Unsupported COMM_TYPE: {comm_type}")
         
-        # Calculate data array start position
+        # Calculate data array start position (sequence records have a trigger time array first)
         wave_descriptor_length = descriptor['WAVE_DESCRIPTOR']
         user_text_length = descriptor['USER_TEXT']
-        data_array_start = (self.wavedesc_start + wave_descriptor_length + user_text_length)
+        data_array_start = (self.wavedesc_start + wave_descriptor_length + user_text_length +
+                            descriptor['TRIGTIME_ARRAY'] + descriptor['RIS_TIME_ARRAY'])
         
         # Extract data array
         wave_array_1_length = descriptor['WAVE_ARRAY_1']
@@ -102,18 +412,25 @@ class WaveformDecoder:
         if data_array_start > len(self.waveform_data) or data_length_to_use <= 0:
             raise ValueError(f"Invalid data array: start={data_array_start}, length={data_length_to_use}")
         
-        if data_length_to_use < actual_data_length:
-            wave_array_count = data_length_to_use // data_size
-        
-        data_array_bytes = self.waveform_data[data_array_start:data_array_start + data_length_to_use]
-        
-        # Unpack data points
-        num_points = min(wave_array_count, len(data_array_bytes) // data_size)
-        raw_data_points = struct.unpack(f'<{num_points}{data_format}', 
-                                       data_array_bytes[:num_points * data_size])
-        
-        # Use provided values from C{channel}:VDIV? and C{channel}:OFST? if available,
-        # otherwise fall back to descriptor values
+        num_points = min(wave_array_count, data_length_to_use // data_size)
+        return descriptor, data_array_start, num_points, data_size
+    
+    @staticmethod
+    def _timing(descriptor: Dict) -> Tuple[float, float]:
+        """Return (time of the first transferred point, interval between transferred points).
+
+        Records transferred with a waveform setup (WFSU) start at FIRST_POINT
+        and contain every SPARSING_FACTOR-th point; both are 0 for full records.
+        """
+        interval = descriptor['HORIZ_INTERVAL']
+        offset = descriptor['HORIZ_OFFSET'] + descriptor.get('FIRST_POINT', 0) * interval
+        return offset, interval * max(descriptor.get('SPARSING_FACTOR', 1), 1)
+    
+    @staticmethod
+    def _scaling(descriptor: Dict, vertical_gain: Optional[float],
+                 vertical_offset: Optional[float]) -> Tuple[float, float]:
+        """Use provided values from C{channel}:VDIV? and C{channel}:OFST? if available,
+        otherwise fall back to descriptor values."""
         if vertical_gain is None:
             vertical_gain = descriptor['VERTICAL_GAIN']
             logger.debug(f"Using VERTICAL_GAIN from descriptor: {vertical_gain}")
@@ -125,83 +442,8 @@ class WaveformDecoder:
             logger.debug(f"Using VERTICAL_OFFSET from descriptor: {vertical_offset}")
         else:
             logger.debug(f"Using vertical offset from OFST? query: {vertical_offset}")
-        
-        # Convert raw values to physical voltage values using:
-        # voltage = (vertical_gain * raw_value) / 25.0 - vertical_offset
-        # where:
-        # - vertical_gain is from C{channel}:VDIV? (V/div) or descriptor
-        # - vertical_offset is from C{channel}:OFST? (V) or descriptor
-        # - raw_value is the signed integer from the waveform data
-        # - The /25.0 factor converts the raw value to the correct scale
-        if numpy_available:
-            raw_data_array = np.array(raw_data_points, dtype=np.float32)
-            voltage_values = ((vertical_gain * raw_data_array) / 25.0 - vertical_offset).tolist()
-        else:
-            voltage_values = [(vertical_gain * dp) / 25.0 - vertical_offset for dp in raw_data_points]
-        
-        # Calculate time values
-        horiz_interval = descriptor['HORIZ_INTERVAL']
-        horiz_offset = descriptor['HORIZ_OFFSET']
-        
-        if numpy_available:
-            time_values = (np.arange(num_points, dtype=np.float64) * horiz_interval + horiz_offset).tolist()
-        else:
-            time_values = [(i * horiz_interval) + horiz_offset for i in range(num_points)]
-        
-        return descriptor, time_values, voltage_values
+        return vertical_gain, vertical_offset
     
-    def _parse_wavedesc(self) -> Dict:
-        """Parse WAVEDESC block from waveform data.
-        
-        Returns:
-            Dictionary with waveform descriptor fields
-        """
-        descriptor = {}
-        
-        # WAVE_DESCRIPTOR (long, 4 bytes at offset 36)
-        descriptor['WAVE_DESCRIPTOR'] = struct.unpack('<I',
-            self.waveform_data[self.wavedesc_start + self.WAVE_DESCRIPTOR_OFFSET:
-                              self.wavedesc_start + self.WAVE_DESCRIPTOR_OFFSET + 4])[0]
-        
-        # USER_TEXT (long, 4 bytes at offset 40)
-        descriptor['USER_TEXT'] = struct.unpack('<I',
-            self.waveform_data[self.wavedesc_start + self.USER_TEXT_OFFSET:
-                              self.wavedesc_start + self.USER_TEXT_OFFSET + 4])[0]
-        
-        # COMM_TYPE (short, 2 bytes at offset 32)
-        descriptor['COMM_TYPE'] = struct.unpack('<H',
-            self.waveform_data[self.wavedesc_start + self.COMM_TYPE_OFFSET:
-                              self.wavedesc_start + self.COMM_TYPE_OFFSET + 2])[0]
-        
-        # WAVE_ARRAY_1 (long, 4 bytes at offset 60)
-        descriptor['WAVE_ARRAY_1'] = struct.unpack('<I',
-            self.waveform_data[self.wavedesc_start + self.WAVE_ARRAY_1_OFFSET:
-                              self.wavedesc_start + self.WAVE_ARRAY_1_OFFSET + 4])[0]
-        
-        # WAVE_ARRAY_COUNT (long, 4 bytes at offset 116)
-        descriptor['WAVE_ARRAY_COUNT'] = struct.unpack('<I',
-            self.waveform_data[self.wavedesc_start + self.WAVE_ARRAY_COUNT_OFFSET:
-                              self.wavedesc_start + self.WAVE_ARRAY_COUNT_OFFSET + 4])[0]
-        
-        # VERTICAL_GAIN (float, 4 bytes at offset 156)
-        descriptor['VERTICAL_GAIN'] = struct.unpack('<f',
-            self.waveform_data[self.wavedesc_start + self.VERTICAL_GAIN_OFFSET:
-                              self.wavedesc_start + self.VERTICAL_GAIN_OFFSET + 4])[0]
-        
-        # VERTICAL_OFFSET (float, 4 bytes at offset 160)
-        descriptor['VERTICAL_OFFSET'] = struct.unpack('<f',
-            self.waveform_data[self.wavedesc_start + self.VERTICAL_OFFSET_OFFSET:
-                              self.wavedesc_start + self.VERTICAL_OFFSET_OFFSET + 4])[0]
-        
-        # HORIZ_INTERVAL (float, 4 bytes at offset 176)
-        descriptor['HORIZ_INTERVAL'] = struct.unpack('<f',
-            self.waveform_data[self.wavedesc_start + self.HORIZ_INTERVAL_OFFSET:
-                              self.wavedesc_start + self.HORIZ_INTERVAL_OFFSET + 4])[0]
-        
-        # HORIZ_OFFSET (double, 8 bytes at offset 180)
-        descriptor['HORIZ_OFFSET'] = struct.unpack('<d',
-            self.waveform_data[self.wavedesc_start + self.HORIZ_OFFSET_OFFSET:
-                              self.wavedesc_start + self.HORIZ_OFFSET_OFFSET + 8])[0]
-        
-        return descriptor
-
+    def _parse_wavedesc(self) -> WaveDescriptor:
+        """Return the WAVEDESC block of the record (fields are parsed on access)."""
+        return WaveDescriptor(self.waveform_data, self.wavedesc_start)
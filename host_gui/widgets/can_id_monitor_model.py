@@ -0,0 +1,160 @@
+"""
+Table model for the fixed "last value per CAN ID" Live Data view.
+
+Like the fixed trace of a bus analyser, the view shows one row per CAN ID
+(and per MessageType value for multiplexed messages) that is updated in
+place. Frames only update per-row statistics; the view is refreshed at a
+capped rate with one dataChanged notification, so refresh cost depends on
+the number of IDs rather than on the bus load.
+"""
+import bisect
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from PySide6 import QtCore
+
+from host_gui.constants import CAN_MUXED_IDS, CAN_MUX_BYTE_INDEX
+
+# Smoothing factor for period/jitter estimates (RFC 3550 style, 1/16)
+_EMA_ALPHA = 1.0 / 16.0
+
+
+class _IdStats:
+    """Per-row statistics for one CAN ID / mux value."""
+
+    __slots__ = ('count', 'last_ts', 'period', 'jitter', 'data')
+
+    def __init__(self):
+        self.count = 0
+        self.last_ts: Optional[float] = None
+        self.period: Optional[float] = None
+        self.jitter = 0.0
+        self.data = b''
+
+
+class CanIdMonitorModel(QtCore.QAbstractTableModel):
+    """Qt table model with one row per CAN ID (and mux value).
+
+    Columns: can_id, mux, dlc, data, count, period_ms, jitter_ms.
+    """
+
+    HEADERS = ('can_id', 'mux', 'dlc', 'data', 'count', 'period_ms', 'jitter_ms')
+
+    def __init__(self, muxed_ids: Optional[frozenset] = None, parent: Optional[QtCore.QObject] = None):
+        """Initialize the model.
+
+        Args:
+            muxed_ids: CAN IDs that get one row per MessageType value
+                (defaults to CAN_MUXED_IDS)
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self._muxed_ids = CAN_MUXED_IDS if muxed_ids is None else muxed_ids
+        self._keys: List[Tuple[int, int]] = []  # Sorted row keys (can_id, mux or -1)
+        self._stats: Dict[Tuple[int, int], _IdStats] = {}
+        self._new_keys: List[Tuple[int, int]] = []
+        self._dirty = False
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._keys)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation,
+                   role: int = QtCore.Qt.DisplayRole) -> Any:
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            if 0 <= section < len(self.HEADERS):
+                return self.HEADERS[section]
+        return None
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if not index.isValid() or index.row() >= len(self._keys):
+            return None
+        if role == QtCore.Qt.TextAlignmentRole and index.column() != 3:
+            return int(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        key = self._keys[index.row()]
+        st = self._stats[key]
+        col = index.column()
+        if col == 0:
+            return f"0x{key[0]:03X}"
+        if col == 1:
+            return str(key[1]) if key[1] >= 0 else ''
+        if col == 2:
+            return str(len(st.data))
+        if col == 3:
+            return st.data.hex(' ').upper()
+        if col == 4:
+            return str(st.count)
+        if col == 5:
+            return f"{st.period * 1000.0:.1f}" if st.period is not None else ''
+        if col == 6:
+            return f"{st.jitter * 1000.0:.2f}" if st.period is not None else ''
+        return None
+
+    def record_frames(self, frames: Sequence[Any]) -> None:
+        """Update per-ID statistics from a batch of frames (no view notification).
+
+        Args:
+            frames: Frames with can_id, data and timestamp attributes
+        """
+        stats = self._stats
+        muxed = self._muxed_ids
+        for frame in frames:
+            can_id = frame.can_id
+            data = frame.data if isinstance(frame.data, (bytes, bytearray)) else b''
+            mux = data[CAN_MUX_BYTE_INDEX] if can_id in muxed and len(data) > CAN_MUX_BYTE_INDEX else -1
+            key = (can_id, mux)
+            st = stats.get(key)
+            if st is None:
+                st = stats[key] = _IdStats()
+                self._new_keys.append(key)
+            ts = frame.timestamp
+            if ts is not None and st.last_ts is not None:
+                delta = ts - st.last_ts
+                if st.period is None:
+                    st.period = delta
+                else:
+                    st.jitter += (abs(delta - st.period) - st.jitter) * _EMA_ALPHA
+                    st.period += (delta - st.period) * _EMA_ALPHA
+            if ts is not None:
+                st.last_ts = ts
+            st.count += 1
+            st.data = bytes(data)
+        if frames:
+            self._dirty = True
+
+    def refresh(self) -> None:
+        """Push accumulated changes to attached views.
+
+        New IDs are inserted at their sorted position; all existing rows are
+        refreshed with one dataChanged notification. Cost is O(number of IDs).
+        """
+        if self._new_keys:
+            for key in self._new_keys:
+                row = bisect.bisect_left(self._keys, key)
+                self.beginInsertRows(QtCore.QModelIndex(), row, row)
+                self._keys.insert(row, key)
+                self.endInsertRows()
+            self._new_keys = []
+        if self._dirty and self._keys:
+            self._dirty = False
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._keys) - 1, len(self.HEADERS) - 1),
+                [QtCore.Qt.DisplayRole],
+            )
+
+    def clear(self) -> None:
+        """Remove all rows and statistics."""
+        self.beginResetModel()
+        self._keys = []
+        self._stats = {}
+        self._new_keys = []
+        self._dirty = False
+        self.endResetModel()
@@ -0,0 +1,154 @@
+"""
+Table model for the Live Data CAN frame view.
+
+The model keeps the most recent frames in a fixed-capacity ring buffer and
+renders cells lazily in data(), so adding a frame costs no widget items.
+Frames are appended in batches (once per GUI poll tick) with a single
+beginInsertRows/endInsertRows pair, which keeps the view interactive under
+several thousand frames per second.
+"""
+import threading
+from typing import Any, List, Optional, Sequence
+
+from PySide6 import QtCore
+
+
+class FrameTableModel(QtCore.QAbstractTableModel):
+    """Qt table model over a fixed-capacity ring buffer of CAN frames.
+
+    Columns match the legacy QTableWidget layout: ts, can_id, len, data.
+
+    Attributes:
+        HEADERS: Column header labels
+    """
+
+    HEADERS = ('ts', 'can_id', 'len', 'data')
+
+    def __init__(self, capacity: int, parent: Optional[QtCore.QObject] = None):
+        """Initialize the model.
+
+        Args:
+            capacity: Maximum number of frames kept (oldest frames are dropped)
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        if capacity < 1:
+            raise ValueError(f"Frame table capacity must be >= 1, got {capacity}")
+        self._capacity = int(capacity)
+        self._buf: List[Any] = [None] * self._capacity
+        self._start = 0  # Ring index of row 0
+        self._count = 0
+        # Guards the ring against readers on other threads (e.g. TestRunner)
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of frames kept in the model."""
+        return self._capacity
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._count
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation,
+                   role: int = QtCore.Qt.DisplayRole) -> Any:
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            if 0 <= section < len(self.HEADERS):
+                return self.HEADERS[section]
+        return None
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        if row >= self._count:
+            return None
+        frame = self._buf[(self._start + row) % self._capacity]
+        return self._format_cell(frame, index.column())
+
+    @staticmethod
+    def _format_cell(frame: Any, column: int) -> str:
+        """Format one cell of a frame row (only called for visible cells)."""
+        data = getattr(frame, 'data', b'')
+        is_bytes = isinstance(data, (bytes, bytearray))
+        if column == 0:
+            return str(getattr(frame, 'timestamp', ''))
+        if column == 1:
+            return str(getattr(frame, 'can_id', ''))
+        if column == 2:
+            return str(len(data)) if is_bytes else ''
+        if column == 3:
+            return data.hex() if is_bytes else str(data)
+        return ''
+
+    def append_frames(self, frames: Sequence[Any]) -> None:
+        """Append a batch of frames, dropping the oldest rows beyond capacity.
+
+        Emits at most one row-removal and one row-insertion notification per
+        call, so callers should batch all frames received in a poll tick.
+
+        Args:
+            frames: Frames with can_id, data and timestamp attributes
+        """
+        n = len(frames)
+        if n == 0:
+            return
+        cap = self._capacity
+
+        if n >= cap:
+            # Batch alone fills the buffer - cheaper to reset than to shift
+            self.beginResetModel()
+            with self._lock:
+                self._buf = list(frames[n - cap:])
+                self._start = 0
+                self._count = cap
+            self.endResetModel()
+            return
+
+        overflow = self._count + n - cap
+        if overflow > 0:
+            self.beginRemoveRows(QtCore.QModelIndex(), 0, overflow - 1)
+            with self._lock:
+                for i in range(overflow):
+                    self._buf[(self._start + i) % cap] = None
+                self._start = (self._start + overflow) % cap
+                self._count -= overflow
+            self.endRemoveRows()
+
+        first = self._count
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + n - 1)
+        with self._lock:
+            end = self._start + self._count
+            for i, frame in enumerate(frames):
+                self._buf[(end + i) % cap] = frame
+            self._count += n
+        self.endInsertRows()
+
+    def frame_at(self, row: int) -> Optional[Any]:
+        """Return the frame shown at a given row, or None if out of range."""
+        with self._lock:
+            if not 0 <= row < self._count:
+                return None
+            return self._buf[(self._start + row) % self._capacity]
+
+    def recent_frames(self, count: int) -> List[Any]:
+        """Return up to ``count`` most recent frames, oldest first (thread-safe)."""
+        with self._lock:
+            n = min(count, self._count)
+            first = self._start + self._count - n
+            return [self._buf[(first + i) % self._capacity] for i in range(n)]
+
+    def clear(self) -> None:
+        """Remove all frames."""
+        self.beginResetModel()
+        with self._lock:
+            self._buf = [None] * self._capacity
+            self._start = 0
+            self._count = 0
+        self.endResetModel()
@@ -0,0 +1,237 @@
+"""
+Blitting live-plot engine for matplotlib canvases.
+
+The static part of the figure (axes, grid, labels, legend, y=x reference
+line) is rendered once and cached as a background bitmap. On each update
+only the points added since the previous update are drawn on top of the
+cached bitmap and the result is blitted to the screen, so the cost of an
+update does not grow with the number of points already shown.
+
+Axis limits grow with hysteresis: when new data leaves the view, the view
+is extended with headroom beyond the data range, so a full redraw happens
+only occasionally instead of on every point. Full redraws plot series
+decimated to display resolution.
+"""
+import logging
+import math
+from typing import Any, Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PySide6 import QtCore
+except ImportError:
+    QtCore = None
+
+from host_gui.utils.decimation import DEFAULT_MAX_POINTS, decimate_for_display
+
+# Fraction of the data span added beyond the data when the view must grow
+LIVE_PLOT_HEADROOM = 0.5
+
+
+class _Bounds:
+    """Running data bounds of one axes."""
+
+    __slots__ = ('xmin', 'xmax', 'ymin', 'ymax')
+
+    def __init__(self):
+        self.xmin = self.ymin = math.inf
+        self.xmax = self.ymax = -math.inf
+
+    def add(self, x: Any, y: Any) -> None:
+        try:
+            x = float(x)
+            y = float(y)
+        except (TypeError, ValueError):
+            return
+        if not (math.isfinite(x) and math.isfinite(y)):
+            return
+        if x < self.xmin:
+            self.xmin = x
+        if x > self.xmax:
+            self.xmax = x
+        if y < self.ymin:
+            self.ymin = y
+        if y > self.ymax:
+            self.ymax = y
+
+    @property
+    def empty(self) -> bool:
+        return self.xmin > self.xmax
+
+
+def _attached(artist: Any) -> bool:
+    """Return True if the artist is still part of a figure (not cleared)."""
+    return getattr(artist, 'axes', None) is not None and getattr(artist, 'figure', None) is not None
+
+
+class LivePlot:
+    """Blit manager for Line2D artists whose data only grows.
+
+    Callers keep updating the artists with set_data() (full data) and call
+    update(); the engine works out which points are new.
+
+    Attributes:
+        full_draws: Number of full canvas redraws performed by update()
+        blits: Number of incremental (blitted) updates
+    """
+
+    def __init__(self, canvas: Any, artists: Sequence[Any], headroom: float = LIVE_PLOT_HEADROOM,
+                 max_points: int = DEFAULT_MAX_POINTS):
+        """Initialize the engine and mark the artists as animated.
+
+        Args:
+            canvas: matplotlib FigureCanvas (Agg based, e.g. FigureCanvasQTAgg)
+            artists: Line2D artists to update incrementally
+            headroom: Fraction of the data span added when the view grows
+            max_points: Display budget per artist for full redraws (min/max decimation)
+        """
+        self.canvas = canvas
+        self.artists: List[Any] = list(artists)
+        self.headroom = headroom
+        self.max_points = max_points
+        self.full_draws = 0
+        self.blits = 0
+        self._seen = [0] * len(self.artists)  # Points included in the bounds
+        self._committed = [0] * len(self.artists)  # Points rendered into the background
+        self._bounds: Dict[Any, _Bounds] = {}
+        self._limits_set = set()
+        self._background = None
+        for artist in self.artists:
+            artist.set_animated(True)
+        self._cid = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def tracks(self, artists: Sequence[Any]) -> bool:
+        """Return True if this engine manages exactly the given artists."""
+        return len(artists) == len(self.artists) and all(a is b for a, b in zip(artists, self.artists))
+
+    def close(self) -> None:
+        """Disconnect from the canvas and return the artists to normal drawing."""
+        try:
+            self.canvas.mpl_disconnect(self._cid)
+        except Exception:
+            pass
+        for artist in self.artists:
+            try:
+                artist.set_animated(False)
+            except Exception:
+                pass
+        self._background = None
+
+    def reset(self) -> None:
+        """Forget data bounds and view limits (e.g. after the data was replaced)."""
+        self._seen = [0] * len(self.artists)
+        self._committed = [0] * len(self.artists)
+        self._bounds = {}
+        self._limits_set = set()
+        self._background = None
+
+    def update(self) -> None:
+        """Show points added since the last update (blit, or full redraw on rescale)."""
+        rescale = False
+        for i, artist in enumerate(self.artists):
+            if not _attached(artist):
+                continue
+            xs = artist.get_xdata(orig=True)
+            ys = artist.get_ydata(orig=True)
+            n = min(len(xs), len(ys))
+            if n < self._seen[i]:
+                # Data was replaced rather than extended - start over
+                self.reset()
+                return self.update()
+            bounds = self._bounds.setdefault(artist.axes, _Bounds())
+            for j in range(self._seen[i], n):
+                bounds.add(xs[j], ys[j])
+            self._seen[i] = n
+        for ax, bounds in self._bounds.items():
+            if self._grow_limits(ax, bounds):
+                rescale = True
+
+        if rescale or self._background is None:
+            # Full redraw; _on_draw recaches the background including all points
+            self.full_draws += 1
+            self.canvas.draw()
+            return
+
+        figure = self.canvas.figure
+        drew = False
+        self.canvas.restore_region(self._background)
+        for i, artist in enumerate(self.artists):
+            if not _attached(artist) or self._seen[i] <= self._committed[i]:
+                continue
+            xs = artist.get_xdata(orig=True)
+            ys = artist.get_ydata(orig=True)
+            # Start one point back so connecting line segments stay continuous
+            start = max(self._committed[i] - 1, 0)
+            artist.set_data(xs[start:self._seen[i]], ys[start:self._seen[i]])
+            try:
+                artist.axes.draw_artist(artist)
+            finally:
+                artist.set_data(xs, ys)
+            self._committed[i] = self._seen[i]
+            drew = True
+        if not drew:
+            return
+        self._background = self.canvas.copy_from_bbox(figure.bbox)
+        self.blits += 1
+        self._present()
+
+    def _grow_limits(self, ax: Any, bounds: _Bounds) -> bool:
+        """Extend the view of ``ax`` if the data left it. Returns True if limits changed."""
+        if bounds.empty:
+            return False
+        first = ax not in self._limits_set
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        if not first and x0 <= bounds.xmin and bounds.xmax <= x1 and y0 <= bounds.ymin and bounds.ymax <= y1:
+            return False
+        ax.set_xlim(*self._padded(bounds.xmin, bounds.xmax, None if first else (x0, x1)))
+        ax.set_ylim(*self._padded(bounds.ymin, bounds.ymax, None if first else (y0, y1)))
+        self._limits_set.add(ax)
+        return True
+
+    def _padded(self, lo: float, hi: float, current: Any) -> tuple:
+        """Return data range [lo, hi] with headroom, never shrinking ``current``."""
+        span = hi - lo
+        pad = self.headroom * span if span > 0 else (abs(hi) * self.headroom or 1.0)
+        if current is None:
+            return lo - pad, hi + pad
+        cur_lo, cur_hi = current
+        new_lo = cur_lo if lo >= cur_lo else lo - pad
+        new_hi = cur_hi if hi <= cur_hi else hi + pad
+        return new_lo, new_hi
+
+    def _on_draw(self, event: Any) -> None:
+        """Recache the background after any full draw and render all points into it."""
+        try:
+            figure = self.canvas.figure
+            for i, artist in enumerate(self.artists):
+                if _attached(artist):
+                    xs = artist.get_xdata(orig=True)
+                    ys = artist.get_ydata(orig=True)
+                    shown_x, shown_y = decimate_for_display(xs, ys, self.max_points)
+                    if shown_x is not xs:
+                        artist.set_data(shown_x, shown_y)
+                    try:
+                        artist.axes.draw_artist(artist)
+                    finally:
+                        if shown_x is not xs:
+                            artist.set_data(xs, ys)
+                    self._committed[i] = min(len(xs), len(ys))
+            self._background = self.canvas.copy_from_bbox(figure.bbox)
+        except Exception as e:
+            self._background = None
+            logger.debug(f"LivePlot: failed to cache background: {e}")
+
+    def _present(self) -> None:
+        """Push the updated buffer to the screen."""
+        canvas = self.canvas
+        if QtCore is not None and hasattr(canvas, 'thread') and hasattr(canvas, 'update'):
+            try:
+                if QtCore.QThread.currentThread() != canvas.thread():
+                    # repaint() is only allowed on the GUI thread; schedule a paint instead
+                    canvas.update()
+                    return
+            except Exception:
+                pass
+        canvas.blit(canvas.figure.bbox)
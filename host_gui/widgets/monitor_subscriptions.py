@@ -0,0 +1,131 @@
+"""
+Push-based subscriptions for the Real-Time Monitoring panel.
+
+Monitor labels register interest in signal handles ("message_id:signal_name",
+the SignalValue key). The decode path offers every decoded batch to the
+registry, which keeps only values that changed for subscribed handles.
+flush() is called once per display refresh and emits all pending changes
+through one batched Qt signal, so labels without traffic cost nothing and
+displayed values lag by at most one refresh interval.
+"""
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from PySide6 import QtCore
+
+
+def make_signal_handle(message_id: Any, signal_name: str) -> Optional[str]:
+    """Build the handle of a signal as used by SignalValue.key.
+
+    Args:
+        message_id: CAN message ID (int, or decimal/hex string from test config)
+        signal_name: DBC signal name
+
+    Returns:
+        "message_id:signal_name" string, or None if the inputs are unusable
+    """
+    if message_id is None or not signal_name:
+        return None
+    try:
+        can_id = int(message_id, 0) if isinstance(message_id, str) else int(message_id)
+    except (TypeError, ValueError):
+        return None
+    return f"{can_id}:{signal_name}"
+
+
+class MonitorSubscriptions(QtCore.QObject):
+    """Registry mapping signal handles to monitor label keys.
+
+    Signals:
+        values_changed: Emitted by flush() with {label_key: value} for every
+            label whose subscribed signal changed since the previous flush
+    """
+
+    values_changed = QtCore.Signal(dict)
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._subscribers: Dict[str, List[str]] = {}  # handle -> label keys
+        self._last_values: Dict[str, Any] = {}  # label key -> last pushed value
+        self._pending: Dict[str, Any] = {}
+        # Monitors are (re)configured from the test thread as well
+        self._lock = threading.Lock()
+
+    def subscribe(self, label_key: str, message_id: Any, signal_name: str) -> bool:
+        """Register a monitor label for updates of one signal.
+
+        Args:
+            label_key: Monitor label key (e.g. 'dut_dc_bus_voltage')
+            message_id: CAN message ID carrying the signal
+            signal_name: DBC signal name
+
+        Returns:
+            True if the subscription was registered
+        """
+        handle = make_signal_handle(message_id, signal_name)
+        if handle is None:
+            return False
+        with self._lock:
+            keys = self._subscribers.setdefault(handle, [])
+            if label_key not in keys:
+                keys.append(label_key)
+        return True
+
+    def clear(self) -> None:
+        """Drop all subscriptions and pending changes."""
+        with self._lock:
+            self._subscribers = {}
+            self._last_values = {}
+            self._pending = {}
+
+    def has_subscriptions(self) -> bool:
+        """Return True if any label is subscribed."""
+        return bool(self._subscribers)
+
+    def offer(self, signal_values: Iterable[Any]) -> None:
+        """Record changed values of subscribed signals from a decoded batch.
+
+        Costs one dict lookup per decoded signal; nothing is done for signals
+        without subscribers.
+
+        Args:
+            signal_values: SignalValue objects (key and value attributes)
+        """
+        subscribers = self._subscribers
+        if not subscribers:
+            return
+        with self._lock:
+            last = self._last_values
+            for sig_val in signal_values:
+                keys = subscribers.get(sig_val.key)
+                if not keys:
+                    continue
+                value = sig_val.value
+                for label_key in keys:
+                    if label_key in last and last[label_key] == value:
+                        continue
+                    last[label_key] = value
+                    self._pending[label_key] = value
+
+    def push(self, label_key: str, value: Any) -> None:
+        """Queue a value for one label directly (e.g. a cached value on subscribe)."""
+        if value is None:
+            return
+        with self._lock:
+            if label_key in self._last_values and self._last_values[label_key] == value:
+                return
+            self._last_values[label_key] = value
+            self._pending[label_key] = value
+
+    def flush(self) -> int:
+        """Emit pending changes as one values_changed batch.
+
+        Returns:
+            Number of labels in the emitted batch (0 if nothing changed)
+        """
+        if not self._pending:
+            return 0
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        self.values_changed.emit(batch)
+        return len(batch)
@@ -0,0 +1,127 @@
+"""
+Table model for the Signal View (decoded DBC signals).
+
+The model stores the latest value of every decoded signal and records which
+rows changed in a dirty set. Decoding only updates that state; views are
+notified at a fixed display rate by refresh(), which emits one dataChanged
+for the changed range. Cells are formatted lazily for visible rows only, so
+CPU spent on the signal table is bounded regardless of the frame rate.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from PySide6 import QtCore
+
+
+class SignalTableModel(QtCore.QAbstractTableModel):
+    """Qt table model holding the latest value per decoded signal.
+
+    Columns match the legacy QTableWidget layout: ts, message, can_id, signal, value.
+    """
+
+    HEADERS = ('ts', 'message', 'can_id', 'signal', 'value')
+    COL_TS = 0
+    COL_VALUE = 4
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        # Row entries: [timestamp, message_name, can_id, signal_name, value]
+        self._rows: List[list] = []
+        self._row_of: Dict[str, int] = {}
+        self._pending: List[list] = []
+        self._dirty: Set[int] = set()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation,
+                   role: int = QtCore.Qt.DisplayRole) -> Any:
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            if 0 <= section < len(self.HEADERS):
+                return self.HEADERS[section]
+        return None
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        if row >= len(self._rows):
+            return None
+        entry = self._rows[row]
+        col = index.column()
+        if col == self.COL_TS:
+            ts = entry[0]
+            try:
+                return datetime.fromtimestamp(ts).isoformat()
+            except Exception:
+                return str(ts)
+        value = entry[col]
+        return '' if value is None else str(value)
+
+    def update_signals(self, signal_values: Iterable[Any], default_ts: Optional[float] = None) -> None:
+        """Store the latest values of decoded signals (no view notification).
+
+        Args:
+            signal_values: SignalValue objects (key, message_name, message_id,
+                signal_name, value, timestamp)
+            default_ts: Timestamp used for signals without one
+        """
+        row_of = self._row_of
+        rows = self._rows
+        for sig_val in signal_values:
+            key = sig_val.key
+            ts = sig_val.timestamp or default_ts
+            row = row_of.get(key)
+            if row is None:
+                entry = [ts, sig_val.message_name or '', sig_val.message_id, sig_val.signal_name, sig_val.value]
+                # New rows are appended after the pending ones on refresh()
+                row_of[key] = len(rows) + len(self._pending)
+                self._pending.append(entry)
+            elif row < len(rows):
+                entry = rows[row]
+                entry[0] = ts
+                entry[4] = sig_val.value
+                self._dirty.add(row)
+            else:
+                entry = self._pending[row - len(rows)]
+                entry[0] = ts
+                entry[4] = sig_val.value
+
+    def get_row(self, key: str) -> Optional[int]:
+        """Return the row of a signal key ("message_id:signal_name"), if shown."""
+        row = self._row_of.get(key)
+        return row if row is not None and row < len(self._rows) else None
+
+    def refresh(self) -> None:
+        """Notify views of all changes since the last refresh.
+
+        Appends new signals with one row insertion and emits one dataChanged
+        covering the ts/value columns of the changed rows.
+        """
+        if self._pending:
+            first = len(self._rows)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(self._pending) - 1)
+            self._rows.extend(self._pending)
+            self._pending = []
+            self.endInsertRows()
+        if self._dirty:
+            top, bottom = min(self._dirty), max(self._dirty)
+            self._dirty.clear()
+            self.dataChanged.emit(self.index(top, self.COL_TS), self.index(bottom, self.COL_VALUE),
+                                  [QtCore.Qt.DisplayRole])
+
+    def clear(self) -> None:
+        """Remove all signals."""
+        self.beginResetModel()
+        self._rows = []
+        self._row_of = {}
+        self._pending = []
+        self._dirty = set()
+        self.endResetModel()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark the oscilloscope path against the built-in scope simulator.
+
+Runs the steps of a phase current test through OscilloscopeService on a
+SimulatedScope with a fixed bus latency and bandwidth: applying the
+configuration (cold and cached), and per setpoint setting VDIV, running and
+stopping the acquisition, querying PAVA MEAN and transferring and analysing
+both phase channels. Results are reproducible, so they can be compared
+between commits and on CI.
+
+Usage:
+    python scripts/benchmark_scope_path.py
+    python scripts/benchmark_scope_path.py --latency-ms 1 --bandwidth-mbps 40 --points 1400000
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from host_gui.constants import OSC_SIMULATOR_RESOURCE
+from host_gui.services.oscilloscope_service import OscilloscopeService
+from host_gui.utils.waveform_analysis import analyze_waveform_steady_state
+
+CONFIG = {
+    'channels': {
+        'CH1': {'enabled': True, 'probe_attenuation': 1.0, 'unit': 'A'},
+        'CH2': {'enabled': True, 'probe_attenuation': 1.0, 'unit': 'A'},
+        'CH3': {'enabled': False, 'probe_attenuation': 1.0, 'unit': 'V'},
+        'CH4': {'enabled': False, 'probe_attenuation': 1.0, 'unit': 'V'},
+    },
+    'acquisition': {'timebase_ms': 10.0},
+}
+
+
+def timed(label: str, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<34} {elapsed * 1000:9.1f} ms")
+    return result, elapsed
+
+
+def run_setpoint(service: OscilloscopeService, iq_ref: float, max_points: int) -> None:
+    scope = service.session.instrument
+    for channel in (1, 2):
+        scope.set_signal(channel, level=0.8 * iq_ref, noise=0.02 * abs(iq_ref) + 0.01, step_at=0.3)
+    service.send_command(f"C1:VDIV {max(abs(iq_ref) / 4, 0.01):.2f}")
+    service.send_command("TRMD AUTO")
+    service.send_command("STOP")
+    service.query_pava_mean(1)
+    for channel in (1, 2):
+        record = service.read_waveform(channel, max_points=max_points)
+        analyze_waveform_steady_state(record, label=f"CH{channel}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--points', type=int, default=140_000, help='Acquired points per channel (default 140k)')
+    parser.add_argument('--max-points', type=int, default=0, help='Points transferred per waveform (0 = all)')
+    parser.add_argument('--latency-ms', type=float, default=0.5, help='Bus latency per write and read')
+    parser.add_argument('--bandwidth-mbps', type=float, default=10.0,
+                        help='Bus throughput in MB/s (0 = unlimited)')
+    parser.add_argument('--setpoints', type=int, default=5, help='Setpoints in the simulated sweep')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        service = OscilloscopeService(cache_path=str(Path(cache_dir) / 'resources.json'))
+        if not service.connect(OSC_SIMULATOR_RESOURCE):
+            print("Could not open the oscilloscope simulator")
+            return 1
+        scope = service.session.instrument
+        scope.points = args.points
+        scope.latency_s = args.latency_ms / 1000.0
+        scope.bandwidth_bps = args.bandwidth_mbps * 1e6
+
+        print(f"Simulated scope: {args.points:,} points, {args.latency_ms} ms latency, "
+              f"{args.bandwidth_mbps} MB/s")
+        timed("apply_configuration (cold)", service.apply_configuration, CONFIG)
+        timed("apply_configuration (cached)", service.apply_configuration, CONFIG)
+        run_setpoint(service, 1.0, args.max_points)  # warm-up: imports and filter design
+        total = 0.0
+        for step in range(args.setpoints):
+            iq_ref = 5.0 * (step + 1)
+            _, elapsed = timed(f"setpoint Iq_ref={iq_ref:g} A", run_setpoint, service, iq_ref, args.max_points)
+            total += elapsed
+        print(f"  {'sweep total':<34} {total * 1000:9.1f} ms  ({len(scope.writes)} program messages, "
+              f"last transfer {service.last_transfer_stats.mb_per_s:.1f} MB/s)")
+        service.disconnect()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark steady-state detection (analyze_steady_state_can) on long waveforms.
+
+Times the prefix-sum implementation on synthetic 1M-point captures (ramp,
+plateau with noise, quantized plateau) and, with --compare, the previous
+per-window implementation (np.mean/np.std of every window) on the same data,
+checking that both select the same region.
+
+Usage:
+    python scripts/benchmark_steady_state.py
+    python scripts/benchmark_steady_state.py --points 1000000 --compare
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from host_gui.utils.signal_analysis import analyze_steady_state_can
+
+
+def legacy_analyze_steady_state(values, window_size=None, variance_threshold_percent=5.0,
+                                skip_initial_percent=30.0):
+    """Previous O(N * window) implementation (NumPy path), kept for comparison."""
+    values_array = np.asarray(values, dtype=np.float64)
+    num_points = len(values_array)
+    if window_size is None:
+        window_size = max(10, min(2000, num_points // 100))
+    search_start = max(int(num_points * skip_initial_percent / 100.0), window_size)
+    search_end = num_points - window_size
+    if search_start >= search_end:
+        search_start, search_end = window_size, num_points - window_size
+    if search_start >= search_end:
+        search_start, search_end = 0, num_points
+
+    def cv(mean, std, reference):
+        return abs(std / mean) * 100 if abs(reference) > 1e-10 else std * 100
+
+    best_start, best_variance, best_mean = search_start, float('inf'), 0.0
+    for start_idx in range(search_start, search_end):
+        window = values_array[start_idx:start_idx + window_size]
+        mean, std = float(np.mean(window)), float(np.std(window))
+        if cv(mean, std, mean) < variance_threshold_percent and std < best_variance:
+            best_variance, best_start, best_mean = std, start_idx, mean
+    if best_variance == float('inf'):
+        for start_idx in range(search_start, search_end):
+            window = values_array[start_idx:start_idx + window_size]
+            std = float(np.std(window))
+            if std < best_variance:
+                best_variance, best_start, best_mean = std, start_idx, float(np.mean(window))
+
+    steady_start, steady_end = best_start, best_start + window_size
+    for i in range(best_start - 1, max(0, best_start - window_size), -1):
+        window = values_array[i:steady_end]
+        if cv(float(np.mean(window)), float(np.std(window)), best_mean) < variance_threshold_percent * 1.5:
+            steady_start = i
+        else:
+            break
+    for i in range(steady_end, min(num_points, steady_end + window_size)):
+        window = values_array[steady_start:i + 1]
+        if cv(float(np.mean(window)), float(np.std(window)), best_mean) < variance_threshold_percent * 1.5:
+            steady_end = i + 1
+        else:
+            break
+    steady = values_array[steady_start:steady_end]
+    return steady_start, steady_end, float(np.mean(steady)), float(np.std(steady))
+
+
+def make_signals(points: int):
+    """Synthetic captures: (name, values)."""
+    rng = np.random.default_rng(0)
+    ramp = points // 5
+    plateau = np.concatenate((np.linspace(0.0, 10.0, ramp), 10.0 + rng.normal(0, 0.05, points - ramp)))
+    # 8-bit scope samples: many windows with identical statistics
+    quantized = (np.round(plateau * 25.0 / 2.0) * 2.0 / 25.0).astype(np.float32)
+    noisy = rng.normal(0.0, 1.0, points)  # no window meets the CV threshold (fallback pass)
+    return [('ramp + plateau', plateau), ('quantized float32', quantized), ('zero-mean noise', noisy)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--points', type=int, default=1_000_000, help='Samples per capture (default 1M)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best is reported)')
+    parser.add_argument('--compare', action='store_true',
+                        help='Also run the previous per-window implementation (slow: minutes at 1M points)')
+    args = parser.parse_args()
+
+    print(f"analyze_steady_state_can, {args.points:,} points")
+    for name, values in make_signals(args.points):
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = analyze_steady_state_can(None, values)
+            best = min(best, time.perf_counter() - start)
+        line = f"  {name:<20} {best * 1000:9.1f} ms  region [{result[0]}, {result[1]}) avg={result[2]:.4f}"
+        if args.compare:
+            start = time.perf_counter()
+            legacy = legacy_analyze_steady_state(values)
+            legacy_s = time.perf_counter() - start
+            same = legacy[:2] == result[:2] and abs(legacy[2] - result[2]) < 1e-9
+            line += f" | previous {legacy_s:8.2f} s ({legacy_s / best:,.0f}x) {'same' if same else 'DIFFERENT'}"
+        print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark the shared waveform analysis library from 10k to 10M points.
+
+Builds synthetic C1:WF? ALL records (8-bit samples of a ramp-up, noisy
+plateau and ramp-down over a 140 ms capture) and times each stage of
+host_gui.utils that the application and the scripts use: WAVEDESC access
+(the fields decoding needs, and all fields), decode_arrays, the 10 kHz
+low-pass filter (full rate and lowpass_decimate), analyze_steady_state_can,
+detect_steady_state_regions on two phase signals, robust_statistics and the
+complete analyze_waveform_steady_state. The best of --repeat runs is shown.
+
+Usage:
+    python scripts/benchmark_waveform_analysis.py
+    python scripts/benchmark_waveform_analysis.py --sizes 10000 1000000 --repeat 5
+"""
+import argparse
+import logging
+import struct
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from host_gui.utils.signal_analysis import analyze_steady_state_can, detect_steady_state_regions, robust_statistics
+from host_gui.utils.signal_processing import apply_lowpass_filter, lowpass_decimate
+from host_gui.utils.waveform_analysis import analyze_waveform_steady_state
+from host_gui.utils.waveform_decoder import WaveDescriptor, WaveformDecoder
+
+CAPTURE_S = 0.14  # 10 ms/div over 14 divisions
+VOLTS_PER_DIV = 2.0
+
+
+def make_record(points: int, seed: int = 0) -> bytes:
+    """Synthetic WF? ALL record: 20 % ramp-up, 60 % plateau at 8 V, 20 % ramp-down."""
+    rng = np.random.default_rng(seed)
+    ramp = points // 5
+    profile = np.concatenate((np.linspace(0.0, 8.0, ramp), np.full(points - 2 * ramp, 8.0),
+                              np.linspace(8.0, 0.0, ramp)))
+    codes = np.clip(np.rint((profile + rng.normal(0.0, 0.1, points)) * 25.0 / VOLTS_PER_DIV), -128, 127)
+    desc = bytearray(346)
+    desc[0:8] = b'WAVEDESC'
+    desc[76:84] = b'SDS1104X'
+    struct.pack_into('<I', desc, WaveformDecoder.WAVE_DESCRIPTOR_OFFSET, len(desc))
+    struct.pack_into('<I', desc, WaveformDecoder.WAVE_ARRAY_1_OFFSET, points)
+    struct.pack_into('<I', desc, WaveformDecoder.WAVE_ARRAY_COUNT_OFFSET, points)
+    struct.pack_into('<f', desc, WaveformDecoder.VERTICAL_GAIN_OFFSET, VOLTS_PER_DIV)
+    struct.pack_into('<f', desc, WaveformDecoder.HORIZ_INTERVAL_OFFSET, CAPTURE_S / points)
+    return bytes(desc) + codes.astype(np.int8).tobytes()
+
+
+def best_of(repeat: int, func, *args, setup=None):
+    """Best wall time of func(*args) (setup() output is appended to args and not timed)."""
+    best = float('inf')
+    for _ in range(repeat):
+        call_args = args + (setup(),) if setup else args
+        start = time.perf_counter()
+        func(*call_args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_size(points: int, repeat: int) -> dict:
+    record = make_record(points)
+    descriptor, time_axis, volts = WaveformDecoder(record).decode_arrays()
+    phase_v = volts.astype(np.float64)
+    phase_w = -phase_v
+    timestamps = np.asarray(time_axis)
+
+    def decode_fields(data):
+        d = WaveDescriptor(data)
+        return d['COMM_TYPE'], d['WAVE_ARRAY_COUNT'], d['VERTICAL_GAIN'], d['HORIZ_INTERVAL']
+
+    return {
+        'WAVEDESC (decode fields)': best_of(repeat, decode_fields, record),
+        'WAVEDESC (all fields)': best_of(repeat, lambda data: WaveDescriptor(data).to_dict(), record),
+        'decode_arrays': best_of(repeat, lambda data: WaveformDecoder(data).decode_arrays(), record),
+        'apply_lowpass_filter': best_of(
+            repeat, lambda values: apply_lowpass_filter(time_axis, values, 10000.0, inplace=True),
+            setup=volts.copy),
+        'lowpass_decimate': best_of(repeat, lowpass_decimate, time_axis, volts),
+        'analyze_steady_state_can': best_of(repeat, analyze_steady_state_can, time_axis, volts),
+        'detect_steady_state_regions': best_of(repeat, detect_steady_state_regions, [phase_v, phase_w], timestamps),
+        'robust_statistics': best_of(repeat, robust_statistics, volts),
+        'analyze_waveform_steady_state': best_of(repeat, analyze_waveform_steady_state, record),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000, 10_000_000],
+                        help='Points per record (default 10k 100k 1M 10M)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best is reported)')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger('host_gui').setLevel(logging.ERROR)
+
+    run_size(10_000, 1)  # warm-up: imports and filter design
+    results = {points: run_size(points, args.repeat) for points in args.sizes}
+    stages = list(next(iter(results.values())))
+    print(f"{'stage (ms)':<32}" + ''.join(f"{points:>14,}" for points in args.sizes))
+    for stage in stages:
+        print(f"{stage:<32}" + ''.join(f"{results[points][stage] * 1000:14.2f}" for points in args.sizes))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
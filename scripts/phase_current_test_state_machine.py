@@ -21,14 +21,6 @@ from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Import numpy for optimized array operations (optional but recommended)
-try:
-    import numpy as np
-    numpy_available = True
-except ImportError:
-    numpy = None
-    numpy_available = False
-
 # Pre-compile regex patterns for better performance
 REGEX_ATTN = re.compile(r'ATTN\s+([\d.]+)', re.IGNORECASE)
 REGEX_TDIV = re.compile(r'TDIV\s+([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)', re.IGNORECASE)
@@ -91,13 +83,23 @@ waveform_spec = importlib.util.spec_from_file_location(
 )
 waveform_module = importlib.util.module_from_spec(waveform_spec)
 waveform_spec.loader.exec_module(waveform_module)
-WaveformDecoder = waveform_module.WaveformDecoder
 query_vertical_gain = waveform_module.query_vertical_gain
 query_vertical_offset = waveform_module.query_vertical_offset
-analyze_steady_state = waveform_module.analyze_steady_state
-apply_lowpass_filter = waveform_module.apply_lowpass_filter
 retrieve_waveform = waveform_module.retrieve_waveform
 
+# Waveform and CAN data analysis is shared with the application
+from host_gui.utils.signal_analysis import detect_steady_state_regions, robust_statistics
+from host_gui.utils.waveform_analysis import analyze_waveform_steady_state
+
+# Import display decimation (long CAN captures are reduced before plotting)
+decimation_spec = importlib.util.spec_from_file_location(
+    "decimation",
+    project_root / "host_gui" / "utils" / "decimation.py"
+)
+decimation_module = importlib.util.module_from_spec(decimation_spec)
+decimation_spec.loader.exec_module(decimation_module)
+decimate_for_display = decimation_module.decimate_for_display
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -721,173 +723,24 @@ class PhaseCurrentTestStateMachine:
             logger.error(f"Failed in wait_and_stop: {e}", exc_info=True)
             return False
     
-    def _retrieve_channel_waveform(self, channel: int) -> Optional[bytes]:
+    def _retrieve_channel_waveform(self, channel: int) -> Optional[bytearray]:
         """Retrieve waveform data for a specific channel.
         
         Args:
             channel: Channel number (1 or 2)
             
         Returns:
-            Binary waveform data or None if retrieval fails
+            Binary waveform data (starting at WAVEDESC) or None if retrieval fails
         """
         if not self.oscilloscope_service.is_connected():
             logger.error("Oscilloscope not connected")
             return None
         
-        try:
-            logger.info(f"Retrieving Channel {channel} waveform data (C{channel}:WF? ALL)...")
-            
-            oscilloscope = self.oscilloscope_service.oscilloscope
-            
-            # Set timeout for large data transfer
-            original_timeout = oscilloscope.timeout
-            oscilloscope.timeout = 10000  # 10 seconds for large waveform data
-            
-            try:
-                import struct
-                
-                # Send query command - waveform data is binary
-                oscilloscope.write(f"C{channel}:WF? ALL")
-                
-                # Read binary data - may need to read in chunks for large waveforms
-                raw_data = b''
-                max_reads = 1000  # Safety limit
-                
-                # Read first chunk to see format
-                try:
-                    first_chunk = oscilloscope.read_raw()
-                    raw_data += first_chunk
-                    logger.info(f"Read first chunk: {len(first_chunk)} bytes")
-                except Exception as e:
-                    logger.error(f"Failed to read first chunk: {e}")
-                    return None
-                
-                # Check if it's SCPI binary block format
-                if len(raw_data) >= 2 and raw_data[0] == ord('#'):
-                    # Parse length from SCPI header
-                    num_digits = int(chr(raw_data[1]))
-                    if 1 <= num_digits <= 9:
-                        length_str = raw_data[2:2+num_digits].decode('ascii')
-                        total_length = int(length_str)
-                        header_size = 2 + num_digits
-                        logger.info(f"SCPI binary block format: total length={total_length}, header={header_size}")
-                        
-                        # Read remaining data
-                        remaining = total_length + header_size - len(raw_data) + 1  # +1 for newline
-                        if remaining > 0:
-                            logger.info(f"Reading remaining {remaining} bytes...")
-                            read_count = 0
-                            while len(raw_data) < total_length + header_size + 1 and read_count < max_reads:
-                                try:
-                                    chunk = oscilloscope.read_raw()
-                                    if not chunk:
-                                        break
-                                    raw_data += chunk
-                                    read_count += 1
-                                    if read_count % 10 == 0:
-                                        logger.debug(f"Read {len(raw_data)} bytes so far...")
-                                except Exception as e:
-                                    logger.warning(f"Error reading chunk: {e}")
-                                    break
-                else:
-                    # Direct binary - read until we get WAVEDESC and then parse to determine length
-                    logger.info("Direct binary format, reading in chunks...")
-                    read_count = 0
-                    while read_count < max_reads:
-                        try:
-                            chunk = oscilloscope.read_raw()
-                            if not chunk:
-                                break
-                            raw_data += chunk
-                            read_count += 1
-                            # Check if we have enough to parse WAVEDESC
-                            if len(raw_data) >= 400:
-                                wavedesc_pos = raw_data.find(b'WAVEDESC')
-                                if wavedesc_pos >= 0:
-                                    # Try to parse WAVE_ARRAY_1 length to know how much more to read
-                                    try:
-                                        wave_array_1_offset = wavedesc_pos + 60
-                                        if len(raw_data) >= wave_array_1_offset + 4:
-                                            wave_array_1_length = struct.unpack('<I', 
-                                                raw_data[wave_array_1_offset:wave_array_1_offset + 4])[0]
-                                            wave_descriptor_length = struct.unpack('<I',
-                                                raw_data[wavedesc_pos + 36:wavedesc_pos + 40])[0]
-                                            user_text_length = struct.unpack('<I',
-                                                raw_data[wavedesc_pos + 40:wavedesc_pos + 44])[0]
-                                            
-                                            expected_total = (wavedesc_pos + wave_descriptor_length + 
-                                                             user_text_length + wave_array_1_length)
-                                            if len(raw_data) >= expected_total:
-                                                logger.info(f"Read complete waveform: {len(raw_data)} bytes")
-                                                break
-                                    except Exception:
-                                        pass
-                        except Exception as e:
-                            logger.debug(f"Read complete or error: {e}")
-                            break
-                
-                logger.info(f"Retrieved {len(raw_data)} bytes of raw data total")
-                
-                # Parse SCPI binary block format: #<n><length><data>
-                if len(raw_data) < 2 or raw_data[0] != ord('#'):
-                    # Data might be direct binary (no SCPI header)
-                    # Check if it starts with WAVEDESC
-                    if raw_data[:8].startswith(b'WAVEDESC'):
-                        logger.info("Waveform data is direct binary (starts with WAVEDESC)")
-                        return raw_data
-                    else:
-                        logger.warning("Waveform data doesn't start with '#' or 'WAVEDESC'")
-                        # Try to find WAVEDESC in the data
-                        wavedesc_pos = raw_data.find(b'WAVEDESC')
-                        if wavedesc_pos >= 0:
-                            logger.info(f"Found WAVEDESC at position {wavedesc_pos}, extracting from there")
-                            return raw_data[wavedesc_pos:]
-                        return raw_data
-                
-                # Parse SCPI binary block format
-                if raw_data[0] == ord('#'):
-                    # Extract length digits
-                    num_digits = int(chr(raw_data[1]))
-                    if num_digits < 1 or num_digits > 9:
-                        logger.warning(f"Invalid number of length digits: {num_digits}")
-                        return raw_data
-                    
-                    # Extract length
-                    length_str = raw_data[2:2+num_digits].decode('ascii')
-                    data_length = int(length_str)
-                    
-                    # Extract actual binary data (skip header: '#' + num_digits + length_str)
-                    header_size = 2 + num_digits
-                    waveform_data = raw_data[header_size:header_size + data_length]
-                    
-                    # Handle potential newline terminator (SCPI standard)
-                    if len(raw_data) > header_size + data_length:
-                        remaining = raw_data[header_size + data_length:]
-                        if remaining.startswith(b'\n') or remaining.startswith(b'\r\n'):
-                            logger.debug("Removed newline terminator from waveform data")
-                    
-                    if len(waveform_data) != data_length:
-                        logger.warning(f"Expected {data_length} bytes, got {len(waveform_data)} bytes")
-                        # Use what we have if it's close
-                        if abs(len(waveform_data) - data_length) <= 2:  # Allow small difference for terminator
-                            logger.info(f"Using {len(waveform_data)} bytes (close to expected {data_length})")
-                        else:
-                            logger.error(f"Data length mismatch too large, cannot proceed")
-                            return None
-                    
-                    logger.info(f"Extracted {len(waveform_data)} bytes of waveform data from SCPI binary block")
-                    return waveform_data
-                else:
-                    # Direct binary data (already handled above)
-                    return raw_data
-                
-            finally:
-                # Restore original timeout
-                oscilloscope.timeout = original_timeout
-                    
-        except Exception as e:
-            logger.error(f"Error retrieving Channel {channel} waveform: {e}", exc_info=True)
-            return None
+        logger.info(f"Retrieving Channel {channel} waveform data (C{channel}:WF? ALL)...")
+        waveform_data = self.oscilloscope_service.read_waveform(channel)
+        if waveform_data is None:
+            logger.error(f"Error retrieving Channel {channel} waveform")
+        return waveform_data
     
     def _process_channel_cpu_ops(self, waveform_data: bytes, vertical_gain: Optional[float], 
                                   vertical_offset: Optional[float], channel: int) -> Tuple[Optional[float], Optional[float], Optional[int], Optional[int]]:
@@ -906,38 +759,21 @@ class PhaseCurrentTestStateMachine:
             (None, None, None, None) if processing fails
         """
         try:
-            # Decode waveform
-            decoder = WaveformDecoder(waveform_data)
-            descriptor, time_values, voltage_values = decoder.decode(
+            # Decode, 10 kHz low-pass filter, discard the initial low samples and
+            # find the steady state exactly as the application does
+            result = analyze_waveform_steady_state(
+                waveform_data,
                 vertical_gain=vertical_gain,
-                vertical_offset=vertical_offset
+                vertical_offset=vertical_offset,
+                label=f"CH{channel}"
             )
-            logger.info(f"CH{channel} decoded: {len(voltage_values)} points")
-            
-            # Apply 10kHz low-pass filter
-            try:
-                filtered = apply_lowpass_filter(time_values, voltage_values, cutoff_freq=10000.0)
-                logger.info(f"CH{channel} filter applied: {len(filtered)} points")
-            except Exception as e:
-                logger.warning(f"Failed to filter CH{channel}: {e}, using unfiltered data")
-                filtered = voltage_values
-            
-            # Analyze steady state
-            steady_avg = None
-            steady_std = None
-            steady_start = None
-            steady_end = None
-            try:
-                steady_start, steady_end, steady_avg, steady_std = analyze_steady_state(
-                    time_values, filtered,
-                    variance_threshold_percent=5.0,
-                    skip_initial_percent=30.0
-                )
-                logger.info(f"CH{channel} Steady State: {steady_avg:.6f} V (std: {steady_std:.6f} V)")
-            except Exception as e:
-                logger.error(f"Failed to analyze CH{channel} steady state: {e}", exc_info=True)
-            
-            return (steady_avg, steady_std, steady_start, steady_end)
+            if result is None:
+                logger.error(f"Failed to analyze CH{channel} steady state")
+                return (None, None, None, None)
+            logger.info(f"CH{channel} Steady State: {result['avg']:.6f} V (std: {result['std']:.6f} V)")
+            # Indices relative to the full record
+            return (result['avg'], result['std'], result['discarded'] + result['start'],
+                    result['discarded'] + result['end'])
             
         except Exception as e:
             logger.error(f"Error processing CH{channel} CPU operations: {e}", exc_info=True)
@@ -1097,345 +933,6 @@ class PhaseCurrentTestStateMachine:
             logger.error(f"Failed to retrieve waveforms: {e}", exc_info=True)
             return False
     
-    def _detect_steady_state_regions(self, phase_v_values: List[float], 
-                                     phase_w_values: List[float], 
-                                     timestamps: List[float]) -> Tuple[Optional[int], Optional[int]]:
-        """Detect steady state regions by analyzing data characteristics.
-        
-        This method analyzes the phase current data to intelligently identify:
-        - Ramp-up period: When values are changing/increasing
-        - Steady-state period: When values are stable
-        - Ramp-down period: When values are decreasing
-        
-        Uses multiple techniques:
-        1. Moving window variance analysis
-        2. Rate of change (derivative) detection
-        3. Statistical stability detection
-        
-        Args:
-            phase_v_values: List of Phase V current values
-            phase_w_values: List of Phase W current values
-            timestamps: List of timestamps for each data point
-            
-        Returns:
-            Tuple of (ramp_up_end_index, ramp_down_start_index) or (None, None) if detection fails
-        """
-        import statistics
-        
-        total_points = len(phase_v_values)
-        if total_points < 10:
-            logger.warning(f"Insufficient data points ({total_points}) for steady state detection")
-            return None, None
-        
-        # First, identify and discard initial low current period (<1A)
-        # Find the start of actual ramp-up when current exceeds 1A (absolute value)
-        # Optimized: use NumPy for vectorized operations
-        current_threshold = 1.0  # Amperes
-        
-        if numpy_available:
-            phase_v_array = np.array(phase_v_values)
-            phase_w_array = np.array(phase_w_values)
-            abs_v_array = np.abs(phase_v_array)
-            abs_w_array = np.abs(phase_w_array)
-            # Find first index where either exceeds threshold
-            mask = (abs_v_array >= current_threshold) | (abs_w_array >= current_threshold)
-            if np.any(mask):
-                initial_discard_end = int(np.argmax(mask))
-            else:
-                initial_discard_end = 0
-        else:
-            initial_discard_end = 0
-            for i in range(total_points):
-                # Check if either phase current exceeds threshold (absolute value)
-                abs_v = abs(phase_v_values[i])
-                abs_w = abs(phase_w_values[i])
-                if abs_v >= current_threshold or abs_w >= current_threshold:
-                    initial_discard_end = i
-                    break
-        
-        # If no point exceeds threshold, use first point as start
-        if initial_discard_end == 0 and (abs(phase_v_values[0]) >= current_threshold or 
-                                         abs(phase_w_values[0]) >= current_threshold):
-            initial_discard_end = 0
-        
-        # Log initial discard information
-        if initial_discard_end > 0:
-            logger.info(f"Discarding initial {initial_discard_end} points with current < {current_threshold} A")
-            logger.debug(f"  Initial period: V range [{min(abs(v) for v in phase_v_values[:initial_discard_end]):.3f}, "
-                        f"{max(abs(v) for v in phase_v_values[:initial_discard_end]):.3f}] A, "
-                        f"W range [{min(abs(w) for w in phase_w_values[:initial_discard_end]):.3f}, "
-                        f"{max(abs(w) for w in phase_w_values[:initial_discard_end]):.3f}] A")
-        
-        # Slice data to start from ramp-up beginning
-        analysis_start = initial_discard_end
-        phase_v_analysis = phase_v_values[analysis_start:]
-        phase_w_analysis = phase_w_values[analysis_start:]
-        timestamps_analysis = timestamps[analysis_start:] if len(timestamps) > analysis_start else timestamps
-        
-        analysis_points = len(phase_v_analysis)
-        if analysis_points < 10:
-            logger.warning(f"Insufficient data points ({analysis_points}) after discarding initial low current period")
-            return None, None
-        
-        # Calculate window size for moving statistics (use 5% of remaining data or minimum 5 points)
-        window_size = max(5, int(analysis_points * 0.05))
-        window_size = min(window_size, analysis_points // 4)  # Don't use more than 25% of data
-        
-        logger.info(f"Analyzing {analysis_points} data points (after discarding {initial_discard_end} initial points) with window size {window_size}")
-        
-        # Calculate moving averages and standard deviations for both phases
-        # Also calculate rate of change (derivative approximation)
-        # Optimized: use NumPy for vectorized operations when available
-        if numpy_available:
-            phase_v_array = np.array(phase_v_analysis, dtype=np.float64)
-            phase_w_array = np.array(phase_w_analysis, dtype=np.float64)
-            
-            # Calculate rate of change using NumPy diff (much faster)
-            if len(timestamps_analysis) > 1:
-                dt_array = np.diff(timestamps_analysis)
-                # Handle zero or negative dt
-                dt_array = np.where(dt_array > 0, dt_array, 1.0)
-            else:
-                dt_array = np.array([1.0])
-            
-            dv_array = np.diff(phase_v_array)
-            dw_array = np.diff(phase_w_array)
-            rate_of_change_v_array = np.abs(dv_array / dt_array)
-            rate_of_change_w_array = np.abs(dw_array / dt_array)
-            # Pad with zero at the beginning
-            rate_of_change_v = [0.0] + rate_of_change_v_array.tolist()
-            rate_of_change_w = [0.0] + rate_of_change_w_array.tolist()
-            
-            # Calculate moving window standard deviations using NumPy
-            # Use a more efficient approach with rolling window
-            moving_std_v = []
-            moving_std_w = []
-            half_window = window_size // 2
-            
-            for i in range(analysis_points):
-                start_idx = max(0, i - half_window)
-                end_idx = min(analysis_points, i + half_window + 1)
-                window_v = phase_v_array[start_idx:end_idx]
-                window_w = phase_w_array[start_idx:end_idx]
-                
-                if len(window_v) > 1:
-                    std_v = float(np.std(window_v))
-                    std_w = float(np.std(window_w))
-                else:
-                    std_v = 0.0
-                    std_w = 0.0
-                
-                moving_std_v.append(std_v)
-                moving_std_w.append(std_w)
-        else:
-            # Fallback to Python implementation
-            moving_std_v = []
-            moving_std_w = []
-            rate_of_change_v = []
-            rate_of_change_w = []
-            
-            for i in range(analysis_points):
-                # Moving window statistics
-                start_idx = max(0, i - window_size // 2)
-                end_idx = min(analysis_points, i + window_size // 2 + 1)
-                window_v = phase_v_analysis[start_idx:end_idx]
-                window_w = phase_w_analysis[start_idx:end_idx]
-                
-                # Calculate standard deviation in window
-                if len(window_v) > 1:
-                    std_v = statistics.stdev(window_v)
-                    std_w = statistics.stdev(window_w)
-                else:
-                    std_v = 0.0
-                    std_w = 0.0
-                
-                moving_std_v.append(std_v)
-                moving_std_w.append(std_w)
-                
-                # Calculate rate of change (derivative approximation)
-                if i > 0:
-                    # Use time difference if available, otherwise assume uniform spacing
-                    if len(timestamps_analysis) > i and timestamps_analysis[i] > timestamps_analysis[i-1]:
-                        dt = timestamps_analysis[i] - timestamps_analysis[i-1]
-                    else:
-                        dt = 1.0  # Assume 1 unit time
-                    
-                    dv_dt = abs((phase_v_analysis[i] - phase_v_analysis[i-1]) / dt)
-                    dw_dt = abs((phase_w_analysis[i] - phase_w_analysis[i-1]) / dt)
-                else:
-                    dv_dt = 0.0
-                    dw_dt = 0.0
-                
-                rate_of_change_v.append(dv_dt)
-                rate_of_change_w.append(dw_dt)
-        
-        # Calculate thresholds for stability
-        # Use median + scaled median absolute deviation for robust threshold
-        # Optimized: use NumPy for statistics when available
-        if numpy_available:
-            def median_absolute_deviation(data_array):
-                if len(data_array) == 0:
-                    return 0.0
-                median = np.median(data_array)
-                deviations = np.abs(data_array - median)
-                return float(np.median(deviations))
-        else:
-            def median_absolute_deviation(data):
-                if not data:
-                    return 0.0
-                median = statistics.median(data)
-                deviations = [abs(x - median) for x in data]
-                return statistics.median(deviations) if deviations else 0.0
-        
-        # Combined metrics for both phases
-        if numpy_available:
-            combined_std = ((np.array(moving_std_v) + np.array(moving_std_w)) / 2.0).tolist()
-            combined_rate = ((np.array(rate_of_change_v) + np.array(rate_of_change_w)) / 2.0).tolist()
-            combined_std_array = np.array(combined_std)
-            combined_rate_array = np.array(combined_rate)
-            
-            # Calculate stability thresholds using NumPy
-            median_std = float(np.median(combined_std_array))
-            mad_std = median_absolute_deviation(combined_std_array)
-            std_threshold = median_std + 2.0 * mad_std  # Threshold for "stable" variance
-            
-            median_rate = float(np.median(combined_rate_array))
-            mad_rate = median_absolute_deviation(combined_rate_array)
-            rate_threshold = median_rate + 2.0 * mad_rate  # Threshold for "stable" rate of change
-        else:
-            combined_std = [(v + w) / 2.0 for v, w in zip(moving_std_v, moving_std_w)]
-            combined_rate = [(v + w) / 2.0 for v, w in zip(rate_of_change_v, rate_of_change_w)]
-            
-            # Calculate stability thresholds
-            median_std = statistics.median(combined_std)
-            mad_std = median_absolute_deviation(combined_std)
-            std_threshold = median_std + 2.0 * mad_std  # Threshold for "stable" variance
-            
-            median_rate = statistics.median(combined_rate)
-            mad_rate = median_absolute_deviation(combined_rate)
-            rate_threshold = median_rate + 2.0 * mad_rate  # Threshold for "stable" rate of change
-        
-        logger.debug(f"Stability thresholds - Std: {std_threshold:.4f}, Rate: {rate_threshold:.4f}")
-        
-        # Find ramp-up end (start of steady state)
-        # Look for point where both std and rate of change drop below thresholds
-        # Start from beginning and find first stable region
-        # Note: These indices are relative to the analysis_start
-        ramp_up_end_relative = None
-        stable_window_count = 0
-        required_stable_points = max(3, window_size // 2)
-        
-        for i in range(window_size, analysis_points - window_size):
-            # Check if this point and surrounding points are stable
-            is_stable_std = combined_std[i] <= std_threshold
-            is_stable_rate = combined_rate[i] <= rate_threshold
-            
-            if is_stable_std and is_stable_rate:
-                stable_window_count += 1
-                if stable_window_count >= required_stable_points:
-                    ramp_up_end_relative = i - required_stable_points
-                    break
-            else:
-                stable_window_count = 0
-        
-        # If no clear ramp-up end found, use a conservative estimate
-        if ramp_up_end_relative is None:
-            # Find point where rate of change first drops significantly
-            for i in range(window_size, analysis_points // 2):
-                if combined_rate[i] <= rate_threshold:
-                    # Check if next few points are also stable
-                    if all(combined_rate[j] <= rate_threshold 
-                           for j in range(i, min(i + required_stable_points, analysis_points))):
-                        ramp_up_end_relative = i
-                        break
-        
-        # Fallback: use 10% of remaining data if still not found
-        if ramp_up_end_relative is None:
-            ramp_up_end_relative = max(1, int(analysis_points * 0.1))
-            logger.warning(f"Could not detect ramp-up end, using conservative estimate: {ramp_up_end_relative}")
-        
-        # Find ramp-down start (end of steady state)
-        # Look backwards from end for point where std or rate increases
-        # Note: These indices are relative to the analysis_start
-        ramp_down_start_relative = None
-        stable_window_count = 0
-        
-        for i in range(analysis_points - window_size, ramp_up_end_relative + window_size, -1):
-            # Check if this point and surrounding points are stable
-            is_stable_std = combined_std[i] <= std_threshold
-            is_stable_rate = combined_rate[i] <= rate_threshold
-            
-            if is_stable_std and is_stable_rate:
-                stable_window_count += 1
-                if stable_window_count >= required_stable_points:
-                    ramp_down_start_relative = i + required_stable_points
-                    break
-            else:
-                stable_window_count = 0
-        
-        # If no clear ramp-down start found, look for increasing rate of change
-        if ramp_down_start_relative is None:
-            for i in range(analysis_points - window_size, ramp_up_end_relative + window_size, -1):
-                if combined_rate[i] > rate_threshold * 1.5:  # Significant increase
-                    # Check if this is sustained (look at points after i)
-                    check_end = min(i + required_stable_points, analysis_points)
-                    if all(combined_rate[j] > rate_threshold 
-                           for j in range(i, check_end)):
-                        ramp_down_start_relative = i
-                        break
-        
-        # Fallback: use 90% of remaining data if still not found
-        if ramp_down_start_relative is None:
-            ramp_down_start_relative = min(analysis_points - 1, int(analysis_points * 0.9))
-            logger.warning(f"Could not detect ramp-down start, using conservative estimate: {ramp_down_start_relative}")
-        
-        # Ensure we have a valid steady state region
-        if ramp_up_end_relative >= ramp_down_start_relative:
-            # Use middle 60% of remaining data as fallback
-            ramp_up_end_relative = int(analysis_points * 0.2)
-            ramp_down_start_relative = int(analysis_points * 0.8)
-            logger.warning("Steady state region too small, using fallback boundaries")
-        
-        # Convert relative indices back to absolute indices (accounting for initial discard)
-        ramp_up_end = analysis_start + ramp_up_end_relative
-        ramp_down_start = analysis_start + ramp_down_start_relative
-        
-        # Log detection results
-        steady_state_points = ramp_down_start - ramp_up_end
-        logger.info(f"Steady state detection results:")
-        if initial_discard_end > 0:
-            logger.info(f"  Initial low current discarded: {initial_discard_end} points ({initial_discard_end/total_points*100:.1f}%)")
-        logger.info(f"  Ramp-up end: index {ramp_up_end} ({ramp_up_end/total_points*100:.1f}%)")
-        logger.info(f"  Ramp-down start: index {ramp_down_start} ({ramp_down_start/total_points*100:.1f}%)")
-        logger.info(f"  Steady state points: {steady_state_points} ({steady_state_points/total_points*100:.1f}%)")
-        
-        # Calculate and log statistics of detected regions
-        if initial_discard_end > 0:
-            initial_v = phase_v_values[:initial_discard_end]
-            initial_w = phase_w_values[:initial_discard_end]
-            logger.debug(f"  Initial low current: {len(initial_v)} points, V range: [{min(initial_v):.3f}, {max(initial_v):.3f}] A, "
-                        f"W range: [{min(initial_w):.3f}, {max(initial_w):.3f}] A")
-        
-        if ramp_up_end > initial_discard_end:
-            ramp_up_v = phase_v_values[initial_discard_end:ramp_up_end]
-            ramp_up_w = phase_w_values[initial_discard_end:ramp_up_end]
-            logger.debug(f"  Ramp-up: {len(ramp_up_v)} points, V range: [{min(ramp_up_v):.3f}, {max(ramp_up_v):.3f}] A, "
-                        f"W range: [{min(ramp_up_w):.3f}, {max(ramp_up_w):.3f}] A")
-        
-        steady_v = phase_v_values[ramp_up_end:ramp_down_start]
-        steady_w = phase_w_values[ramp_up_end:ramp_down_start]
-        if steady_v:
-            logger.debug(f"  Steady state: {len(steady_v)} points, V range: [{min(steady_v):.3f}, {max(steady_v):.3f}] A, "
-                        f"W range: [{min(steady_w):.3f}, {max(steady_w):.3f}] A")
-        
-        if ramp_down_start < total_points:
-            ramp_down_v = phase_v_values[ramp_down_start:]
-            ramp_down_w = phase_w_values[ramp_down_start:]
-            logger.debug(f"  Ramp-down: {len(ramp_down_v)} points, V range: [{min(ramp_down_v):.3f}, {max(ramp_down_v):.3f}] A, "
-                        f"W range: [{min(ramp_down_w):.3f}, {max(ramp_down_w):.3f}] A")
-        
-        return ramp_up_end, ramp_down_start
-    
     def _process_can_data(self) -> None:
         """Process collected CAN data to extract steady-state PhaseVCurrent and PhaseWCurrent.
         
@@ -1501,8 +998,8 @@ class PhaseCurrentTestStateMachine:
         
         # Analyze data to intelligently detect steady state regions
         # This replaces hardcoded 20%/80% discard logic with data-driven analysis
-        ramp_up_end, ramp_down_start = self._detect_steady_state_regions(
-            phase_v_values, phase_w_values, timestamps
+        ramp_up_end, ramp_down_start = detect_steady_state_regions(
+            [phase_v_values, phase_w_values], timestamps
         )
         
         if ramp_up_end is None or ramp_down_start is None:
@@ -1521,33 +1018,10 @@ class PhaseCurrentTestStateMachine:
             logger.warning("No steady state data available after filtering")
             return
         
-        # Calculate averages - optimized with NumPy when available
-        if numpy_available:
-            steady_v_array = np.array(steady_state_v, dtype=np.float64)
-            steady_w_array = np.array(steady_state_w, dtype=np.float64)
-            avg_phase_v = float(np.mean(steady_v_array))
-            avg_phase_w = float(np.mean(steady_w_array))
-            
-            # Calculate standard deviations for quality check
-            try:
-                std_phase_v = float(np.std(steady_v_array)) if len(steady_state_v) > 1 else 0.0
-                std_phase_w = float(np.std(steady_w_array)) if len(steady_state_w) > 1 else 0.0
-            except Exception:
-                std_phase_v = 0.0
-                std_phase_w = 0.0
-        else:
-            # Fallback to Python implementation
-            avg_phase_v = sum(steady_state_v) / len(steady_state_v)
-            avg_phase_w = sum(steady_state_w) / len(steady_state_w)
-            
-            # Calculate standard deviations for quality check
-            import statistics
-            try:
-                std_phase_v = statistics.stdev(steady_state_v) if len(steady_state_v) > 1 else 0.0
-                std_phase_w = statistics.stdev(steady_state_w) if len(steady_state_w) > 1 else 0.0
-            except Exception:
-                std_phase_v = 0.0
-                std_phase_w = 0.0
+        stats_v = robust_statistics(steady_state_v)
+        stats_w = robust_statistics(steady_state_w)
+        avg_phase_v, std_phase_v = stats_v.mean, stats_v.std
+        avg_phase_w, std_phase_w = stats_w.mean, stats_w.std
         
         # Print results
         total_points = len(phase_v_values)
@@ -1609,7 +1083,8 @@ class PhaseCurrentTestStateMachine:
             fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
             
             # Plot Phase V Current
-            ax1.plot(time_relative, phase_v_values, 'b-', linewidth=1.5, label='Phase V Current', alpha=0.7)
+            ax1.plot(*decimate_for_display(time_relative, phase_v_values), 'b-', linewidth=1.5,
+                     label='Phase V Current', alpha=0.7)
             
             # Identify initial low current period (<1A) to show as discarded
             current_threshold = 1.0
@@ -1649,7 +1124,8 @@ class PhaseCurrentTestStateMachine:
             ax1.legend(loc='best')
             
             # Plot Phase W Current
-            ax2.plot(time_relative, phase_w_values, 'r-', linewidth=1.5, label='Phase W Current', alpha=0.7)
+            ax2.plot(*decimate_for_display(time_relative, phase_w_values), 'r-', linewidth=1.5,
+                     label='Phase W Current', alpha=0.7)
             
             # Plot regions: Red for discarded (initial low current, ramp-up, and ramp-down), Green for steady-state
             # Initial low current region (discarded): from start to where current exceeds 1A
@@ -60,17 +60,27 @@ def parse_pava_response(response: str) -> tuple[float, str]:
     return None, f"Could not parse PAVA response: {response}"
 
 
-def main() -> int:
+def load_oscilloscope_service():
+    """Load the OscilloscopeService class from the repository.
+
+    The project root is put on sys.path, since the service imports other
+    host_gui modules.
+    """
     repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
     services_path = os.path.join(repo_root, 'host_gui', 'services')
-    sys.path.insert(0, services_path)
 
+    import importlib.util
+    spec = importlib.util.spec_from_file_location('oscilloscope_service', os.path.join(services_path, 'oscilloscope_service.py'))
+    osc_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(osc_module)  # type: ignore
+    return getattr(osc_module, 'OscilloscopeService')
+
+
+def main() -> int:
     try:
-        import importlib.util
-        spec = importlib.util.spec_from_file_location('oscilloscope_service', os.path.join(services_path, 'oscilloscope_service.py'))
-        osc_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(osc_module)  # type: ignore
-        Service = getattr(osc_module, 'OscilloscopeService')
+        Service = load_oscilloscope_service()
     except Exception as e:
         print(f"ERROR: Failed to import OscilloscopeService: {e}")
         return 2